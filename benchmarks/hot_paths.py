@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""Offline benchmark suite for in-process hot paths.
+
+Needs no server, database or Redis. Micro-benchmarks cover
+canonicalization, projection, idShortPath navigation, $value extraction,
+Pydantic validation of a large submodel, AASX export/import and the XML
+serializer. Macro-benchmarks drive the AAS and Submodel routers in-process
+(raw ASGI calls, no HTTP client) through fast-path GETs served from an
+in-memory stand-in for Redis behind the real ``RedisCache``.
+
+Every case is timed as ``rounds`` rounds of ``number`` calls; the per-call
+median of the rounds is what gets compared. Results are written to
+``results/hot_paths.json``. Against a baseline (a results file from an
+earlier run, typically of the main branch on the same machine) the run
+fails when any case's median regressed by more than ``--threshold``.
+
+Usage:
+    python benchmarks/hot_paths.py
+    python benchmarks/hot_paths.py --save-baseline
+    python benchmarks/hot_paths.py --baseline benchmarks/baselines/hot_paths.json
+    python benchmarks/hot_paths.py --filter asgi --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import orjson
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message
+
+from titan.api.routers import aas_repository, submodel_repository
+from titan.cache.redis import RedisCache
+from titan.compat.aasx import AasxExporter, AasxImporter
+from titan.compat.xml_serializer import XmlDeserializer, XmlSerializer
+from titan.config import settings
+from titan.core.canonicalize import canonical_bytes
+from titan.core.ids import encode_id_to_b64url
+from titan.core.model import AssetAdministrationShell, Submodel
+from titan.core.projection import (
+    ProjectionModifiers,
+    apply_projection,
+    extract_value,
+    navigate_id_short_path,
+)
+from titan.persistence.tables import generate_etag
+
+RESULTS_DIR = Path(__file__).parent / "results"
+BASELINE = Path(__file__).parent / "baselines" / "hot_paths.json"
+
+AAS_ID = "urn:example:aas:benchmark"
+SUBMODEL_ID = "urn:example:submodel:benchmark"
+
+# Deepest element of make_submodel(): collection 7, nested list, entry 3
+DEEP_PATH = "Collection7.Measurements[3]"
+
+
+@dataclass
+class CaseResult:
+    """Timing for one benchmark case."""
+
+    name: str
+    group: str
+    rounds: int
+    number: int
+    median_us: float
+    min_us: float
+    p95_us: float
+
+
+@dataclass
+class Case:
+    """A benchmark case: ``func`` is called ``number`` times per round."""
+
+    name: str
+    group: str
+    func: Callable[[], Any]
+    number: int
+
+
+def make_submodel(collections: int = 20, properties: int = 25) -> dict[str, Any]:
+    """Build a large submodel with nested collections, lists and values."""
+    elements: list[dict[str, Any]] = []
+    for c in range(collections):
+        children: list[dict[str, Any]] = [
+            {
+                "modelType": "Property",
+                "idShort": f"Property{p}",
+                "valueType": "xs:double",
+                "value": f"{c * properties + p}.5",
+                "semanticId": {
+                    "type": "ExternalReference",
+                    "keys": [{"type": "GlobalReference", "value": f"urn:example:prop:{p}"}],
+                },
+            }
+            for p in range(properties)
+        ]
+        children.append(
+            {
+                "modelType": "MultiLanguageProperty",
+                "idShort": "Label",
+                "value": [
+                    {"language": "en", "text": f"Collection {c}"},
+                    {"language": "de", "text": f"Sammlung {c}"},
+                ],
+            }
+        )
+        children.append(
+            {
+                "modelType": "Range",
+                "idShort": "Limits",
+                "valueType": "xs:int",
+                "min": "0",
+                "max": str(100 + c),
+            }
+        )
+        children.append(
+            {
+                "modelType": "SubmodelElementList",
+                "idShort": "Measurements",
+                "typeValueListElement": "Property",
+                "valueTypeListElement": "xs:double",
+                "value": [
+                    {"modelType": "Property", "valueType": "xs:double", "value": f"{i}.25"}
+                    for i in range(10)
+                ],
+            }
+        )
+        elements.append(
+            {
+                "modelType": "SubmodelElementCollection",
+                "idShort": f"Collection{c}",
+                "value": children,
+            }
+        )
+    return {
+        "modelType": "Submodel",
+        "id": SUBMODEL_ID,
+        "idShort": "BenchmarkSubmodel",
+        "kind": "Instance",
+        "semanticId": {
+            "type": "ExternalReference",
+            "keys": [{"type": "GlobalReference", "value": "urn:example:semantic:benchmark"}],
+        },
+        "submodelElements": elements,
+    }
+
+
+def make_shell() -> dict[str, Any]:
+    """Build a shell referencing the benchmark submodel."""
+    return {
+        "modelType": "AssetAdministrationShell",
+        "id": AAS_ID,
+        "idShort": "BenchmarkShell",
+        "assetInformation": {
+            "assetKind": "Instance",
+            "globalAssetId": "urn:example:asset:benchmark",
+        },
+        "submodels": [
+            {
+                "type": "ModelReference",
+                "keys": [{"type": "Submodel", "value": SUBMODEL_ID}],
+            }
+        ],
+    }
+
+
+class InMemoryRedis:
+    """The subset of the Redis client ``RedisCache`` reads and writes with.
+
+    TTLs are ignored; nothing expires during a run.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes | str) -> None:
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    def pipeline(self) -> _InMemoryPipeline:
+        return _InMemoryPipeline(self)
+
+
+class _InMemoryPipeline:
+    def __init__(self, redis: InMemoryRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> _InMemoryPipeline:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.commands.clear()
+
+    def get(self, key: str) -> None:
+        self.commands.append(("get", (key,)))
+
+    def setex(self, key: str, ttl: int, value: bytes | str) -> None:
+        self.commands.append(("setex", (key, ttl, value)))
+
+    async def execute(self) -> list[Any]:
+        results = [await getattr(self.redis, name)(*args) for name, args in self.commands]
+        self.commands.clear()
+        return results
+
+
+class _NoDatabase:
+    """Repository stand-in: every request must be served from the cache."""
+
+    async def get_bytes_by_id(self, identifier: str) -> None:
+        raise AssertionError(f"cache miss for {identifier}")
+
+
+async def make_asgi_app(shell: dict[str, Any], submodel: dict[str, Any]) -> ASGIApp:
+    """Repository routers with the cache pre-populated, as after a first read."""
+    # No identity provider offline; requests run as the anonymous admin
+    settings.allow_anonymous_admin = True
+    cache = RedisCache(InMemoryRedis())  # type: ignore[arg-type]
+    for doc, setter in ((shell, cache.set_aas), (submodel, cache.set_submodel)):
+        doc_bytes = canonical_bytes(doc)
+        await setter(encode_id_to_b64url(doc["id"]), doc_bytes, generate_etag(doc_bytes))
+
+    async def get_cache() -> RedisCache:
+        return cache
+
+    async def get_repo() -> _NoDatabase:
+        return _NoDatabase()
+
+    app = FastAPI()
+    app.include_router(aas_repository.router)
+    app.include_router(submodel_repository.router)
+    for dependency in (
+        aas_repository.get_cache,
+        aas_repository.get_aas_repo,
+        aas_repository.get_submodel_repo,
+        submodel_repository.get_cache,
+        submodel_repository.get_submodel_repo,
+    ):
+        override = get_cache if dependency.__name__ == "get_cache" else get_repo
+        app.dependency_overrides[dependency] = override
+    return app
+
+
+def make_request(app: ASGIApp, path: str, encoding: str = "") -> Callable[[], Any]:
+    """Coroutine function performing one GET against ``app``."""
+    headers = [(b"host", b"bench"), (b"accept", b"application/json")]
+    if encoding:
+        headers.append((b"accept-encoding", encoding.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def request() -> None:
+        status = 0
+
+        async def send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await app(dict(scope), receive, send)
+        if status != 200:
+            raise AssertionError(f"GET {path} returned {status}")
+
+    return request
+
+
+async def build_cases() -> list[Case]:
+    """Set up fixtures once and return every case."""
+    shell = make_shell()
+    submodel = make_submodel()
+    submodel_bytes = canonical_bytes(submodel)
+    shell_model = AssetAdministrationShell.model_validate(shell)
+    submodel_model = Submodel.model_validate(submodel)
+    element = navigate_id_short_path(submodel, "Collection7")
+    assert element is not None and navigate_id_short_path(submodel, DEEP_PATH) is not None
+
+    exporter = AasxExporter()
+    aasx_bytes = (
+        await exporter.export_to_stream(shells=[shell_model], submodels=[submodel_model])
+    ).getvalue()
+    xml_bytes = XmlSerializer().serialize_environment([shell_model], [submodel_model])
+
+    async def export_aasx() -> None:
+        await exporter.export_to_stream(shells=[shell_model], submodels=[submodel_model])
+
+    async def import_aasx() -> None:
+        await AasxImporter().import_from_stream(BytesIO(aasx_bytes))
+
+    app = await make_asgi_app(shell, submodel)
+    shell_path = f"/shells/{encode_id_to_b64url(AAS_ID)}"
+    submodel_path = f"/submodels/{encode_id_to_b64url(SUBMODEL_ID)}"
+
+    metadata = ProjectionModifiers(content="metadata")
+    core = ProjectionModifiers(level="core")
+    value = ProjectionModifiers(content="value")
+
+    return [
+        Case("canonical_bytes", "core", lambda: canonical_bytes(submodel), 200),
+        Case("orjson_loads", "core", lambda: orjson.loads(submodel_bytes), 200),
+        Case("projection_metadata", "projection", lambda: apply_projection(submodel, metadata), 20),
+        Case("projection_core", "projection", lambda: apply_projection(submodel, core), 20),
+        Case("projection_value", "projection", lambda: apply_projection(submodel, value), 20),
+        Case(
+            "navigate_id_short_path",
+            "projection",
+            lambda: navigate_id_short_path(submodel, DEEP_PATH),
+            5000,
+        ),
+        Case("extract_value_collection", "projection", lambda: extract_value(element), 1000),
+        Case("validate_submodel", "model", lambda: Submodel.model_validate(submodel), 10),
+        Case(
+            "dump_submodel",
+            "model",
+            lambda: submodel_model.model_dump(by_alias=True, exclude_none=True),
+            10,
+        ),
+        Case("aasx_export", "aasx", export_aasx, 5),
+        Case("aasx_import", "aasx", import_aasx, 5),
+        Case(
+            "xml_serialize",
+            "xml",
+            lambda: XmlSerializer().serialize_environment([shell_model], [submodel_model]),
+            5,
+        ),
+        Case("xml_parse", "xml", lambda: XmlDeserializer().parse_environment(xml_bytes), 5),
+        Case("get_shell", "asgi", make_request(app, shell_path), 500),
+        Case("get_submodel", "asgi", make_request(app, submodel_path), 500),
+        Case("get_submodel_gzip", "asgi", make_request(app, submodel_path, "gzip"), 500),
+        Case(
+            "get_element",
+            "asgi",
+            make_request(app, f"{submodel_path}/submodel-elements/{DEEP_PATH}"),
+            500,
+        ),
+    ]
+
+
+async def time_case(case: Case, rounds: int) -> CaseResult:
+    """Time ``rounds`` rounds of ``case.number`` calls after one warm-up round."""
+    is_async = inspect.iscoroutinefunction(case.func)
+
+    async def one_round() -> float:
+        start = time.perf_counter_ns()
+        if is_async:
+            for _ in range(case.number):
+                await case.func()
+        else:
+            for _ in range(case.number):
+                case.func()
+        return (time.perf_counter_ns() - start) / 1000 / case.number
+
+    await one_round()
+    per_call = sorted([await one_round() for _ in range(rounds)])
+    return CaseResult(
+        name=case.name,
+        group=case.group,
+        rounds=rounds,
+        number=case.number,
+        median_us=round(statistics.median(per_call), 3),
+        min_us=round(per_call[0], 3),
+        p95_us=round(per_call[max(0, int(len(per_call) * 0.95) - 1)], 3),
+    )
+
+
+async def run(rounds: int, scale: float, pattern: str) -> list[CaseResult]:
+    """Run every case whose name or group contains ``pattern``."""
+    results: list[CaseResult] = []
+    for case in await build_cases():
+        if pattern and pattern not in case.name and pattern != case.group:
+            continue
+        case.number = max(1, int(case.number * scale))
+        results.append(await time_case(case, rounds))
+        print(f"  {case.group:<10} {case.name:<26} {results[-1].median_us:>12.2f} us")
+    return results
+
+
+def compare(
+    results: list[CaseResult], baseline: dict[str, Any], threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Cases slower than the baseline median by more than ``threshold``.
+
+    Returns:
+        List of (name, baseline_us, current_us, ratio)
+    """
+    previous = {r["name"]: r["median_us"] for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'case':<26} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for r in results:
+        if r.name not in previous:
+            print(f"{r.name:<26} {'-':>12} {r.median_us:>12.2f} {'new':>8}")
+            continue
+        ratio = r.median_us / previous[r.name] if previous[r.name] else 1.0
+        marker = "  REGRESSION" if ratio > 1 + threshold else ""
+        print(
+            f"{r.name:<26} {previous[r.name]:>12.2f} {r.median_us:>12.2f} "
+            f"{ratio - 1:>+8.1%}{marker}"
+        )
+        if marker:
+            regressions.append((r.name, previous[r.name], r.median_us, ratio))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for calls per round")
+    parser.add_argument(
+        "--filter", default="", help="Only cases whose name contains this, or a group"
+    )
+    parser.add_argument("--baseline", type=Path, help="Results file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Allowed median slowdown (0.15 = 15%%)"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help=f"Also write results to {BASELINE}"
+    )
+    args = parser.parse_args()
+
+    print(f"Running hot path benchmarks ({args.rounds} rounds)")
+    results = asyncio.run(run(args.rounds, args.scale, args.filter))
+
+    report = {
+        "metadata": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+            "scale": args.scale,
+        },
+        "results": [asdict(r) for r in results],
+    }
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output = RESULTS_DIR / "hot_paths.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+    if args.save_baseline:
+        BASELINE.parent.mkdir(exist_ok=True)
+        BASELINE.write_text(json.dumps(report, indent=2))
+        print(f"Baseline written to {BASELINE}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Benchmark for the per-request cost of the API middleware stack.
+
+Drives an ASGI app in-process (no server, no HTTP client) with a GET that
+returns pre-serialized bytes, like a cache-hit fast-path read. Each
+middleware is measured alone and behind a pass-through
+``BaseHTTPMiddleware``, which is the per-layer overhead the stack paid
+before it was rewritten as pure ASGI. The full five-layer stack is
+measured both ways as well.
+
+Rate limiting uses an in-memory limiter that always allows, so only the
+middleware itself is timed.
+
+Usage:
+    python benchmarks/middleware_stack.py
+    python benchmarks/middleware_stack.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message
+
+import titan.cache
+from titan.api.middleware import (
+    CachingMiddleware,
+    CompressionMiddleware,
+    CorrelationMiddleware,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Cached shell document served by the endpoint
+PAYLOAD = b'{"modelType":"AssetAdministrationShell","id":"urn:example:aas:1"}'
+
+# Layers in the order create_app() stacks them (innermost first)
+LAYERS: list[tuple[str, Callable[[ASGIApp], ASGIApp]]] = [
+    ("correlation", CorrelationMiddleware),
+    ("caching", CachingMiddleware),
+    ("rate_limit", lambda app: _rate_limited(app)),
+    ("compression", CompressionMiddleware),
+    (
+        "security_headers",
+        lambda app: SecurityHeadersMiddleware(
+            app,
+            enable_hsts=True,
+            hsts_max_age=31536000,
+            hsts_include_subdomains=True,
+            hsts_preload=False,
+            csp_policy="default-src 'none'",
+            permissions_policy="",
+        ),
+    ),
+]
+
+
+@dataclass
+class StackResult:
+    """Timing for one middleware configuration."""
+
+    name: str
+    iterations: int
+    p50_us: float
+    p95_us: float
+    added_p50_us: float
+
+
+class _AllowAllLimiter:
+    async def is_allowed(self, key: str) -> tuple[bool, dict[str, str]]:
+        return True, {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "99"}
+
+
+def _rate_limited(app: ASGIApp) -> RateLimitMiddleware:
+    middleware = RateLimitMiddleware(app)
+    middleware._limiter = _AllowAllLimiter()  # type: ignore[assignment]
+    return middleware
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    """The framework cost of a BaseHTTPMiddleware layer, without any work."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        return await call_next(request)
+
+
+async def endpoint(request: Request) -> Response:
+    return Response(PAYLOAD, media_type="application/json", headers={"ETag": '"abc"'})
+
+
+def make_endpoint_app() -> ASGIApp:
+    return Starlette(routes=[Route("/shells/{aas_id}", endpoint)])
+
+
+def wrap(app: ASGIApp, layers: list[Callable[[ASGIApp], ASGIApp]], legacy: bool) -> ASGIApp:
+    """Stack layers around app, optionally each behind a BaseHTTPMiddleware."""
+    for layer in layers:
+        app = layer(app)
+        if legacy:
+            app = PassThroughMiddleware(app)
+    return app
+
+
+async def request_once(app: ASGIApp) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/shells/dXJuOmV4YW1wbGU6YWFzOjE",
+        "raw_path": b"/shells/dXJuOmV4YW1wbGU6YWFzOjE",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"accept", b"application/json"),
+            (b"accept-encoding", b"gzip, br"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    await app(scope, receive, send)
+
+
+async def measure(name: str, app: ASGIApp, iterations: int, baseline_us: float) -> StackResult:
+    """Time ``iterations`` requests through app."""
+    for _ in range(min(iterations, 500)):
+        await request_once(app)
+
+    latencies: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await request_once(app)
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    return StackResult(
+        name=name,
+        iterations=iterations,
+        p50_us=round(p50, 2),
+        p95_us=round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        added_p50_us=round(p50 - baseline_us, 2),
+    )
+
+
+async def run(iterations: int) -> list[StackResult]:
+    """Measure the bare endpoint, each layer and the full stack."""
+
+    async def no_redis() -> None:
+        return None
+
+    titan.cache.get_redis = no_redis  # type: ignore[assignment]
+
+    bare = await measure("endpoint", make_endpoint_app(), iterations, 0.0)
+    results = [bare]
+    for name, layer in LAYERS:
+        for legacy in (True, False):
+            label = f"{name} ({'BaseHTTPMiddleware' if legacy else 'pure ASGI'})"
+            app = wrap(make_endpoint_app(), [layer], legacy)
+            results.append(await measure(label, app, iterations, bare.p50_us))
+
+    layers = [layer for _, layer in LAYERS]
+    for legacy in (True, False):
+        label = f"full stack ({'BaseHTTPMiddleware' if legacy else 'pure ASGI'})"
+        app = wrap(make_endpoint_app(), layers, legacy)
+        results.append(await measure(label, app, iterations, bare.p50_us))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations))
+
+    print(f"{'configuration':<42} {'p50 us':>9} {'p95 us':>9} {'added us':>9}")
+    for r in results:
+        print(f"{r.name:<42} {r.p50_us:>9.2f} {r.p95_us:>9.2f} {r.added_p50_us:>9.2f}")
+
+    legacy, pure = results[-2:]
+    print(f"\nFull stack overhead saved per request (p50): {legacy.p50_us - pure.p50_us:.1f} us")
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output = RESULTS_DIR / "middleware_stack.json"
+    output.write_text(json.dumps([asdict(r) for r in results], indent=2))
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,7 @@ from titan.api.middleware import (
     CompressionMiddleware,
     CorrelationMiddleware,
     RateLimitMiddleware,
+    ReadRoutingMiddleware,
     SecurityHeadersMiddleware,
 )
 from titan.api.middleware.rate_limit import RateLimitConfig
@@ -42,6 +43,7 @@ from titan.api.routers import (
     discovery,
     federation,
     health,
+    profiling,
     registry,
     serialization,
     submodel_repository,
@@ -63,14 +65,23 @@ from titan.connectors.opcua.connection import close_opcua, get_opcua_connection_
 from titan.connectors.opcua.handler import OpcUaEventHandler
 from titan.events import AasEvent, AnyEvent, SubmodelElementEvent, SubmodelEvent
 from titan.events.runtime import get_event_bus, start_event_bus, stop_event_bus
+from titan.graphql.query_cache import get_query_cache
 from titan.observability import configure_logging
 from titan.observability.metrics import MetricsMiddleware, get_metrics
+from titan.observability.profiling import start_snapshot_publisher, stop_snapshot_publisher
 from titan.observability.tracing import (
     TracingMiddleware,
     setup_tracing,
     shutdown_tracing,
 )
 from titan.persistence.db import close_db, init_db
+from titan.security.audit_pipeline import start_audit_pipeline, stop_audit_pipeline
+from titan.tenancy import (
+    AdmissionRejectedError,
+    AuthenticatedTenantMiddleware,
+    TenantAdmissionMiddleware,
+)
+from titan.tenancy.middleware import admission_rejected_exception_handler
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +137,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await get_event_bus().subscribe(broadcast_handler)
     logger.info("WebSocket event broadcast handler subscribed")
 
+    # Evict cached GraphQL results when the entities they read change
+    await get_event_bus().subscribe(get_query_cache().handle_event)
+
     # Wire MQTT event handler to event bus (optional, requires MQTT_BROKER config)
     mqtt_publisher = await get_mqtt_publisher()
     if mqtt_publisher is not None:
@@ -189,6 +203,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             "NEVER enable this in production!"
         )
 
+    # Batched, asynchronous audit logging (optional)
+    if settings.audit_pipeline_enabled:
+        await start_audit_pipeline()
+
+    # Publish request sketches for the cluster-wide profiling view
+    if settings.enable_profiling_endpoints:
+        start_snapshot_publisher(settings.profile_snapshot_interval)
+
     logger.info("Titan-AAS startup complete")
 
     yield
@@ -199,6 +221,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await close_opcua()
     await close_mqtt_subscriber()
     await close_mqtt()
+    await stop_audit_pipeline()
+    await stop_snapshot_publisher()
     await stop_event_bus()
     await close_redis()
     await close_db()
@@ -232,6 +256,9 @@ def create_app() -> FastAPI:
     # Add observability middleware
     # Order matters: TracingMiddleware wraps MetricsMiddleware wraps CorrelationMiddleware
     # CorrelationMiddleware is innermost to set context for all other middleware
+    if settings.database_replica_urls:
+        # Marks GET/HEAD requests for replica sessions (see persistence.replicas)
+        app.add_middleware(ReadRoutingMiddleware)
     app.add_middleware(CorrelationMiddleware)
     if settings.enable_metrics:
         app.add_middleware(MetricsMiddleware)
@@ -246,14 +273,27 @@ def create_app() -> FastAPI:
             CachingMiddleware,
             default_max_age=settings.cache_max_age,
             stale_while_revalidate=settings.cache_stale_while_revalidate,
+            tenant_header="X-Tenant-ID" if settings.enable_tenant_isolation else None,
         )
 
+    if settings.enable_tenant_admission:
+        # Weighted fair admission per tenant, inside the (cheaper) rate limiter
+        app.add_middleware(TenantAdmissionMiddleware)
+
+    if settings.enable_tenant_isolation:
+        # Sets the tenant context that row-level security and cache keys use
+        # from the verified token; outside admission so both see the same tenant
+        app.add_middleware(AuthenticatedTenantMiddleware)
+
     if settings.enable_rate_limiting:
         app.add_middleware(
             RateLimitMiddleware,
             config=RateLimitConfig(
                 requests_per_window=settings.rate_limit_requests,
                 window_seconds=settings.rate_limit_window,
+                algorithm=settings.rate_limit_algorithm,
+                local_batch=settings.rate_limit_local_batch,
+                local_ttl_seconds=settings.rate_limit_local_ttl,
             ),
         )
 
@@ -278,6 +318,9 @@ def create_app() -> FastAPI:
 
     # Register exception handlers
     app.add_exception_handler(AasApiError, cast(ExceptionHandler, aas_api_exception_handler))
+    app.add_exception_handler(
+        AdmissionRejectedError, cast(ExceptionHandler, admission_rejected_exception_handler)
+    )
     app.add_exception_handler(Exception, cast(ExceptionHandler, generic_exception_handler))
 
     # Include routers
@@ -288,6 +331,10 @@ def create_app() -> FastAPI:
     if settings.enable_metrics:
         app.include_router(metrics_router.router)
 
+    # Debug profiling endpoints (admin-only CPU sampler)
+    if settings.enable_profiling_endpoints:
+        app.include_router(profiling.router)
+
     # IDTA-01002 Part 2 Repository API routers
     app.include_router(aas_repository.router)
     app.include_router(submodel_repository.router)
@@ -3,17 +3,22 @@
 Provides reusable components to reduce boilerplate across API endpoints:
 - Base64URL identifier decoding
 - ETag header validation
-- Common response builders
+- Common response builders (including pre-compressed cached variants)
 """
 
 from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Header, Path, Response
+from fastapi import Header, Path, Request, Response
 
 from titan.api.errors import InvalidBase64UrlError, PreconditionFailedError
+from titan.cache import RedisCache
+from titan.cache.compressed import compress, negotiate_encoding
+from titan.cache.keys import EntityType
+from titan.config import settings
 from titan.core.ids import InvalidBase64Url, decode_id_from_b64url
+from titan.observability.metrics import record_cache_hit, record_cache_miss
 
 # =============================================================================
 # Base64URL Identifier Decoding Dependencies
@@ -134,6 +139,97 @@ def json_response_with_etag(
     )
 
 
+def _negotiated_encoding(request: Request) -> str | None:
+    """Encoding for a cached compressed variant, or None for identity."""
+    if not settings.enable_compression or not settings.cache_compressed_variants:
+        return None
+    return negotiate_encoding(request.headers.get("accept-encoding", ""))
+
+
+def _encoded_response(body: bytes, etag: str, encoding: str) -> Response:
+    response = json_response_with_etag(body, etag)
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+async def cached_encoded_response(
+    request: Request,
+    cache: RedisCache,
+    entity_type: EntityType,
+    identifier_b64: str,
+    etag: str,
+    variant: str = "",
+) -> Response | None:
+    """Return a cached compressed representation without rebuilding it.
+
+    Lets projection endpoints skip hydration and projection entirely when
+    the negotiated variant of this revision is already cached.
+
+    Returns:
+        Compressed Response, or None if no variant is cached
+    """
+    encoding = _negotiated_encoding(request)
+    if encoding is None:
+        return None
+    body = await cache.get_compressed(entity_type, identifier_b64, etag, encoding, variant)
+    if body is None:
+        return None
+    record_cache_hit("compressed")
+    return _encoded_response(body, etag, encoding)
+
+
+async def encoded_json_response(
+    request: Request,
+    cache: RedisCache,
+    entity_type: EntityType,
+    identifier_b64: str,
+    content: bytes,
+    etag: str,
+    variant: str = "",
+    check_cache: bool = True,
+) -> Response:
+    """Build a JSON response with ETag, compressed from the cache when possible.
+
+    Negotiates Accept-Encoding and returns a compressed representation of
+    ``content`` stored under the document's ETag. On a miss the variant is
+    compressed once and cached, so later hits skip compression entirely.
+    Small documents and clients without a supported encoding get the
+    identity representation.
+
+    Args:
+        request: Incoming request (for Accept-Encoding)
+        cache: Redis cache
+        entity_type: Cache entity type of the document
+        identifier_b64: Base64URL identifier of the document
+        content: Canonical JSON bytes of this revision
+        etag: ETag of this revision (will be quoted)
+        variant: Projection label, empty for the full document
+        check_cache: Look up a cached variant first (False after a
+            cached_encoded_response miss)
+
+    Returns:
+        FastAPI Response with ETag and, if compressed, Content-Encoding
+    """
+    if len(content) < settings.compression_min_size:
+        return json_response_with_etag(content, etag)
+
+    encoding = _negotiated_encoding(request)
+    if encoding is None:
+        return json_response_with_etag(content, etag)
+
+    body = None
+    if check_cache:
+        body = await cache.get_compressed(entity_type, identifier_b64, etag, encoding, variant)
+    if body is None:
+        record_cache_miss("compressed")
+        body = compress(content, encoding, settings.compression_level)
+        await cache.set_compressed(entity_type, identifier_b64, etag, encoding, body, variant)
+    else:
+        record_cache_hit("compressed")
+    return _encoded_response(body, etag, encoding)
+
+
 def no_content_response(etag: str) -> Response:
     """Build a 204 No Content response with ETag header.
 
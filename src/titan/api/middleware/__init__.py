@@ -2,10 +2,11 @@
 
 Provides production-ready middleware:
 - HTTP caching headers
-- Gzip/Brotli compression
+- Brotli/zstd/Gzip compression
 - Request rate limiting
 - Security headers (HSTS, CSP, X-Frame-Options, etc.)
 - Correlation context for request tracing
+- Read replica routing with read-your-writes tokens
 
 Note: For CORS, use FastAPI's built-in CORSMiddleware from starlette.middleware.cors
 """
@@ -14,6 +15,7 @@ from titan.api.middleware.caching import CachingMiddleware
 from titan.api.middleware.compression import CompressionMiddleware
 from titan.api.middleware.correlation import CorrelationMiddleware
 from titan.api.middleware.rate_limit import RateLimitMiddleware
+from titan.api.middleware.read_routing import ReadRoutingMiddleware
 from titan.api.middleware.security_headers import SecurityHeadersMiddleware
 
 __all__ = [
@@ -21,5 +23,6 @@ __all__ = [
     "CompressionMiddleware",
     "CorrelationMiddleware",
     "RateLimitMiddleware",
+    "ReadRoutingMiddleware",
     "SecurityHeadersMiddleware",
 ]
@@ -2,23 +2,29 @@
 
 Adds Cache-Control, Vary, and other caching headers to responses.
 Supports conditional requests with If-Modified-Since.
+
+Implemented as pure ASGI middleware: headers are added to the
+``http.response.start`` message as it passes through, so the response body
+is never buffered or copied.
 """
 
 from __future__ import annotations
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class CachingMiddleware(BaseHTTPMiddleware):
+class CachingMiddleware:
     """Add HTTP caching headers based on request/response.
 
     Features:
     - Cache-Control headers based on endpoint type
     - Vary headers for proper CDN behavior
     - Supports private (authenticated) and public responses
+
+    With ``tenant_header`` (tenant isolation), repository responses are
+    tenant-scoped: they are never marked public and the header is added
+    to Vary, so shared caches cannot serve one tenant's body to another.
     """
 
     def __init__(
@@ -26,38 +32,41 @@ class CachingMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         default_max_age: int = 60,
         stale_while_revalidate: int = 30,
+        tenant_header: str | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.default_max_age = default_max_age
         self.stale_while_revalidate = stale_while_revalidate
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """Add caching headers to response."""
-        response = await call_next(request)
-
-        # Skip for non-GET requests or error responses
-        if request.method != "GET" or response.status_code >= 400:
-            return response
-
-        # Skip if Cache-Control already set
-        if "cache-control" in response.headers:
-            return response
-
-        # Add Cache-Control based on endpoint
-        cache_control = self._get_cache_control(request)
-        if cache_control:
-            response.headers["Cache-Control"] = cache_control
-
-        # Add Vary header for proper CDN/proxy behavior
-        # This tells caches that responses vary based on these headers
-        response.headers["Vary"] = "Accept, Accept-Encoding, Authorization"
-
-        return response
-
-    def _get_cache_control(self, request: Request) -> str | None:
+        self.tenant_header = tenant_header
+        vary = ["Accept", "Accept-Encoding", "Authorization"]
+        if tenant_header is not None:
+            vary.append(tenant_header)
+        self.vary = ", ".join(vary)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only GET responses get caching headers
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = self._get_cache_control(scope["path"], Headers(scope=scope))
+
+        async def send_with_cache_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                # Skip if Cache-Control already set
+                if "cache-control" not in headers:
+                    if cache_control:
+                        headers["Cache-Control"] = cache_control
+                    # Add Vary header for proper CDN/proxy behavior
+                    # This tells caches that responses vary based on these headers
+                    headers["Vary"] = self.vary
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+    def _get_cache_control(self, path: str, headers: Headers) -> str | None:
         """Determine Cache-Control based on endpoint."""
-        path = request.url.path
-
         # Health endpoints - never cache
         if "/health" in path:
             return "no-cache, no-store, must-revalidate"
@@ -68,8 +77,8 @@ class CachingMiddleware(BaseHTTPMiddleware):
 
         # API endpoints - private caching (authenticated)
         if path.startswith("/shells") or path.startswith("/submodels"):
-            # Check if request has Authorization header
-            if request.headers.get("Authorization"):
+            # Authenticated or tenant-scoped responses must not be shared
+            if headers.get("authorization") or self.tenant_header is not None:
                 # Private cache (only browser, not CDN)
                 return (
                     f"private, max-age={self.default_max_age}, "
@@ -8,83 +8,103 @@ from __future__ import annotations
 import uuid
 from collections.abc import Awaitable, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from titan.observability.logging import (
     correlation_id_var,
     request_id_var,
+    request_scope_var,
 )
 
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
+class CorrelationMiddleware:
     """Middleware for propagating correlation context.
 
     Extracts or generates correlation IDs and propagates them to:
     - Request state (for use in handlers)
-    - Context variables (for logging)
+    - Context variables (for logging and CPU profile route labels)
     - Response headers (for client correlation)
 
     Headers:
     - x-request-id: Unique ID for this request
     - x-correlation-id: ID for tracking across services (passed through)
     - x-b3-traceid: OpenTelemetry/Zipkin trace ID (passed through)
+
+    Runs as pure ASGI middleware, so the application executes in the same
+    task and sees the context variables directly.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Extract and propagate correlation context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+
         # Extract or generate request ID
         request_id = (
-            request.headers.get("x-request-id")
-            or request.headers.get("x-amzn-requestid")  # AWS ALB
+            request_headers.get("x-request-id")
+            or request_headers.get("x-amzn-requestid")  # AWS ALB
             or str(uuid.uuid4())
         )
 
         # Extract or inherit correlation ID
         correlation_id = (
-            request.headers.get("x-correlation-id")
-            or request.headers.get("x-correlationid")  # Alternate format
+            request_headers.get("x-correlation-id")
+            or request_headers.get("x-correlationid")  # Alternate format
             or request_id  # Fall back to request ID
         )
 
+        # Store in request state for handlers
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["correlation_id"] = correlation_id
+
+        async def send_with_correlation(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add correlation headers to response
+                headers = MutableHeaders(scope=message)
+                headers["x-request-id"] = request_id
+                headers["x-correlation-id"] = correlation_id
+
+                # Add trace ID if OpenTelemetry is active
+                trace_id = _current_trace_id()
+                if trace_id:
+                    headers["x-trace-id"] = trace_id
+            await send(message)
+
         # Set context variables for logging
         request_token = request_id_var.set(request_id)
         correlation_token = correlation_id_var.set(correlation_id)
+        scope_token = request_scope_var.set(scope)
 
         try:
-            # Store in request state for handlers
-            request.state.request_id = request_id
-            request.state.correlation_id = correlation_id
-
-            # Process request
-            response = await call_next(request)
-
-            # Add correlation headers to response
-            response.headers["x-request-id"] = request_id
-            response.headers["x-correlation-id"] = correlation_id
-
-            # Add trace ID if OpenTelemetry is active
-            try:
-                from opentelemetry import trace
-
-                span = trace.get_current_span()
-                span_context = span.get_span_context()
-                if span_context.is_valid:
-                    response.headers["x-trace-id"] = format(span_context.trace_id, "032x")
-            except ImportError:
-                pass
-
-            return response
-
+            await self.app(scope, receive, send_with_correlation)
         finally:
             # Reset context variables
             request_id_var.reset(request_token)
             correlation_id_var.reset(correlation_token)
+            request_scope_var.reset(scope_token)
+
+
+def _current_trace_id() -> str | None:
+    """Return the active OpenTelemetry trace ID, if any."""
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+
+    span_context = trace.get_current_span().get_span_context()
+    if span_context.is_valid:
+        return format(span_context.trace_id, "032x")
+    return None
 
 
 async def correlation_context_middleware(
@@ -1,20 +1,28 @@
 """Rate limiting middleware for Titan-AAS.
 
-Provides Redis-backed sliding window rate limiting.
-Supports both IP-based and token-based limiting.
+Provides Redis-backed rate limiting with two algorithms:
+- gcra (default): generic cell rate algorithm (a token bucket) run as one
+  atomic Lua call; stores a single timestamp per key
+- sliding_window: sorted set of request timestamps per key
+
+Supports both IP-based and token-based limiting. The GCRA limiter can
+reserve tokens in batches per worker (local pre-admission), so most
+requests are admitted without a Redis round trip.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import math
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Protocol
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -32,6 +40,20 @@ class RateLimitConfig:
     bypass_prefixes: list[str] = field(default_factory=lambda: ["/health", "/metrics"])
     # IPs to bypass (internal services)
     bypass_ips: list[str] = field(default_factory=list)
+    # "gcra" or "sliding_window"
+    algorithm: str = "gcra"
+    # Tokens a worker reserves per Redis call (GCRA; 0 or 1 = every request)
+    local_batch: int = 0
+    # Seconds reserved tokens stay usable; unused ones are forfeited
+    local_ttl_seconds: float = 1.0
+    # Keys with a local reservation kept per worker
+    local_max_keys: int = 10000
+
+
+class RateLimiter(Protocol):
+    """Decides whether a request identified by ``key`` is allowed."""
+
+    async def is_allowed(self, key: str) -> tuple[bool, dict[str, str]]: ...
 
 
 class SlidingWindowRateLimiter:
@@ -89,11 +111,155 @@ class SlidingWindowRateLimiter:
         return allowed, headers
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# GCRA: the key stores the theoretical arrival time (TAT, ms) of the next
+# token. A request may run ahead of now by at most ``burst`` emission
+# intervals. Up to ARGV[3] tokens are granted at once (batch reservation).
+# Returns {granted, remaining, retry_after_ms, reset_ms}.
+GCRA_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local available = math.floor((now + burst * interval - tat) / interval)
+local granted = math.min(requested, available)
+if granted <= 0 then
+    return {0, 0, math.ceil(tat + interval - burst * interval - now), math.ceil(tat - now)}
+end
+tat = tat + granted * interval
+redis.call("SET", KEYS[1], string.format("%.3f", tat), "PX", math.ceil(tat - now))
+return {granted, available - granted, 0, math.ceil(tat - now)}
+"""
+
+
+@dataclass
+class _LocalBudget:
+    """Tokens a worker reserved for one key."""
+
+    tokens: int = 0
+    expires_at: float = 0.0
+    # Tokens left in Redis when the batch was reserved
+    remaining: int = 0
+    reset_at: int = 0
+    denied_until: float = 0.0
+    retry_after: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class GCRARateLimiter:
+    """Redis-backed GCRA (token bucket) rate limiter.
+
+    One EVALSHA per decision and O(1) memory per key. With
+    ``local_batch > 1`` each worker reserves that many tokens per call and
+    admits requests from its reservation until it is used up or expires.
+    Denials are cached locally until the next token is due, so a client
+    hammering a closed bucket does not reach Redis either.
+    """
+
+    def __init__(self, redis: Redis, config: RateLimitConfig):
+        self.redis = redis
+        self.config = config
+        self._script: Any = redis.register_script(GCRA_SCRIPT)
+        self._local: OrderedDict[str, _LocalBudget] = OrderedDict()
+
+    @property
+    def emission_interval_ms(self) -> float:
+        """Milliseconds between two tokens."""
+        return self.config.window_seconds * 1000 / self.config.requests_per_window
+
+    async def acquire(self, key: str, tokens: int = 1) -> tuple[int, int, int, int]:
+        """Take up to ``tokens`` tokens in one atomic call.
+
+        Returns:
+            Tuple of (granted, remaining, retry_after_ms, reset_ms)
+        """
+        result = await self._script(
+            keys=[f"{key}:gcra"],
+            args=[self.emission_interval_ms, self.config.requests_per_window, tokens],
+        )
+        granted, remaining, retry_after_ms, reset_ms = (int(value) for value in result)
+        return granted, remaining, retry_after_ms, reset_ms
+
+    async def is_allowed(self, key: str) -> tuple[bool, dict[str, str]]:
+        """Check if request is allowed.
+
+        Returns:
+            Tuple of (allowed, headers) where headers contains
+            rate limit information.
+        """
+        if self.config.local_batch <= 1:
+            granted, remaining, retry_after_ms, reset_ms = await self.acquire(key)
+            reset_at = int(time.time() + reset_ms / 1000)
+            return self._decision(granted > 0, remaining, reset_at, retry_after_ms)
+
+        budget = self._local.get(key)
+        if budget is None:
+            budget = self._local[key] = _LocalBudget()
+            if len(self._local) > self.config.local_max_keys:
+                self._local.popitem(last=False)
+        else:
+            self._local.move_to_end(key)
+
+        decision = self._admit_locally(budget)
+        if decision is not None:
+            return decision
+        async with budget.lock:
+            # Another request may have refilled while this one waited
+            decision = self._admit_locally(budget)
+            if decision is not None:
+                return decision
+            granted, remaining, retry_after_ms, reset_ms = await self.acquire(
+                key, self.config.local_batch
+            )
+            now = time.monotonic()
+            budget.remaining = remaining
+            budget.reset_at = int(time.time() + reset_ms / 1000)
+            if granted == 0:
+                budget.tokens = 0
+                budget.denied_until = now + retry_after_ms / 1000
+                budget.retry_after = retry_after_ms
+                return self._decision(False, 0, budget.reset_at, retry_after_ms)
+            budget.tokens = granted - 1
+            budget.expires_at = now + self.config.local_ttl_seconds
+            return self._decision(True, remaining + budget.tokens, budget.reset_at, 0)
+
+    def _admit_locally(self, budget: _LocalBudget) -> tuple[bool, dict[str, str]] | None:
+        """Decide from the local reservation (None when Redis must be asked)."""
+        now = time.monotonic()
+        if budget.denied_until > now:
+            retry_after_ms = math.ceil((budget.denied_until - now) * 1000)
+            return self._decision(False, 0, budget.reset_at, retry_after_ms)
+        if budget.tokens > 0 and budget.expires_at > now:
+            budget.tokens -= 1
+            return self._decision(True, budget.remaining + budget.tokens, budget.reset_at, 0)
+        return None
+
+    def _decision(
+        self, allowed: bool, remaining: int, reset_at: int, retry_after_ms: int
+    ) -> tuple[bool, dict[str, str]]:
+        headers = {
+            "X-RateLimit-Limit": str(self.config.requests_per_window),
+            "X-RateLimit-Remaining": str(max(0, remaining)),
+            "X-RateLimit-Reset": str(reset_at),
+        }
+        if not allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(retry_after_ms / 1000)))
+        return allowed, headers
+
+
+class RateLimitMiddleware:
     """Rate limiting middleware with IP and token support.
 
     Features:
-    - Sliding window algorithm for accurate limiting
+    - GCRA (default) or sliding window algorithm
+    - Optional per-worker batch reservation of GCRA tokens
     - IP-based rate limiting for unauthenticated requests
     - Token-based rate limiting for authenticated requests
     - Bypass paths for health checks and metrics
@@ -102,30 +268,40 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     """
 
     def __init__(self, app: ASGIApp, config: RateLimitConfig | None = None) -> None:
-        super().__init__(app)
+        self.app = app
         self.config = config or RateLimitConfig()
-        self._limiter: SlidingWindowRateLimiter | None = None
+        self._limiter: RateLimiter | None = None
 
-    def _get_limiter(self, redis: Redis) -> SlidingWindowRateLimiter:
+    def _get_limiter(self, redis: Redis) -> RateLimiter:
         """Get or create the rate limiter with the given Redis client."""
         if self._limiter is None:
-            self._limiter = SlidingWindowRateLimiter(redis, self.config)
+            if self.config.algorithm == "sliding_window":
+                self._limiter = SlidingWindowRateLimiter(redis, self.config)
+            else:
+                self._limiter = GCRARateLimiter(redis, self.config)
         return self._limiter
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Apply rate limiting to request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Check bypass paths
-        path = request.url.path
+        path = scope["path"]
         if any(path.startswith(prefix) for prefix in self.config.bypass_prefixes):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Check bypass IPs
-        client_ip = self._get_client_ip(request)
+        request_headers = Headers(scope=scope)
+        client_ip = self._get_client_ip(scope, request_headers)
         if client_ip in self.config.bypass_ips:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get rate limit key
-        key = self._get_rate_limit_key(request)
+        key = self._get_rate_limit_key(request_headers, client_ip)
 
         try:
             # Get Redis lazily at request time
@@ -140,7 +316,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
             if settings.rate_limit_fail_mode == "closed":
                 # Fail-closed: reject requests when Redis is unavailable
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=503,
                     content={
                         "messages": [
@@ -153,11 +329,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     },
                     headers={"Retry-After": "30"},
                 )
+                await response(scope, receive, send)
+                return
             # Fail-open (default): allow request when Redis is unavailable
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         if not allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "messages": [
@@ -170,23 +349,27 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
                 headers=headers,
             )
+            await response(scope, receive, send)
+            return
 
         # Process request and add rate limit headers to response
-        response = await call_next(request)
-
-        for name, value in headers.items():
-            response.headers[name] = value
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers[name] = value
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_rate_limit_headers)
 
-    def _get_rate_limit_key(self, request: Request) -> str:
+    def _get_rate_limit_key(self, headers: Headers, client_ip: str) -> str:
         """Determine rate limit key from request.
 
         Uses token hash for authenticated requests,
         IP address for unauthenticated requests.
         """
         # Try API token first (from Authorization header)
-        auth_header = request.headers.get("authorization", "")
+        auth_header = headers.get("authorization", "")
         if auth_header.startswith("Bearer "):
             token = auth_header[7:]
             # Hash token for privacy
@@ -195,28 +378,28 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Fall back to IP address
         # Hash IP to prevent Redis key injection from malicious X-Forwarded-For headers
-        client_ip = self._get_client_ip(request)
         ip_hash = hashlib.sha256(client_ip.encode()).hexdigest()[:16]
         return f"ratelimit:ip:{ip_hash}"
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """Extract client IP, handling proxies.
 
         Checks standard proxy headers in order of preference.
         """
         # Check X-Forwarded-For (common for load balancers)
-        forwarded = request.headers.get("x-forwarded-for")
+        forwarded = headers.get("x-forwarded-for")
         if forwarded:
             # Take the first IP (original client)
             return forwarded.split(",")[0].strip()
 
         # Check X-Real-IP (nginx)
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # Fall back to direct client IP
-        if request.client:
-            return request.client.host
+        client: tuple[str, int] | None = scope.get("client")
+        if client:
+            return client[0]
 
         return "unknown"
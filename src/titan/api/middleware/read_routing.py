@@ -0,0 +1,68 @@
+"""Read replica routing middleware.
+
+Records whether a request may be served from a read replica and the
+client's consistency token, and returns a new token after writes.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from titan.persistence.db import get_engine
+from titan.persistence.replicas import (
+    CONSISTENCY_HEADER,
+    READ_METHODS,
+    ReadRouting,
+    format_lsn,
+    parse_lsn,
+    primary_lsn,
+    routing_var,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReadRoutingMiddleware:
+    """Middleware routing read-only requests to replicas.
+
+    GET/HEAD requests are marked read-only, so ``get_session`` hands out a
+    replica session. A client that sends ``X-Consistency-Token`` is only
+    served by a replica that has replayed that WAL position. Responses to
+    requests that committed on the primary carry a fresh token.
+
+    Runs as pure ASGI middleware, so the application executes in the same
+    task and sees the routing context variable directly.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        routing = ReadRouting(
+            read_only=scope["method"] in READ_METHODS,
+            min_lsn=parse_lsn(Headers(scope=scope).get(CONSISTENCY_HEADER)),
+        )
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start" and routing.wrote:
+                try:
+                    lsn = await primary_lsn(get_engine())
+                except Exception:
+                    logger.warning("Could not read the primary WAL position", exc_info=True)
+                    lsn = None
+                if lsn is not None:
+                    MutableHeaders(scope=message)[CONSISTENCY_HEADER] = format_lsn(lsn)
+            await send(message)
+
+        token = routing_var.set(routing)
+        try:
+            await self.app(scope, receive, send_with_token)
+        finally:
+            routing_var.reset(token)
@@ -12,14 +12,16 @@ Adds security headers to all responses per OWASP recommendations:
 
 from __future__ import annotations
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Middleware to add security headers to all responses.
 
+    The header set is computed once at construction and applied to each
+    ``http.response.start`` message (pure ASGI, no response buffering).
+
     Args:
         app: The ASGI application
         enable_hsts: Whether to add HSTS header (should only be enabled with HTTPS)
@@ -34,7 +36,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         enable_hsts: bool | None = None,
         hsts_max_age: int | None = None,  # 1 year
         hsts_include_subdomains: bool | None = None,
@@ -44,7 +46,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         x_frame_options: str = "DENY",
         referrer_policy: str = "strict-origin-when-cross-origin",
     ):
-        super().__init__(app)
+        self.app = app
         if (
             enable_hsts is None
             or hsts_max_age is None
@@ -90,33 +92,41 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         else:
             self._hsts_value = None
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Add security headers to the response."""
-        response = await call_next(request)
-
         # Always add these headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = self.x_frame_options
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = self.referrer_policy
+        headers = [
+            ("X-Content-Type-Options", "nosniff"),
+            ("X-Frame-Options", self.x_frame_options),
+            ("X-XSS-Protection", "1; mode=block"),
+            ("Referrer-Policy", self.referrer_policy),
+        ]
 
         # Optional HSTS (only enable with HTTPS)
         if self._hsts_value:
-            response.headers["Strict-Transport-Security"] = self._hsts_value
+            headers.append(("Strict-Transport-Security", self._hsts_value))
 
         # Optional Content-Security-Policy
         if self.csp_policy:
-            response.headers["Content-Security-Policy"] = self.csp_policy
+            headers.append(("Content-Security-Policy", self.csp_policy))
 
         # Optional Permissions-Policy
         if self.permissions_policy:
-            response.headers["Permissions-Policy"] = self.permissions_policy
+            headers.append(("Permissions-Policy", self.permissions_policy))
+
+        self._headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self._headers:
+                    headers[name] = value
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_security_headers)
 
 
 # Default CSP for API-only applications
@@ -37,9 +37,11 @@ from titan.api.attachment_utils import (
     clear_attachment_payload,
 )
 from titan.api.deps import (
+    cached_encoded_response,
     check_not_modified,
     check_precondition,
     decode_identifier,
+    encoded_json_response,
     json_response_with_etag,
     no_content_response,
 )
@@ -665,7 +667,9 @@ async def get_shell_by_id(
             not_modified = check_not_modified(if_none_match, etag)
             if not_modified:
                 return not_modified
-            return json_response_with_etag(doc_bytes, etag)
+            return await encoded_json_response(
+                request, cache, "aas", aas_identifier, doc_bytes, etag
+            )
 
     # Cache miss or slow path - get from database
     result = await repo.get_bytes_by_id(identifier)
@@ -684,13 +688,27 @@ async def get_shell_by_id(
 
     if is_fast_path(request):
         # Fast path - return bytes directly
-        return json_response_with_etag(doc_bytes, etag)
+        return await encoded_json_response(request, cache, "aas", aas_identifier, doc_bytes, etag)
     else:
-        # Slow path - apply projections
-        doc = orjson.loads(doc_bytes)
+        # Slow path - apply projections (unless a compressed projection is cached)
         modifiers = ProjectionModifiers(level=level, extent=extent, content=content)
+        cached_response = await cached_encoded_response(
+            request, cache, "aas", aas_identifier, etag, modifiers.variant
+        )
+        if cached_response:
+            return cached_response
+        doc = orjson.loads(doc_bytes)
         projected = apply_projection(doc, modifiers)
-        return json_response_with_etag(canonical_bytes(projected), etag)
+        return await encoded_json_response(
+            request,
+            cache,
+            "aas",
+            aas_identifier,
+            canonical_bytes(projected),
+            etag,
+            modifiers.variant,
+            check_cache=False,
+        )
 
 
 @router.put(
@@ -20,6 +20,7 @@ from titan.api.deps import (
     check_not_modified,
     check_precondition,
     decode_identifier,
+    encoded_json_response,
     json_response_with_etag,
 )
 from titan.api.errors import (
@@ -197,6 +198,7 @@ async def post_concept_description(
 )
 async def get_concept_description_by_id(
     cd_identifier: str,
+    request: Request,
     if_none_match: str | None = Header(None, alias="If-None-Match"),
     repo: ConceptDescriptionRepository = Depends(get_concept_description_repo),
     cache: RedisCache = Depends(get_cache),
@@ -210,7 +212,7 @@ async def get_concept_description_by_id(
         not_modified = check_not_modified(if_none_match, etag)
         if not_modified:
             return not_modified
-        return json_response_with_etag(doc_bytes, etag)
+        return await encoded_json_response(request, cache, "cd", cd_identifier, doc_bytes, etag)
 
     result = await repo.get_bytes_by_id(identifier)
     if result is None:
@@ -223,7 +225,7 @@ async def get_concept_description_by_id(
     if not_modified:
         return not_modified
 
-    return json_response_with_etag(doc_bytes, etag)
+    return await encoded_json_response(request, cache, "cd", cd_identifier, doc_bytes, etag)
 
 
 @router.put(
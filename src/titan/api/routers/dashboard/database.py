@@ -5,12 +5,13 @@ Provides visibility into:
 - Query performance metrics
 - Table statistics
 - Slow query analysis
+- Statement fingerprints and per-request query budgets (N+1 detection)
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
@@ -18,6 +19,11 @@ from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from titan.persistence.db import get_session
+from titan.persistence.instrumentation import (
+    get_pool_wait_stats,
+    get_route_query_stats,
+    get_statement_stats,
+)
 from titan.persistence.tables import (
     AasTable,
     AasxPackageTable,
@@ -70,6 +76,55 @@ class SlowQuery(BaseModel):
     rows: int
 
 
+class StatementStat(BaseModel):
+    """Statement fingerprint statistics recorded by this worker."""
+
+    fingerprint: str
+    statement: str
+    operation: str
+    table: str
+    calls: int
+    total_duration_ms: float
+    avg_duration_ms: float
+    p95_duration_ms: float
+    p99_duration_ms: float
+    max_duration_ms: float
+    rows: int
+    bytes_sent: int
+    bytes_received: int
+
+
+class RouteQueryBudget(BaseModel):
+    """Statements executed per request for one route."""
+
+    path: str
+    requests: int
+    avg_queries: float
+    max_queries: int
+    repeated_requests: int
+    worst_fingerprint: str | None = None
+    worst_statement: str | None = None
+    worst_repetitions: int = 0
+
+
+class PoolWaitStats(BaseModel):
+    """Connection pool checkout wait statistics."""
+
+    checkouts: int
+    avg_wait_ms: float
+    p95_wait_ms: float
+    p99_wait_ms: float
+    max_wait_ms: float
+
+
+class QueryBudgetReport(BaseModel):
+    """Per-route query budgets and pool wait times."""
+
+    timestamp: datetime
+    routes: list[RouteQueryBudget]
+    pool_wait: PoolWaitStats
+
+
 class DatabaseStats(BaseModel):
     """Complete database statistics."""
 
@@ -241,3 +296,89 @@ async def get_slow_queries(
     except Exception:
         # pg_stat_statements not enabled
         return []
+
+
+@router.get(
+    "/statements",
+    response_model=list[StatementStat],
+    dependencies=[Depends(require_permission(Permission.READ_AAS))],
+)
+async def get_statements(
+    limit: int = Query(default=20, le=100, description="Maximum number of statements to return"),
+    sort_by: Literal["total", "avg", "p99", "calls", "rows"] = Query(
+        default="total", description="Sort key"
+    ),
+) -> list[StatementStat]:
+    """Get the top statement fingerprints executed by this worker.
+
+    Unlike /slow-queries this does not need pg_stat_statements: statements
+    are timed by the engine instrumentation (see DB_INSTRUMENTATION).
+    """
+    keys = {
+        "total": lambda s: s.total_duration_ms,
+        "avg": lambda s: s.avg_duration_ms,
+        "p99": lambda s: s.sketch.quantile(0.99),
+        "calls": lambda s: s.calls,
+        "rows": lambda s: s.rows,
+    }
+    stats = sorted(get_statement_stats(), key=keys[sort_by], reverse=True)[:limit]
+    return [
+        StatementStat(
+            fingerprint=s.fingerprint,
+            statement=s.text[:500],
+            operation=s.operation,
+            table=s.table,
+            calls=s.calls,
+            total_duration_ms=round(s.total_duration_ms, 2),
+            avg_duration_ms=round(s.avg_duration_ms, 2),
+            p95_duration_ms=round(s.sketch.quantile(0.95), 2),
+            p99_duration_ms=round(s.sketch.quantile(0.99), 2),
+            max_duration_ms=round(s.max_duration_ms, 2),
+            rows=s.rows,
+            bytes_sent=s.bytes_sent,
+            bytes_received=s.bytes_received,
+        )
+        for s in stats
+    ]
+
+
+@router.get(
+    "/query-budget",
+    response_model=QueryBudgetReport,
+    dependencies=[Depends(require_permission(Permission.READ_AAS))],
+)
+async def get_query_budget(
+    limit: int = Query(default=20, le=100, description="Maximum number of routes to return"),
+) -> QueryBudgetReport:
+    """Get per-route statement counts, worst first.
+
+    Routes whose requests repeat one statement DB_REPEATED_QUERY_THRESHOLD
+    times or more are likely N+1 patterns; the repeated statement is shown.
+    """
+    routes = sorted(
+        get_route_query_stats(),
+        key=lambda r: (r.repeated_requests, r.avg_queries),
+        reverse=True,
+    )[:limit]
+
+    budgets: list[RouteQueryBudget] = []
+    for route in routes:
+        worst = get_statement_stats(route.worst_fingerprint) if route.worst_fingerprint else []
+        budgets.append(
+            RouteQueryBudget(
+                path=route.path,
+                requests=route.requests,
+                avg_queries=round(route.avg_queries, 2),
+                max_queries=route.max_queries,
+                repeated_requests=route.repeated_requests,
+                worst_fingerprint=route.worst_fingerprint,
+                worst_statement=worst[0].text[:500] if worst else None,
+                worst_repetitions=route.worst_repetitions,
+            )
+        )
+
+    return QueryBudgetReport(
+        timestamp=datetime.utcnow(),
+        routes=budgets,
+        pool_wait=PoolWaitStats(**get_pool_wait_stats()),
+    )
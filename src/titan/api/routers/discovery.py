@@ -12,10 +12,13 @@ Discovery allows finding AAS based on:
 - specificAssetIds: Domain-specific identifiers (name/value pairs)
 
 Returns a list of AAS identifiers (Base64URL encoded) matching the criteria.
+Asset-link lookups are answered from the normalized ``asset_links`` index
+with a single query per request.
 """
 
 from __future__ import annotations
 
+import base64
 from typing import Annotated
 
 import orjson
@@ -26,8 +29,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from titan.api.pagination import DEFAULT_LIMIT, LimitParam
 from titan.api.responses import json_bytes_response
+from titan.config import settings
 from titan.core.canonicalize import canonical_bytes
 from titan.core.ids import decode_id_from_b64url, encode_id_to_b64url
+from titan.persistence.asset_links import (
+    SOURCE_DESCRIPTOR,
+    SOURCE_SHELL,
+    AssetLinkIndex,
+    AssetLinkPair,
+    extract_asset_links,
+)
 from titan.persistence.db import get_session
 from titan.persistence.registry import AasDescriptorRepository
 from titan.persistence.tables import AasDescriptorTable
@@ -55,6 +66,19 @@ async def get_aas_descriptor_repo(
     return AasDescriptorRepository(session)
 
 
+async def _lookup_asset_links(
+    session: AsyncSession, links: list[AssetLinkPair], limit: int
+) -> list[str]:
+    """Resolve asset links to Base64URL-encoded AAS identifiers in one query."""
+    if not links:
+        return []
+    sources = [SOURCE_DESCRIPTOR]
+    if settings.discovery_include_shells:
+        sources.append(SOURCE_SHELL)
+    identifiers = await AssetLinkIndex(session).lookup(links, limit=limit, sources=sources)
+    return [encode_id_to_b64url(identifier) for identifier in identifiers]
+
+
 @router.get(
     "/shells",
     dependencies=[Depends(require_permission(Permission.READ_DESCRIPTOR))],
@@ -69,7 +93,6 @@ async def lookup_shells(
             description="List of asset identifiers to search for (Base64URL encoded JSON)",
         ),
     ] = None,
-    repo: AasDescriptorRepository = Depends(get_aas_descriptor_repo),
     session: AsyncSession = Depends(get_session),
 ) -> Response:
     """Look up AAS by asset identifiers.
@@ -94,15 +117,10 @@ async def lookup_shells(
         result = await session.execute(stmt)
         identifiers = [encode_id_to_b64url(row.identifier) for row in result.all()]
     else:
-        # Parse and search by asset IDs
-        identifiers = []
-        seen = set()
-
+        links: list[AssetLinkPair] = []
         for asset_id_b64 in asset_ids:
             # Decode Base64URL-encoded JSON
             try:
-                import base64
-
                 # Restore padding
                 padded = asset_id_b64 + "=" * ((4 - len(asset_id_b64) % 4) % 4)
                 json_bytes = base64.urlsafe_b64decode(padded.encode("ascii"))
@@ -110,31 +128,10 @@ async def lookup_shells(
             except Exception:
                 # Skip invalid asset IDs
                 continue
+            if isinstance(asset_id_obj, dict):
+                links.extend(extract_asset_links(asset_id_obj))
 
-            # Search by globalAssetId
-            if "globalAssetId" in asset_id_obj:
-                global_asset_id = asset_id_obj["globalAssetId"]
-                results = await repo.find_by_global_asset_id(global_asset_id, limit=limit)
-                for doc_bytes, _ in results:
-                    doc = orjson.loads(doc_bytes)
-                    aas_id = doc.get("id")
-                    if aas_id and aas_id not in seen:
-                        seen.add(aas_id)
-                        identifiers.append(encode_id_to_b64url(aas_id))
-
-            # Search by specificAssetIds
-            if "specificAssetIds" in asset_id_obj:
-                for specific_id in asset_id_obj.get("specificAssetIds", []):
-                    name = specific_id.get("name")
-                    value = specific_id.get("value")
-                    if name and value:
-                        results = await repo.find_by_specific_asset_id(name, value, limit=limit)
-                        for doc_bytes, _ in results:
-                            doc = orjson.loads(doc_bytes)
-                            aas_id = doc.get("id")
-                            if aas_id and aas_id not in seen:
-                                seen.add(aas_id)
-                                identifiers.append(encode_id_to_b64url(aas_id))
+        identifiers = await _lookup_asset_links(session, links, limit)
 
     response_data = {
         "result": identifiers,
@@ -171,8 +168,6 @@ async def lookup_submodels(
     if semantic_id:
         # Decode Base64URL-encoded semantic ID
         try:
-            import base64
-
             padded = semantic_id + "=" * ((4 - len(semantic_id) % 4) % 4)
             decoded_semantic_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
         except Exception:
@@ -219,7 +214,7 @@ async def search_shells_by_asset_link(
     request: Request,
     asset_links: list[AssetLink],
     limit: LimitParam = DEFAULT_LIMIT,
-    repo: AasDescriptorRepository = Depends(get_aas_descriptor_repo),
+    session: AsyncSession = Depends(get_session),
 ) -> Response:
     """Bulk search for AAS by asset links (IDTA-01002 SSP-002).
 
@@ -232,30 +227,9 @@ async def search_shells_by_asset_link(
             {"name": "serialNumber", "value": "SN12345"}
         ]
     """
-    identifiers: list[str] = []
-    seen: set[str] = set()
-
-    for asset_link in asset_links:
-        if asset_link.name == "globalAssetId":
-            # Search by global asset ID
-            results = await repo.find_by_global_asset_id(asset_link.value, limit=limit)
-            for doc_bytes, _ in results:
-                doc = orjson.loads(doc_bytes)
-                aas_id = doc.get("id")
-                if aas_id and aas_id not in seen:
-                    seen.add(aas_id)
-                    identifiers.append(encode_id_to_b64url(aas_id))
-        else:
-            # Search by specific asset ID
-            results = await repo.find_by_specific_asset_id(
-                asset_link.name, asset_link.value, limit=limit
-            )
-            for doc_bytes, _ in results:
-                doc = orjson.loads(doc_bytes)
-                aas_id = doc.get("id")
-                if aas_id and aas_id not in seen:
-                    seen.add(aas_id)
-                    identifiers.append(encode_id_to_b64url(aas_id))
+    identifiers = await _lookup_asset_links(
+        session, [(link.name, link.value) for link in asset_links], limit
+    )
 
     response_data = {
         "result": identifiers,
@@ -7,6 +7,9 @@ Provides federation management endpoints:
 - DELETE /federation/peers/{id}       - Unregister peer
 - GET  /federation/sync/status        - Current sync status
 - POST /federation/sync/now           - Trigger immediate sync
+- POST /federation/sync/changes       - Apply a batch of changes pushed by a peer
+- GET  /federation/sync/tree/{type}   - Hash-tree nodes for anti-entropy sync
+- GET  /federation/sync/tree/{type}/entries - (identifier, etag) pairs of leaf buckets
 - GET  /federation/conflicts          - List unresolved conflicts
 - POST /federation/conflicts/{id}/resolve - Resolve conflict
 """
@@ -18,11 +21,14 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from titan.cache import RedisCache, get_redis
+from titan.events import get_event_bus
 from titan.federation import (
     ConflictInfo,
     ConflictManager,
@@ -32,8 +38,11 @@ from titan.federation import (
     ResolutionStrategy,
     SyncMode,
 )
+from titan.federation.apply import ChangeBatchApplier, publish_applied_changes
+from titan.federation.merkle import MAX_PREFIXES_PER_REQUEST, TREE_DEPTH, DatabaseMerkleIndex
 from titan.federation.peer import PeerCapabilities
-from titan.persistence.db import get_session
+from titan.federation.wire import SUPPORTED_ENCODINGS, decode_body
+from titan.persistence.db import get_session, get_session_factory
 from titan.persistence.tables import FederationConflictTable, FederationSyncLogTable
 from titan.security.deps import require_permission
 from titan.security.rbac import Permission
@@ -46,6 +55,10 @@ router = APIRouter(prefix="/federation", tags=["Federation"])
 _peer_registry: PeerRegistry | None = None
 _conflict_manager: ConflictManager | None = None
 _federation_sync: FederationSync | None = None
+_merkle_index: DatabaseMerkleIndex | None = None
+
+# Upper bound on changes accepted in one bulk push
+MAX_CHANGE_BATCH_SIZE = 1000
 
 
 def get_peer_registry() -> PeerRegistry:
@@ -71,10 +84,19 @@ def get_federation_sync() -> FederationSync:
         _federation_sync = FederationSync(
             registry=get_peer_registry(),
             conflict_manager=get_conflict_manager(),
+            merkle_index=get_merkle_index(),
         )
     return _federation_sync
 
 
+def get_merkle_index() -> DatabaseMerkleIndex:
+    """Get or create the local hash-tree index singleton."""
+    global _merkle_index
+    if _merkle_index is None:
+        _merkle_index = DatabaseMerkleIndex(get_session_factory())
+    return _merkle_index
+
+
 # --------------------------------------------------------------------------
 # Request/Response Models
 # --------------------------------------------------------------------------
@@ -89,6 +111,10 @@ class PeerCapabilitiesModel(BaseModel):
     submodel_registry: bool = Field(default=False, alias="submodelRegistry")
     aasx_server: bool = Field(default=False, alias="aasxServer")
     read_only: bool = Field(default=False, alias="readOnly")
+    bulk_sync: bool = Field(default=False, alias="bulkSync")
+    merkle_sync: bool = Field(default=False, alias="merkleSync")
+    delta_sync: bool = Field(default=False, alias="deltaSync")
+    sync_encodings: list[str] = Field(default_factory=list, alias="syncEncodings")
 
     model_config = {"populate_by_name": True}
 
@@ -134,6 +160,16 @@ class ConflictResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class ChangeBatchRequest(BaseModel):
+    """Batch of changes pushed by a peer (``SyncChange.to_dict()`` format).
+
+    Update changes may carry a JSON Patch (``patch``) against ``baseEtag``
+    instead of the full ``doc``.
+    """
+
+    changes: list[dict[str, Any]] = Field(..., max_length=MAX_CHANGE_BATCH_SIZE)
+
+
 class ResolveConflictRequest(BaseModel):
     """Request to resolve a conflict."""
 
@@ -190,6 +226,10 @@ async def register_peer(
         caps.submodel_registry = request.capabilities.submodel_registry
         caps.aasx_server = request.capabilities.aasx_server
         caps.read_only = request.capabilities.read_only
+        caps.bulk_sync = request.capabilities.bulk_sync
+        caps.merkle_sync = request.capabilities.merkle_sync
+        caps.delta_sync = request.capabilities.delta_sync
+        caps.sync_encodings = request.capabilities.sync_encodings
 
     peer = Peer(
         id=peer_id,
@@ -310,6 +350,100 @@ async def trigger_sync(
     }
 
 
+@router.post(
+    "/sync/changes",
+    dependencies=[Depends(require_permission(Permission.ADMIN))],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ChangeBatchRequest.model_json_schema()}},
+        },
+        "x-delta-sync": True,
+        "x-sync-encodings": list(SUPPORTED_ENCODINGS),
+    },
+)
+async def apply_change_batch(
+    http_request: Request,
+    session: AsyncSession = Depends(get_session),
+) -> dict[str, Any]:
+    """Apply a batch of changes pushed by a federation peer.
+
+    All changes are applied in one transaction with a savepoint per change,
+    and the response reports a status per change ID. The body may be
+    zstd or gzip compressed (``Content-Encoding``). Patched updates whose
+    base no longer matches report ``base_mismatch`` so the sender can
+    resend the full document.
+    """
+    request = await _read_change_batch(http_request)
+    applier = ChangeBatchApplier(session)
+    results = await applier.apply(request.changes)
+    await session.commit()
+
+    cache = RedisCache(await get_redis())
+    await publish_applied_changes(results, cache, get_event_bus())
+
+    applied = sum(1 for r in results if r.status == "applied")
+    skipped = sum(1 for r in results if r.status == "skipped")
+
+    return {
+        "results": [r.to_dict() for r in results],
+        "applied": applied,
+        "skipped": skipped,
+        "failed": len(results) - applied - skipped,
+    }
+
+
+async def _read_change_batch(http_request: Request) -> ChangeBatchRequest:
+    """Decode and validate a possibly compressed change batch body."""
+    encoding = http_request.headers.get("content-encoding")
+    try:
+        body = decode_body(await http_request.body(), encoding)
+    except ValueError as e:
+        status_code = (
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            if str(e).startswith("Unsupported")
+            else status.HTTP_400_BAD_REQUEST
+        )
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+    try:
+        return ChangeBatchRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+@router.get(
+    "/sync/tree/{entity_type}",
+    dependencies=[Depends(require_permission(Permission.ADMIN))],
+)
+async def get_sync_tree_nodes(
+    entity_type: str,
+    prefix: list[str] = Query(default=[""], max_length=MAX_PREFIXES_PER_REQUEST),
+) -> dict[str, Any]:
+    """Get hash-tree nodes and their children for the given prefixes.
+
+    Peers walk the tree top-down starting at the root prefix ``""`` and only
+    request children of nodes whose hash or count differs from their own.
+    """
+    _validate_tree_request(entity_type, prefix, max_length=TREE_DEPTH)
+    nodes = await get_merkle_index().nodes(entity_type, prefix)
+    return {"entityType": entity_type, "depth": TREE_DEPTH, "nodes": nodes}
+
+
+@router.get(
+    "/sync/tree/{entity_type}/entries",
+    dependencies=[Depends(require_permission(Permission.ADMIN))],
+)
+async def get_sync_tree_entries(
+    entity_type: str,
+    bucket: list[str] = Query(..., max_length=MAX_PREFIXES_PER_REQUEST),
+) -> dict[str, Any]:
+    """List identifier -> etag for all entities in the given leaf buckets."""
+    _validate_tree_request(entity_type, bucket, max_length=TREE_DEPTH, exact=True)
+    entries = await get_merkle_index().bucket_entries(entity_type, bucket)
+    return {"entityType": entity_type, "entries": entries, "count": len(entries)}
+
+
 @router.get(
     "/sync/history",
     dependencies=[Depends(require_permission(Permission.ADMIN))],
@@ -577,6 +711,27 @@ async def resolve_all_conflicts(
 # --------------------------------------------------------------------------
 
 
+def _validate_tree_request(
+    entity_type: str,
+    prefixes: list[str],
+    max_length: int,
+    exact: bool = False,
+) -> None:
+    """Validate entity type and hex prefixes of a hash-tree request."""
+    if entity_type not in ("aas", "submodel", "concept_description"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown entity type: {entity_type}",
+        )
+    for prefix in prefixes:
+        valid_length = len(prefix) == max_length if exact else len(prefix) <= max_length
+        if not valid_length or any(c not in "0123456789abcdef" for c in prefix):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid tree prefix: {prefix!r}",
+            )
+
+
 def _peer_to_response(peer: Peer) -> PeerResponse:
     """Convert Peer to response model."""
     return PeerResponse(
@@ -591,6 +746,10 @@ def _peer_to_response(peer: Peer) -> PeerResponse:
             submodelRegistry=peer.capabilities.submodel_registry,
             aasxServer=peer.capabilities.aasx_server,
             readOnly=peer.capabilities.read_only,
+            bulkSync=peer.capabilities.bulk_sync,
+            merkleSync=peer.capabilities.merkle_sync,
+            deltaSync=peer.capabilities.delta_sync,
+            syncEncodings=peer.capabilities.sync_encodings,
         ),
         lastSeen=peer.last_seen.isoformat() if peer.last_seen else None,
         lastSync=peer.last_sync.isoformat() if peer.last_sync else None,
@@ -1,7 +1,7 @@
 """API router for profiling endpoints.
 
 Provides debug endpoints for:
-- CPU profiling statistics
+- On-demand sampling CPU profiles (collapsed stacks / speedscope)
 - Memory usage snapshots
 - Request timing statistics
 - Async task counts
@@ -15,15 +15,20 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, Response
 from pydantic import BaseModel
 
 from titan.config import settings
 from titan.observability.profiling import (
+    EndpointStats,
     get_collector,
     get_memory_snapshot,
+    load_cluster_endpoint_stats,
 )
-from titan.security.deps import require_permission_if_public
+from titan.observability.sampler import SamplerBusyError, profile_cpu
+from titan.security.deps import require_permission, require_permission_if_public
 from titan.security.rbac import Permission
 
 router = APIRouter(
@@ -73,6 +78,10 @@ class EndpointStatsResponse(BaseModel):
     avg_duration_ms: float
     min_duration_ms: float
     max_duration_ms: float
+    p50_duration_ms: float
+    p90_duration_ms: float
+    p95_duration_ms: float
+    p99_duration_ms: float
     error_count: int
     error_rate: float
 
@@ -82,6 +91,8 @@ class EndpointListResponse(BaseModel):
 
     endpoints: list[EndpointStatsResponse]
     count: int
+    scope: str = "local"
+    window_seconds: float | None = None
 
 
 class MemorySnapshotResponse(BaseModel):
@@ -103,54 +114,118 @@ async def get_profile_stats() -> ProfileStatsResponse:
     return ProfileStatsResponse.from_stats(stats.to_dict())
 
 
+def _endpoint_response(stat: EndpointStats, recent: bool) -> EndpointStatsResponse:
+    error_rate = stat.error_count / stat.request_count if stat.request_count > 0 else 0.0
+    sketch = stat.recent.merged() if recent else stat.sketch
+    return EndpointStatsResponse(
+        path=stat.path,
+        method=stat.method,
+        request_count=stat.request_count,
+        avg_duration_ms=round(stat.avg_duration_ms, 2),
+        min_duration_ms=(
+            round(stat.min_duration_ms, 2) if stat.min_duration_ms != float("inf") else 0.0
+        ),
+        max_duration_ms=round(stat.max_duration_ms, 2),
+        p50_duration_ms=round(sketch.quantile(0.50), 2),
+        p90_duration_ms=round(sketch.quantile(0.90), 2),
+        p95_duration_ms=round(sketch.quantile(0.95), 2),
+        p99_duration_ms=round(sketch.quantile(0.99), 2),
+        error_count=stat.error_count,
+        error_rate=round(error_rate, 4),
+    )
+
+
 @router.get("/endpoints", response_model=EndpointListResponse)
 async def get_endpoint_stats(
     sort_by: str = Query(
         "request_count",
-        description="Sort by: request_count, avg_duration_ms, error_count",
+        description="Sort by: request_count, avg_duration_ms, p99_duration_ms, error_count",
     ),
     limit: int = Query(50, ge=1, le=500, description="Maximum endpoints to return"),
+    recent: bool = Query(
+        False, description="Percentiles over the sliding window instead of since reset"
+    ),
+    cluster: bool = Query(
+        False, description="Merge the sketches published by all instances (requires Redis)"
+    ),
 ) -> EndpointListResponse:
     """Get per-endpoint statistics.
 
-    Shows request counts, timing, and error rates for each endpoint.
+    Shows request counts, timing percentiles, and error rates for each
+    endpoint. With ``cluster=true`` the snapshots that all instances
+    publish every PROFILE_SNAPSHOT_INTERVAL seconds are merged.
     """
-    collector = get_collector()
-    endpoint_stats = collector.get_endpoint_stats()
+    if cluster:
+        endpoint_stats = await load_cluster_endpoint_stats()
+    else:
+        endpoint_stats = get_collector().get_endpoint_stats()
 
     # Convert to response format
-    endpoints = []
-    for stat in endpoint_stats:
-        error_rate = stat.error_count / stat.request_count if stat.request_count > 0 else 0.0
-        endpoints.append(
-            EndpointStatsResponse(
-                path=stat.path,
-                method=stat.method,
-                request_count=stat.request_count,
-                avg_duration_ms=round(stat.avg_duration_ms, 2),
-                min_duration_ms=(
-                    round(stat.min_duration_ms, 2) if stat.min_duration_ms != float("inf") else 0.0
-                ),
-                max_duration_ms=round(stat.max_duration_ms, 2),
-                error_count=stat.error_count,
-                error_rate=round(error_rate, 4),
-            )
-        )
+    endpoints = [_endpoint_response(stat, recent) for stat in endpoint_stats]
 
     # Sort
     if sort_by == "avg_duration_ms":
         endpoints.sort(key=lambda e: e.avg_duration_ms, reverse=True)
+    elif sort_by == "p99_duration_ms":
+        endpoints.sort(key=lambda e: e.p99_duration_ms, reverse=True)
     elif sort_by == "error_count":
         endpoints.sort(key=lambda e: e.error_count, reverse=True)
     else:
         endpoints.sort(key=lambda e: e.request_count, reverse=True)
 
+    window = endpoint_stats[0].recent.span_seconds if recent and endpoint_stats else None
     return EndpointListResponse(
         endpoints=endpoints[:limit],
         count=len(endpoints),
+        scope="cluster" if cluster else "local",
+        window_seconds=window,
     )
 
 
+@router.post(
+    "/cpu",
+    dependencies=[Depends(require_permission(Permission.ADMIN))],
+    response_class=Response,
+)
+async def record_cpu_profile(
+    seconds: float = Query(10.0, gt=0, le=300, description="Recording duration"),
+    interval_ms: float = Query(5.0, ge=1, le=1000, description="Sampling interval"),
+    output: str = Query(
+        "collapsed",
+        alias="format",
+        pattern="^(collapsed|speedscope)$",
+        description="collapsed (folded stacks) or speedscope (JSON)",
+    ),
+    mode: str | None = Query(
+        None,
+        pattern="^(signal|thread)$",
+        description="signal (CPU time, SIGPROF) or thread (wall time); default signal",
+    ),
+) -> Response:
+    """Record a CPU profile of this worker for ``seconds``.
+
+    Samples the event loop thread while the worker keeps serving traffic
+    and returns the aggregated stacks, labelled with route and asyncio
+    task. Always requires the admin permission. Only one profile can be
+    recorded at a time per worker (409 otherwise).
+    """
+    try:
+        sampler = await profile_cpu(seconds, interval=interval_ms / 1000, mode=mode)
+    except SamplerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    headers = {"X-Profile-Samples": str(sampler.samples), "X-Profile-Mode": sampler.mode}
+    if output == "speedscope":
+        return Response(
+            orjson.dumps(sampler.to_speedscope(name=f"titan-aas {settings.instance_id}")),
+            media_type="application/json",
+            headers=headers,
+        )
+    return PlainTextResponse(sampler.to_collapsed(), headers=headers)
+
+
 @router.get("/memory")
 async def get_memory_stats() -> dict[str, Any]:
     """Get memory usage snapshot.
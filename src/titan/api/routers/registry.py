@@ -17,6 +17,9 @@ All identifiers in path segments are Base64URL encoded per IDTA spec.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Protocol, TypeVar
+
 import orjson
 from fastapi import APIRouter, Depends, Header, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -568,6 +571,52 @@ async def delete_nested_submodel_descriptor(
 # =============================================================================
 
 
+DescriptorT = TypeVar("DescriptorT", AssetAdministrationShellDescriptor, SubmodelDescriptor)
+_DescriptorT_contra = TypeVar(
+    "_DescriptorT_contra",
+    AssetAdministrationShellDescriptor,
+    SubmodelDescriptor,
+    contravariant=True,
+)
+
+
+class _DescriptorRepository(Protocol[_DescriptorT_contra]):
+    """Write operations shared by the AAS and Submodel descriptor repositories."""
+
+    async def existing_identifiers(self, identifiers: Sequence[str]) -> set[str]: ...
+
+    async def create_many(self, descriptors: Sequence[_DescriptorT_contra]) -> set[str]: ...
+
+    async def update(
+        self, identifier: str, descriptor: _DescriptorT_contra
+    ) -> tuple[bytes, str] | None: ...
+
+
+async def _bulk_upsert(
+    repo: _DescriptorRepository[DescriptorT],
+    descriptors: Sequence[DescriptorT],
+) -> tuple[int, int]:
+    """Create or update descriptors with set-based statements.
+
+    One query finds the existing identifiers, new descriptors are written
+    with multi-row inserts and only existing ones are updated row by row.
+    When an identifier repeats within the batch, the last descriptor wins.
+
+    Returns:
+        Tuple of (created, updated) counts
+    """
+    latest = {descriptor.id: descriptor for descriptor in descriptors}
+    existing = await repo.existing_identifiers(list(latest))
+    inserted = await repo.create_many(
+        [descriptor for identifier, descriptor in latest.items() if identifier not in existing]
+    )
+    for identifier, descriptor in latest.items():
+        # Existing rows, plus rows created concurrently after the pre-check
+        if identifier not in inserted:
+            await repo.update(identifier, descriptor)
+    return len(inserted), len(descriptors) - len(inserted)
+
+
 @router.post("/shell-descriptors/$bulk", status_code=201)
 async def bulk_create_shell_descriptors(
     descriptors: list[AssetAdministrationShellDescriptor],
@@ -579,17 +628,7 @@ async def bulk_create_shell_descriptors(
     Creates new descriptors or updates existing ones.
     Returns a summary of created and updated counts.
     """
-    created = 0
-    updated = 0
-
-    for descriptor in descriptors:
-        if await repo.exists(descriptor.id):
-            await repo.update(descriptor.id, descriptor)
-            updated += 1
-        else:
-            await repo.create(descriptor)
-            created += 1
-
+    created, updated = await _bulk_upsert(repo, descriptors)
     await session.commit()
 
     result = {
@@ -616,15 +655,8 @@ async def bulk_delete_shell_descriptors(
     Accepts a list of identifiers (not Base64URL encoded).
     Returns a summary of deleted and not found counts.
     """
-    deleted = 0
-    not_found = 0
-
-    for identifier in identifiers:
-        if await repo.delete(identifier):
-            deleted += 1
-        else:
-            not_found += 1
-
+    deleted = len(await repo.delete_many(list(dict.fromkeys(identifiers))))
+    not_found = len(identifiers) - deleted
     await session.commit()
 
     result = {
@@ -844,17 +876,7 @@ async def bulk_create_submodel_descriptors(
     Creates new descriptors or updates existing ones.
     Returns a summary of created and updated counts.
     """
-    created = 0
-    updated = 0
-
-    for descriptor in descriptors:
-        if await repo.exists(descriptor.id):
-            await repo.update(descriptor.id, descriptor)
-            updated += 1
-        else:
-            await repo.create(descriptor)
-            created += 1
-
+    created, updated = await _bulk_upsert(repo, descriptors)
     await session.commit()
 
     result = {
@@ -881,15 +903,8 @@ async def bulk_delete_submodel_descriptors(
     Accepts a list of identifiers (not Base64URL encoded).
     Returns a summary of deleted and not found counts.
     """
-    deleted = 0
-    not_found = 0
-
-    for identifier in identifiers:
-        if await repo.delete(identifier):
-            deleted += 1
-        else:
-            not_found += 1
-
+    deleted = len(await repo.delete_many(list(dict.fromkeys(identifiers))))
+    not_found = len(identifiers) - deleted
     await session.commit()
 
     result = {
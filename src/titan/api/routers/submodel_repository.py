@@ -45,9 +45,11 @@ from titan.api.attachment_utils import (
     clear_attachment_payload,
 )
 from titan.api.deps import (
+    cached_encoded_response,
     check_not_modified,
     check_precondition,
     decode_identifier,
+    encoded_json_response,
     json_response_with_etag,
     no_content_response,
 )
@@ -527,7 +529,9 @@ async def get_submodel_by_id(
             not_modified = check_not_modified(if_none_match, etag)
             if not_modified:
                 return not_modified
-            return json_response_with_etag(doc_bytes, etag)
+            return await encoded_json_response(
+                request, cache, "sm", submodel_identifier, doc_bytes, etag
+            )
 
     # Cache miss or slow path
     result = await repo.get_bytes_by_id(identifier)
@@ -542,12 +546,28 @@ async def get_submodel_by_id(
         return not_modified
 
     if is_fast_path(request):
-        return json_response_with_etag(doc_bytes, etag)
+        return await encoded_json_response(
+            request, cache, "sm", submodel_identifier, doc_bytes, etag
+        )
     else:
-        doc = orjson.loads(doc_bytes)
         modifiers = ProjectionModifiers(level=level, extent=extent, content=content)
+        cached_response = await cached_encoded_response(
+            request, cache, "sm", submodel_identifier, etag, modifiers.variant
+        )
+        if cached_response:
+            return cached_response
+        doc = orjson.loads(doc_bytes)
         projected = apply_projection(doc, modifiers)
-        return json_response_with_etag(canonical_bytes(projected), etag)
+        return await encoded_json_response(
+            request,
+            cache,
+            "sm",
+            submodel_identifier,
+            canonical_bytes(projected),
+            etag,
+            modifiers.variant,
+            check_cache=False,
+        )
 
 
 @router.put(
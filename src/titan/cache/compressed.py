@@ -0,0 +1,112 @@
+"""Content-encoding negotiation and compression for cached documents.
+
+Large documents served from the cache used to be compressed again on every
+request. Compressed variants are instead stored next to the canonical
+bytes, keyed by ETag and encoding, so a cache hit can be returned with its
+``Content-Encoding`` directly.
+
+Supported encodings, in server preference order:
+- br (requires ``brotli``)
+- zstd (requires ``zstandard``)
+- gzip (always available)
+
+Example:
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    if encoding:
+        body = compress(doc_bytes, encoding)
+"""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import Sequence
+
+# Optional codecs; gzip is always available
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+def _available_encodings() -> tuple[str, ...]:
+    encodings: list[str] = []
+    if BROTLI_AVAILABLE:
+        encodings.append("br")
+    if ZSTD_AVAILABLE:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return tuple(encodings)
+
+
+# Encodings this process can produce, best first
+SUPPORTED_ENCODINGS = _available_encodings()
+
+
+def negotiate_encoding(accept_encoding: str, supported: Sequence[str] | None = None) -> str | None:
+    """Pick the encoding to use for a response.
+
+    Honours quality values (``gzip;q=0.5``), ``q=0`` exclusions and the
+    ``*`` wildcard. Ties are broken by server preference.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header
+        supported: Candidate encodings, best first (default: all available)
+
+    Returns:
+        The chosen encoding, or None to send the identity representation
+    """
+    candidates = SUPPORTED_ENCODINGS if supported is None else tuple(supported)
+    if not accept_encoding or not candidates:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in candidates:
+        quality = weights.get(encoding, wildcard)
+        if quality > best_quality:
+            best = encoding
+            best_quality = quality
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int = 6) -> bytes:
+    """Compress data with the given encoding.
+
+    ``level`` is clamped to each codec's range (gzip 9, brotli 11, zstd 22).
+
+    Raises:
+        ValueError: If the encoding is not supported in this process
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=min(level, 9), mtime=0)
+    if encoding == "br" and BROTLI_AVAILABLE:
+        return bytes(brotli.compress(data, quality=min(level, 11)))
+    if encoding == "zstd" and ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=min(level, 22)).compress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
@@ -6,7 +6,10 @@ Where:
 - prefix: "titan" (namespace for multi-tenant Redis)
 - entity_type: "aas", "sm" (submodel), "cd" (concept description)
 - identifier_b64: Base64URL encoded identifier
-- variant: "bytes" (canonical JSON), "etag", etc.
+- variant: "bytes" (canonical JSON), "etag", "enc" (compressed), etc.
+
+With ENABLE_TENANT_ISOLATION, keys of tenants other than the default tenant
+are scoped with a TenantCacheKey segment: titan:tenant:{tenant}:{entity_type}:...
 """
 
 from __future__ import annotations
@@ -14,6 +17,10 @@ from __future__ import annotations
 import base64
 from typing import Literal
 
+from titan.config import settings
+from titan.tenancy.context import DEFAULT_TENANT, get_current_tenant
+from titan.tenancy.isolation import TenantCacheKey
+
 EntityType = Literal["aas", "sm", "cd", "aas_desc", "sm_desc"]
 
 
@@ -22,35 +29,65 @@ class CacheKeys:
 
     PREFIX = "titan"
 
+    @classmethod
+    def namespace(cls) -> str:
+        """Key namespace of the current tenant."""
+        if settings.enable_tenant_isolation:
+            tenant = get_current_tenant()
+            if tenant != DEFAULT_TENANT:
+                return f"{cls.PREFIX}:{TenantCacheKey.build(tenant_id=tenant)}"
+        return cls.PREFIX
+
     @classmethod
     def aas_bytes(cls, identifier_b64: str) -> str:
         """Key for AAS canonical bytes."""
-        return f"{cls.PREFIX}:aas:{identifier_b64}:bytes"
+        return f"{cls.namespace()}:aas:{identifier_b64}:bytes"
 
     @classmethod
     def aas_etag(cls, identifier_b64: str) -> str:
         """Key for AAS ETag."""
-        return f"{cls.PREFIX}:aas:{identifier_b64}:etag"
+        return f"{cls.namespace()}:aas:{identifier_b64}:etag"
 
     @classmethod
     def submodel_bytes(cls, identifier_b64: str) -> str:
         """Key for Submodel canonical bytes."""
-        return f"{cls.PREFIX}:sm:{identifier_b64}:bytes"
+        return f"{cls.namespace()}:sm:{identifier_b64}:bytes"
 
     @classmethod
     def submodel_etag(cls, identifier_b64: str) -> str:
         """Key for Submodel ETag."""
-        return f"{cls.PREFIX}:sm:{identifier_b64}:etag"
+        return f"{cls.namespace()}:sm:{identifier_b64}:etag"
 
     @classmethod
     def concept_description_bytes(cls, identifier_b64: str) -> str:
         """Key for ConceptDescription canonical bytes."""
-        return f"{cls.PREFIX}:cd:{identifier_b64}:bytes"
+        return f"{cls.namespace()}:cd:{identifier_b64}:bytes"
 
     @classmethod
     def concept_description_etag(cls, identifier_b64: str) -> str:
         """Key for ConceptDescription ETag."""
-        return f"{cls.PREFIX}:cd:{identifier_b64}:etag"
+        return f"{cls.namespace()}:cd:{identifier_b64}:etag"
+
+    @classmethod
+    def compressed(
+        cls,
+        entity_type: EntityType,
+        identifier_b64: str,
+        etag: str,
+        encoding: str,
+        variant: str = "",
+    ) -> str:
+        """Key for a compressed representation of a cached document.
+
+        Keyed by ETag, so variants of an older revision are never served and
+        simply expire. ``variant`` distinguishes projections (empty for the
+        full document) and is encoded to avoid delimiter collisions.
+        """
+        encoded_variant = cls._encode_component(variant)
+        return (
+            f"{cls.namespace()}:{entity_type}:{identifier_b64}"
+            f":enc:{encoded_variant}:{encoding}:{etag}"
+        )
 
     @classmethod
     def invalidation_pattern(
@@ -64,8 +101,8 @@ class CacheKeys:
                 for that specific entity. When omitted, matches all keys for the type.
         """
         if identifier_b64:
-            return f"{cls.PREFIX}:{entity_type}:{identifier_b64}:*"
-        return f"{cls.PREFIX}:{entity_type}:*"
+            return f"{cls.namespace()}:{entity_type}:{identifier_b64}:*"
+        return f"{cls.namespace()}:{entity_type}:*"
 
     @classmethod
     def submodel_element_value(cls, submodel_b64: str, id_short_path: str) -> str:
@@ -75,7 +112,7 @@ class CacheKeys:
         The idShort path is encoded to avoid delimiter collisions.
         """
         encoded_path = cls._encode_component(id_short_path)
-        return f"{cls.PREFIX}:sm:{submodel_b64}:elem:{encoded_path}:value"
+        return f"{cls.namespace()}:sm:{submodel_b64}:elem:{encoded_path}:value"
 
     @classmethod
     def _encode_component(cls, value: str) -> str:
@@ -95,9 +132,17 @@ class CacheKeys:
         if len(parts) < 4 or parts[0] != cls.PREFIX:
             return None
 
+        tenant: dict[str, str] = {}
+        if parts[1] == TenantCacheKey.PREFIX:
+            if len(parts) < 6:
+                return None
+            tenant = {"tenant": parts[2]}
+            parts = [parts[0], *parts[3:]]
+
         return {
             "prefix": parts[0],
             "entity_type": parts[1],
             "identifier_b64": parts[2],
             "variant": parts[3] if len(parts) > 3 else "",
+            **tenant,
         }
@@ -2,17 +2,26 @@
 
 Provides async Redis operations for caching canonical bytes.
 Uses redis-py async client for connection pooling.
+
+Document writes count against the current tenant's cache quota
+(ENABLE_TENANT_ADMISSION); writes over quota are skipped.
+
+Compressed representations (br/zstd/gzip) of cached documents are stored
+under ETag-scoped keys, either lazily on the first compressed read or
+eagerly when the document is cached (CACHE_PRECOMPRESS_ENCODINGS).
 """
 
 from __future__ import annotations
 
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
 from typing import TYPE_CHECKING, cast
 
 import redis.asyncio as redis
 
-from titan.cache.keys import CacheKeys
+from titan.cache.compressed import SUPPORTED_ENCODINGS, compress
+from titan.cache.keys import CacheKeys, EntityType
 from titan.config import settings
+from titan.tenancy.admission import charge_tenant_cache
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -82,7 +91,15 @@ class RedisCache:
 
         return (doc_bytes, etag.decode() if isinstance(etag, bytes) else etag)
 
-    async def _set_pair(self, key_bytes: str, key_etag: str, doc_bytes: bytes, etag: str) -> None:
+    async def _set_pair(
+        self,
+        key_bytes: str,
+        key_etag: str,
+        doc_bytes: bytes,
+        etag: str,
+        extra: Sequence[tuple[str, bytes]] = (),
+        tenant: str | None = None,
+    ) -> None:
         """Set cached bytes and ETag pair using pipeline.
 
         Args:
@@ -90,12 +107,70 @@ class RedisCache:
             key_etag: Redis key for ETag
             doc_bytes: Document bytes to cache
             etag: ETag string to cache
+            extra: Additional (key, value) pairs written in the same pipeline
+            tenant: Tenant charged for the write (defaults to the current tenant)
         """
+        size = len(doc_bytes) + sum(len(value) for _, value in extra)
+        if not charge_tenant_cache(size, tenant):
+            return
         async with self.client.pipeline() as pipe:
             pipe.setex(key_bytes, self.ttl, doc_bytes)
             pipe.setex(key_etag, self.ttl, etag)
+            for key, value in extra:
+                pipe.setex(key, self.ttl, value)
             await pipe.execute()
 
+    def _precompressed(
+        self, entity_type: EntityType, identifier_b64: str, doc_bytes: bytes, etag: str
+    ) -> list[tuple[str, bytes]]:
+        """Compressed variants to write eagerly alongside a document."""
+        if not settings.cache_precompress_encodings:
+            return []
+        if len(doc_bytes) < settings.compression_min_size:
+            return []
+        variants: list[tuple[str, bytes]] = []
+        for encoding in settings.cache_precompress_encodings.split(","):
+            encoding = encoding.strip().lower()
+            if encoding in SUPPORTED_ENCODINGS:
+                variants.append(
+                    (
+                        CacheKeys.compressed(entity_type, identifier_b64, etag, encoding),
+                        compress(doc_bytes, encoding, settings.compression_level),
+                    )
+                )
+        return variants
+
+    # -------------------------------------------------------------------------
+    # Compressed representations
+    # -------------------------------------------------------------------------
+
+    async def get_compressed(
+        self,
+        entity_type: EntityType,
+        identifier_b64: str,
+        etag: str,
+        encoding: str,
+        variant: str = "",
+    ) -> bytes | None:
+        """Get a cached compressed representation of a document revision."""
+        key = CacheKeys.compressed(entity_type, identifier_b64, etag, encoding, variant)
+        return cast(bytes | None, await self.client.get(key))
+
+    async def set_compressed(
+        self,
+        entity_type: EntityType,
+        identifier_b64: str,
+        etag: str,
+        encoding: str,
+        data: bytes,
+        variant: str = "",
+    ) -> None:
+        """Cache a compressed representation of a document revision."""
+        if not charge_tenant_cache(len(data)):
+            return
+        key = CacheKeys.compressed(entity_type, identifier_b64, etag, encoding, variant)
+        await self.client.setex(key, self.ttl, data)
+
     # -------------------------------------------------------------------------
     # AAS caching
     # -------------------------------------------------------------------------
@@ -111,13 +186,17 @@ class RedisCache:
             CacheKeys.aas_etag(identifier_b64),
         )
 
-    async def set_aas(self, identifier_b64: str, doc_bytes: bytes, etag: str) -> None:
-        """Cache AAS bytes and ETag."""
+    async def set_aas(
+        self, identifier_b64: str, doc_bytes: bytes, etag: str, tenant: str | None = None
+    ) -> None:
+        """Cache AAS bytes and ETag, charged to ``tenant`` when given."""
         await self._set_pair(
             CacheKeys.aas_bytes(identifier_b64),
             CacheKeys.aas_etag(identifier_b64),
             doc_bytes,
             etag,
+            self._precompressed("aas", identifier_b64, doc_bytes, etag),
+            tenant,
         )
 
     async def delete_aas(self, identifier_b64: str) -> None:
@@ -126,6 +205,35 @@ class RedisCache:
         key_etag = CacheKeys.aas_etag(identifier_b64)
         await self.client.delete(key_bytes, key_etag)
 
+    async def set_aas_many(self, items: Sequence[tuple[str, bytes, str]]) -> None:
+        """Cache many AAS in one pipeline.
+
+        Args:
+            items: (identifier_b64, doc_bytes, etag) tuples
+        """
+        if not items:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            for identifier_b64, doc_bytes, etag in items:
+                variants = self._precompressed("aas", identifier_b64, doc_bytes, etag)
+                if not charge_tenant_cache(len(doc_bytes) + sum(len(v) for _, v in variants)):
+                    continue
+                pipe.setex(CacheKeys.aas_bytes(identifier_b64), self.ttl, doc_bytes)
+                pipe.setex(CacheKeys.aas_etag(identifier_b64), self.ttl, etag)
+                for key, value in variants:
+                    pipe.setex(key, self.ttl, value)
+            await pipe.execute()
+
+    async def delete_aas_many(self, identifiers_b64: Sequence[str]) -> None:
+        """Delete many cached AAS with one command."""
+        if not identifiers_b64:
+            return
+        keys: list[str] = []
+        for identifier_b64 in identifiers_b64:
+            keys.append(CacheKeys.aas_bytes(identifier_b64))
+            keys.append(CacheKeys.aas_etag(identifier_b64))
+        await self.client.delete(*keys)
+
     # -------------------------------------------------------------------------
     # Submodel caching
     # -------------------------------------------------------------------------
@@ -137,13 +245,17 @@ class RedisCache:
             CacheKeys.submodel_etag(identifier_b64),
         )
 
-    async def set_submodel(self, identifier_b64: str, doc_bytes: bytes, etag: str) -> None:
-        """Cache Submodel bytes and ETag."""
+    async def set_submodel(
+        self, identifier_b64: str, doc_bytes: bytes, etag: str, tenant: str | None = None
+    ) -> None:
+        """Cache Submodel bytes and ETag, charged to ``tenant`` when given."""
         await self._set_pair(
             CacheKeys.submodel_bytes(identifier_b64),
             CacheKeys.submodel_etag(identifier_b64),
             doc_bytes,
             etag,
+            self._precompressed("sm", identifier_b64, doc_bytes, etag),
+            tenant,
         )
 
     async def delete_submodel(self, identifier_b64: str) -> None:
@@ -164,14 +276,16 @@ class RedisCache:
         )
 
     async def set_concept_description(
-        self, identifier_b64: str, doc_bytes: bytes, etag: str
+        self, identifier_b64: str, doc_bytes: bytes, etag: str, tenant: str | None = None
     ) -> None:
-        """Cache ConceptDescription bytes and ETag."""
+        """Cache ConceptDescription bytes and ETag, charged to ``tenant`` when given."""
         await self._set_pair(
             CacheKeys.concept_description_bytes(identifier_b64),
             CacheKeys.concept_description_etag(identifier_b64),
             doc_bytes,
             etag,
+            self._precompressed("cd", identifier_b64, doc_bytes, etag),
+            tenant,
         )
 
     async def delete_concept_description(self, identifier_b64: str) -> None:
@@ -221,7 +335,7 @@ class RedisCache:
         Called when a Submodel is updated to ensure cache consistency.
         Returns the number of keys deleted.
         """
-        pattern = f"{CacheKeys.PREFIX}:sm:{submodel_b64}:elem:*"
+        pattern = f"{CacheKeys.namespace()}:sm:{submodel_b64}:elem:*"
         deleted = 0
 
         # Use SCAN to avoid blocking on large keyspaces
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import Any
 from uuid import uuid4
 
 from pydantic import Field
@@ -23,12 +24,26 @@ class Settings(BaseSettings):
         validation_alias="DATABASE_URL",
     )
 
+    # Read replicas (comma-separated URLs); GET/HEAD requests are served from them
+    database_replica_urls: str = Field(default="", validation_alias="DATABASE_REPLICA_URLS")
+
     # Database connection pool (tuned for 15K+ RPS)
     db_pool_size: int = Field(default=40, validation_alias="DB_POOL_SIZE")
     db_max_overflow: int = Field(default=10, validation_alias="DB_MAX_OVERFLOW")
     db_pool_timeout: int = Field(default=30, validation_alias="DB_POOL_TIMEOUT")
     db_pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
 
+    # Raw asyncpg prepared statements for hot repository reads (disable behind
+    # a transaction-pooling PgBouncer)
+    db_raw_reads: bool = Field(default=True, validation_alias="DB_RAW_READS")
+
+    # Database instrumentation (statement/pool metrics, per-request query budget)
+    db_instrumentation: bool = Field(default=True, validation_alias="DB_INSTRUMENTATION")
+    # Executions of one statement within a request that flag an N+1 pattern
+    db_repeated_query_threshold: int = Field(
+        default=10, validation_alias="DB_REPEATED_QUERY_THRESHOLD"
+    )
+
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", validation_alias="REDIS_URL")
 
@@ -129,6 +144,11 @@ class Settings(BaseSettings):
     oidc_client_id: str | None = Field(default=None, validation_alias="OIDC_CLIENT_ID")
     oidc_roles_claim: str | None = Field(default="roles", validation_alias="OIDC_ROLES_CLAIM")
     oidc_jwks_cache_seconds: int = Field(default=3600, validation_alias="OIDC_JWKS_CACHE_SECONDS")
+    oidc_jwks_min_refresh_seconds: int = Field(
+        default=30, validation_alias="OIDC_JWKS_MIN_REFRESH_SECONDS"
+    )
+    oidc_token_cache_size: int = Field(default=10000, validation_alias="OIDC_TOKEN_CACHE_SIZE")
+    oidc_token_cache_seconds: int = Field(default=300, validation_alias="OIDC_TOKEN_CACHE_SECONDS")
 
     # Authentication defaults
     allow_anonymous_admin: bool = Field(default=False, validation_alias="ALLOW_ANONYMOUS_ADMIN")
@@ -145,6 +165,21 @@ class Settings(BaseSettings):
     otlp_endpoint: str | None = Field(default=None, validation_alias="OTLP_ENDPOINT")
     enable_metrics: bool = Field(default=True, validation_alias="ENABLE_METRICS")
     log_level: str = "INFO"
+    # Mount the /debug/profile endpoints (request stats, CPU sampler)
+    enable_profiling_endpoints: bool = Field(
+        default=False, validation_alias="ENABLE_PROFILING_ENDPOINTS"
+    )
+    # Seconds between publishing this instance's request sketches to Redis
+    # for the cluster-wide view (GET /debug/profile/endpoints?cluster=true)
+    profile_snapshot_interval: float = Field(
+        default=30.0, validation_alias="PROFILE_SNAPSHOT_INTERVAL"
+    )
+
+    # Discovery: also resolve asset links of shells in the repository,
+    # not only those of registered descriptors
+    discovery_include_shells: bool = Field(
+        default=False, validation_alias="DISCOVERY_INCLUDE_SHELLS"
+    )
 
     # Blob Storage
     blob_storage_type: str = Field(default="local", validation_alias="BLOB_STORAGE_TYPE")
@@ -190,6 +225,15 @@ class Settings(BaseSettings):
     enable_compression: bool = Field(default=True, validation_alias="ENABLE_COMPRESSION")
     compression_min_size: int = Field(default=500, validation_alias="COMPRESSION_MIN_SIZE")
     compression_level: int = Field(default=6, validation_alias="COMPRESSION_LEVEL")
+    # Serve cached compressed variants of documents on the fast path
+    cache_compressed_variants: bool = Field(
+        default=True, validation_alias="CACHE_COMPRESSED_VARIANTS"
+    )
+    # Encodings compressed eagerly when a document is cached (e.g. "br,gzip");
+    # empty means variants are only produced on the first compressed read
+    cache_precompress_encodings: str = Field(
+        default="", validation_alias="CACHE_PRECOMPRESS_ENCODINGS"
+    )
 
     # Rate Limiting
     enable_rate_limiting: bool = Field(default=True, validation_alias="ENABLE_RATE_LIMITING")
@@ -197,6 +241,35 @@ class Settings(BaseSettings):
     rate_limit_window: int = Field(default=60, validation_alias="RATE_LIMIT_WINDOW")
     # Rate limit fail mode: "open" (allow if Redis down) or "closed" (reject if Redis down)
     rate_limit_fail_mode: str = Field(default="open", validation_alias="RATE_LIMIT_FAIL_MODE")
+    # Algorithm: "gcra" (one atomic Lua call, O(1) state per key) or "sliding_window"
+    rate_limit_algorithm: str = Field(default="gcra", validation_alias="RATE_LIMIT_ALGORITHM")
+    # GCRA tokens each worker reserves per Redis call (0 = ask Redis on every request)
+    rate_limit_local_batch: int = Field(default=0, validation_alias="RATE_LIMIT_LOCAL_BATCH")
+    # Seconds a worker may use reserved tokens before they are forfeited
+    rate_limit_local_ttl: float = Field(default=1.0, validation_alias="RATE_LIMIT_LOCAL_TTL")
+
+    # Tenant isolation: row-level security on the repository tables (the tenant
+    # is set per transaction) and tenant-scoped cache keys
+    enable_tenant_isolation: bool = Field(default=False, validation_alias="ENABLE_TENANT_ISOLATION")
+
+    # Tenant admission control (per-worker weighted fair queuing and quotas)
+    enable_tenant_admission: bool = Field(default=False, validation_alias="ENABLE_TENANT_ADMISSION")
+    # Requests served concurrently across all tenants
+    tenant_max_in_flight: int = Field(default=256, validation_alias="TENANT_MAX_IN_FLIGHT")
+    # Requests served concurrently per tenant
+    tenant_max_concurrency: int = Field(default=64, validation_alias="TENANT_MAX_CONCURRENCY")
+    # Share of the database pool (pool size + overflow) one tenant may hold
+    tenant_db_pool_share: float = Field(default=0.5, validation_alias="TENANT_DB_POOL_SHARE")
+    # Bytes one tenant may write to the cache per cache TTL window (0 = unlimited)
+    tenant_cache_bytes: int = Field(default=64 * 1024 * 1024, validation_alias="TENANT_CACHE_BYTES")
+    # Seconds a request may wait for admission before a 503
+    tenant_queue_timeout: float = Field(default=5.0, validation_alias="TENANT_QUEUE_TIMEOUT")
+    # Waiting requests per tenant before a 429
+    tenant_max_queue: int = Field(default=100, validation_alias="TENANT_MAX_QUEUE")
+    # Per-tenant overrides (JSON), e.g. {"acme": {"weight": 4, "maxConcurrency": 128}}
+    tenant_quotas: dict[str, dict[str, Any]] = Field(
+        default_factory=dict, validation_alias="TENANT_QUOTAS"
+    )
 
     # Security Headers
     enable_security_headers: bool = Field(default=True, validation_alias="ENABLE_SECURITY_HEADERS")
@@ -208,9 +281,40 @@ class Settings(BaseSettings):
     csp_policy: str | None = Field(default=None, validation_alias="CSP_POLICY")
     permissions_policy: str | None = Field(default=None, validation_alias="PERMISSIONS_POLICY")
 
+    # Audit pipeline (batched, asynchronous audit logging)
+    audit_pipeline_enabled: bool = Field(default=False, validation_alias="AUDIT_PIPELINE_ENABLED")
+    audit_sinks: str = Field(default="logger", validation_alias="AUDIT_SINKS")
+    audit_buffer_size: int = Field(default=10000, validation_alias="AUDIT_BUFFER_SIZE")
+    audit_batch_size: int = Field(default=500, validation_alias="AUDIT_BATCH_SIZE")
+    audit_flush_interval: float = Field(default=1.0, validation_alias="AUDIT_FLUSH_INTERVAL")
+    # drop_oldest, drop_newest or block
+    audit_overflow_policy: str = Field(
+        default="drop_oldest", validation_alias="AUDIT_OVERFLOW_POLICY"
+    )
+    audit_log_file: str | None = Field(default=None, validation_alias="AUDIT_LOG_FILE")
+    audit_redis_stream: str = Field(default="titan:audit", validation_alias="AUDIT_REDIS_STREAM")
+
     # ABAC (Attribute-Based Access Control)
     enable_abac: bool = Field(default=False, validation_alias="ENABLE_ABAC")
     abac_default_deny: bool = Field(default=True, validation_alias="ABAC_DEFAULT_DENY")
+    abac_decision_cache_size: int = Field(
+        default=10000, validation_alias="ABAC_DECISION_CACHE_SIZE"
+    )
+    abac_decision_cache_ttl: float = Field(default=5.0, validation_alias="ABAC_DECISION_CACHE_TTL")
+
+    # GraphQL query limits (see titan.graphql.limits for the cost model)
+    graphql_max_depth: int = Field(default=12, validation_alias="GRAPHQL_MAX_DEPTH")
+    graphql_max_cost: int = Field(default=25000, validation_alias="GRAPHQL_MAX_COST")
+    graphql_default_list_size: int = Field(default=10, validation_alias="GRAPHQL_DEFAULT_LIST_SIZE")
+
+    # GraphQL persisted queries and result cache (size 0 disables the cache)
+    graphql_query_cache_size: int = Field(default=1000, validation_alias="GRAPHQL_QUERY_CACHE_SIZE")
+    graphql_query_cache_ttl: float = Field(
+        default=300.0, validation_alias="GRAPHQL_QUERY_CACHE_TTL"
+    )
+    graphql_persisted_query_size: int = Field(
+        default=5000, validation_alias="GRAPHQL_PERSISTED_QUERY_SIZE"
+    )
 
 
 settings = Settings()
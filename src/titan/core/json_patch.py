@@ -0,0 +1,194 @@
+"""JSON Pointer (RFC 6901) and JSON Patch (RFC 6902) helpers.
+
+Shared by the federation wire format (document deltas) and the package
+element diff (idShortPath-annotated operations):
+- escape_token / unescape_token: JSON Pointer reference tokens
+- patch_operation: build one add/remove/replace operation
+- make_patch: generic structural diff of two JSON values
+- apply_patch: apply add/remove/replace operations in order
+
+Patches from make_patch apply sequentially: object keys are diffed
+recursively, arrays positionally with trailing removals in descending
+order followed by appends.
+
+Example:
+    ops = make_patch(base_doc, new_doc)
+    assert apply_patch(copy.deepcopy(base_doc), ops) == new_doc
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class PatchError(ValueError):
+    """Raised when a patch cannot be applied to a document."""
+
+
+def patch_operation(op: str, path: str, value: Any = None, **extra: Any) -> dict[str, Any]:
+    """Build a JSON Patch operation.
+
+    Args:
+        op: "add", "remove" or "replace"
+        path: JSON Pointer of the target
+        value: New value (omitted for remove)
+        **extra: Additional members, e.g. ``idShortPath``
+
+    Returns:
+        The operation
+    """
+    operation: dict[str, Any] = {"op": op, "path": path, **extra}
+    if op != "remove":
+        operation["value"] = value
+    return operation
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Generate JSON Patch operations transforming ``old`` into ``new``.
+
+    Args:
+        old: Base JSON value
+        new: Target JSON value
+        path: JSON Pointer of the values within their document
+
+    Returns:
+        Sequentially applicable JSON Patch operations
+    """
+    operations: list[dict[str, Any]] = []
+    _diff(old, new, path, operations)
+    return operations
+
+
+def _diff(old: Any, new: Any, path: str, out: list[dict[str, Any]]) -> None:
+    """Append operations for one value pair."""
+    if old == new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            out.append(patch_operation("remove", f"{path}/{escape_token(key)}"))
+        for key, value in new.items():
+            child = f"{path}/{escape_token(key)}"
+            if key not in old:
+                out.append(patch_operation("add", child, value))
+            else:
+                _diff(old[key], value, child, out)
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for idx in range(common):
+            _diff(old[idx], new[idx], f"{path}/{idx}", out)
+        for idx in range(len(old) - 1, common - 1, -1):
+            out.append(patch_operation("remove", f"{path}/{idx}"))
+        for idx in range(common, len(new)):
+            out.append(patch_operation("add", f"{path}/-", new[idx]))
+        return
+
+    out.append(patch_operation("replace", path, new))
+
+
+def apply_patch(doc: Any, operations: list[dict[str, Any]]) -> Any:
+    """Apply JSON Patch operations to a document in place.
+
+    Args:
+        doc: Parsed JSON document (mutated)
+        operations: add/remove/replace operations
+
+    Returns:
+        The patched document (a new value if the root was replaced)
+
+    Raises:
+        PatchError: If an operation is unsupported or its path does not exist
+    """
+    for operation in operations:
+        op = operation.get("op")
+        path = operation.get("path")
+        if not isinstance(path, str):
+            raise PatchError("Patch operation without path")
+
+        if path == "":
+            if op not in ("add", "replace"):
+                raise PatchError(f"Cannot {op} the document root")
+            doc = operation.get("value")
+            continue
+
+        parent, token = _resolve_parent(doc, path)
+        if op == "add":
+            _add(parent, token, operation.get("value"), path)
+        elif op == "remove":
+            _remove(parent, token, path)
+        elif op == "replace":
+            _replace(parent, token, operation.get("value"), path)
+        else:
+            raise PatchError(f"Unsupported patch operation: {op}")
+
+    return doc
+
+
+def _resolve_parent(doc: Any, path: str) -> tuple[Any, str]:
+    """Walk a JSON Pointer to the container holding its last token."""
+    if not path.startswith("/"):
+        raise PatchError(f"Invalid JSON Pointer: {path}")
+
+    tokens = [unescape_token(t) for t in path[1:].split("/")]
+    target = doc
+    for token in tokens[:-1]:
+        if isinstance(target, dict) and token in target:
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_index(target, token, path, allow_end=False)]
+        else:
+            raise PatchError(f"Path not found: {path}")
+    return target, tokens[-1]
+
+
+def _add(parent: Any, token: str, value: Any, path: str) -> None:
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        if token == "-":
+            parent.append(value)
+        else:
+            parent.insert(_index(parent, token, path, allow_end=True), value)
+    else:
+        raise PatchError(f"Path not found: {path}")
+
+
+def _remove(parent: Any, token: str, path: str) -> None:
+    if isinstance(parent, dict) and token in parent:
+        del parent[token]
+    elif isinstance(parent, list):
+        del parent[_index(parent, token, path, allow_end=False)]
+    else:
+        raise PatchError(f"Path not found: {path}")
+
+
+def _replace(parent: Any, token: str, value: Any, path: str) -> None:
+    # Assign in place so object key order (and canonical bytes) is preserved
+    if isinstance(parent, dict) and token in parent:
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent[_index(parent, token, path, allow_end=False)] = value
+    else:
+        raise PatchError(f"Path not found: {path}")
+
+
+def _index(target: list[Any], token: str, path: str, allow_end: bool) -> int:
+    """Parse an array index token, checking bounds."""
+    if not token.isdigit():
+        raise PatchError(f"Invalid array index in {path}")
+    idx = int(token)
+    if idx > len(target) or (idx == len(target) and not allow_end):
+        raise PatchError(f"Array index out of range: {path}")
+    return idx
+
+
+def escape_token(token: str) -> str:
+    """Escape a JSON Pointer reference token (RFC 6901)."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape_token(token: str) -> str:
+    """Unescape a JSON Pointer reference token (RFC 6901)."""
+    return token.replace("~1", "/").replace("~0", "~")
@@ -43,6 +43,11 @@ class ProjectionModifiers:
     def include_blob_value(self) -> bool:
         return self.extent == "withBlobValue"
 
+    @property
+    def variant(self) -> str:
+        """Stable label for these modifiers (keys cached projections)."""
+        return f"level={self.level}&extent={self.extent}&content={self.content}"
+
 
 # Metadata fields that should be included in $metadata projection
 METADATA_FIELDS = frozenset(
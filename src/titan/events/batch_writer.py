@@ -12,6 +12,7 @@ import logging
 import time
 from collections import deque
 from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -21,7 +22,9 @@ from titan.events.schemas import (
     EventType,
     SubmodelElementEvent,
     SubmodelEvent,
+    event_tenant,
 )
+from titan.tenancy.context import TenantScope
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -188,6 +191,12 @@ class MicroBatchWriter:
 
     async def _update_cache(self, event: AnyEvent) -> None:
         """Update Redis cache immediately (hot path)."""
+        tenant = event_tenant(event)
+        # Cache keys belong to the publishing tenant
+        with TenantScope(tenant) if tenant else nullcontext():
+            await self._update_entity_cache(event)
+
+    async def _update_entity_cache(self, event: AnyEvent) -> None:
         if isinstance(event, AasEvent):
             if event.event_type == EventType.DELETED:
                 await self.cache.delete_aas(event.identifier_b64)
@@ -196,6 +205,7 @@ class MicroBatchWriter:
                     event.identifier_b64,
                     event.doc_bytes,
                     event.etag,
+                    tenant=event.tenant_id,
                 )
 
         elif isinstance(event, SubmodelEvent):
@@ -207,6 +217,7 @@ class MicroBatchWriter:
                     event.identifier_b64,
                     event.doc_bytes,
                     event.etag,
+                    tenant=event.tenant_id,
                 )
                 # Invalidate element values when submodel changes
                 if event.event_type == EventType.UPDATED:
@@ -12,7 +12,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING
 
 from titan.events.schemas import AnyEvent
@@ -34,6 +34,15 @@ class EventBus(ABC):
         """Publish an event to the bus."""
         pass
 
+    async def publish_many(self, events: Sequence[AnyEvent]) -> None:
+        """Publish several events in order.
+
+        Backends that can batch (e.g. one Redis pipeline) override this;
+        the default publishes one at a time.
+        """
+        for event in events:
+            await self.publish(event)
+
     @abstractmethod
     async def subscribe(self, handler: EventHandler) -> None:
         """Subscribe a handler to receive events."""
@@ -18,6 +18,7 @@ import asyncio
 import base64
 import logging
 import os
+from collections.abc import Sequence
 from dataclasses import asdict
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -140,6 +141,22 @@ class RedisStreamEventBus(EventBus):
 
         logger.debug(f"Published event {event.event_id} as {message_id!r}")
 
+    async def publish_many(self, events: Sequence[AnyEvent]) -> None:
+        """Publish several events with one pipelined round trip."""
+        if not events:
+            return
+        redis = await self._get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(
+                    self.stream_name,
+                    {"data": self._serialize_event(event)},
+                    maxlen=100000,
+                )
+            await pipe.execute()
+
+        logger.debug(f"Published {len(events)} events to {self.stream_name}")
+
     async def subscribe(self, handler: EventHandler) -> None:
         """Subscribe a handler to receive events."""
         self._handlers.append(handler)
@@ -5,6 +5,9 @@ Events carry all data needed for the single writer to:
 - Persist to database
 - Update cache
 - Broadcast via MQTT/WebSocket
+
+Entity events record the tenant they were published for, since consumers
+run outside the request (and its tenant context).
 """
 
 from __future__ import annotations
@@ -15,6 +18,8 @@ from enum import Enum
 from typing import Any, Literal
 from uuid import uuid4
 
+from titan.tenancy.admission import current_tenant
+
 
 class EventType(str, Enum):
     """Type of entity change event."""
@@ -34,6 +39,7 @@ class AasEvent:
     doc_bytes: bytes | None = None  # None for delete
     etag: str | None = None
     entity: Literal["aas"] = "aas"
+    tenant_id: str = field(default_factory=current_tenant)
     event_id: str = field(default_factory=lambda: str(uuid4()))
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -49,6 +55,7 @@ class SubmodelEvent:
     etag: str | None = None
     semantic_id: str | None = None
     entity: Literal["submodel"] = "submodel"
+    tenant_id: str = field(default_factory=current_tenant)
     event_id: str = field(default_factory=lambda: str(uuid4()))
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -66,6 +73,7 @@ class SubmodelElementEvent:
     id_short_path: str
     value_bytes: bytes | None = None  # None for delete
     entity: Literal["element"] = "element"
+    tenant_id: str = field(default_factory=current_tenant)
     event_id: str = field(default_factory=lambda: str(uuid4()))
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -80,6 +88,7 @@ class ConceptDescriptionEvent:
     doc_bytes: bytes | None = None
     etag: str | None = None
     entity: Literal["concept_description"] = "concept_description"
+    tenant_id: str = field(default_factory=current_tenant)
     event_id: str = field(default_factory=lambda: str(uuid4()))
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -189,3 +198,8 @@ AnyEvent = (
     | PackageEvent
     | OperationInvocationEvent
 )
+
+
+def event_tenant(event: AnyEvent) -> str | None:
+    """Tenant an entity event was published for (None for other events)."""
+    return getattr(event, "tenant_id", None)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
 from titan.events.schemas import (
@@ -18,7 +19,9 @@ from titan.events.schemas import (
     EventType,
     SubmodelElementEvent,
     SubmodelEvent,
+    event_tenant,
 )
+from titan.tenancy.context import TenantScope
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -84,16 +87,19 @@ class SingleWriter:
         2. Updates the cache
         3. Broadcasts the event
         """
+        tenant = event_tenant(event)
         try:
-            if isinstance(event, AasEvent):
-                await self._handle_aas_event(event)
-            elif isinstance(event, SubmodelEvent):
-                await self._handle_submodel_event(event)
-            elif isinstance(event, SubmodelElementEvent):
-                await self._handle_element_event(event)
-            else:
-                logger.warning(f"Unknown event type: {type(event)}")
-                return
+            # Cache keys belong to the publishing tenant
+            with TenantScope(tenant) if tenant else nullcontext():
+                if isinstance(event, AasEvent):
+                    await self._handle_aas_event(event)
+                elif isinstance(event, SubmodelEvent):
+                    await self._handle_submodel_event(event)
+                elif isinstance(event, SubmodelElementEvent):
+                    await self._handle_element_event(event)
+                else:
+                    logger.warning(f"Unknown event type: {type(event)}")
+                    return
 
             # Broadcast after successful processing
             if self.broadcast_callback:
@@ -112,6 +118,7 @@ class SingleWriter:
                     event.identifier_b64,
                     event.doc_bytes,
                     event.etag,
+                    tenant=event.tenant_id,
                 )
             logger.debug(f"AAS created: {event.identifier}")
 
@@ -122,6 +129,7 @@ class SingleWriter:
                     event.identifier_b64,
                     event.doc_bytes,
                     event.etag,
+                    tenant=event.tenant_id,
                 )
             logger.debug(f"AAS updated: {event.identifier}")
 
@@ -138,6 +146,7 @@ class SingleWriter:
                     event.identifier_b64,
                     event.doc_bytes,
                     event.etag,
+                    tenant=event.tenant_id,
                 )
             logger.debug(f"Submodel created: {event.identifier}")
 
@@ -147,6 +156,7 @@ class SingleWriter:
                     event.identifier_b64,
                     event.doc_bytes,
                     event.etag,
+                    tenant=event.tenant_id,
                 )
             # Invalidate element values when submodel changes
             await self.cache.invalidate_submodel_elements(event.identifier_b64)
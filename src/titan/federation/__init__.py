@@ -15,7 +15,12 @@ from titan.federation.conflicts import (
     ResolutionStrategy,
 )
 from titan.federation.discovery import FederatedDiscovery
-from titan.federation.edge import EdgeConfig, EdgeController, EdgeStatus
+from titan.federation.edge import (
+    DatabasePendingChangeStore,
+    EdgeConfig,
+    EdgeController,
+    EdgeStatus,
+)
 from titan.federation.peer import Peer, PeerRegistry
 from titan.federation.sync import (
     ChangeQueue,
@@ -30,6 +35,7 @@ __all__ = [
     "ConflictInfo",
     "ConflictManager",
     "ConflictResolver",
+    "DatabasePendingChangeStore",
     "EdgeConfig",
     "EdgeController",
     "EdgeStatus",
@@ -0,0 +1,330 @@
+"""Receiving side of batched federation pushes.
+
+Applies a batch of changes sent by a peer in a single request:
+- Existing entities are looked up with one query per entity type
+- Each change runs in its own savepoint, so one bad change does not
+  abort the rest of the batch
+- Replays are idempotent: creates of existing entities become updates,
+  deletes of missing entities and updates with an unchanged etag are skipped
+- Updates may carry a JSON Patch against ``baseEtag``; if the stored
+  version differs the change reports ``base_mismatch`` and the sender
+  falls back to the full document
+
+Example:
+    applier = ChangeBatchApplier(session)
+    results = await applier.apply(changes)
+    await session.commit()
+    await publish_applied_changes(results, cache, get_event_bus())
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from titan.cache import RedisCache
+from titan.core.canonicalize import canonical_bytes
+from titan.core.ids import encode_id_to_b64url
+from titan.core.json_patch import PatchError, apply_patch
+from titan.core.model import AssetAdministrationShell, ConceptDescription, Submodel
+from titan.events import (
+    EventBus,
+    EventType,
+    publish_aas_deleted,
+    publish_aas_event,
+    publish_concept_description_event,
+    publish_submodel_deleted,
+    publish_submodel_event,
+)
+from titan.persistence.repositories import (
+    AasRepository,
+    ConceptDescriptionRepository,
+    SubmodelRepository,
+)
+from titan.persistence.tables import (
+    AasTable,
+    ConceptDescriptionTable,
+    SubmodelTable,
+    generate_etag,
+)
+
+logger = logging.getLogger(__name__)
+
+_TABLES: dict[str, Any] = {
+    "aas": AasTable,
+    "submodel": SubmodelTable,
+    "concept_description": ConceptDescriptionTable,
+}
+
+_MODELS: dict[str, Any] = {
+    "aas": AssetAdministrationShell,
+    "submodel": Submodel,
+    "concept_description": ConceptDescription,
+}
+
+
+@dataclass
+class ChangeApplyResult:
+    """Outcome of applying a single pushed change."""
+
+    change_id: str
+    entity_type: str
+    entity_id: str
+    status: str  # "applied", "skipped", "base_mismatch", "failed"
+    operation: str | None = None  # Effective operation: "create", "update", "delete"
+    doc_bytes: bytes | None = None
+    etag: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API response."""
+        result: dict[str, Any] = {"changeId": self.change_id, "status": self.status}
+        if self.etag:
+            result["etag"] = self.etag
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+class ChangeBatchApplier:
+    """Applies a batch of federation changes within one database session."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._repos: dict[str, Any] = {
+            "aas": AasRepository(session),
+            "submodel": SubmodelRepository(session),
+            "concept_description": ConceptDescriptionRepository(session),
+        }
+
+    async def apply(self, changes: list[dict[str, Any]]) -> list[ChangeApplyResult]:
+        """Apply changes in order and return one result per change.
+
+        Args:
+            changes: Changes in ``SyncChange.to_dict()`` format
+
+        Returns:
+            Per-change results in input order
+        """
+        existing = await self._load_existing_etags(changes)
+        results: list[ChangeApplyResult] = []
+
+        for change in changes:
+            entity_type = change.get("entityType", "")
+            entity_id = change.get("entityId", "")
+            result = ChangeApplyResult(
+                change_id=change.get("changeId", ""),
+                entity_type=entity_type,
+                entity_id=entity_id,
+                status="failed",
+            )
+            results.append(result)
+
+            if entity_type not in _TABLES:
+                result.error = f"Unknown entity type: {entity_type}"
+                continue
+
+            etags = existing[entity_type]
+            try:
+                async with self.session.begin_nested():
+                    await self._apply_one(change, result, etags)
+            except Exception as e:
+                result.status = "failed"
+                result.error = str(e)
+                logger.warning(f"Failed to apply change {result.change_id}: {e}")
+
+        return results
+
+    async def _apply_one(
+        self,
+        change: dict[str, Any],
+        result: ChangeApplyResult,
+        etags: dict[str, str],
+    ) -> None:
+        """Apply one change, updating the known etags for later changes."""
+        operation = change.get("operation")
+        entity_id = result.entity_id
+        repo = self._repos[result.entity_type]
+
+        if operation == "delete":
+            if entity_id not in etags:
+                result.status = "skipped"
+                return
+            await repo.delete(entity_id)
+            del etags[entity_id]
+            result.status = "applied"
+            result.operation = "delete"
+            return
+
+        if operation not in ("create", "update"):
+            result.error = f"Unknown operation: {operation}"
+            return
+
+        current_etag = etags.get(entity_id)
+        if current_etag is not None and current_etag == change.get("etag"):
+            result.status = "skipped"
+            result.etag = current_etag
+            return
+
+        doc = change.get("doc")
+        if change.get("patch") is not None:
+            doc = await self._patched_doc(change, result, current_etag)
+            if doc is None:
+                return
+        if not isinstance(doc, dict):
+            result.error = "Missing document"
+            return
+
+        model = _MODELS[result.entity_type].model_validate(doc)
+        if current_etag is None:
+            doc_bytes, etag = await repo.create(model)
+            result.operation = "create"
+        else:
+            updated = await repo.update(entity_id, model)
+            if updated is None:
+                raise ValueError(f"Entity disappeared during apply: {entity_id}")
+            doc_bytes, etag = updated
+            result.operation = "update"
+
+        etags[entity_id] = etag
+        result.status = "applied"
+        result.doc_bytes = doc_bytes
+        result.etag = etag
+
+    async def _patched_doc(
+        self,
+        change: dict[str, Any],
+        result: ChangeApplyResult,
+        current_etag: str | None,
+    ) -> dict[str, Any] | None:
+        """Apply a delta change to the stored document.
+
+        Returns:
+            The patched document, or None (status ``base_mismatch``) if the
+            stored version is not the patch base or the result does not
+            match the sender's target etag
+        """
+        doc: dict[str, Any] | None = None
+        if current_etag is not None and current_etag == change.get("baseEtag"):
+            stored = await self._repos[result.entity_type].get_bytes_by_id(result.entity_id)
+            if stored is not None and stored[1] == current_etag:
+                try:
+                    doc = apply_patch(orjson.loads(stored[0]), change["patch"])
+                except PatchError as e:
+                    result.error = str(e)
+
+        target_etag = change.get("etag")
+        if doc is not None and target_etag:
+            if generate_etag(canonical_bytes(doc)) != target_etag:
+                result.error = "Patched document does not match target etag"
+                doc = None
+
+        if doc is None:
+            result.status = "base_mismatch"
+            result.etag = current_etag
+        return doc
+
+    async def _load_existing_etags(
+        self, changes: list[dict[str, Any]]
+    ) -> dict[str, dict[str, str]]:
+        """Fetch current etags for all referenced entities, one query per type."""
+        ids_by_type: dict[str, set[str]] = {entity_type: set() for entity_type in _TABLES}
+        for change in changes:
+            entity_type = change.get("entityType", "")
+            if entity_type in ids_by_type and change.get("entityId"):
+                ids_by_type[entity_type].add(change["entityId"])
+
+        existing: dict[str, dict[str, str]] = {}
+        for entity_type, identifiers in ids_by_type.items():
+            existing[entity_type] = {}
+            if not identifiers:
+                continue
+            table = _TABLES[entity_type]
+            stmt = select(table.identifier, table.etag).where(table.identifier.in_(identifiers))
+            result = await self.session.execute(stmt)
+            existing[entity_type] = {row.identifier: row.etag for row in result.all()}
+
+        return existing
+
+
+async def publish_applied_changes(
+    results: list[ChangeApplyResult],
+    cache: RedisCache,
+    event_bus: EventBus,
+) -> None:
+    """Refresh cache entries and publish events for applied changes.
+
+    Call after the session has been committed.
+    """
+    for result in results:
+        if result.status != "applied":
+            continue
+
+        identifier_b64 = encode_id_to_b64url(result.entity_id)
+        try:
+            await _publish_one(result, identifier_b64, cache, event_bus)
+        except Exception as e:
+            logger.warning(f"Post-apply propagation failed for {result.entity_id}: {e}")
+
+
+async def _publish_one(
+    result: ChangeApplyResult,
+    identifier_b64: str,
+    cache: RedisCache,
+    event_bus: EventBus,
+) -> None:
+    """Update cache and publish the event for one applied change."""
+    if result.operation == "delete":
+        if result.entity_type == "aas":
+            await cache.delete_aas(identifier_b64)
+            await publish_aas_deleted(event_bus, result.entity_id, identifier_b64)
+        elif result.entity_type == "submodel":
+            await cache.delete_submodel(identifier_b64)
+            await cache.invalidate_submodel_elements(identifier_b64)
+            await publish_submodel_deleted(event_bus, result.entity_id, identifier_b64)
+        else:
+            await cache.delete_concept_description(identifier_b64)
+            await publish_concept_description_event(
+                event_bus, EventType.DELETED, result.entity_id, identifier_b64
+            )
+        return
+
+    assert result.doc_bytes is not None and result.etag is not None
+    event_type = EventType.CREATED if result.operation == "create" else EventType.UPDATED
+
+    if result.entity_type == "aas":
+        await cache.set_aas(identifier_b64, result.doc_bytes, result.etag)
+        await publish_aas_event(
+            event_bus,
+            event_type,
+            result.entity_id,
+            identifier_b64,
+            result.doc_bytes,
+            result.etag,
+        )
+    elif result.entity_type == "submodel":
+        await cache.set_submodel(identifier_b64, result.doc_bytes, result.etag)
+        await cache.invalidate_submodel_elements(identifier_b64)
+        await publish_submodel_event(
+            event_bus,
+            event_type,
+            result.entity_id,
+            identifier_b64,
+            result.doc_bytes,
+            result.etag,
+        )
+    else:
+        await cache.set_concept_description(identifier_b64, result.doc_bytes, result.etag)
+        await publish_concept_description_event(
+            event_bus,
+            event_type,
+            result.entity_id,
+            identifier_b64,
+            result.doc_bytes,
+            result.etag,
+        )
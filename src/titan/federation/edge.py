@@ -5,16 +5,33 @@ Enables:
 - Background sync when connected
 - Delta-only sync (bandwidth optimization)
 - Conflict queue for disconnected updates
+- Durable, coalescing offline queue (federation_pending_changes)
+- Compressed, delta-encoded batch pushes when the hub supports them
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
+import heapq
 import logging
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Protocol
+
+import orjson
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from titan.core.json_patch import make_patch
+from titan.federation.merkle import MerkleIndex, RemoteMerkleIndex, reconcile
+from titan.federation.peer import PeerCapabilities, capabilities_from_openapi
+from titan.federation.sync import BULK_CHANGES_PATH
+from titan.federation.wire import choose_encoding, encode_body
+from titan.persistence.tables import FederationPendingChangeTable, generate_etag
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +67,440 @@ class PendingChange:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     attempts: int = 0
     last_error: str | None = None
+    # Payload size; kept when the payload itself is left in the store
+    size: int = 0
+
+    def __post_init__(self) -> None:
+        if self.data is not None:
+            self.size = len(self.data)
+
+
+# Entity types the hub accepts from edges
+_HUB_ENDPOINTS = {"aas": "/shells", "submodel": "/submodels"}
+
+# Drain order: lower rank syncs first
+_PRIORITY_RANK = {SyncPriority.HIGH: 0, SyncPriority.NORMAL: 1, SyncPriority.LOW: 2}
+
+
+def coalesce_changes(
+    old: PendingChange, new: PendingChange, in_flight: bool = False
+) -> PendingChange | None:
+    """Collapse two pending changes to the same entity into one.
+
+    The merged change keeps the queue position (id, created_at) of the
+    older one, the payload of the newer one and the higher priority.
+
+    A create followed by a delete cancels out only if the create was never
+    sent. Once it may have reached the hub (attempted or in flight) the
+    delete is queued instead, and the merged change keeps one attempt on
+    record so it is never mistaken for an unsent change, also after a
+    restart.
+
+    Args:
+        old: Change already queued
+        new: Incoming change for the same entity
+        in_flight: Whether ``old`` is currently being pushed
+
+    Returns:
+        The merged change, or None if the two cancel out (unsent create then delete)
+    """
+    sent = in_flight or old.attempts > 0
+    if new.action == "delete":
+        if old.action == "create" and not sent:
+            return None
+        action = "delete"
+    elif old.action == "create":
+        action = "create"
+    elif old.action == "delete":
+        # Entity still exists on the hub; recreate it in place
+        action = "update"
+    else:
+        action = new.action
+
+    priority = min(old.priority, new.priority, key=_PRIORITY_RANK.__getitem__)
+    return replace(
+        new,
+        id=old.id,
+        action=action,
+        priority=priority,
+        created_at=old.created_at,
+        attempts=1 if sent else 0,
+        last_error=None,
+    )
+
+
+class PendingChangeStore(Protocol):
+    """Durable backing store for the edge offline queue.
+
+    The queue keeps only change metadata in memory; payloads stay in the
+    store and are read back when changes are pushed.
+    """
+
+    async def load(self) -> list[PendingChange]:
+        """Load all pending changes without payloads (``size`` set), oldest first."""
+        ...
+
+    async def load_payloads(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], bytes]:
+        """Load the payloads of the pending changes of the given entities."""
+        ...
+
+    async def save(self, change: PendingChange) -> None:
+        """Insert or replace the pending change for the change's entity."""
+        ...
+
+    async def save_attempts(self, change: PendingChange) -> None:
+        """Update the attempt count and last error of a pending change."""
+        ...
+
+    async def delete(self, entity_type: str, entity_id: str) -> None:
+        """Remove the pending change for an entity."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove all pending changes."""
+        ...
+
+
+class DatabasePendingChangeStore:
+    """Pending change store backed by the federation_pending_changes table.
+
+    Rows bound for the hub have no target_peer_id and are unique per
+    entity, so saves are single-statement upserts.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def load(self) -> list[PendingChange]:
+        """Load hub-bound pending change metadata in creation order."""
+        table = FederationPendingChangeTable
+        stmt = (
+            select(
+                table.id,
+                table.entity_type,
+                table.entity_id,
+                table.action,
+                table.etag,
+                table.priority,
+                table.created_at,
+                table.attempts,
+                table.last_error,
+                func.coalesce(func.octet_length(table.data), 0).label("size"),
+            )
+            .where(table.target_peer_id.is_(None))
+            .order_by(table.created_at, table.id)
+        )
+        async with self._session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+
+        return [
+            PendingChange(
+                id=row.id,
+                entity_type=row.entity_type,
+                entity_id=row.entity_id,
+                action=row.action,
+                etag=row.etag,
+                priority=SyncPriority(row.priority),
+                created_at=row.created_at,
+                attempts=row.attempts,
+                last_error=row.last_error,
+                size=row.size,
+            )
+            for row in rows
+        ]
+
+    async def load_payloads(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], bytes]:
+        """Read the payloads of hub-bound pending changes."""
+        if not keys:
+            return {}
+        table = FederationPendingChangeTable
+        stmt = select(table.entity_type, table.entity_id, table.data).where(
+            table.target_peer_id.is_(None),
+            tuple_(table.entity_type, table.entity_id).in_(keys),
+            table.data.is_not(None),
+        )
+        async with self._session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+        return {(row.entity_type, row.entity_id): row.data for row in rows}
+
+    async def save(self, change: PendingChange) -> None:
+        """Upsert the pending change for the change's entity."""
+        table = FederationPendingChangeTable.__table__
+        values = {
+            "entity_type": change.entity_type,
+            "entity_id": change.entity_id,
+            "action": change.action,
+            "data": change.data,
+            "etag": change.etag,
+            "priority": change.priority.value,
+            "attempts": change.attempts,
+            "last_error": change.last_error,
+            "created_at": change.created_at,
+        }
+        stmt = pg_insert(table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.entity_type, table.c.entity_id],
+            index_where=table.c.target_peer_id.is_(None),
+            set_={
+                key: stmt.excluded[key]
+                for key in ("action", "data", "etag", "priority", "attempts", "last_error")
+            },
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def save_attempts(self, change: PendingChange) -> None:
+        """Update the attempt count and last error, leaving the payload alone."""
+        table = FederationPendingChangeTable
+        stmt = (
+            update(table)
+            .where(
+                table.target_peer_id.is_(None),
+                table.entity_type == change.entity_type,
+                table.entity_id == change.entity_id,
+            )
+            .values(attempts=change.attempts, last_error=change.last_error)
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def delete(self, entity_type: str, entity_id: str) -> None:
+        """Delete the pending change for an entity."""
+        table = FederationPendingChangeTable
+        stmt = delete(table).where(
+            table.target_peer_id.is_(None),
+            table.entity_type == entity_type,
+            table.entity_id == entity_id,
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def clear(self) -> None:
+        """Delete all hub-bound pending changes."""
+        table = FederationPendingChangeTable
+        async with self._session_factory() as session:
+            await session.execute(delete(table).where(table.target_peer_id.is_(None)))
+            await session.commit()
+
+
+class OfflineQueue:
+    """Bounded, coalescing queue of changes waiting to be synced.
+
+    Holds at most one change per entity. Each priority has its own heap
+    ordered by enqueue sequence with lazy deletion, so enqueue, coalesce
+    and eviction of the oldest low-priority change are O(log n). Pending
+    byte size is tracked incrementally. When a store is given, every
+    mutation is written through so the queue survives restarts, and only
+    change metadata is kept in memory: payloads are read back from the
+    store by ``checkout`` when changes are pushed.
+    """
+
+    def __init__(self, max_size: int, store: PendingChangeStore | None = None) -> None:
+        self.max_size = max_size
+        self.store = store
+        self._changes: dict[tuple[str, str], PendingChange] = {}
+        self._seqs: dict[tuple[str, str], int] = {}
+        self._heaps: dict[SyncPriority, list[tuple[int, tuple[str, str]]]] = {
+            priority: [] for priority in SyncPriority
+        }
+        self._in_flight: set[tuple[str, str]] = set()
+        self._next_seq = 0
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    @property
+    def bytes_pending(self) -> int:
+        """Total payload size of queued changes."""
+        return self._bytes
+
+    async def load(self) -> int:
+        """Replace in-memory state with the contents of the store.
+
+        Returns:
+            Number of loaded changes
+        """
+        if self.store is None:
+            return 0
+        changes = await self.store.load()
+        self._reset()
+        for change in changes:
+            self._insert(change)
+        return len(changes)
+
+    async def put(self, change: PendingChange) -> bool:
+        """Queue a change, coalescing with any pending change to the same entity.
+
+        Args:
+            change: The change to queue
+
+        Returns:
+            False if the queue is full and nothing could be evicted
+        """
+        key = (change.entity_type, change.entity_id)
+        existing = self._changes.get(key)
+
+        if existing is not None:
+            merged = coalesce_changes(existing, change, in_flight=key in self._in_flight)
+            if merged is None:
+                self._discard(key)
+                await self._store_delete(key)
+                return True
+            await self._store_save(merged)
+            self._replace(key, existing, merged)
+            return True
+
+        if len(self._changes) >= self.max_size:
+            evicted = self._pop_oldest(SyncPriority.LOW)
+            if evicted is None:
+                return False
+            logger.warning("Dropped oldest low-priority change from queue")
+            await self._store_delete((evicted.entity_type, evicted.entity_id))
+
+        await self._store_save(change)
+        self._insert(change)
+        return True
+
+    async def checkout(self, changes: list[PendingChange]) -> list[PendingChange]:
+        """Mark queued changes as in flight and return them with payloads.
+
+        Every checked-out change must be passed back to ``acknowledge`` or
+        ``record_failure`` (the queued change, not the returned copy).
+
+        Args:
+            changes: Queued changes as returned by ``ordered``
+
+        Returns:
+            The changes with ``data`` loaded, in the same order
+        """
+        keys = [(c.entity_type, c.entity_id) for c in changes]
+        self._in_flight.update(keys)
+        if self.store is None:
+            return list(changes)
+        payloads = await self.store.load_payloads(keys)
+        return [
+            replace(change, data=payloads.get(key))
+            for change, key in zip(changes, keys, strict=True)
+        ]
+
+    async def acknowledge(self, change: PendingChange) -> bool:
+        """Remove a change once synced.
+
+        A change that was coalesced with a newer write while in flight is
+        kept, since the newer payload has not been synced yet.
+
+        Returns:
+            True if the change was removed
+        """
+        key = (change.entity_type, change.entity_id)
+        self._in_flight.discard(key)
+        if self._changes.get(key) is not change:
+            return False
+        self._discard(key)
+        await self._store_delete(key)
+        return True
+
+    async def record_failure(self, change: PendingChange, error: str | None = None) -> None:
+        """Count a failed sync attempt for a queued change."""
+        self._in_flight.discard((change.entity_type, change.entity_id))
+        change.attempts += 1
+        if error is not None:
+            change.last_error = error
+        if self._changes.get((change.entity_type, change.entity_id)) is change:
+            if self.store is not None:
+                await self.store.save_attempts(change)
+
+    async def clear(self) -> int:
+        """Remove all changes.
+
+        Returns:
+            Number of removed changes
+        """
+        count = len(self._changes)
+        self._reset()
+        if self.store is not None:
+            await self.store.clear()
+        return count
+
+    def ordered(self, priority: SyncPriority | None = None) -> list[PendingChange]:
+        """Return queued changes in drain order (priority, then age).
+
+        Args:
+            priority: Only return changes with this priority
+        """
+        priorities = [priority] if priority else sorted(SyncPriority, key=_PRIORITY_RANK.get)
+        result: list[PendingChange] = []
+        for p in priorities:
+            live = sorted(entry for entry in self._heaps[p] if self._is_live(entry))
+            result.extend(self._changes[key] for _, key in live)
+        return result
+
+    def _reset(self) -> None:
+        self._changes.clear()
+        self._seqs.clear()
+        self._in_flight.clear()
+        for heap in self._heaps.values():
+            heap.clear()
+        self._bytes = 0
+
+    def _is_live(self, entry: tuple[int, tuple[str, str]]) -> bool:
+        seq, key = entry
+        return self._seqs.get(key) == seq
+
+    def _push(self, key: tuple[str, str], priority: SyncPriority) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seqs[key] = seq
+        heap = self._heaps[priority]
+        heapq.heappush(heap, (seq, key))
+        # Compact once stale entries dominate so heaps stay O(live)
+        if len(heap) > 2 * len(self._changes) + 64:
+            self._heaps[priority] = [entry for entry in heap if self._is_live(entry)]
+            heapq.heapify(self._heaps[priority])
+
+    def _metadata(self, change: PendingChange) -> PendingChange:
+        """The in-memory form of a change: without payload when stored."""
+        if self.store is None or change.data is None:
+            return change
+        return replace(change, data=None)
+
+    def _insert(self, change: PendingChange) -> None:
+        key = (change.entity_type, change.entity_id)
+        self._changes[key] = self._metadata(change)
+        self._bytes += change.size
+        self._push(key, change.priority)
+
+    def _replace(self, key: tuple[str, str], old: PendingChange, new: PendingChange) -> None:
+        self._changes[key] = self._metadata(new)
+        self._bytes += new.size - old.size
+        if new.priority != old.priority:
+            self._push(key, new.priority)
+
+    def _discard(self, key: tuple[str, str]) -> PendingChange:
+        change = self._changes.pop(key)
+        del self._seqs[key]
+        self._bytes -= change.size
+        return change
+
+    def _pop_oldest(self, priority: SyncPriority) -> PendingChange | None:
+        heap = self._heaps[priority]
+        while heap:
+            entry = heapq.heappop(heap)
+            if self._is_live(entry):
+                return self._discard(entry[1])
+        return None
+
+    async def _store_save(self, change: PendingChange) -> None:
+        if self.store is not None:
+            await self.store.save(change)
+
+    async def _store_delete(self, key: tuple[str, str]) -> None:
+        if self.store is not None:
+            await self.store.delete(*key)
 
 
 @dataclass
@@ -63,6 +514,9 @@ class EdgeConfig:
     retry_attempts: int = 3
     auto_reconnect: bool = True
     reconnect_delay: int = 10  # seconds
+    push_batch_size: int = 200  # changes per batched push
+    delta_sync: bool = True  # send JSON Patch deltas when the hub supports them
+    delta_base_cache_size: int = 10000  # acknowledged versions kept as delta bases
 
 
 @dataclass
@@ -75,25 +529,36 @@ class EdgeStatus:
     pending_changes: int = 0
     conflicts: int = 0
     bytes_pending: int = 0
+    bytes_sent: int = 0
 
 
 class EdgeController:
     """Controls edge deployment behavior."""
 
-    def __init__(self, config: EdgeConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: EdgeConfig | None = None,
+        store: PendingChangeStore | None = None,
+    ) -> None:
         """Initialize edge controller.
 
         Args:
             config: Edge deployment configuration
+            store: Durable store for the offline queue (in-memory only if None)
         """
         self.config = config or EdgeConfig()
         self._connection_state = ConnectionState.DISCONNECTED
-        self._pending_queue: list[PendingChange] = []
+        self._pending_queue = OfflineQueue(self.config.max_offline_queue, store)
         self._conflict_queue: list[dict[str, Any]] = []
         self._sync_task: asyncio.Task | None = None
         self._reconnect_task: asyncio.Task | None = None
         self._last_sync: datetime | None = None
         self._last_sync_cursor: str | None = None
+        self._merkle_index: MerkleIndex | None = None
+        self._hub_capabilities = PeerCapabilities()
+        # Last version acknowledged by the hub per entity: (hub etag, doc bytes)
+        self._delta_bases: OrderedDict[tuple[str, str], tuple[str, bytes]] = OrderedDict()
+        self._bytes_sent = 0
 
     @property
     def status(self) -> EdgeStatus:
@@ -104,7 +569,8 @@ class EdgeController:
             last_sync=self._last_sync,
             pending_changes=len(self._pending_queue),
             conflicts=len(self._conflict_queue),
-            bytes_pending=sum(len(c.data or b"") for c in self._pending_queue),
+            bytes_pending=self._pending_queue.bytes_pending,
+            bytes_sent=self._bytes_sent,
         )
 
     @property
@@ -114,6 +580,9 @@ class EdgeController:
 
     async def start(self) -> None:
         """Start edge controller."""
+        loaded = await self._pending_queue.load()
+        if loaded:
+            logger.info(f"Restored {loaded} pending changes from offline queue")
         if self.config.hub_url:
             await self._connect()
         logger.info("Edge controller started")
@@ -139,20 +608,15 @@ class EdgeController:
     async def queue_change(self, change: PendingChange) -> None:
         """Queue a change for sync to hub.
 
+        Successive changes to the same entity are collapsed into one.
+
         Args:
             change: The change to queue
         """
-        if len(self._pending_queue) >= self.config.max_offline_queue:
-            # Remove oldest low-priority items
-            low_priority = [c for c in self._pending_queue if c.priority == SyncPriority.LOW]
-            if low_priority:
-                self._pending_queue.remove(low_priority[0])
-                logger.warning("Dropped oldest low-priority change from queue")
-            else:
-                logger.warning("Pending queue full, cannot add change")
-                return
+        if not await self._pending_queue.put(change):
+            logger.warning("Pending queue full, cannot add change")
+            return
 
-        self._pending_queue.append(change)
         logger.debug(f"Queued change: {change.entity_type}/{change.entity_id}")
 
         # If connected and high priority, trigger immediate sync
@@ -170,23 +634,35 @@ class EdgeController:
 
         return await self._sync_to_hub()
 
+    def set_merkle_index(self, index: MerkleIndex | None) -> None:
+        """Set the local hash-tree index used for anti-entropy pulls.
+
+        When set, pulls compare hash trees with the hub and only fetch
+        entities in differing buckets instead of paging through everything.
+
+        Args:
+            index: Local Merkle index (None to fall back to cursor paging)
+        """
+        self._merkle_index = index
+
     def get_pending_changes(self) -> list[PendingChange]:
-        """Get all pending changes."""
-        return self._pending_queue.copy()
+        """Get all pending changes in sync order.
+
+        With a durable store the payloads stay in the store (``data`` is None).
+        """
+        return self._pending_queue.ordered()
 
     def get_conflicts(self) -> list[dict[str, Any]]:
         """Get pending conflicts."""
         return self._conflict_queue.copy()
 
-    def clear_pending(self) -> int:
+    async def clear_pending(self) -> int:
         """Clear all pending changes.
 
         Returns:
             Number of cleared changes
         """
-        count = len(self._pending_queue)
-        self._pending_queue.clear()
-        return count
+        return await self._pending_queue.clear()
 
     async def _connect(self) -> bool:
         """Attempt to connect to hub."""
@@ -204,6 +680,7 @@ class EdgeController:
                 if response.status_code == 200:
                     self._connection_state = ConnectionState.CONNECTED
                     logger.info("Connected to hub")
+                    await self._discover_hub_capabilities(client)
 
                     # Start sync loop
                     self._sync_task = asyncio.create_task(self._sync_loop())
@@ -219,6 +696,15 @@ class EdgeController:
 
         return False
 
+    async def _discover_hub_capabilities(self, client: Any) -> None:
+        """Negotiate batched, delta and compressed pushes from the hub's OpenAPI."""
+        try:
+            response = await client.get(f"{self.config.hub_url}/openapi.json")
+            if response.status_code == 200:
+                self._hub_capabilities = capabilities_from_openapi(response.json())
+        except Exception as e:
+            logger.warning(f"Failed to discover hub capabilities: {e}")
+
     async def _reconnect_loop(self) -> None:
         """Background reconnection loop."""
         while self._connection_state == ConnectionState.DISCONNECTED:
@@ -257,26 +743,11 @@ class EdgeController:
             import httpx
 
             async with httpx.AsyncClient(timeout=30.0) as client:
-                # Push pending changes
-                pushed_ids = []
-                for change in self._pending_queue[:]:
-                    if change.attempts >= self.config.retry_attempts:
-                        continue
-
-                    try:
-                        success = await self._push_change(client, change)
-                        if success:
-                            pushed_ids.append(change.id)
-                            result["pushed"] += 1
-                        else:
-                            change.attempts += 1
-                    except Exception as e:
-                        change.attempts += 1
-                        change.last_error = str(e)
-                        result["errors"].append(str(e))
-
-                # Remove successfully pushed changes
-                self._pending_queue = [c for c in self._pending_queue if c.id not in pushed_ids]
+                # Push pending changes, removing each once acknowledged
+                if self._hub_capabilities.bulk_sync:
+                    await self._push_batched(client, result)
+                else:
+                    await self._push_individually(client, result)
 
                 # Pull updates from hub (delta sync)
                 pulled = await self._pull_from_hub(client)
@@ -290,11 +761,134 @@ class EdgeController:
 
         return result
 
+    async def _push_individually(self, client: Any, result: dict[str, Any]) -> None:
+        """Push pending changes one request at a time."""
+        for change in self._pending_queue.ordered():
+            if change.attempts >= self.config.retry_attempts:
+                continue
+
+            try:
+                [loaded] = await self._pending_queue.checkout([change])
+                success = await self._push_change(client, loaded)
+                if success:
+                    await self._pending_queue.acknowledge(change)
+                    result["pushed"] += 1
+                else:
+                    await self._pending_queue.record_failure(change)
+            except Exception as e:
+                await self._pending_queue.record_failure(change, str(e))
+                result["errors"].append(str(e))
+
+    async def _push_batched(self, client: Any, result: dict[str, Any]) -> None:
+        """Push pending changes in batches to the hub's bulk endpoint.
+
+        Updates are sent as JSON Patch deltas against the last version the
+        hub acknowledged when that is smaller than the document; changes the
+        hub rejects with ``base_mismatch`` are resent in full.
+        """
+        ready = [
+            c
+            for c in self._pending_queue.ordered()
+            if c.attempts < self.config.retry_attempts and c.entity_type in _HUB_ENDPOINTS
+        ]
+        batch_size = max(1, self.config.push_batch_size)
+
+        for start in range(0, len(ready), batch_size):
+            batch = {c.id: c for c in ready[start : start + batch_size]}
+            try:
+                # Payloads are only read from the store for the batch being sent
+                loaded = await self._pending_queue.checkout(list(batch.values()))
+                statuses = await self._post_change_batch(
+                    client,
+                    [self._to_wire_change(c, self.config.delta_sync) for c in loaded],
+                )
+                rebase = [
+                    c for c in loaded if statuses.get(c.id, {}).get("status") == "base_mismatch"
+                ]
+                if rebase:
+                    statuses.update(
+                        await self._post_change_batch(
+                            client, [self._to_wire_change(c, False) for c in rebase]
+                        )
+                    )
+            except Exception as e:
+                for change in batch.values():
+                    await self._pending_queue.record_failure(change, str(e))
+                result["errors"].append(str(e))
+                continue
+
+            for sent in loaded:
+                change = batch[sent.id]
+                status = statuses.get(sent.id, {})
+                if status.get("status") in ("applied", "skipped"):
+                    self._remember_base(sent, status.get("etag"))
+                    await self._pending_queue.acknowledge(change)
+                    result["pushed"] += 1
+                else:
+                    await self._pending_queue.record_failure(change, status.get("error"))
+
+    async def _post_change_batch(
+        self, client: Any, changes: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """POST one batch and return per-change results keyed by change ID."""
+        encoding = choose_encoding(self._hub_capabilities.sync_encodings)
+        body = encode_body({"changes": changes}, encoding)
+        headers = {"Content-Type": "application/json"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+
+        self._bytes_sent += len(body)
+        response = await client.post(
+            f"{self.config.hub_url}{BULK_CHANGES_PATH}", content=body, headers=headers
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"Batch push failed: HTTP {response.status_code}")
+        return {r.get("changeId"): r for r in response.json().get("results", [])}
+
+    def _to_wire_change(self, change: PendingChange, use_delta: bool) -> dict[str, Any]:
+        """Build the bulk-push representation of a pending change."""
+        wire: dict[str, Any] = {
+            "changeId": change.id,
+            "entityType": change.entity_type,
+            "entityId": change.entity_id,
+            "operation": change.action,
+            "doc": None,
+            "etag": generate_etag(change.data) if change.data else None,
+        }
+        if change.data is None or change.action == "delete":
+            return wire
+
+        doc = orjson.loads(change.data)
+        base = self._delta_bases.get((change.entity_type, change.entity_id))
+        if use_delta and self._hub_capabilities.delta_sync and change.action == "update" and base:
+            patch = make_patch(orjson.loads(base[1]), doc)
+            if len(orjson.dumps(patch)) < len(change.data):
+                wire["patch"] = patch
+                wire["baseEtag"] = base[0]
+                return wire
+
+        wire["doc"] = doc
+        return wire
+
+    def _remember_base(self, change: PendingChange, hub_etag: str | None) -> None:
+        """Record the version the hub acknowledged as the next delta base."""
+        key = (change.entity_type, change.entity_id)
+        if change.action == "delete" or not change.data or not hub_etag:
+            self._delta_bases.pop(key, None)
+            return
+
+        self._delta_bases[key] = (hub_etag, change.data)
+        self._delta_bases.move_to_end(key)
+        while len(self._delta_bases) > self.config.delta_base_cache_size:
+            self._delta_bases.popitem(last=False)
+
     async def _push_change(self, client: Any, change: PendingChange) -> bool:
         """Push a single change to hub."""
         if not self.config.hub_url or not change.data:
             return False
 
+        self._bytes_sent += len(change.data)
+
         endpoint = f"{self.config.hub_url}"
         if change.entity_type == "aas":
             endpoint += "/shells"
@@ -366,6 +960,9 @@ class EdgeController:
         if not self.config.hub_url:
             return 0
 
+        if self._merkle_index is not None:
+            return await self._pull_entity_type_merkle(client, entity_type, endpoint)
+
         pulled = 0
         cursor = self._get_sync_cursor(entity_type)
         url = f"{self.config.hub_url}{endpoint}"
@@ -411,6 +1008,50 @@ class EdgeController:
 
         return pulled
 
+    async def _pull_entity_type_merkle(self, client: Any, entity_type: str, endpoint: str) -> int:
+        """Pull only entities whose hash-tree buckets differ from the hub.
+
+        Args:
+            client: HTTP client
+            entity_type: Type of entity (aas, submodel)
+            endpoint: API endpoint path
+
+        Returns:
+            Number of items pulled
+        """
+        assert self._merkle_index is not None and self.config.hub_url
+        pulled = 0
+
+        try:
+            delta = await reconcile(
+                self._merkle_index, RemoteMerkleIndex(client, self.config.hub_url), entity_type
+            )
+        except Exception as e:
+            logger.error(f"Hash-tree reconcile of {entity_type} failed: {e}")
+            return 0
+
+        for entity_id, remote_etag in delta.changed.items():
+            local_etag = delta.local_etags.get(entity_id)
+            encoded = base64.urlsafe_b64encode(entity_id.encode()).decode().rstrip("=")
+            try:
+                response = await client.get(f"{self.config.hub_url}{endpoint}/{encoded}")
+                if response.status_code != 200:
+                    logger.error(f"Failed to pull {entity_type}: {response.status_code}")
+                    continue
+                # The hub may have changed since the bucket listing
+                etag = response.headers.get("ETag", "").strip('"') or remote_etag
+                if etag == local_etag:
+                    # Already identical locally: neither an update nor a conflict
+                    continue
+                item = response.json()
+                item["_etag"] = etag
+                await self._process_pulled_item(entity_type, item)
+                pulled += 1
+            except Exception as e:
+                logger.error(f"Error processing {entity_type} item: {e}")
+
+        return pulled
+
     async def _process_pulled_item(self, entity_type: str, item: dict[str, Any]) -> None:
         """Process a single pulled item.
 
@@ -544,7 +1185,7 @@ class EdgeController:
 
     async def _sync_high_priority(self) -> None:
         """Sync only high-priority items."""
-        high_priority = [c for c in self._pending_queue if c.priority == SyncPriority.HIGH]
+        high_priority = self._pending_queue.ordered(SyncPriority.HIGH)
         if not high_priority:
             return
 
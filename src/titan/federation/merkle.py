@@ -0,0 +1,379 @@
+"""Hash-tree anti-entropy for federation and edge sync.
+
+Summarizes a repository as a fixed-depth hash tree so two instances can
+find their differences without listing every entity:
+- Entities are bucketed by the hex prefix of md5(identifier)
+- Each node digest is the XOR of 64-bit hashes of ``identifier:etag``
+  for all entities below it, built from the stored ``etag`` columns
+- Peers compare nodes top-down and only descend into differing subtrees;
+  only leaf buckets that differ are listed as (identifier, etag) pairs
+
+With depth 4 there are 65,536 leaf buckets, so two 1M-entity repositories
+differing by a few hundred entities exchange a few hundred small buckets.
+
+Example:
+    local = DatabaseMerkleIndex(get_session_factory())
+    remote = RemoteMerkleIndex(client, "https://hub.example.com")
+    delta = await reconcile(local, remote, "submodel")
+    for entity_id, remote_etag in delta.changed.items():
+        ...  # fetch only these entities
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+from sqlalchemy import func, literal_column, select, text
+
+from titan.persistence.tables import AasTable, ConceptDescriptionTable, SubmodelTable
+from titan.tenancy.context import get_current_tenant
+
+if TYPE_CHECKING:
+    import httpx
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# Number of hex characters in a leaf bucket prefix (16-way fanout per level)
+TREE_DEPTH = 4
+
+# Maximum prefixes/buckets requested from a remote index per HTTP call
+MAX_PREFIXES_PER_REQUEST = 256
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+_HEX = "0123456789abcdef"
+
+_TABLES: dict[str, Any] = {
+    "aas": AasTable,
+    "submodel": SubmodelTable,
+    "concept_description": ConceptDescriptionTable,
+}
+
+# Mirrors bucket_of()/entity_hash() so Postgres aggregates leaves itself
+_LEAF_QUERY = """
+    SELECT substr(md5(identifier), 1, {depth}) AS bucket,
+           count(*) AS cnt,
+           bit_xor(('x' || substr(md5(identifier || ':' || etag), 1, 16))::bit(64)::bigint)
+               AS digest
+    FROM {table}
+    GROUP BY 1
+"""
+
+
+def bucket_of(identifier: str, depth: int = TREE_DEPTH) -> str:
+    """Return the leaf bucket (hex prefix) for an identifier."""
+    return hashlib.md5(identifier.encode(), usedforsecurity=False).hexdigest()[:depth]
+
+
+def entity_hash(identifier: str, etag: str) -> int:
+    """Return the 64-bit hash contributed by one entity version."""
+    digest = hashlib.md5(f"{identifier}:{etag}".encode(), usedforsecurity=False).hexdigest()
+    return int(digest[:16], 16)
+
+
+@dataclass(frozen=True, slots=True)
+class MerkleNode:
+    """Summary of one subtree: XOR digest and entity count."""
+
+    digest: int = 0
+    count: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {"hash": f"{self.digest:016x}", "count": self.count}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MerkleNode:
+        """Parse a node from its API representation."""
+        return cls(digest=int(data.get("hash", "0"), 16), count=int(data.get("count", 0)))
+
+
+_EMPTY = MerkleNode()
+
+
+class MerkleTree:
+    """Fixed-depth hash tree over (identifier, etag) pairs.
+
+    Only non-empty nodes are stored.
+    """
+
+    def __init__(self, leaves: dict[str, MerkleNode], depth: int = TREE_DEPTH) -> None:
+        self.depth = depth
+        self._nodes: dict[str, MerkleNode] = dict(leaves)
+
+        # Aggregate each level into its parent
+        level = leaves
+        for length in range(depth - 1, -1, -1):
+            parents: dict[str, list[int]] = {}
+            for prefix, node in level.items():
+                acc = parents.setdefault(prefix[:length], [0, 0])
+                acc[0] ^= node.digest
+                acc[1] += node.count
+            level = {p: MerkleNode(digest=d, count=c) for p, (d, c) in parents.items()}
+            self._nodes.update(level)
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[tuple[str, str]], depth: int = TREE_DEPTH
+    ) -> MerkleTree:
+        """Build a tree from (identifier, etag) pairs."""
+        leaves: dict[str, list[int]] = {}
+        for identifier, etag in entries:
+            acc = leaves.setdefault(bucket_of(identifier, depth), [0, 0])
+            acc[0] ^= entity_hash(identifier, etag)
+            acc[1] += 1
+        return cls({b: MerkleNode(digest=d, count=c) for b, (d, c) in leaves.items()}, depth)
+
+    @property
+    def root(self) -> MerkleNode:
+        """Summary of the whole repository."""
+        return self.node("")
+
+    def node(self, prefix: str) -> MerkleNode:
+        """Get the node for a prefix (empty node if no entities below it)."""
+        return self._nodes.get(prefix, _EMPTY)
+
+    def children(self, prefix: str) -> dict[str, MerkleNode]:
+        """Get the non-empty children of a prefix."""
+        if len(prefix) >= self.depth:
+            return {}
+        return {prefix + c: self._nodes[prefix + c] for c in _HEX if prefix + c in self._nodes}
+
+    def describe(self, prefixes: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Describe nodes and their children for the tree exchange protocol."""
+        return {
+            prefix: {
+                **self.node(prefix).to_dict(),
+                "children": {p: n.to_dict() for p, n in self.children(prefix).items()},
+            }
+            for prefix in prefixes
+        }
+
+
+@dataclass
+class MerkleDelta:
+    """Entities that differ between a local and a remote index."""
+
+    # identifier -> remote etag, for entities missing or different locally
+    changed: dict[str, str] = field(default_factory=dict)
+    # identifier -> local etag, for entities that differ (subset of changed)
+    local_etags: dict[str, str] = field(default_factory=dict)
+    # identifiers present locally but not remotely
+    missing_remote: set[str] = field(default_factory=set)
+    # leaf buckets that had to be listed
+    buckets: list[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if both sides are identical."""
+        return not self.changed and not self.missing_remote
+
+
+class MerkleIndex(Protocol):
+    """Source of hash-tree nodes and leaf bucket entries."""
+
+    async def nodes(self, entity_type: str, prefixes: list[str]) -> dict[str, dict[str, Any]]:
+        """Describe nodes and their children (see ``MerkleTree.describe``)."""
+        ...
+
+    async def bucket_entries(self, entity_type: str, buckets: list[str]) -> dict[str, str]:
+        """List identifier -> etag for all entities in the given leaf buckets."""
+        ...
+
+
+class StaticMerkleIndex:
+    """Merkle index over in-memory (identifier, etag) pairs."""
+
+    def __init__(self, entries: dict[str, dict[str, str]], depth: int = TREE_DEPTH) -> None:
+        self._entries = entries
+        self._trees = {
+            entity_type: MerkleTree.from_entries(items.items(), depth)
+            for entity_type, items in entries.items()
+        }
+        self.depth = depth
+
+    async def nodes(self, entity_type: str, prefixes: list[str]) -> dict[str, dict[str, Any]]:
+        tree = self._trees.get(entity_type) or MerkleTree({}, self.depth)
+        return tree.describe(prefixes)
+
+    async def bucket_entries(self, entity_type: str, buckets: list[str]) -> dict[str, str]:
+        wanted = set(buckets)
+        return {
+            identifier: etag
+            for identifier, etag in self._entries.get(entity_type, {}).items()
+            if bucket_of(identifier, self.depth) in wanted
+        }
+
+
+class DatabaseMerkleIndex:
+    """Merkle index computed from the stored per-entity etag columns.
+
+    Leaf buckets are aggregated by Postgres in one GROUP BY query per
+    entity type (requires PostgreSQL 14+ for ``bit_xor``); the resulting
+    tree is cached for ``ttl`` seconds so a tree walk costs one scan.
+    Sessions only see the current tenant's rows under row-level security,
+    so trees are cached per (tenant, entity type).
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl: float = 5.0,
+        depth: int = TREE_DEPTH,
+    ) -> None:
+        self._session_factory = session_factory
+        self.ttl = ttl
+        self.depth = depth
+        self._trees: dict[tuple[str, str], tuple[float, MerkleTree]] = {}
+
+    async def tree(self, entity_type: str) -> MerkleTree:
+        """Get the (cached) tree for an entity type of the current tenant."""
+        key = (get_current_tenant(), entity_type)
+        cached = self._trees.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.ttl:
+            return cached[1]
+
+        table = _table_for(entity_type)
+        query = text(_LEAF_QUERY.format(depth=self.depth, table=table.__tablename__))
+        async with self._session_factory() as session:
+            result = await session.execute(query)
+            leaves = {
+                row.bucket: MerkleNode(digest=int(row.digest) & _MASK_64, count=int(row.cnt))
+                for row in result.all()
+            }
+
+        tree = MerkleTree(leaves, self.depth)
+        self._trees[key] = (now, tree)
+        return tree
+
+    def invalidate(self, entity_type: str | None = None) -> None:
+        """Drop cached trees of all tenants (all entity types if none given)."""
+        if entity_type is None:
+            self._trees.clear()
+        else:
+            for key in [key for key in self._trees if key[1] == entity_type]:
+                del self._trees[key]
+
+    async def nodes(self, entity_type: str, prefixes: list[str]) -> dict[str, dict[str, Any]]:
+        tree = await self.tree(entity_type)
+        return tree.describe(prefixes)
+
+    async def bucket_entries(self, entity_type: str, buckets: list[str]) -> dict[str, str]:
+        if not buckets:
+            return {}
+        table = _table_for(entity_type)
+        # Inline constants so the expression matches the bucket index
+        bucket_expr = func.substr(
+            func.md5(table.identifier), literal_column("1"), literal_column(str(self.depth))
+        )
+        stmt = select(table.identifier, table.etag).where(bucket_expr.in_(buckets))
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            return {row.identifier: row.etag for row in result.all()}
+
+
+class RemoteMerkleIndex:
+    """Merkle index of a peer, queried over its federation API."""
+
+    def __init__(self, client: httpx.AsyncClient, base_url: str) -> None:
+        self._client = client
+        self._base_url = base_url.rstrip("/")
+
+    async def nodes(self, entity_type: str, prefixes: list[str]) -> dict[str, dict[str, Any]]:
+        nodes: dict[str, dict[str, Any]] = {}
+        url = f"{self._base_url}/federation/sync/tree/{entity_type}"
+        for chunk in _chunks(prefixes):
+            response = await self._client.get(url, params={"prefix": chunk})
+            response.raise_for_status()
+            nodes.update(response.json().get("nodes", {}))
+        return nodes
+
+    async def bucket_entries(self, entity_type: str, buckets: list[str]) -> dict[str, str]:
+        entries: dict[str, str] = {}
+        url = f"{self._base_url}/federation/sync/tree/{entity_type}/entries"
+        for chunk in _chunks(buckets):
+            response = await self._client.get(url, params={"bucket": chunk})
+            response.raise_for_status()
+            entries.update(response.json().get("entries", {}))
+        return entries
+
+
+async def reconcile(
+    local: MerkleIndex,
+    remote: MerkleIndex,
+    entity_type: str,
+    depth: int = TREE_DEPTH,
+) -> MerkleDelta:
+    """Find entities that differ between two indexes.
+
+    Walks both trees level by level, requesting all differing prefixes of a
+    level in one batch, then lists only the differing leaf buckets.
+    """
+    delta = MerkleDelta()
+    frontier = [""]
+    differing_buckets: list[str] = []
+
+    while frontier:
+        local_nodes = await local.nodes(entity_type, frontier)
+        remote_nodes = await remote.nodes(entity_type, frontier)
+        next_frontier: list[str] = []
+
+        for prefix in frontier:
+            local_node = local_nodes.get(prefix, {})
+            remote_node = remote_nodes.get(prefix, {})
+            if _same(local_node, remote_node):
+                continue
+            if len(prefix) >= depth:
+                differing_buckets.append(prefix)
+                continue
+
+            local_children = local_node.get("children", {})
+            remote_children = remote_node.get("children", {})
+            for child in sorted(local_children.keys() | remote_children.keys()):
+                if not _same(local_children.get(child, {}), remote_children.get(child, {})):
+                    next_frontier.append(child)
+
+        frontier = next_frontier
+
+    if not differing_buckets:
+        return delta
+
+    delta.buckets = differing_buckets
+    local_entries = await local.bucket_entries(entity_type, differing_buckets)
+    remote_entries = await remote.bucket_entries(entity_type, differing_buckets)
+
+    for identifier, remote_etag in remote_entries.items():
+        local_etag = local_entries.get(identifier)
+        if local_etag != remote_etag:
+            delta.changed[identifier] = remote_etag
+            if local_etag is not None:
+                delta.local_etags[identifier] = local_etag
+
+    delta.missing_remote = local_entries.keys() - remote_entries.keys()
+    return delta
+
+
+def _same(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """Compare two node summaries (missing nodes are empty)."""
+    return int(a.get("hash", "0"), 16) == int(b.get("hash", "0"), 16) and a.get(
+        "count", 0
+    ) == b.get("count", 0)
+
+
+def _table_for(entity_type: str) -> Any:
+    """Resolve the table for an entity type."""
+    table = _TABLES.get(entity_type)
+    if table is None:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+    return table
+
+
+def _chunks(items: list[str]) -> list[list[str]]:
+    """Split a list into request-sized chunks."""
+    return [
+        items[i : i + MAX_PREFIXES_PER_REQUEST]
+        for i in range(0, len(items), MAX_PREFIXES_PER_REQUEST)
+    ]
@@ -39,9 +39,40 @@ class PeerCapabilities:
     submodel_registry: bool = False
     aasx_server: bool = False
     read_only: bool = False
+    bulk_sync: bool = False  # Accepts batched changes on /federation/sync/changes
+    merkle_sync: bool = False  # Serves hash-tree nodes on /federation/sync/tree
+    delta_sync: bool = False  # Accepts JSON Patch deltas in batched changes
+    sync_encodings: list[str] = field(default_factory=list)  # Content-Encodings for sync bodies
     max_payload_size: int = 10 * 1024 * 1024  # 10MB default
 
 
+def capabilities_from_openapi(spec: dict[str, Any]) -> PeerCapabilities:
+    """Derive peer capabilities from its OpenAPI document.
+
+    Args:
+        spec: Parsed ``/openapi.json`` of the peer
+
+    Returns:
+        Capabilities inferred from the advertised paths
+    """
+    paths = spec.get("paths", {})
+
+    caps = PeerCapabilities()
+    caps.aas_repository = "/shells" in paths
+    caps.submodel_repository = "/submodels" in paths
+    caps.aas_registry = "/shell-descriptors" in paths
+    caps.submodel_registry = "/submodel-descriptors" in paths
+    caps.aasx_server = "/packages" in paths
+    caps.bulk_sync = "/federation/sync/changes" in paths
+    caps.merkle_sync = "/federation/sync/tree/{entity_type}" in paths
+
+    # Wire options are advertised as extensions on the bulk change operation
+    bulk_op = paths.get("/federation/sync/changes", {}).get("post", {})
+    caps.delta_sync = bool(bulk_op.get("x-delta-sync", False))
+    caps.sync_encodings = list(bulk_op.get("x-sync-encodings", []))
+    return caps
+
+
 @dataclass
 class Peer:
     """A federated Titan-AAS instance."""
@@ -75,6 +106,10 @@ class Peer:
                 "submodelRegistry": self.capabilities.submodel_registry,
                 "aasxServer": self.capabilities.aasx_server,
                 "readOnly": self.capabilities.read_only,
+                "bulkSync": self.capabilities.bulk_sync,
+                "merkleSync": self.capabilities.merkle_sync,
+                "deltaSync": self.capabilities.delta_sync,
+                "syncEncodings": list(self.capabilities.sync_encodings),
             },
             "lastSeen": self.last_seen.isoformat() if self.last_seen else None,
             "lastSync": self.last_sync.isoformat() if self.last_sync else None,
@@ -182,17 +217,7 @@ class PeerRegistry:
             # Check OpenAPI spec for available endpoints
             response = await self._client.get(f"{peer.url}/openapi.json")
             if response.status_code == 200:
-                spec = response.json()
-                paths = spec.get("paths", {})
-
-                caps = PeerCapabilities()
-                caps.aas_repository = "/shells" in paths
-                caps.submodel_repository = "/submodels" in paths
-                caps.aas_registry = "/shell-descriptors" in paths
-                caps.submodel_registry = "/submodel-descriptors" in paths
-                caps.aasx_server = "/packages" in paths
-
-                peer.capabilities = caps
+                peer.capabilities = capabilities_from_openapi(response.json())
 
         except Exception as e:
             logger.warning(f"Failed to discover capabilities for {peer.id}: {e}")
@@ -9,7 +9,9 @@ Provides bi-directional sync between federated Titan-AAS instances with:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import zlib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -19,13 +21,17 @@ from uuid import uuid4
 import httpx
 
 from titan.federation.conflicts import ConflictInfo, ConflictManager, ResolutionStrategy
+from titan.federation.merkle import MerkleIndex, RemoteMerkleIndex, reconcile
 from titan.federation.peer import Peer, PeerRegistry
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Receiving endpoint for batched change pushes (see api/routers/federation.py)
+BULK_CHANGES_PATH = "/federation/sync/changes"
+
 
 class SyncMode(str, Enum):
     """Synchronization modes."""
@@ -72,18 +78,21 @@ class ChangeQueue:
     """Queue of pending changes to push to peers.
 
     Tracks local changes that need to be synchronized to remote peers.
+    Changes are kept in an insertion-ordered dict keyed by change ID, so
+    acknowledging and evicting changes are O(1) per change.
     """
 
-    _changes: list[SyncChange] = field(default_factory=list)
+    _changes: dict[str, SyncChange] = field(default_factory=dict)
     _max_size: int = 10000
 
     def add(self, change: SyncChange) -> None:
         """Add a change to the queue."""
         if len(self._changes) >= self._max_size:
             # Drop oldest changes if queue is full
-            self._changes = self._changes[-self._max_size + 1 :]
+            while len(self._changes) >= self._max_size:
+                del self._changes[next(iter(self._changes))]
             logger.warning("Change queue overflow, dropped oldest changes")
-        self._changes.append(change)
+        self._changes[change.id] = change
 
     def get_pending(self, since: datetime | None = None) -> list[SyncChange]:
         """Get pending changes since a timestamp.
@@ -95,10 +104,10 @@ class ChangeQueue:
             List of pending changes
         """
         if since is None:
-            return list(self._changes)
-        return [c for c in self._changes if c.timestamp > since]
+            return list(self._changes.values())
+        return [c for c in self._changes.values() if c.timestamp > since]
 
-    def mark_synced(self, change_ids: list[str]) -> int:
+    def mark_synced(self, change_ids: Iterable[str]) -> int:
         """Remove synced changes from queue.
 
         Args:
@@ -107,9 +116,11 @@ class ChangeQueue:
         Returns:
             Number of changes removed
         """
-        before = len(self._changes)
-        self._changes = [c for c in self._changes if c.id not in change_ids]
-        return before - len(self._changes)
+        removed = 0
+        for change_id in change_ids:
+            if self._changes.pop(change_id, None) is not None:
+                removed += 1
+        return removed
 
     def clear(self) -> None:
         """Clear all pending changes."""
@@ -130,6 +141,8 @@ class SyncResult:
     conflicts: int = 0
     errors: list[str] = field(default_factory=list)
     duration_ms: float = 0
+    # Change IDs that were due for this peer but not acknowledged
+    unacknowledged: set[str] = field(default_factory=set)
 
 
 @dataclass
@@ -148,6 +161,10 @@ class FederationSync:
     sync_timeout: float = 30.0
     delta_sync_enabled: bool = True
     hub_peer_id: str | None = None  # Only used for HUB_SPOKE topology
+    max_concurrent_peers: int = 8  # Peers synced in parallel
+    max_in_flight_per_peer: int = 4  # Concurrent push requests per peer
+    push_batch_size: int = 500  # Changes per bulk push request
+    merkle_index: MerkleIndex | None = None  # Local hash tree for anti-entropy pulls
     _etag_store: dict[str, str] = field(default_factory=dict)  # entity_id -> etag
     _local_data_provider: Callable[[str, str], dict | None] | None = None
 
@@ -220,31 +237,44 @@ class FederationSync:
         total_conflicts = 0
         total_errors: list[str] = []
 
-        async with httpx.AsyncClient(timeout=self.sync_timeout) as client:
-            for peer in peers:
+        # Snapshot pending changes once so concurrent peers see the same set
+        snapshot_time = datetime.now(UTC)
+        pending = self.change_queue.get_pending()
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_peers))
+
+        async def sync_peer(client: httpx.AsyncClient, peer: Peer) -> SyncResult:
+            async with semaphore:
                 try:
-                    result = await self._sync_with_peer(client, peer)
-                    results.append(result)
+                    result = await self._sync_with_peer(client, peer, pending)
+                    # Delta pushes skip changes older than last_sync, so it may
+                    # only advance once the peer acknowledged the whole snapshot
+                    # (and not past it: later changes are not in the snapshot)
+                    if result.success and not result.unacknowledged:
+                        peer.last_sync = snapshot_time
+                    return result
+                except Exception as e:
+                    logger.error(f"Sync with {peer.id} failed: {e}")
+                    return SyncResult(
+                        peer_id=peer.id,
+                        success=False,
+                        errors=[f"Sync with {peer.id} failed: {e}"],
+                        unacknowledged={c.id for c in pending},
+                    )
 
-                    total_pushed += result.pushed
-                    total_pulled += result.pulled
-                    total_conflicts += result.conflicts
-                    total_errors.extend(result.errors)
+        async with httpx.AsyncClient(timeout=self.sync_timeout) as client:
+            results = list(await asyncio.gather(*(sync_peer(client, peer) for peer in peers)))
 
-                    # Update peer last_sync timestamp
-                    peer.last_sync = datetime.now(UTC)
+        unacknowledged: set[str] = set()
+        for result in results:
+            total_pushed += result.pushed
+            total_pulled += result.pulled
+            total_conflicts += result.conflicts
+            total_errors.extend(result.errors)
+            unacknowledged |= result.unacknowledged
 
-                except Exception as e:
-                    error_msg = f"Sync with {peer.id} failed: {e}"
-                    logger.error(error_msg)
-                    total_errors.append(error_msg)
-                    results.append(
-                        SyncResult(
-                            peer_id=peer.id,
-                            success=False,
-                            errors=[str(e)],
-                        )
-                    )
+        # A change leaves the queue once every peer it was due for acknowledged it
+        if pending and self.mode in (SyncMode.PUSH, SyncMode.BIDIRECTIONAL):
+            self.change_queue.mark_synced(c.id for c in pending if c.id not in unacknowledged)
 
         end_time = datetime.now(UTC)
         duration_ms = (end_time - start_time).total_seconds() * 1000
@@ -302,57 +332,89 @@ class FederationSync:
             # Mesh topology - sync with all healthy peers
             return self.registry.list_healthy()
 
-    async def _sync_with_peer(self, client: httpx.AsyncClient, peer: Peer) -> SyncResult:
+    async def _sync_with_peer(
+        self,
+        client: httpx.AsyncClient,
+        peer: Peer,
+        pending: list[SyncChange] | None = None,
+    ) -> SyncResult:
         """Sync with a single peer.
 
+        Push and pull run concurrently since they touch disjoint data.
+
         Args:
             client: HTTP client
             peer: Peer to sync with
+            pending: Snapshot of queued changes (defaults to the current queue)
 
         Returns:
             Sync result for this peer
         """
         start_time = datetime.now(UTC)
         result = SyncResult(peer_id=peer.id, success=True)
+        if pending is None:
+            pending = self.change_queue.get_pending()
 
-        try:
-            if self.mode in (SyncMode.PUSH, SyncMode.BIDIRECTIONAL):
-                pushed = await self._push_to_peer(client, peer)
-                result.pushed = pushed
+        push = self.mode in (SyncMode.PUSH, SyncMode.BIDIRECTIONAL)
+        pull = self.mode in (SyncMode.PULL, SyncMode.BIDIRECTIONAL)
 
-            if self.mode in (SyncMode.PULL, SyncMode.BIDIRECTIONAL):
-                pulled, conflicts = await self._pull_from_peer(client, peer)
-                result.pulled = pulled
-                result.conflicts = conflicts
+        push_outcome, pull_outcome = await asyncio.gather(
+            self._push_to_peer(client, peer, pending, result) if push else _noop(0),
+            self._pull_from_peer(client, peer) if pull else _noop((0, 0)),
+            return_exceptions=True,
+        )
 
-        except Exception as e:
+        if isinstance(push_outcome, BaseException):
             result.success = False
-            result.errors.append(str(e))
-            logger.error(f"Sync with peer {peer.id} failed: {e}")
+            result.errors.append(str(push_outcome))
+            result.unacknowledged |= {c.id for c in pending}
+            logger.error(f"Push to peer {peer.id} failed: {push_outcome}")
+        else:
+            result.pushed = push_outcome
+
+        if isinstance(pull_outcome, BaseException):
+            result.success = False
+            result.errors.append(str(pull_outcome))
+            logger.error(f"Pull from peer {peer.id} failed: {pull_outcome}")
+        else:
+            result.pulled, result.conflicts = pull_outcome
 
         end_time = datetime.now(UTC)
         result.duration_ms = (end_time - start_time).total_seconds() * 1000
 
         return result
 
-    async def _push_to_peer(self, client: httpx.AsyncClient, peer: Peer) -> int:
+    async def _push_to_peer(
+        self,
+        client: httpx.AsyncClient,
+        peer: Peer,
+        pending: list[SyncChange],
+        result: SyncResult,
+    ) -> int:
         """Push local changes to a peer.
 
-        Pushes pending changes from the change queue to the peer.
         Only pushes changes that occurred since the last sync with this peer.
+        Peers advertising ``bulk_sync`` receive changes in batches of
+        ``push_batch_size``; others receive one request per change.
+
+        Changes are hashed by entity into at most ``max_in_flight_per_peer``
+        lanes that are pushed concurrently. Each lane is sent in order, one
+        request at a time, so the changes of one entity arrive in the order
+        they were made; after a change is not acknowledged, the entity's
+        later changes wait for the next round.
 
         Args:
             client: HTTP client
             peer: Target peer
+            pending: Snapshot of queued changes
+            result: Sync result collecting unacknowledged change IDs
 
         Returns:
             Number of items pushed
         """
-        pushed = 0
-
         # Get changes since last sync (delta sync)
         since = peer.last_sync if self.delta_sync_enabled else None
-        changes = self.change_queue.get_pending(since=since)
+        changes = pending if since is None else [c for c in pending if c.timestamp > since]
 
         if not changes:
             logger.debug(f"No pending changes to push to peer {peer.id}")
@@ -360,22 +422,71 @@ class FederationSync:
 
         logger.debug(f"Pushing {len(changes)} changes to peer {peer.id}")
 
-        synced_ids: list[str] = []
-
+        acknowledged: set[str] = set()
+        size = max(1, self.push_batch_size) if peer.capabilities.bulk_sync else 1
+        # No more lanes than requests, so small pushes stay a single batch
+        lane_count = min(max(1, self.max_in_flight_per_peer), -(-len(changes) // size))
+        lanes: list[list[SyncChange]] = [[] for _ in range(lane_count)]
         for change in changes:
-            try:
-                success = await self._push_single_change(client, peer, change)
-                if success:
-                    pushed += 1
-                    synced_ids.append(change.id)
-            except Exception as e:
-                logger.warning(f"Failed to push change {change.id} to {peer.id}: {e}")
+            lanes[_entity_lane(change, lane_count)].append(change)
+
+        async def push_lane(lane: list[SyncChange]) -> None:
+            blocked: set[tuple[str, str]] = set()
+            for i in range(0, len(lane), size):
+                batch = [c for c in lane[i : i + size] if _entity_key(c) not in blocked]
+                if not batch:
+                    continue
+                if peer.capabilities.bulk_sync:
+                    applied = await self._push_batch(client, peer, batch)
+                else:
+                    applied = set()
+                    try:
+                        if await self._push_single_change(client, peer, batch[0]):
+                            applied.add(batch[0].id)
+                    except Exception as e:
+                        logger.warning(f"Failed to push change {batch[0].id} to {peer.id}: {e}")
+                acknowledged.update(applied)
+                blocked.update(_entity_key(c) for c in batch if c.id not in applied)
+
+        await asyncio.gather(*(push_lane(lane) for lane in lanes))
+
+        result.unacknowledged |= {c.id for c in changes if c.id not in acknowledged}
+        return len(acknowledged)
+
+    async def _push_batch(
+        self,
+        client: httpx.AsyncClient,
+        peer: Peer,
+        batch: list[SyncChange],
+    ) -> set[str]:
+        """Push a batch of changes in a single request.
+
+        Args:
+            client: HTTP client
+            peer: Target peer
+            batch: Changes to push
 
-        # Mark successfully synced changes
-        if synced_ids:
-            self.change_queue.mark_synced(synced_ids)
+        Returns:
+            IDs of changes the peer applied or already had
+        """
+        try:
+            response = await client.post(
+                f"{peer.url}{BULK_CHANGES_PATH}",
+                json={"changes": [change.to_dict() for change in batch]},
+            )
+            if response.status_code != 200:
+                logger.warning(f"Bulk push to {peer.id} failed: {response.status_code}")
+                return set()
 
-        return pushed
+            return {
+                item["changeId"]
+                for item in response.json().get("results", [])
+                if item.get("status") in ("applied", "skipped")
+            }
+
+        except Exception as e:
+            logger.error(f"Bulk push to {peer.id} failed: {e}")
+            return set()
 
     async def _push_single_change(
         self,
@@ -479,6 +590,9 @@ class FederationSync:
         Returns:
             Tuple of (items_pulled, conflicts_detected)
         """
+        if self.merkle_index is not None and peer.capabilities.merkle_sync:
+            return await self._pull_entity_type_merkle(client, peer, entity_type, endpoint)
+
         pulled = 0
         conflicts = 0
         cursor: str | None = None
@@ -524,11 +638,85 @@ class FederationSync:
 
         return pulled, conflicts
 
+    async def _pull_entity_type_merkle(
+        self,
+        client: httpx.AsyncClient,
+        peer: Peer,
+        entity_type: str,
+        endpoint: str,
+    ) -> tuple[int, int]:
+        """Pull only entities whose hash-tree buckets differ from the peer.
+
+        Args:
+            client: HTTP client
+            peer: Source peer
+            entity_type: Type of entity
+            endpoint: API endpoint
+
+        Returns:
+            Tuple of (items_pulled, conflicts_detected)
+        """
+        assert self.merkle_index is not None
+        pulled = 0
+        conflicts = 0
+
+        try:
+            delta = await reconcile(
+                self.merkle_index, RemoteMerkleIndex(client, peer.url), entity_type
+            )
+        except Exception as e:
+            logger.error(f"Hash-tree reconcile of {entity_type} with {peer.id} failed: {e}")
+            return 0, 0
+
+        if delta.is_empty:
+            return 0, 0
+
+        logger.debug(
+            f"Hash-tree reconcile with {peer.id}: {len(delta.changed)} {entity_type} "
+            f"changed in {len(delta.buckets)} buckets"
+        )
+
+        semaphore = asyncio.Semaphore(max(1, self.max_in_flight_per_peer))
+
+        async def fetch(entity_id: str) -> dict[str, Any] | None:
+            async with semaphore:
+                response = await client.get(f"{peer.url}{endpoint}/{_url_encode_id(entity_id)}")
+                if response.status_code != 200:
+                    logger.warning(
+                        f"Fetch {entity_type}/{entity_id} from {peer.id} failed: "
+                        f"{response.status_code}"
+                    )
+                    return None
+                doc: dict[str, Any] = response.json()
+                return doc
+
+        entity_ids = list(delta.changed)
+        docs = await asyncio.gather(*(fetch(i) for i in entity_ids), return_exceptions=True)
+
+        for entity_id, doc in zip(entity_ids, docs, strict=True):
+            if not isinstance(doc, dict):
+                continue
+            has_conflict = await self._check_and_handle_conflict(
+                peer,
+                entity_type,
+                doc,
+                remote_etag=delta.changed[entity_id],
+                local_etag=delta.local_etags.get(entity_id),
+            )
+            if has_conflict:
+                conflicts += 1
+            else:
+                pulled += 1
+
+        return pulled, conflicts
+
     async def _check_and_handle_conflict(
         self,
         peer: Peer,
         entity_type: str,
         remote_doc: dict[str, Any],
+        remote_etag: str | None = None,
+        local_etag: str | None = None,
     ) -> bool:
         """Check if remote document conflicts with local version.
 
@@ -536,16 +724,20 @@ class FederationSync:
             peer: Source peer
             entity_type: Type of entity
             remote_doc: Remote document
+            remote_etag: Stored remote ETag (computed from the doc if unknown)
+            local_etag: Stored local ETag (looked up in the etag store if unknown)
 
         Returns:
             True if conflict was detected
         """
         entity_id = remote_doc.get("id", "")
-        remote_etag = _compute_simple_etag(remote_doc)
+        if remote_etag is None:
+            remote_etag = _compute_simple_etag(remote_doc)
 
         # Check if we have a local version
         key = f"{entity_type}:{entity_id}"
-        local_etag = self._etag_store.get(key)
+        if local_etag is None:
+            local_etag = self._etag_store.get(key)
 
         if local_etag is None:
             # No local version - no conflict
@@ -647,6 +839,30 @@ class FederationSync:
         return count
 
 
+async def _noop(value: Any) -> Any:
+    """Return a value from a coroutine (placeholder for skipped sync phases)."""
+    return value
+
+
+def _entity_key(change: SyncChange) -> tuple[str, str]:
+    """Identify the entity a change applies to."""
+    return change.entity_type, change.entity_id
+
+
+def _entity_lane(change: SyncChange, lanes: int) -> int:
+    """Pick the push lane of a change; stable for all changes of an entity.
+
+    Args:
+        change: Change to place
+        lanes: Number of lanes
+
+    Returns:
+        Lane index in ``range(lanes)``
+    """
+    key = f"{change.entity_type}:{change.entity_id}".encode()
+    return zlib.crc32(key) % lanes
+
+
 def _url_encode_id(entity_id: str) -> str:
     """URL-encode an entity ID using Base64URL.
 
@@ -0,0 +1,97 @@
+"""Compact wire format for edge-to-hub synchronization.
+
+Metered edge links pay for every byte, so batched pushes can:
+- Carry JSON Patch deltas (RFC 6902 add/remove/replace, generated and
+  applied by ``titan.core.json_patch``) against the version the hub last
+  acknowledged instead of full documents
+- Be compressed with zstd (gzip when zstandard is not installed)
+
+Example:
+    body = encode_body({"changes": changes}, "zstd")
+    payload = decode_body(body, "zstd")
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+from typing import Any
+
+import orjson
+
+# Try to import zstandard, fall back to gzip-only if not available
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Content-Encodings accepted for sync bodies, in order of preference
+SUPPORTED_ENCODINGS: tuple[str, ...] = ("zstd", "gzip") if ZSTD_AVAILABLE else ("gzip",)
+
+ZSTD_LEVEL = 3
+
+# Upper bound on decompressed sync bodies (guards against compression bombs)
+MAX_DECODED_SIZE = 256 * 1024 * 1024
+
+
+def choose_encoding(remote_encodings: list[str]) -> str | None:
+    """Pick the preferred Content-Encoding supported by both sides."""
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding in remote_encodings:
+            return encoding
+    return None
+
+
+def encode_body(payload: Any, encoding: str | None) -> bytes:
+    """Serialize and optionally compress a sync body.
+
+    Args:
+        payload: JSON-serializable payload
+        encoding: "zstd", "gzip" or None for plain JSON
+    """
+    body = orjson.dumps(payload)
+    if encoding is None:
+        return body
+    if encoding == "zstd" and ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def decode_body(body: bytes, encoding: str | None) -> bytes:
+    """Decompress a sync body according to its Content-Encoding.
+
+    Raises:
+        ValueError: If the encoding is unsupported or the body is invalid
+    """
+    if not encoding or encoding == "identity":
+        return body
+    if encoding == "zstd" and ZSTD_AVAILABLE:
+        try:
+            decoded = _read_limited(zstandard.ZstdDecompressor().stream_reader(body))
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd body: {e}") from e
+    elif encoding == "gzip":
+        try:
+            decoded = _read_limited(gzip.GzipFile(fileobj=io.BytesIO(body)))
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Invalid gzip body: {e}") from e
+    else:
+        raise ValueError(f"Unsupported encoding: {encoding}")
+    return decoded
+
+
+def _read_limited(reader: Any) -> bytes:
+    """Read a decompression stream, refusing output above MAX_DECODED_SIZE."""
+    chunks: list[bytes] = []
+    total = 0
+    with reader:
+        while chunk := reader.read(1024 * 1024):
+            total += len(chunk)
+            if total > MAX_DECODED_SIZE:
+                raise ValueError("Decoded body too large")
+            chunks.append(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,237 @@
+"""Set-based execution of GraphQL bulk mutations.
+
+``createShells`` and ``deleteShells`` accept thousands of items. Rather
+than one repository call and flush per item, a batch is processed as:
+- Validate every input and flag in-batch duplicate IDs
+- Check which IDs already exist with one query
+- Write the remaining rows with multi-row INSERT/DELETE statements
+- Commit once, then update the cache and publish events in one pipeline each
+
+Each input still gets its own result in input order.
+
+Example:
+    results = await create_shells_bulk(info.context, inputs)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+from titan.cache import RedisCache, get_redis
+from titan.core.ids import encode_id_to_b64url
+from titan.core.model import AssetAdministrationShell
+from titan.events import get_event_bus
+from titan.events.schemas import AasEvent, EventType
+from titan.graphql.converters import shell_from_input, shell_to_graphql
+from titan.graphql.schema import (
+    DeleteMutationResult,
+    MutationError,
+    ShellInput,
+    ShellMutationResult,
+)
+from titan.persistence.repositories import AasRepository
+
+if TYPE_CHECKING:
+    from titan.graphql.dataloaders import DataLoaderContext
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT", ShellMutationResult, DeleteMutationResult)
+
+
+def _duplicate(shell_id: str) -> MutationError:
+    return MutationError(code="DUPLICATE_ID", message=f"Shell with ID '{shell_id}' already exists")
+
+
+def _failed(results: list[ResultT], message: str, result_type: type[ResultT]) -> None:
+    """Mark every successful result as failed (the transaction was lost)."""
+    for i, result in enumerate(results):
+        if result.success:
+            results[i] = result_type(
+                success=False,
+                error=MutationError(code="INTERNAL_ERROR", message=message),
+            )
+
+
+async def _propagate_created(created: dict[str, tuple[bytes, str]]) -> None:
+    """Populate the cache and publish CREATED events for committed shells."""
+    items = [
+        (identifier, encode_id_to_b64url(identifier), doc_bytes, etag)
+        for identifier, (doc_bytes, etag) in created.items()
+    ]
+    try:
+        cache = RedisCache(await get_redis())
+        await cache.set_aas_many([(b64, doc_bytes, etag) for _, b64, doc_bytes, etag in items])
+    except Exception as e:
+        logger.warning(f"Failed to cache {len(items)} created shells: {e}")
+    try:
+        await get_event_bus().publish_many(
+            [
+                AasEvent(
+                    event_type=EventType.CREATED,
+                    identifier=identifier,
+                    identifier_b64=b64,
+                    doc_bytes=doc_bytes,
+                    etag=etag,
+                )
+                for identifier, b64, doc_bytes, etag in items
+            ]
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish {len(items)} shell created events: {e}")
+
+
+async def _propagate_deleted(deleted: Sequence[str]) -> None:
+    """Evict cached documents and publish DELETED events for removed shells."""
+    items = [(identifier, encode_id_to_b64url(identifier)) for identifier in deleted]
+    try:
+        cache = RedisCache(await get_redis())
+        await cache.delete_aas_many([b64 for _, b64 in items])
+    except Exception as e:
+        logger.warning(f"Failed to evict {len(items)} deleted shells: {e}")
+    try:
+        await get_event_bus().publish_many(
+            [
+                AasEvent(
+                    event_type=EventType.DELETED,
+                    identifier=identifier,
+                    identifier_b64=b64,
+                    doc_bytes=None,
+                    etag=None,
+                )
+                for identifier, b64 in items
+            ]
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish {len(items)} shell deleted events: {e}")
+
+
+async def create_shells_bulk(
+    ctx: DataLoaderContext, inputs: Sequence[ShellInput]
+) -> list[ShellMutationResult]:
+    """Create many shells in one transaction.
+
+    Args:
+        ctx: GraphQL request context (session)
+        inputs: Shell creation inputs
+
+    Returns:
+        One ShellMutationResult per input, in input order
+    """
+    session = ctx.session
+    results: list[ShellMutationResult | None] = [None] * len(inputs)
+    models: dict[int, AssetAdministrationShell] = {}
+    seen: set[str] = set()
+
+    for i, input_item in enumerate(inputs):
+        try:
+            model = shell_from_input(input_item)
+        except ValueError as e:
+            results[i] = ShellMutationResult(
+                success=False, error=MutationError(code="VALIDATION_ERROR", message=str(e))
+            )
+            continue
+        if model.id in seen:
+            results[i] = ShellMutationResult(success=False, error=_duplicate(model.id))
+            continue
+        seen.add(model.id)
+        models[i] = model
+
+    created: dict[str, tuple[bytes, str]] = {}
+    if models:
+        repo = AasRepository(session)
+        try:
+            existing = await repo.existing_identifiers([m.id for m in models.values()])
+            for i, model in list(models.items()):
+                if model.id in existing:
+                    results[i] = ShellMutationResult(success=False, error=_duplicate(model.id))
+                    del models[i]
+            created = await repo.create_many(list(models.values()))
+        except Exception as e:
+            await session.rollback()
+            for i in models:
+                results[i] = ShellMutationResult(
+                    success=False,
+                    error=MutationError(
+                        code="INTERNAL_ERROR", message=f"Failed to create shell: {str(e)}"
+                    ),
+                )
+            return [result for result in results if result is not None]
+
+    for i, model in models.items():
+        if model.id in created:
+            results[i] = ShellMutationResult(success=True, shell=shell_to_graphql(model))
+        else:
+            # Inserted concurrently between the pre-check and the insert
+            results[i] = ShellMutationResult(success=False, error=_duplicate(model.id))
+
+    final = [result for result in results if result is not None]
+    try:
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        _failed(final, f"Transaction failed: {str(e)}", ShellMutationResult)
+        return final
+
+    if created:
+        await _propagate_created(created)
+    return final
+
+
+async def delete_shells_bulk(
+    ctx: DataLoaderContext, ids: Sequence[str]
+) -> list[DeleteMutationResult]:
+    """Delete many shells in one transaction.
+
+    Args:
+        ctx: GraphQL request context (session)
+        ids: Shell identifiers to delete
+
+    Returns:
+        One DeleteMutationResult per ID, in input order
+    """
+    session = ctx.session
+    unique_ids = list(dict.fromkeys(ids))
+
+    try:
+        deleted = await AasRepository(session).delete_many(unique_ids)
+    except Exception as e:
+        await session.rollback()
+        return [
+            DeleteMutationResult(
+                success=False,
+                error=MutationError(
+                    code="INTERNAL_ERROR", message=f"Failed to delete shell: {str(e)}"
+                ),
+            )
+            for _ in ids
+        ]
+
+    results: list[DeleteMutationResult] = []
+    reported: set[str] = set()
+    for shell_id in ids:
+        if shell_id in deleted and shell_id not in reported:
+            reported.add(shell_id)
+            results.append(DeleteMutationResult(success=True, id=shell_id))
+        else:
+            results.append(
+                DeleteMutationResult(
+                    success=False,
+                    error=MutationError(
+                        code="NOT_FOUND", message=f"Shell with ID '{shell_id}' not found"
+                    ),
+                )
+            )
+
+    try:
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        _failed(results, f"Transaction failed: {str(e)}", DeleteMutationResult)
+        return results
+
+    if deleted:
+        await _propagate_deleted(sorted(deleted))
+    return results
@@ -4,6 +4,7 @@ Converts between:
 - titan.core.model.AssetAdministrationShell → graphql.schema.Shell
 - titan.core.model.Submodel → graphql.schema.Submodel
 - Related nested types (Reference, Key, etc.)
+- Raw JSON documents → scalar-only Shell/Submodel summaries
 """
 
 from __future__ import annotations
@@ -86,6 +87,49 @@ def submodel_to_graphql(model: PydanticSubmodel | None) -> Submodel | None:
     )
 
 
+def shell_summary_to_graphql(doc: dict[str, Any]) -> Shell:
+    """Build a GraphQL Shell from a raw JSON document without validation.
+
+    Used for list queries that select only scalar fields; populates id,
+    idShort and assetInformation and leaves everything else unset.
+
+    Args:
+        doc: AAS document (possibly narrowed to those keys)
+
+    Returns:
+        GraphQL Shell type
+    """
+    asset = doc.get("assetInformation") or {}
+    return Shell(
+        id=doc["id"],
+        id_short=doc.get("idShort"),
+        asset_information=AssetInformation(
+            asset_kind=_convert_asset_kind(asset.get("assetKind")),
+            global_asset_id=asset.get("globalAssetId"),
+            asset_type=asset.get("assetType"),
+        ),
+    )
+
+
+def submodel_summary_to_graphql(doc: dict[str, Any]) -> Submodel:
+    """Build a GraphQL Submodel from a raw JSON document without validation.
+
+    Used for list queries that select only scalar fields; populates id,
+    idShort and kind and leaves everything else unset.
+
+    Args:
+        doc: Submodel document (possibly narrowed to those keys)
+
+    Returns:
+        GraphQL Submodel type
+    """
+    return Submodel(
+        id=doc["id"],
+        id_short=doc.get("idShort"),
+        kind=_convert_modelling_kind(doc.get("kind")),
+    )
+
+
 def _convert_asset_kind(kind: Any | None) -> AssetKind:
     """Convert Pydantic AssetKind to GraphQL AssetKind."""
     if kind is None:
@@ -27,6 +27,7 @@ from typing import TYPE_CHECKING, Any
 from strawberry.dataloader import DataLoader
 
 from titan.graphql.converters import shell_to_graphql, submodel_to_graphql
+from titan.graphql.query_cache import ReadSet
 from titan.graphql.schema import Shell, Submodel
 from titan.persistence.repositories import AasRepository, SubmodelRepository
 
@@ -112,6 +113,8 @@ class DataLoaderContext:
         """
         self.session = session
         self.user = user
+        # Entities resolved by this operation (drives result cache eviction)
+        self.reads = ReadSet()
         self._loaders = self._create_loaders()
 
     def _create_loaders(self) -> dict[str, DataLoader]:
@@ -0,0 +1,249 @@
+"""Selection-aware execution of GraphQL list queries.
+
+List resolvers inspect the client's selection set under ``edges`` and
+build a ListPlan describing:
+- Which top-level JSONB document keys to fetch (the rest stay in Postgres)
+- Whether Pydantic hydration is needed at all
+
+Selections made only of scalar fields (id, idShort, kind, ...) are built
+directly from the raw documents; anything else is validated against the
+narrowed document and converted as before. Filters are passed to the
+repository and evaluated in SQL.
+
+Example:
+    plan = plan_submodel_query(edge_fields(info))
+    docs, cursor = await repo.list_projected(plan.keys, limit=first)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from strawberry.types.nodes import SelectedField
+
+from titan.core.model import AssetAdministrationShell
+from titan.core.model import Submodel as PydanticSubmodel
+from titan.graphql.converters import (
+    shell_summary_to_graphql,
+    shell_to_graphql,
+    submodel_summary_to_graphql,
+    submodel_to_graphql,
+)
+from titan.graphql.schema import (
+    AssetKind,
+    PageInfo,
+    Shell,
+    ShellConnection,
+    Submodel,
+    SubmodelConnection,
+)
+from titan.persistence.repositories import AasRepository, SubmodelRepository
+
+if TYPE_CHECKING:
+    from strawberry.types import Info
+
+    from titan.graphql.dataloaders import DataLoaderContext
+
+
+# GraphQL field -> top-level document keys it reads
+SHELL_FIELD_KEYS: dict[str, tuple[str, ...]] = {
+    "__typename": (),
+    "id": ("id",),
+    "idShort": ("idShort",),
+    "description": ("description",),
+    "assetInformation": ("assetInformation",),
+    "administration": ("administration",),
+    "derivedFrom": ("derivedFrom",),
+    "submodels": ("id",),
+}
+
+SUBMODEL_FIELD_KEYS: dict[str, tuple[str, ...]] = {
+    "__typename": (),
+    "id": ("id",),
+    "idShort": ("idShort",),
+    "description": ("description",),
+    "semanticId": ("semanticId",),
+    "kind": ("kind",),
+    "administration": ("administration",),
+    "submodelElements": ("submodelElements",),
+}
+
+# Fields the summary converters can build without Pydantic
+SHELL_SCALAR_FIELDS = frozenset({"__typename", "id", "idShort", "assetInformation", "submodels"})
+SUBMODEL_SCALAR_FIELDS = frozenset({"__typename", "id", "idShort", "kind"})
+
+# Keys always fetched: what the summaries need, plus what validation requires
+SHELL_BASE_KEYS = ("id", "assetInformation")
+SHELL_MODEL_KEYS = ("modelType", "id", "assetInformation")
+SUBMODEL_BASE_KEYS = ("id",)
+SUBMODEL_MODEL_KEYS = ("modelType", "id")
+
+
+@dataclass(frozen=True)
+class ListPlan:
+    """How to load one page of a list query."""
+
+    # Top-level document keys to select (None for the whole document)
+    keys: tuple[str, ...] | None
+    # Whether documents must be validated into Pydantic models
+    hydrate: bool
+
+
+def _walk(selections: Iterable[Any]) -> Iterator[SelectedField]:
+    """Yield selected fields, expanding fragments in place."""
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            yield from _walk(selection.selections)
+
+
+def edge_fields(info: Info) -> set[str]:
+    """Names of the fields selected on a connection's ``edges``."""
+    fields: set[str] = set()
+    for field in _walk(info.selected_fields):
+        for child in _walk(field.selections):
+            if child.name == "edges":
+                fields.update(edge.name for edge in _walk(child.selections))
+    return fields
+
+
+def _plan(
+    fields: set[str],
+    field_keys: dict[str, tuple[str, ...]],
+    scalar_fields: frozenset[str],
+    base_keys: tuple[str, ...],
+    model_keys: tuple[str, ...],
+) -> ListPlan:
+    if not fields <= field_keys.keys():
+        # Unknown field (schema grew without updating the map): load everything
+        return ListPlan(keys=None, hydrate=True)
+
+    hydrate = not fields <= scalar_fields
+    keys = dict.fromkeys(model_keys if hydrate else base_keys)
+    for field in sorted(fields):
+        keys.update(dict.fromkeys(field_keys[field]))
+    return ListPlan(keys=tuple(keys), hydrate=hydrate)
+
+
+def plan_shell_query(fields: set[str]) -> ListPlan:
+    """Plan a shells query for the given edge selection."""
+    return _plan(fields, SHELL_FIELD_KEYS, SHELL_SCALAR_FIELDS, SHELL_BASE_KEYS, SHELL_MODEL_KEYS)
+
+
+def plan_submodel_query(fields: set[str]) -> ListPlan:
+    """Plan a submodels query for the given edge selection."""
+    return _plan(
+        fields,
+        SUBMODEL_FIELD_KEYS,
+        SUBMODEL_SCALAR_FIELDS,
+        SUBMODEL_BASE_KEYS,
+        SUBMODEL_MODEL_KEYS,
+    )
+
+
+def _page_info(after: str | None, cursor: str | None) -> PageInfo:
+    return PageInfo(
+        has_next_page=cursor is not None,
+        has_previous_page=after is not None,
+        end_cursor=cursor,
+    )
+
+
+async def resolve_shells(
+    info: Info,
+    id_short: str | None,
+    asset_kind: AssetKind | None,
+    first: int,
+    after: str | None,
+) -> ShellConnection:
+    """Execute a shells list query.
+
+    Args:
+        info: Strawberry resolver info (selection set and context)
+        id_short: Optional idShort filter
+        asset_kind: Optional assetKind filter
+        first: Page size
+        after: Cursor from previous page
+
+    Returns:
+        Shell connection for the requested page
+    """
+    ctx: DataLoaderContext = info.context
+    ctx.reads.add_type("aas")
+    plan = plan_shell_query(edge_fields(info))
+
+    docs, cursor = await AasRepository(ctx.session).list_projected(
+        plan.keys,
+        limit=first,
+        cursor=after,
+        id_short=id_short,
+        asset_kind=asset_kind.value if asset_kind is not None else None,
+    )
+
+    edges: list[Shell]
+    if plan.hydrate:
+        edges = [
+            gql_shell
+            for doc in docs
+            if (gql_shell := shell_to_graphql(AssetAdministrationShell.model_validate(doc)))
+            is not None
+        ]
+    else:
+        edges = [shell_summary_to_graphql(doc) for doc in docs]
+
+    return ShellConnection(
+        edges=edges,
+        page_info=_page_info(after, cursor),
+        total_count=len(edges),
+    )
+
+
+async def resolve_submodels(
+    info: Info,
+    semantic_id: str | None,
+    id_short: str | None,
+    first: int,
+    after: str | None,
+) -> SubmodelConnection:
+    """Execute a submodels list query.
+
+    Args:
+        info: Strawberry resolver info (selection set and context)
+        semantic_id: Optional semantic ID filter
+        id_short: Optional idShort filter
+        first: Page size
+        after: Cursor from previous page
+
+    Returns:
+        Submodel connection for the requested page
+    """
+    ctx: DataLoaderContext = info.context
+    ctx.reads.add_type("submodel")
+    plan = plan_submodel_query(edge_fields(info))
+
+    docs, cursor = await SubmodelRepository(ctx.session).list_projected(
+        plan.keys,
+        limit=first,
+        cursor=after,
+        semantic_id=semantic_id,
+        id_short=id_short,
+    )
+
+    edges: list[Submodel]
+    if plan.hydrate:
+        edges = [
+            gql_sm
+            for doc in docs
+            if (gql_sm := submodel_to_graphql(PydanticSubmodel.model_validate(doc))) is not None
+        ]
+    else:
+        edges = [submodel_summary_to_graphql(doc) for doc in docs]
+
+    return SubmodelConnection(
+        edges=edges,
+        page_info=_page_info(after, cursor),
+        total_count=len(edges),
+    )
@@ -0,0 +1,262 @@
+"""Query cost and depth analysis for GraphQL operations.
+
+Nested list selections multiply: ``shells(first: 100) { edges { submodels
+{ submodelElements } } }`` can touch hundreds of thousands of objects.
+Operations are scored before execution and rejected when they exceed the
+configured limits.
+
+Cost model:
+- Object fields cost 1, scalar and enum fields are free
+- A field taking a ``first`` argument multiplies its selections by that
+  page size; the first list inside it (the connection's ``edges``) is the
+  page and is not multiplied again
+- Other list fields multiply their selections by ``default_list_size``
+- Introspection fields (``__schema``, ``__type``) are ignored
+
+Variables are resolved when known; an unresolvable ``first`` falls back to
+the argument's schema default.
+
+Example:
+    schema = strawberry.Schema(query=Query, extensions=[QueryCostLimiter])
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    is_composite_type,
+)
+from strawberry.extensions import SchemaExtension
+
+from titan.config import settings
+
+
+@dataclass(frozen=True)
+class QueryCost:
+    """Estimated cost of one operation."""
+
+    cost: int
+    depth: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {"cost": self.cost, "depth": self.depth}
+
+
+class _Analyzer:
+    """Walks one operation computing cost and depth."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+        variables: dict[str, Any],
+        default_list_size: int,
+    ) -> None:
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables
+        self.default_list_size = default_list_size
+
+    def selection_set(
+        self,
+        parent: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        page_size: int | None,
+        visited: frozenset[str],
+    ) -> tuple[int, int]:
+        cost = 0
+        depth = 0
+        for field, field_parent in self._fields(parent, selection_set, visited):
+            field_cost, field_depth = self.field(field_parent, field, page_size, visited)
+            cost += field_cost
+            depth = max(depth, field_depth)
+        return cost, depth
+
+    def field(
+        self,
+        parent: GraphQLNamedType,
+        node: FieldNode,
+        page_size: int | None,
+        visited: frozenset[str],
+    ) -> tuple[int, int]:
+        name = node.name.value
+        if name.startswith("__") or not isinstance(parent, GraphQLObjectType):
+            return 0, 0
+        definition = parent.fields.get(name)
+        if definition is None:
+            return 0, 1
+
+        output = get_named_type(definition.type)
+        if not is_composite_type(output) or node.selection_set is None:
+            return 0, 1
+
+        multiplier = 1
+        child_page_size = None
+        if "first" in definition.args:
+            child_page_size = self._first(node, definition.args["first"].default_value)
+        elif _is_list(definition.type):
+            if page_size is not None:
+                multiplier = page_size
+            else:
+                multiplier = self.default_list_size
+
+        child_cost, child_depth = self.selection_set(
+            output, node.selection_set, child_page_size, visited
+        )
+        return 1 + multiplier * child_cost, 1 + child_depth
+
+    def _fields(
+        self,
+        parent: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        visited: frozenset[str],
+    ) -> Iterator[tuple[FieldNode, GraphQLNamedType]]:
+        """Yield fields with their parent type, expanding fragments."""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield selection, parent
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type: GraphQLNamedType | None = parent
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                if fragment_type is not None:
+                    yield from self._fields(fragment_type, selection.selection_set, visited)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited:
+                    continue
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                if fragment_type is not None:
+                    yield from self._fields(fragment_type, fragment.selection_set, visited | {name})
+
+    def _first(self, node: FieldNode, default: Any) -> int:
+        """Resolve the ``first`` argument of a paginated field."""
+        for argument in node.arguments:
+            if argument.name.value != "first":
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return max(int(value.value), 0)
+            if isinstance(value, VariableNode):
+                resolved = self.variables.get(value.name.value)
+                if isinstance(resolved, int):
+                    return max(resolved, 0)
+        return default if isinstance(default, int) else self.default_list_size
+
+
+def _is_list(field_type: Any) -> bool:
+    if isinstance(field_type, GraphQLNonNull):
+        field_type = field_type.of_type
+    return isinstance(field_type, GraphQLList)
+
+
+def analyze_query(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None = None,
+    variables: dict[str, Any] | None = None,
+    default_list_size: int | None = None,
+) -> QueryCost:
+    """Estimate the cost and depth of an operation.
+
+    Args:
+        schema: Executable graphql-core schema
+        document: Parsed (and validated) document
+        operation_name: Operation to analyze when the document has several
+        variables: Variable values used to resolve ``first``
+        default_list_size: Assumed size of unpaginated lists
+
+    Returns:
+        QueryCost of the selected operation (zero if none matches)
+    """
+    fragments: dict[str, FragmentDefinitionNode] = {}
+    operation: OperationDefinitionNode | None = None
+    for definition in document.definitions:
+        if isinstance(definition, FragmentDefinitionNode):
+            fragments[definition.name.value] = definition
+        elif isinstance(definition, OperationDefinitionNode):
+            if operation_name is None or (
+                definition.name is not None and definition.name.value == operation_name
+            ):
+                operation = operation or definition
+
+    if operation is None:
+        return QueryCost(cost=0, depth=0)
+
+    analyzer = _Analyzer(
+        schema,
+        fragments,
+        variables or {},
+        default_list_size or settings.graphql_default_list_size,
+    )
+    root = schema.get_root_type(operation.operation)
+    if root is None:
+        return QueryCost(cost=0, depth=0)
+    cost, depth = analyzer.selection_set(root, operation.selection_set, None, frozenset())
+    return QueryCost(cost=cost, depth=depth)
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject operations whose estimated cost or depth exceeds the limits.
+
+    The estimate is reported in the response ``extensions`` under "cost".
+    """
+
+    def __init__(
+        self,
+        *,
+        max_cost: int | None = None,
+        max_depth: int | None = None,
+        default_list_size: int | None = None,
+    ) -> None:
+        self.max_cost = max_cost if max_cost is not None else settings.graphql_max_cost
+        self.max_depth = max_depth if max_depth is not None else settings.graphql_max_depth
+        self.default_list_size = default_list_size
+        self.result: QueryCost | None = None
+
+    def on_execute(self) -> Iterator[None]:
+        context = self.execution_context
+        if context.graphql_document is not None:
+            self.result = analyze_query(
+                context.schema._schema,
+                context.graphql_document,
+                context.operation_name,
+                context.variables,
+                self.default_list_size,
+            )
+            if self.result.depth > self.max_depth:
+                raise GraphQLError(
+                    f"Query depth {self.result.depth} exceeds the maximum of {self.max_depth}",
+                    extensions={"code": "QUERY_TOO_DEEP", **self.result.to_dict()},
+                )
+            if self.result.cost > self.max_cost:
+                raise GraphQLError(
+                    f"Query cost {self.result.cost} exceeds the maximum of {self.max_cost}",
+                    extensions={"code": "QUERY_TOO_COMPLEX", **self.result.to_dict()},
+                )
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        if self.result is None:
+            return {}
+        return {"cost": self.result.to_dict()}
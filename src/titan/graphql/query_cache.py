@@ -0,0 +1,379 @@
+"""Automatic persisted queries and result caching for GraphQL.
+
+Dashboards poll the same queries over and over. Two layers avoid paying
+for parsing, transfer and execution each time:
+
+- Automatic persisted queries (APQ, Apollo protocol): clients send
+  ``extensions.persistedQuery.sha256Hash`` and omit the query text once the
+  server has seen it; unknown hashes answer ``PersistedQueryNotFound`` so the
+  client retries with the full query.
+- Result cache: successful query results are cached under the query hash,
+  operation name, variables and user. Resolvers record what they read in
+  the context's ReadSet (whole entity types for list queries, identifiers
+  for lookups); entity events from the event bus evict every entry that
+  read the changed entity.
+
+Example:
+    cache = get_query_cache()
+    await get_event_bus().subscribe(cache.handle_event)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+from graphql import ExecutionResult as GraphQLExecutionResult
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from titan.config import settings
+from titan.events.schemas import (
+    AasEvent,
+    AnyEvent,
+    ConceptDescriptionEvent,
+    SubmodelElementEvent,
+    SubmodelEvent,
+)
+from titan.tenancy.context import get_current_tenant
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReadSet:
+    """Entities read while resolving one operation.
+
+    Every resolver that loads entities must record them here, otherwise
+    cached results would not be evicted when those entities change.
+    """
+
+    # Entity types read as a whole (list queries)
+    entity_types: set[str] = field(default_factory=set)
+    # (entity type, identifier) pairs read individually
+    entities: set[tuple[str, str]] = field(default_factory=set)
+
+    def add_type(self, entity_type: str) -> None:
+        self.entity_types.add(entity_type)
+
+    def add(self, entity_type: str, identifier: str) -> None:
+        self.entities.add((entity_type, identifier))
+
+    @property
+    def touched_types(self) -> set[str]:
+        return self.entity_types | {entity_type for entity_type, _ in self.entities}
+
+
+def query_hash(query: str) -> str:
+    """SHA-256 hex digest of a query document, as used by APQ."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _event_entity(event: AnyEvent) -> tuple[str, str] | None:
+    """(entity type, identifier) an event changes (None for non-entity events)."""
+    if isinstance(event, SubmodelElementEvent):
+        return "submodel", event.submodel_identifier
+    if isinstance(event, AasEvent | SubmodelEvent | ConceptDescriptionEvent):
+        return event.entity, event.identifier
+    return None
+
+
+# Generation key bumped by invalidate_all()
+_ALL = "*"
+
+
+@dataclass
+class CachedResult:
+    """A cached result and the reads it depends on."""
+
+    data: dict[str, Any] | None
+    reads: ReadSet
+    expires_at: float
+
+
+class QueryResultCache:
+    """LRU cache of query results invalidated by entity events.
+
+    Attributes:
+        max_entries: Maximum cached results (0 disables caching)
+        ttl: Seconds a result may be served without any invalidation,
+            bounding staleness if events are lost
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, CachedResult] = OrderedDict()
+        self._by_type: dict[str, set[str]] = {}
+        self._by_entity: dict[tuple[str, str], set[str]] = {}
+        # Bumped per entity type on every event, so results computed while
+        # a write landed are not stored
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        query_digest: str,
+        operation_name: str | None,
+        variables: dict[str, Any] | None,
+        scope: str | None,
+    ) -> str:
+        """Cache key for one operation execution."""
+        payload = orjson.dumps(
+            [query_digest, operation_name, variables or {}, scope],
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def generation(self) -> dict[str, int]:
+        """Snapshot of the invalidation counters."""
+        return dict(self._generations)
+
+    def get(self, key: str) -> CachedResult | None:
+        """Cached result for ``key`` (None on a miss or after expiry)."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._evict(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: dict[str, Any] | None,
+        reads: ReadSet,
+        generation: dict[str, int],
+    ) -> bool:
+        """Store a result unless an entity it read changed meanwhile.
+
+        Returns:
+            True if the result was cached
+        """
+        if self.max_entries <= 0:
+            return False
+        for entity_type in reads.touched_types | {_ALL}:
+            if self._generations.get(entity_type, 0) != generation.get(entity_type, 0):
+                return False
+
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = CachedResult(data, reads, time.monotonic() + self.ttl)
+        for entity_type in reads.entity_types:
+            self._by_type.setdefault(entity_type, set()).add(key)
+        for entity in reads.entities:
+            self._by_entity.setdefault(entity, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+        return True
+
+    def invalidate(self, entity_type: str, identifier: str) -> int:
+        """Evict results that read an entity.
+
+        Returns:
+            Number of evicted results
+        """
+        self._generations[entity_type] = self._generations.get(entity_type, 0) + 1
+        keys = self._by_type.get(entity_type, set()) | self._by_entity.get(
+            (entity_type, identifier), set()
+        )
+        for key in keys:
+            self._evict(key)
+        return len(keys)
+
+    def invalidate_all(self) -> None:
+        """Evict every result (used after local writes with unknown scope)."""
+        self._generations[_ALL] = self._generations.get(_ALL, 0) + 1
+        self.clear()
+
+    async def handle_event(self, event: AnyEvent) -> None:
+        """Event bus handler evicting results affected by an entity change."""
+        changed = _event_entity(event)
+        if changed is None:
+            return
+        entity_type, identifier = changed
+        evicted = self.invalidate(entity_type, identifier)
+        if evicted:
+            logger.debug(f"Evicted {evicted} cached GraphQL results for {entity_type}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_type.clear()
+        self._by_entity.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for entity_type in entry.reads.entity_types:
+            _discard(self._by_type, entity_type, key)
+        for entity in entry.reads.entities:
+            _discard(self._by_entity, entity, key)
+
+
+def _discard(index: dict[Any, set[str]], name: Any, key: str) -> None:
+    keys = index.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+
+class PersistedQueryStore:
+    """Bounded LRU map of APQ hashes to query documents."""
+
+    def __init__(self, max_entries: int = 5000) -> None:
+        self.max_entries = max_entries
+        self._queries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, digest: str) -> str | None:
+        query = self._queries.get(digest)
+        if query is not None:
+            self._queries.move_to_end(digest)
+        return query
+
+    def put(self, digest: str, query: str) -> None:
+        self._queries[digest] = query
+        self._queries.move_to_end(digest)
+        while len(self._queries) > self.max_entries:
+            self._queries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._queries.clear()
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+
+# Process-wide stores shared by all executions
+_query_cache: QueryResultCache | None = None
+_persisted_queries: PersistedQueryStore | None = None
+
+
+def get_query_cache() -> QueryResultCache:
+    """Get the GraphQL result cache singleton."""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryResultCache(
+            max_entries=settings.graphql_query_cache_size,
+            ttl=settings.graphql_query_cache_ttl,
+        )
+    return _query_cache
+
+
+def get_persisted_queries() -> PersistedQueryStore:
+    """Get the APQ store singleton."""
+    global _persisted_queries
+    if _persisted_queries is None:
+        _persisted_queries = PersistedQueryStore(settings.graphql_persisted_query_size)
+    return _persisted_queries
+
+
+def _scope(context: Any) -> str | None:
+    """User (and tenant) a result was computed for (cached results are never shared)."""
+    user = getattr(context, "user", None)
+    subject = getattr(user, "sub", None) if user is not None else None
+    if settings.enable_tenant_isolation:
+        return f"{get_current_tenant()}:{subject or ''}"
+    return subject
+
+
+class PersistedQueryCache(SchemaExtension):
+    """Resolve APQ hashes and serve repeated queries from QueryResultCache.
+
+    Only query operations whose resolvers recorded their reads are cached;
+    mutations and results with errors never are. GraphQL mutations do not
+    publish entity events, so a mutation executed here evicts all results.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: QueryResultCache | None = None,
+        persisted_queries: PersistedQueryStore | None = None,
+    ) -> None:
+        self.cache = cache or get_query_cache()
+        self.persisted_queries = persisted_queries or get_persisted_queries()
+        self._key: str | None = None
+        self._generation: dict[str, int] = {}
+        self._hit = False
+
+    def on_operation(self) -> Iterator[None]:
+        context = self.execution_context
+        persisted = (context.operation_extensions or {}).get("persistedQuery")
+        if isinstance(persisted, dict):
+            digest = persisted.get("sha256Hash")
+            if not isinstance(digest, str):
+                raise GraphQLError(
+                    "persistedQuery requires sha256Hash",
+                    extensions={"code": "PERSISTED_QUERY_INVALID"},
+                )
+            if context.query:
+                if query_hash(context.query) != digest:
+                    raise GraphQLError(
+                        "provided sha does not match query",
+                        extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+                    )
+                self.persisted_queries.put(digest, context.query)
+            else:
+                query = self.persisted_queries.get(digest)
+                if query is None:
+                    raise GraphQLError(
+                        "PersistedQueryNotFound",
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    )
+                context.query = query
+        yield
+
+    def on_execute(self) -> Iterator[None]:
+        context = self.execution_context
+        if context.query and context.operation_type == OperationType.QUERY:
+            self._key = self.cache.make_key(
+                query_hash(context.query),
+                context.operation_name,
+                context.variables,
+                _scope(context.context),
+            )
+            cached = self.cache.get(self._key)
+            if cached is not None:
+                self._hit = True
+                context.result = GraphQLExecutionResult(data=cached.data, errors=None)
+            else:
+                self._generation = self.cache.generation()
+
+        yield
+
+        if context.operation_type == OperationType.MUTATION:
+            self.cache.invalidate_all()
+            return
+        if self._key is None or self._hit:
+            return
+        result = context.result
+        reads: ReadSet | None = getattr(context.context, "reads", None)
+        if (
+            isinstance(result, GraphQLExecutionResult)
+            and not result.errors
+            and reads is not None
+            and reads.touched_types
+        ):
+            self.cache.put(self._key, result.data, reads, self._generation)
+
+    def get_results(self) -> dict[str, Any]:
+        if self._key is None:
+            return {}
+        return {"cacheHit": self._hit}
@@ -254,6 +254,8 @@ class Shell:
     async def submodels(self, info: Info) -> list[Submodel]:
         """Get submodels referenced by this shell."""
         ctx: DataLoaderContext = info.context
+        ctx.reads.add("aas", self.id)
+        ctx.reads.add_type("submodel")
         return await ctx.submodels_by_shell_loader.load(self.id)
 
 
@@ -399,30 +401,14 @@ class Query:
         first: int = 100,
         after: str | None = None,
     ) -> ShellConnection:
-        """Query shells with optional filtering."""
-        from titan.graphql.converters import shell_to_graphql
-        from titan.persistence.repositories import AasRepository
+        """Query shells with optional filtering.
 
-        ctx: DataLoaderContext = info.context
-        repo = AasRepository(ctx.session)
-
-        # Query shells with pagination
-        shells_list, cursor = await repo.list_models(limit=first, cursor=after)
-
-        # Convert to GraphQL types
-        edges = [
-            gql_shell for shell in shells_list if (gql_shell := shell_to_graphql(shell)) is not None
-        ]
-
-        return ShellConnection(
-            edges=edges,
-            page_info=PageInfo(
-                has_next_page=cursor is not None,
-                has_previous_page=after is not None,
-                end_cursor=cursor,
-            ),
-            total_count=len(edges),
-        )
+        Filters are evaluated in SQL and only the document fields selected
+        under ``edges`` are loaded.
+        """
+        from titan.graphql.execution import resolve_shells
+
+        return await resolve_shells(info, id_short, asset_kind, first, after)
 
     @strawberry.field
     async def shell(
@@ -432,6 +418,7 @@ class Query:
     ) -> Shell | None:
         """Get a shell by identifier."""
         ctx: DataLoaderContext = info.context
+        ctx.reads.add("aas", id)
         return await ctx.shell_loader.load(id)
 
     @strawberry.field
@@ -443,28 +430,14 @@ class Query:
         first: int = 100,
         after: str | None = None,
     ) -> SubmodelConnection:
-        """Query submodels with optional filtering."""
-        from titan.graphql.converters import submodel_to_graphql
-        from titan.persistence.repositories import SubmodelRepository
+        """Query submodels with optional filtering.
 
-        ctx: DataLoaderContext = info.context
-        repo = SubmodelRepository(ctx.session)
-
-        # Query submodels with pagination
-        submodels_list, cursor = await repo.list_models(limit=first, cursor=after)
-
-        # Convert to GraphQL types
-        edges = [gql_sm for sm in submodels_list if (gql_sm := submodel_to_graphql(sm)) is not None]
-
-        return SubmodelConnection(
-            edges=edges,
-            page_info=PageInfo(
-                has_next_page=cursor is not None,
-                has_previous_page=after is not None,
-                end_cursor=cursor,
-            ),
-            total_count=len(edges),
-        )
+        Filters are evaluated in SQL and only the document fields selected
+        under ``edges`` are loaded.
+        """
+        from titan.graphql.execution import resolve_submodels
+
+        return await resolve_submodels(info, semantic_id, id_short, first, after)
 
     @strawberry.field
     async def submodel(
@@ -474,6 +447,7 @@ class Query:
     ) -> Submodel | None:
         """Get a submodel by identifier."""
         ctx: DataLoaderContext = info.context
+        ctx.reads.add("submodel", id)
         return await ctx.submodel_loader.load(id)
 
 
@@ -1105,6 +1079,9 @@ class Mutation:
     ) -> list[ShellMutationResult]:
         """Create multiple shells in a single transaction.
 
+        Existence is checked with one query and rows are written with
+        multi-row inserts (see titan.graphql.bulk).
+
         Args:
             info: GraphQL context information
             inputs: List of shell creation inputs
@@ -1112,11 +1089,9 @@ class Mutation:
         Returns:
             List of ShellMutationResult (one per input)
         """
-        from titan.graphql.converters import shell_from_input, shell_to_graphql
-        from titan.persistence.repositories import AasRepository
+        from titan.graphql.bulk import create_shells_bulk
 
         ctx: DataLoaderContext = info.context
-        session = ctx.session
 
         # Check permission
         perm_error = check_permission(ctx, Permission.CREATE_AAS)
@@ -1124,61 +1099,7 @@ class Mutation:
             # Return error for all inputs
             return [ShellMutationResult(success=False, error=perm_error) for _ in inputs]
 
-        results: list[ShellMutationResult] = []
-
-        for input_item in inputs:
-            try:
-                shell_model = shell_from_input(input_item)
-                repo = AasRepository(session)
-                await repo.create(shell_model)
-                gql_shell = shell_to_graphql(shell_model)
-                results.append(ShellMutationResult(success=True, shell=gql_shell))  # nosec B604
-            except ValueError as e:
-                results.append(
-                    ShellMutationResult(
-                        success=False,
-                        error=MutationError(code="VALIDATION_ERROR", message=str(e)),
-                    )
-                )
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "duplicate" in error_msg or "unique" in error_msg:
-                    results.append(
-                        ShellMutationResult(
-                            success=False,
-                            error=MutationError(
-                                code="DUPLICATE_ID",
-                                message=f"Shell with ID '{input_item.id}' already exists",
-                            ),
-                        )
-                    )
-                else:
-                    results.append(
-                        ShellMutationResult(
-                            success=False,
-                            error=MutationError(
-                                code="INTERNAL_ERROR",
-                                message=f"Failed to create shell: {str(e)}",
-                            ),
-                        )
-                    )
-
-        try:
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            # If commit fails, mark all successful results as failed
-            for i, result in enumerate(results):
-                if result.success:
-                    results[i] = ShellMutationResult(
-                        success=False,
-                        error=MutationError(
-                            code="INTERNAL_ERROR",
-                            message=f"Transaction failed: {str(e)}",
-                        ),
-                    )
-
-        return results
+        return await create_shells_bulk(ctx, inputs)
 
     @strawberry.mutation
     async def delete_shells(
@@ -1195,10 +1116,9 @@ class Mutation:
         Returns:
             List of DeleteMutationResult (one per ID)
         """
-        from titan.persistence.repositories import AasRepository
+        from titan.graphql.bulk import delete_shells_bulk
 
         ctx: DataLoaderContext = info.context
-        session = ctx.session
 
         # Check permission
         perm_error = check_permission(ctx, Permission.DELETE_AAS)
@@ -1206,59 +1126,17 @@ class Mutation:
             # Return error for all IDs
             return [DeleteMutationResult(success=False, error=perm_error) for _ in ids]
 
-        results: list[DeleteMutationResult] = []
-
-        for shell_id in ids:
-            try:
-                repo = AasRepository(session)
-                deleted = await repo.delete(shell_id)
-
-                if deleted:
-                    results.append(DeleteMutationResult(success=True, id=shell_id))
-                else:
-                    results.append(
-                        DeleteMutationResult(
-                            success=False,
-                            error=MutationError(
-                                code="NOT_FOUND",
-                                message=f"Shell with ID '{shell_id}' not found",
-                            ),
-                        )
-                    )
-            except Exception as e:
-                results.append(
-                    DeleteMutationResult(
-                        success=False,
-                        error=MutationError(
-                            code="INTERNAL_ERROR",
-                            message=f"Failed to delete shell: {str(e)}",
-                        ),
-                    )
-                )
-
-        try:
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            # If commit fails, mark all successful results as failed
-            for i, result in enumerate(results):
-                if result.success:
-                    results[i] = DeleteMutationResult(
-                        success=False,
-                        error=MutationError(
-                            code="INTERNAL_ERROR",
-                            message=f"Transaction failed: {str(e)}",
-                        ),
-                    )
-
-        return results
+        return await delete_shells_bulk(ctx, ids)
 
 
 def _create_schema() -> strawberry.Schema:
     """Create the GraphQL schema with query, mutation, and subscription roots.
 
+    Installs the cost/depth limiter and the persisted query result cache.
     Deferred import of Subscription to avoid circular dependency issues.
     """
+    from titan.graphql.limits import QueryCostLimiter
+    from titan.graphql.query_cache import PersistedQueryCache
     from titan.graphql.subscriptions import Subscription
 
     return strawberry.Schema(
@@ -1266,6 +1144,8 @@ def _create_schema() -> strawberry.Schema:
         mutation=Mutation,
         subscription=Subscription,
         types=[SubmodelElementCollection],  # Include collection type
+        # Cost limits run first so rejected queries never reach the cache
+        extensions=[QueryCostLimiter, PersistedQueryCache],
     )
 
 
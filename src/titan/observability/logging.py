@@ -23,6 +23,7 @@ import contextvars
 import json
 import logging
 import sys
+from collections.abc import MutableMapping
 from datetime import UTC, datetime
 from typing import Any
 
@@ -33,6 +34,10 @@ correlation_id_var: contextvars.ContextVar[str] = contextvars.ContextVar(
 )
 tenant_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("tenant_id", default="")
 user_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("user_id", default="")
+# ASGI scope of the request being served (route labels for the CPU sampler)
+request_scope_var: contextvars.ContextVar[MutableMapping[str, Any] | None] = contextvars.ContextVar(
+    "request_scope", default=None
+)
 
 
 class JsonFormatter(logging.Formatter):
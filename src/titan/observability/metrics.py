@@ -45,6 +45,12 @@ class MetricsRegistry:
     # Database metrics
     db_query_duration_seconds: Any = None
     db_connections_active: Any = None
+    db_statement_duration_seconds: Any = None
+    db_rows_total: Any = None
+    db_bytes_total: Any = None
+    db_pool_wait_seconds: Any = None
+    db_queries_per_request: Any = None
+    db_repeated_queries_total: Any = None
 
     # Cache metrics
     cache_hits_total: Any = None
@@ -85,6 +91,17 @@ class MetricsRegistry:
     package_version_comparison_duration_seconds: Any = None
     package_version_storage_bytes: Any = None
 
+    # Audit pipeline metrics
+    audit_events_total: Any = None
+    audit_queue_depth: Any = None
+
+    # Tenant admission metrics
+    tenant_admissions_total: Any = None
+    tenant_requests_in_flight: Any = None
+    tenant_queue_wait_seconds: Any = None
+    tenant_db_sessions_in_use: Any = None
+    tenant_cache_writes_rejected_total: Any = None
+
     # Internal state
     _initialized: bool = field(default=False, repr=False)
     _registry: Any = field(default=None, repr=False)
@@ -142,6 +159,44 @@ class MetricsRegistry:
                 "Active database connections",
             )
 
+            self.db_statement_duration_seconds = Histogram(
+                "titan_db_statement_duration_seconds",
+                "Database statement latency by normalized statement fingerprint",
+                ["fingerprint"],
+                buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+            )
+
+            self.db_rows_total = Counter(
+                "titan_db_rows_total",
+                "Rows returned or affected by database statements",
+                ["operation", "table"],
+            )
+
+            self.db_bytes_total = Counter(
+                "titan_db_bytes_total",
+                "Estimated statement and result payload bytes",
+                ["direction"],
+            )
+
+            self.db_pool_wait_seconds = Histogram(
+                "titan_db_pool_wait_seconds",
+                "Time spent waiting for a pooled database connection",
+                buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+            )
+
+            self.db_queries_per_request = Histogram(
+                "titan_db_queries_per_request",
+                "Database statements executed per HTTP request",
+                ["path"],
+                buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500),
+            )
+
+            self.db_repeated_queries_total = Counter(
+                "titan_db_repeated_queries_total",
+                "Requests that repeated one statement beyond the N+1 threshold",
+                ["path"],
+            )
+
             # Cache metrics
             self.cache_hits_total = Counter(
                 "titan_cache_hits_total",
@@ -312,6 +367,50 @@ class MetricsRegistry:
                 "Total storage used by package versions",
             )
 
+            # Audit pipeline metrics
+            self.audit_events_total = Counter(
+                "titan_audit_events_total",
+                "Audit events by outcome (written, dropped, failed)",
+                ["outcome"],
+            )
+
+            self.audit_queue_depth = Gauge(
+                "titan_audit_queue_depth",
+                "Audit events buffered and not yet written",
+            )
+
+            # Tenant admission metrics
+            self.tenant_admissions_total = Counter(
+                "titan_tenant_admissions_total",
+                "Requests by tenant and admission outcome (admitted, queued, rejected, timeout)",
+                ["tenant", "outcome"],
+            )
+
+            self.tenant_requests_in_flight = Gauge(
+                "titan_tenant_requests_in_flight",
+                "Admitted requests being served per tenant",
+                ["tenant"],
+            )
+
+            self.tenant_queue_wait_seconds = Histogram(
+                "titan_tenant_queue_wait_seconds",
+                "Time requests waited for admission per tenant",
+                ["tenant"],
+                buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+            )
+
+            self.tenant_db_sessions_in_use = Gauge(
+                "titan_tenant_db_sessions_in_use",
+                "Database sessions held per tenant",
+                ["tenant"],
+            )
+
+            self.tenant_cache_writes_rejected_total = Counter(
+                "titan_tenant_cache_writes_rejected_total",
+                "Cache writes skipped because the tenant exceeded its cache quota",
+                ["tenant"],
+            )
+
             self._initialized = True
             logger.info("Prometheus metrics initialized")
 
@@ -389,6 +488,9 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         if request.url.path in ("/health", "/ready", "/metrics"):
             return await call_next(request)
 
+        # Imported here: the instrumentation module records into this one
+        from titan.persistence.instrumentation import query_budget
+
         method = request.method
         path = self._normalize_path(request.url.path)
 
@@ -400,7 +502,9 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         status_code = 500  # Default in case of exception
 
         try:
-            response = await call_next(request)
+            # Count the statements this request executes (N+1 detection)
+            with query_budget(path):
+                response = await call_next(request)
             status_code = response.status_code
             return response
         finally:
@@ -493,6 +597,68 @@ def record_db_query(operation: str, table: str, duration: float) -> None:
         ).observe(duration)
 
 
+def record_db_statement(
+    fingerprint: str,
+    operation: str,
+    table: str,
+    duration: float,
+    rows: int,
+    bytes_sent: int,
+    bytes_received: int,
+) -> None:
+    """Record one executed database statement.
+
+    Args:
+        fingerprint: Normalized statement ID (see titan.persistence.instrumentation);
+            "<other>" once MAX_TRACKED_STATEMENTS fingerprints are tracked
+        operation: Statement operation (select, insert, update, delete)
+        table: Primary table name
+        duration: Execution time in seconds
+        rows: Rows returned or affected
+        bytes_sent: Estimated statement + parameter bytes
+        bytes_received: Estimated result bytes
+    """
+    record_db_query(operation, table, duration)
+    metrics = get_metrics()
+    if metrics.db_statement_duration_seconds:
+        metrics.db_statement_duration_seconds.labels(fingerprint=fingerprint).observe(duration)
+    if metrics.db_rows_total and rows:
+        metrics.db_rows_total.labels(operation=operation, table=table).inc(rows)
+    if metrics.db_bytes_total:
+        metrics.db_bytes_total.labels(direction="sent").inc(bytes_sent)
+        if bytes_received:
+            metrics.db_bytes_total.labels(direction="received").inc(bytes_received)
+
+
+def record_db_pool_wait(duration: float) -> None:
+    """Record time spent waiting for a pooled connection (seconds)."""
+    metrics = get_metrics()
+    if metrics.db_pool_wait_seconds:
+        metrics.db_pool_wait_seconds.observe(duration)
+
+
+def set_db_connections_active(count: int) -> None:
+    """Set the number of connections checked out of the pool."""
+    metrics = get_metrics()
+    if metrics.db_connections_active:
+        metrics.db_connections_active.set(count)
+
+
+def record_db_request_budget(path: str, queries: int, repeated: bool) -> None:
+    """Record the statements executed by one HTTP request.
+
+    Args:
+        path: Normalized request path
+        queries: Statements executed while serving the request
+        repeated: Whether a statement exceeded the N+1 threshold
+    """
+    metrics = get_metrics()
+    if metrics.db_queries_per_request:
+        metrics.db_queries_per_request.labels(path=path).observe(queries)
+    if repeated and metrics.db_repeated_queries_total:
+        metrics.db_repeated_queries_total.labels(path=path).inc()
+
+
 def record_cache_hit(cache_type: str = "redis") -> None:
     """Record cache hit."""
     metrics = get_metrics()
@@ -797,3 +963,72 @@ def set_package_version_storage_bytes(size_bytes: float) -> None:
     metrics = get_metrics()
     if metrics.package_version_storage_bytes:
         metrics.package_version_storage_bytes.set(size_bytes)
+
+
+# -----------------------------------------------------------------------------
+# Audit pipeline metrics
+# -----------------------------------------------------------------------------
+
+
+def record_audit_events(outcome: str, count: int = 1) -> None:
+    """Record audit events leaving the pipeline.
+
+    Args:
+        outcome: written, dropped or failed
+        count: Number of events
+    """
+    metrics = get_metrics()
+    if metrics.audit_events_total:
+        metrics.audit_events_total.labels(outcome=outcome).inc(count)
+
+
+def set_audit_queue_depth(depth: int) -> None:
+    """Set the number of buffered audit events.
+
+    Args:
+        depth: Events waiting to be written
+    """
+    metrics = get_metrics()
+    if metrics.audit_queue_depth:
+        metrics.audit_queue_depth.set(depth)
+
+
+# -----------------------------------------------------------------------------
+# Tenant admission metrics
+# -----------------------------------------------------------------------------
+
+
+def record_tenant_admission(tenant: str, outcome: str, waited: float | None = None) -> None:
+    """Record an admission decision.
+
+    Args:
+        tenant: Tenant identifier
+        outcome: admitted, queued, rejected or timeout
+        waited: Seconds spent queued (for requests admitted after queuing)
+    """
+    metrics = get_metrics()
+    if metrics.tenant_admissions_total:
+        metrics.tenant_admissions_total.labels(tenant=tenant, outcome=outcome).inc()
+    if waited is not None and metrics.tenant_queue_wait_seconds:
+        metrics.tenant_queue_wait_seconds.labels(tenant=tenant).observe(waited)
+
+
+def set_tenant_requests_in_flight(tenant: str, count: int) -> None:
+    """Set the number of admitted requests of a tenant."""
+    metrics = get_metrics()
+    if metrics.tenant_requests_in_flight:
+        metrics.tenant_requests_in_flight.labels(tenant=tenant).set(count)
+
+
+def set_tenant_db_sessions(tenant: str, count: int) -> None:
+    """Set the number of database sessions held by a tenant."""
+    metrics = get_metrics()
+    if metrics.tenant_db_sessions_in_use:
+        metrics.tenant_db_sessions_in_use.labels(tenant=tenant).set(count)
+
+
+def record_tenant_cache_rejected(tenant: str) -> None:
+    """Record a cache write skipped by the tenant cache quota."""
+    metrics = get_metrics()
+    if metrics.tenant_cache_writes_rejected_total:
+        metrics.tenant_cache_writes_rejected_total.labels(tenant=tenant).inc()
@@ -7,6 +7,13 @@ Provides profiling capabilities:
 - Database query timing
 - Request timing statistics
 
+Request latencies are kept in streaming quantile sketches (see
+titan.observability.sketch) per endpoint, both since the last reset and
+over a sliding window. Recording is O(1); percentiles are computed from the
+sketches on demand, and sketches from several workers can be merged into
+a cluster-wide view: every instance publishes its snapshot periodically
+(start_snapshot_publisher) and load_cluster_endpoint_stats merges them.
+
 Example:
     from titan.observability.profiling import ProfileCollector
 
@@ -25,17 +32,29 @@ import asyncio
 import logging
 import time
 import tracemalloc
-from collections.abc import Callable, Generator
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from titan.observability.sketch import DDSketch, WindowedSketch
+
 logger = logging.getLogger(__name__)
 
+# Endpoint key used once max_endpoints distinct endpoints have been seen
+OTHER_ENDPOINT = "<other>"
+
+# Redis hash holding one sketch snapshot per instance
+SNAPSHOT_KEY = "titan:profile:snapshots"
+# Snapshots not refreshed for this long belong to stopped instances
+SNAPSHOT_MAX_AGE = 300.0
+
 
 @dataclass
 class RequestStats:
@@ -59,6 +78,10 @@ class EndpointStats:
     min_duration_ms: float = float("inf")
     max_duration_ms: float = 0.0
     error_count: int = 0
+    # Latency distribution since the last reset
+    sketch: DDSketch = field(default_factory=DDSketch, repr=False, compare=False)
+    # Latency distribution over the last few minutes
+    recent: WindowedSketch = field(default_factory=WindowedSketch, repr=False, compare=False)
 
     @property
     def avg_duration_ms(self) -> float:
@@ -75,6 +98,60 @@ class EndpointStats:
         self.max_duration_ms = max(self.max_duration_ms, duration_ms)
         if is_error:
             self.error_count += 1
+        self.sketch.add(duration_ms)
+        self.recent.add(duration_ms)
+
+    def percentile(self, percentile: float, recent: bool = False) -> float:
+        """Estimate a latency percentile (0-100).
+
+        Args:
+            percentile: Percentile to estimate
+            recent: Use the sliding window instead of all requests since reset
+        """
+        sketch = self.recent.merged() if recent else self.sketch
+        return sketch.quantile(percentile / 100)
+
+    def merge(self, other: EndpointStats) -> None:
+        """Add another worker's statistics for the same endpoint."""
+        self.request_count += other.request_count
+        self.total_duration_ms += other.total_duration_ms
+        self.min_duration_ms = min(self.min_duration_ms, other.min_duration_ms)
+        self.max_duration_ms = max(self.max_duration_ms, other.max_duration_ms)
+        self.error_count += other.error_count
+        self.sketch.merge(other.sketch)
+        # Remote windows arrive pre-merged; fold them into the current slot
+        self.recent.add_sketch(other.recent.merged())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize, including sketches, for exchange between workers."""
+        return {
+            "path": self.path,
+            "method": self.method,
+            "requestCount": self.request_count,
+            "totalDurationMs": self.total_duration_ms,
+            "minDurationMs": self.min_duration_ms if self.request_count else None,
+            "maxDurationMs": self.max_duration_ms,
+            "errorCount": self.error_count,
+            "sketch": self.sketch.to_dict(),
+            "recent": self.recent.merged().to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EndpointStats:
+        """Deserialize statistics produced by to_dict."""
+        stats = cls(
+            path=data["path"],
+            method=data["method"],
+            request_count=data["requestCount"],
+            total_duration_ms=data["totalDurationMs"],
+            max_duration_ms=data["maxDurationMs"],
+            error_count=data["errorCount"],
+            sketch=DDSketch.from_dict(data["sketch"]),
+        )
+        if data.get("minDurationMs") is not None:
+            stats.min_duration_ms = data["minDurationMs"]
+        stats.recent.add_sketch(DDSketch.from_dict(data["recent"]))
+        return stats
 
 
 @dataclass
@@ -142,25 +219,34 @@ class ProfileCollector:
     """Collects profiling data from various sources.
 
     Thread-safe collection of request timings, memory usage,
-    and other performance metrics.
+    and other performance metrics. Recording a request is O(1): counters
+    and per-endpoint sketches are updated in place; percentiles are only
+    computed when statistics are read.
     """
 
     def __init__(
         self,
         max_history: int = 10000,
         enable_memory_tracking: bool = False,
+        max_endpoints: int = 1000,
     ) -> None:
         """Initialize collector.
 
         Args:
-            max_history: Maximum request history to keep
+            max_history: Maximum request history to keep (0 disables it)
             enable_memory_tracking: Enable tracemalloc (has overhead)
+            max_endpoints: Distinct endpoints tracked before further ones
+                are grouped under OTHER_ENDPOINT
         """
         self.max_history = max_history
         self.enable_memory_tracking = enable_memory_tracking
+        self.max_endpoints = max_endpoints
 
-        self._request_history: list[RequestStats] = []
+        self._request_history: deque[RequestStats] = deque(maxlen=max_history)
         self._endpoint_stats: dict[str, EndpointStats] = {}
+        self._total_requests = 0
+        self._total_errors = 0
+        self._total_duration_ms = 0.0
         self._cache_hits = 0
         self._cache_misses = 0
         self._db_query_count = 0
@@ -204,31 +290,37 @@ class ProfileCollector:
             status_code: Response status code
             duration_ms: Request duration in milliseconds
         """
-        # Record in history
-        stats = RequestStats(
-            path=path,
-            method=method,
-            status_code=status_code,
-            duration_ms=duration_ms,
-            timestamp=time.time(),
-        )
-
-        self._request_history.append(stats)
-
-        # Trim history if needed
-        if len(self._request_history) > self.max_history:
-            self._request_history = self._request_history[-self.max_history :]
+        is_error = status_code >= 400
+        self._total_requests += 1
+        self._total_duration_ms += duration_ms
+        if is_error:
+            self._total_errors += 1
+
+        # Record in history (bounded deque, oldest entries drop off)
+        if self.max_history:
+            self._request_history.append(
+                RequestStats(
+                    path=path,
+                    method=method,
+                    status_code=status_code,
+                    duration_ms=duration_ms,
+                    timestamp=time.time(),
+                )
+            )
 
         # Update endpoint stats
         key = f"{method}:{path}"
-        if key not in self._endpoint_stats:
-            self._endpoint_stats[key] = EndpointStats(
-                path=path,
-                method=method,
-            )
-
-        is_error = status_code >= 400
-        self._endpoint_stats[key].record(duration_ms, is_error)
+        endpoint = self._endpoint_stats.get(key)
+        if endpoint is None:
+            if len(self._endpoint_stats) >= self.max_endpoints:
+                key = f"{method}:{OTHER_ENDPOINT}"
+                endpoint = self._endpoint_stats.get(key)
+            if endpoint is None:
+                endpoint = self._endpoint_stats[key] = EndpointStats(
+                    path=key.partition(":")[2],
+                    method=method,
+                )
+        endpoint.record(duration_ms, is_error)
 
     def record_cache_hit(self) -> None:
         """Record a cache hit."""
@@ -252,18 +344,18 @@ class ProfileCollector:
         stats = ProfileStats()
 
         # Request stats
-        if self._request_history:
-            durations = [r.duration_ms for r in self._request_history]
-            durations.sort()
-
-            stats.total_requests = len(durations)
-            stats.total_errors = sum(1 for r in self._request_history if r.status_code >= 400)
-            stats.avg_duration_ms = sum(durations) / len(durations)
-
-            # Percentiles
-            stats.p50_duration_ms = self._percentile(durations, 50)
-            stats.p95_duration_ms = self._percentile(durations, 95)
-            stats.p99_duration_ms = self._percentile(durations, 99)
+        if self._total_requests:
+            stats.total_requests = self._total_requests
+            stats.total_errors = self._total_errors
+            stats.avg_duration_ms = self._total_duration_ms / self._total_requests
+
+            # Percentiles from the merged endpoint sketches
+            sketch = DDSketch()
+            for endpoint in self._endpoint_stats.values():
+                sketch.merge(endpoint.sketch)
+            stats.p50_duration_ms = sketch.quantile(0.50)
+            stats.p95_duration_ms = sketch.quantile(0.95)
+            stats.p99_duration_ms = sketch.quantile(0.99)
 
         # Memory stats
         if self.enable_memory_tracking and tracemalloc.is_tracing():
@@ -293,10 +385,34 @@ class ProfileCollector:
         """Get per-endpoint statistics."""
         return list(self._endpoint_stats.values())
 
+    def snapshot(self) -> dict[str, Any]:
+        """Serialize per-endpoint statistics and sketches for other workers."""
+        return {
+            "timestamp": time.time(),
+            "endpoints": [stats.to_dict() for stats in self._endpoint_stats.values()],
+        }
+
+    @staticmethod
+    def merge_snapshots(snapshots: Iterable[dict[str, Any]]) -> list[EndpointStats]:
+        """Combine snapshots from several workers into per-endpoint statistics."""
+        merged: dict[str, EndpointStats] = {}
+        for snapshot in snapshots:
+            for data in snapshot.get("endpoints", []):
+                stats = EndpointStats.from_dict(data)
+                key = f"{stats.method}:{stats.path}"
+                if key in merged:
+                    merged[key].merge(stats)
+                else:
+                    merged[key] = stats
+        return list(merged.values())
+
     def reset(self) -> None:
         """Reset all collected statistics."""
         self._request_history.clear()
         self._endpoint_stats.clear()
+        self._total_requests = 0
+        self._total_errors = 0
+        self._total_duration_ms = 0.0
         self._cache_hits = 0
         self._cache_misses = 0
         self._db_query_count = 0
@@ -305,16 +421,6 @@ class ProfileCollector:
         if self.enable_memory_tracking and tracemalloc.is_tracing():
             tracemalloc.reset_peak()
 
-    @staticmethod
-    def _percentile(sorted_data: list[float], percentile: int) -> float:
-        """Calculate percentile from sorted data."""
-        if not sorted_data:
-            return 0.0
-        k = (len(sorted_data) - 1) * percentile / 100
-        f = int(k)
-        c = f + 1 if f < len(sorted_data) - 1 else f
-        return sorted_data[f] + (sorted_data[c] - sorted_data[f]) * (k - f)
-
 
 # Global collector instance
 _collector: ProfileCollector | None = None
@@ -336,6 +442,83 @@ def reset_collector() -> None:
     _collector = None
 
 
+async def publish_snapshot(
+    collector: ProfileCollector | None = None,
+    max_age: float = SNAPSHOT_MAX_AGE,
+) -> None:
+    """Store this instance's sketch snapshot in Redis for cluster views.
+
+    Snapshots older than ``max_age`` seconds (stopped instances) are
+    removed at the same time.
+    """
+    from titan.cache.redis import get_redis
+    from titan.config import settings
+
+    snapshot = (collector or get_collector()).snapshot()
+    redis = await get_redis()
+    await redis.hset(SNAPSHOT_KEY, settings.instance_id, orjson.dumps(snapshot))
+
+    entries = await redis.hgetall(SNAPSHOT_KEY)
+    now = time.time()
+    stale = [
+        instance
+        for instance, raw in entries.items()
+        if now - orjson.loads(raw).get("timestamp", 0) > max_age
+    ]
+    if stale:
+        await redis.hdel(SNAPSHOT_KEY, *stale)
+
+
+async def load_cluster_endpoint_stats(max_age: float = SNAPSHOT_MAX_AGE) -> list[EndpointStats]:
+    """Merge the snapshots published by all instances.
+
+    Snapshots older than ``max_age`` seconds (stopped instances) are
+    skipped; the publishers remove them.
+    """
+    from titan.cache.redis import get_redis
+
+    redis = await get_redis()
+    entries = await redis.hgetall(SNAPSHOT_KEY)
+    now = time.time()
+    snapshots = [orjson.loads(raw) for raw in entries.values()]
+    return ProfileCollector.merge_snapshots(
+        [s for s in snapshots if now - s.get("timestamp", 0) <= max_age]
+    )
+
+
+# Periodic snapshot publisher (started in the application lifespan)
+_publisher_task: asyncio.Task[None] | None = None
+
+
+async def _publish_loop(interval: float) -> None:
+    while True:
+        try:
+            await publish_snapshot()
+        except Exception as e:
+            logger.warning(f"Failed to publish profile snapshot: {e}")
+        await asyncio.sleep(interval)
+
+
+def start_snapshot_publisher(interval: float) -> None:
+    """Publish this instance's snapshot every ``interval`` seconds."""
+    global _publisher_task
+    if _publisher_task is None:
+        _publisher_task = asyncio.create_task(_publish_loop(interval))
+
+
+async def stop_snapshot_publisher() -> None:
+    """Stop the periodic snapshot publisher."""
+    global _publisher_task
+    if _publisher_task is None:
+        return
+    _publisher_task.cancel()
+    try:
+        await _publisher_task
+    except asyncio.CancelledError:
+        pass
+    _publisher_task = None
+
+
 @contextmanager
 def profile_request(
     path: str,
@@ -390,8 +573,12 @@ class ProfilingMiddleware(BaseHTTPMiddleware):
 
         duration_ms = (time.perf_counter() - start) * 1000
 
+        # Group by route template (/shells/{aas_identifier}), not the raw path
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or request.url.path
+
         self.collector.record_request(
-            path=request.url.path,
+            path=path,
             method=request.method,
             status_code=response.status_code,
             duration_ms=duration_ms,
@@ -0,0 +1,267 @@
+"""On-demand sampling CPU profiler.
+
+Samples the Python stack of the event loop thread at a fixed interval and
+aggregates identical stacks, so a hot worker can be profiled under real
+load without restarting it or installing a tracing profiler:
+- signal mode: ``SIGPROF`` from ``setitimer(ITIMER_PROF)``, which fires
+  per ``interval`` of consumed CPU time; idle workers take no samples.
+  Requires the event loop to run in the main thread (Unix only).
+- thread mode: a background thread reads the loop thread's frame with
+  ``sys._current_frames()`` every ``interval`` seconds of wall time.
+
+Each stack is prefixed with the route of the request being served
+(from ``request_scope_var``, signal mode only) and the asyncio task name.
+Results are exported as collapsed stacks (flamegraph.pl, speedscope,
+inferno) or speedscope JSON.
+
+Example:
+    sampler = await profile_cpu(seconds=10)
+    body = sampler.to_collapsed()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any
+
+from titan.observability.logging import request_scope_var
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Only one sampler may run per process (SIGPROF is process-wide)
+_active: StackSampler | None = None
+_active_lock = threading.Lock()
+
+
+class SamplerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def signal_mode_available() -> bool:
+    """Whether SIGPROF sampling can be used from the current thread."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _short_filename(filename: str) -> str:
+    """Strip the longest sys.path prefix (site-packages, src, ...)."""
+    best = ""
+    for entry in sys.path:
+        if entry and filename.startswith(entry) and len(entry) > len(best):
+            best = entry
+    return filename[len(best) :].lstrip("/\\") if best else filename
+
+
+class StackSampler:
+    """Statistical stack sampler producing folded stacks."""
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        max_depth: int = 128,
+        mode: str | None = None,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples (CPU time in signal mode)
+            max_depth: Frames kept per stack (innermost frames are kept)
+            mode: "signal" or "thread" (default: signal when available)
+        """
+        if mode not in (None, "signal", "thread"):
+            raise ValueError(f"Unknown sampler mode: {mode}")
+        self.interval = interval
+        self.max_depth = max_depth
+        self.mode = mode or ("signal" if signal_mode_available() else "thread")
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.samples = 0
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._labels: dict[CodeType, str] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._target_thread = 0
+        self._previous_handler: Any = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Start sampling the current thread.
+
+        Raises:
+            SamplerBusyError: If another sampler is running in this process
+        """
+        global _active
+        with _active_lock:
+            if _active is not None:
+                raise SamplerBusyError("A CPU profile is already being recorded")
+            _active = self
+
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._target_thread = threading.get_ident()
+        self.stacks.clear()
+        self.samples = 0
+        self.started_at = time.time()
+        self._running = True
+
+        if self.mode == "signal":
+            if not signal_mode_available():
+                self._release()
+                raise RuntimeError("Signal sampling requires the main thread on Unix")
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run_thread, name="titan-stack-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and keep the collected stacks."""
+        if not self._running:
+            return
+        if self.mode == "signal":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        else:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+        self.duration = time.time() - self.started_at
+        self._release()
+
+    def _release(self) -> None:
+        global _active
+        self._running = False
+        with _active_lock:
+            if _active is self:
+                _active = None
+
+    # -------------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------------
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        if frame is None:
+            return
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        self._record(frame, task, route=_route_label())
+
+    def _run_thread(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_thread)
+            if frame is None:
+                continue
+            task = asyncio.current_task(self._loop) if self._loop is not None else None
+            self._record(frame, task, route=None)
+
+    def _record(self, frame: FrameType, task: asyncio.Task[Any] | None, route: str | None) -> None:
+        labels = self._labels
+        stack: list[str] = []
+        current: FrameType | None = frame
+        while current is not None and len(stack) < self.max_depth:
+            code = current.f_code
+            label = labels.get(code)
+            if label is None:
+                name = getattr(code, "co_qualname", code.co_name)
+                label = labels[code] = (
+                    f"{name} ({_short_filename(code.co_filename)}:{code.co_firstlineno})"
+                )
+            stack.append(label)
+            current = current.f_back
+        if task is not None:
+            stack.append(f"[task] {task.get_name()}")
+        if route is not None:
+            stack.append(f"[route] {route}")
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.samples += 1
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+
+    def to_collapsed(self) -> str:
+        """Folded stacks: ``frame;frame;frame count`` per line, hottest first."""
+        return "".join(
+            f"{';'.join(frame.replace(';', ',') for frame in stack)} {count}\n"
+            for stack, count in self.stacks.most_common()
+        )
+
+    def to_speedscope(self, name: str = "titan") -> dict[str, Any]:
+        """Speedscope "sampled" profile with one weighted sample per unique stack."""
+        frame_index: dict[str, int] = {}
+        frames: list[dict[str, Any]] = []
+        samples: list[list[int]] = []
+        weights: list[float] = []
+        for stack, count in self.stacks.most_common():
+            indices = []
+            for label in stack:
+                index = frame_index.get(label)
+                if index is None:
+                    index = frame_index[label] = len(frames)
+                    frames.append({"name": label})
+                indices.append(index)
+            samples.append(indices)
+            weights.append(count * self.interval)
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "titan-aas",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": f"{name} ({self.mode}, {self.samples} samples)",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+def _route_label() -> str | None:
+    """Label of the request being served in the current context."""
+    scope = request_scope_var.get()
+    if scope is None:
+        return None
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    return f"{scope.get('method', '')} {path}"
+
+
+async def profile_cpu(
+    seconds: float,
+    interval: float = 0.005,
+    mode: str | None = None,
+) -> StackSampler:
+    """Sample the event loop thread for ``seconds`` and return the sampler.
+
+    Raises:
+        SamplerBusyError: If another profile is being recorded
+    """
+    sampler = StackSampler(interval=interval, mode=mode)
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        sampler.stop()
+    return sampler
@@ -0,0 +1,234 @@
+"""Mergeable streaming quantile sketches for latency percentiles.
+
+DDSketch-style log-bucketed histograms: every value is counted in the
+bucket ``ceil(log_gamma(value))``, so any quantile estimate is within a
+relative error ``alpha`` of the true value. Compared to keeping a sorted
+history of durations:
+- Recording is O(1) (one dict increment), with no per-value allocation
+- Memory is bounded by the dynamic range, not the request count
+- Sketches with the same ``alpha`` merge exactly (bucket-wise sums), so
+  per-worker sketches combine into cluster-wide percentiles
+
+WindowedSketch keeps a ring of per-interval sketches for "last N minutes"
+views without ever rescanning old values.
+
+Example:
+    sketch = DDSketch()
+    sketch.add(12.5)
+    p99 = sketch.quantile(0.99)
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any
+
+# Default relative accuracy (1%)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this are counted as zero (durations are never negative)
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class DDSketch:
+    """Log-bucketed quantile sketch with relative-error guarantees."""
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_bins",
+        "bins",
+        "count",
+        "sum",
+        "min",
+        "max",
+        "zero_count",
+        "_multiplier",
+        "_gamma",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = 2048,
+    ) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+            max_bins: Bucket limit; the lowest buckets are collapsed beyond it
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self.bins: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.zero_count = 0
+
+    def add(self, value: float) -> None:
+        """Record a value."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= MIN_INDEXABLE_VALUE:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) * self._multiplier)
+        bins = self.bins
+        bins[index] = bins.get(index, 0) + 1
+        if len(bins) > self.max_bins:
+            self._collapse()
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0 <= q <= 1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                value = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def avg(self) -> float:
+        """Mean of recorded values."""
+        return self.sum / self.count if self.count else 0.0
+
+    def merge(self, other: DDSketch) -> None:
+        """Add the contents of another sketch (same relative accuracy)."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        self.zero_count += other.zero_count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def copy(self) -> DDSketch:
+        """Return an independent copy."""
+        sketch = DDSketch(self.relative_accuracy, self.max_bins)
+        sketch.merge(self)
+        return sketch
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self.bins.clear()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.zero_count = 0
+
+    def _collapse(self) -> None:
+        """Fold the lowest bucket into the next one (bounds memory)."""
+        lowest, second = sorted(self.bins)[:2]
+        self.bins[second] += self.bins.pop(lowest)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for exchange between workers."""
+        return {
+            "relativeAccuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zeroCount": self.zero_count,
+            "bins": {str(index): count for index, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DDSketch:
+        """Deserialize a sketch produced by to_dict."""
+        sketch = cls(data.get("relativeAccuracy", DEFAULT_RELATIVE_ACCURACY))
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        sketch.zero_count = data.get("zeroCount", 0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        sketch.bins = {int(index): count for index, count in data.get("bins", {}).items()}
+        return sketch
+
+
+class WindowedSketch:
+    """Ring of per-interval sketches covering the most recent time span.
+
+    Values land in the sketch of the current ``interval``-second slot; a
+    slot is cleared when the ring wraps around to it. ``merged()`` combines
+    the slots that are still within ``intervals * interval`` seconds.
+    """
+
+    __slots__ = ("interval", "intervals", "relative_accuracy", "_slots", "_epochs")
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        intervals: int = 5,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
+        self.interval = interval
+        self.intervals = intervals
+        self.relative_accuracy = relative_accuracy
+        self._slots = [DDSketch(relative_accuracy) for _ in range(intervals)]
+        self._epochs = [-1] * intervals
+
+    @property
+    def span_seconds(self) -> float:
+        """Time span covered by merged()."""
+        return self.interval * self.intervals
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Record a value in the current slot."""
+        self._current(now).add(value)
+
+    def add_sketch(self, sketch: DDSketch, now: float | None = None) -> None:
+        """Merge a whole sketch (e.g. from another worker) into the current slot."""
+        self._current(now).merge(sketch)
+
+    def _current(self, now: float | None) -> DDSketch:
+        epoch = int((time.time() if now is None else now) // self.interval)
+        slot = epoch % self.intervals
+        if self._epochs[slot] != epoch:
+            self._slots[slot].clear()
+            self._epochs[slot] = epoch
+        return self._slots[slot]
+
+    def merged(self, now: float | None = None) -> DDSketch:
+        """Combine the slots within the window into one sketch."""
+        epoch = int((time.time() if now is None else now) // self.interval)
+        sketch = DDSketch(self.relative_accuracy)
+        for slot, slot_epoch in enumerate(self._epochs):
+            if epoch - self.intervals < slot_epoch <= epoch:
+                sketch.merge(self._slots[slot])
+        return sketch
+
+    def clear(self) -> None:
+        """Remove all values."""
+        for sketch in self._slots:
+            sketch.clear()
+        self._epochs = [-1] * self.intervals
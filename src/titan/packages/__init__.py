@@ -10,6 +10,7 @@ Provides package lifecycle management including:
 """
 
 from titan.packages.differ import PackageComparison, PackageDiffer
+from titan.packages.element_diff import diff_submodel_docs
 from titan.packages.manager import (
     BatchExportResult,
     BatchImportResult,
@@ -36,4 +37,5 @@ __all__ = [
     "SemanticValidationResult",
     "PackageDiffer",
     "PackageComparison",
+    "diff_submodel_docs",
 ]
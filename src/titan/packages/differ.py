@@ -9,18 +9,70 @@ Provides functionality to compare two package versions and generate diffs:
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from io import BytesIO
 from typing import Any
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from titan.compat.aasx import AasxImporter
+from titan.core.canonicalize import canonical_bytes_from_model
+from titan.packages.element_diff import diff_submodel_docs
 from titan.persistence.tables import AasxPackageTable
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (version1, version2) diffs kept in memory
+DIFF_CACHE_SIZE = 64
+
+
+class DiffCache:
+    """Bounded LRU cache of JSON Patch diffs keyed by package version pair.
+
+    Diffs are stored serialized so every caller gets its own operation list;
+    mutating a returned diff cannot corrupt the shared entry.
+    """
+
+    def __init__(self, max_entries: int = DIFF_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> list[dict[str, Any]] | None:
+        """Return a fresh copy of a cached diff and mark it as recently used."""
+        encoded = self._entries.get(key)
+        if encoded is None:
+            return None
+        self._entries.move_to_end(key)
+        operations: list[dict[str, Any]] = orjson.loads(encoded)
+        return operations
+
+    def put(self, key: tuple[str, str], operations: list[dict[str, Any]]) -> None:
+        """Store a diff, evicting the least recently used entry when full."""
+        self._entries[key] = orjson.dumps(operations)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached diffs."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared across differ instances (routers create one per request)
+_diff_cache = DiffCache()
+
+
+def _canonical_doc(model: Any) -> dict[str, Any]:
+    """Convert a parsed model to its canonical JSON document."""
+    doc: dict[str, Any] = orjson.loads(canonical_bytes_from_model(model))
+    return doc
+
 
 @dataclass
 class PackageComparison:
@@ -120,11 +172,11 @@ class PackageDiffer:
         comparison.shells_removed = list(shells1 - shells2)
 
         # Check for modified shells (same ID but different content)
+        shells1_map = {s.id: s for s in parsed1.shells}
+        shells2_map = {s.id: s for s in parsed2.shells}
         common_shells = shells1 & shells2
         for shell_id in common_shells:
-            shell1 = next(s for s in parsed1.shells if s.id == shell_id)
-            shell2 = next(s for s in parsed2.shells if s.id == shell_id)
-            if self._shells_differ(shell1, shell2):
+            if self._shells_differ(shells1_map[shell_id], shells2_map[shell_id]):
                 comparison.shells_modified.append(shell_id)
 
         # Compare submodels
@@ -135,11 +187,11 @@ class PackageDiffer:
         comparison.submodels_removed = list(submodels1 - submodels2)
 
         # Check for modified submodels
+        submodels1_map = {s.id: s for s in parsed1.submodels}
+        submodels2_map = {s.id: s for s in parsed2.submodels}
         common_submodels = submodels1 & submodels2
         for sm_id in common_submodels:
-            sm1 = next(s for s in parsed1.submodels if s.id == sm_id)
-            sm2 = next(s for s in parsed2.submodels if s.id == sm_id)
-            if self._submodels_differ(sm1, sm2):
+            if self._submodels_differ(submodels1_map[sm_id], submodels2_map[sm_id]):
                 comparison.submodels_modified.append(sm_id)
 
         # Compare concept descriptions
@@ -186,6 +238,12 @@ class PackageDiffer:
         # Get both version packages
         pkg1, pkg2 = await self._get_version_packages(session, package_id, version1, version2)
 
+        # Package versions are immutable, so the diff for a pair never changes
+        cache_key = (pkg1.id, pkg2.id)
+        cached = _diff_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Retrieve and parse both packages
         from titan.api.routers.aasx import _retrieve_package
 
@@ -197,84 +255,68 @@ class PackageDiffer:
 
         # Generate JSON Patch operations
         operations: list[dict[str, Any]] = []
+        operations.extend(
+            self._diff_identifiables("/assetAdministrationShells", parsed1.shells, parsed2.shells)
+        )
+        operations.extend(
+            self._diff_identifiables("/submodels", parsed1.submodels, parsed2.submodels)
+        )
 
-        # Diff shells
-        shells1_map = {s.id: s for s in parsed1.shells}
-        shells2_map = {s.id: s for s in parsed2.shells}
-
-        # Added shells
-        for shell_id in shells2_map.keys() - shells1_map.keys():
-            operations.append(
-                {
-                    "op": "add",
-                    "path": "/assetAdministrationShells/-",
-                    "value": {"id": shell_id, "idShort": shells2_map[shell_id].id_short},
-                }
-            )
-
-        # Removed shells
-        for shell_id in shells1_map.keys() - shells2_map.keys():
-            # Find index
-            idx = next(i for i, s in enumerate(parsed1.shells) if s.id == shell_id)
-            operations.append(
-                {
-                    "op": "remove",
-                    "path": f"/assetAdministrationShells/{idx}",
-                }
-            )
+        _diff_cache.put(cache_key, operations)
 
-        # Modified shells (simplified - just report as replace)
-        for shell_id in shells1_map.keys() & shells2_map.keys():
-            if self._shells_differ(shells1_map[shell_id], shells2_map[shell_id]):
-                idx = next(i for i, s in enumerate(parsed1.shells) if s.id == shell_id)
-                operations.append(
-                    {
-                        "op": "replace",
-                        "path": f"/assetAdministrationShells/{idx}",
-                        "value": {"id": shell_id, "idShort": shells2_map[shell_id].id_short},
-                    }
-                )
+        logger.info(
+            f"Generated {len(operations)} JSON Patch operations "
+            f"for versions {version1} vs {version2}"
+        )
 
-        # Diff submodels (similar logic)
-        submodels1_map = {s.id: s for s in parsed1.submodels}
-        submodels2_map = {s.id: s for s in parsed2.submodels}
+        return operations
 
-        # Added submodels
-        for sm_id in submodels2_map.keys() - submodels1_map.keys():
-            operations.append(
-                {
-                    "op": "add",
-                    "path": "/submodels/-",
-                    "value": {"id": sm_id, "idShort": submodels2_map[sm_id].id_short},
-                }
-            )
+    def _diff_identifiables(
+        self,
+        collection_path: str,
+        items1: list[Any],
+        items2: list[Any],
+    ) -> list[dict[str, Any]]:
+        """Generate element-level JSON Patch operations for one top-level collection.
 
-        # Removed submodels
-        for sm_id in submodels1_map.keys() - submodels2_map.keys():
-            idx = next(i for i, s in enumerate(parsed1.submodels) if s.id == sm_id)
-            operations.append(
-                {
-                    "op": "remove",
-                    "path": f"/submodels/{idx}",
-                }
-            )
+        Args:
+            collection_path: JSON Pointer of the collection in the environment
+            items1: Identifiables of the base version
+            items2: Identifiables of the target version
 
-        # Modified submodels
-        for sm_id in submodels1_map.keys() & submodels2_map.keys():
-            if self._submodels_differ(submodels1_map[sm_id], submodels2_map[sm_id]):
-                idx = next(i for i, s in enumerate(parsed1.submodels) if s.id == sm_id)
-                operations.append(
-                    {
-                        "op": "replace",
-                        "path": f"/submodels/{idx}",
-                        "value": {"id": sm_id, "idShort": submodels2_map[sm_id].id_short},
-                    }
+        Returns:
+            JSON Patch operations for added, removed and modified items
+        """
+        operations: list[dict[str, Any]] = []
+        index1 = {item.id: idx for idx, item in enumerate(items1)}
+        index2 = {item.id: idx for idx, item in enumerate(items2)}
+
+        # Removals in descending index order keep earlier indices valid
+        for idx in sorted((index1[i] for i in index1.keys() - index2.keys()), reverse=True):
+            operations.append({"op": "remove", "path": f"{collection_path}/{idx}"})
+
+        # Track the collection as the emitted operations leave it, so every
+        # path refers to the state after the operations before it
+        current = [item_id for item_id in index1 if item_id in index2]
+        for new_idx, item in enumerate(items2):
+            item_path = f"{collection_path}/{new_idx}"
+            if item.id not in index1:
+                operations.append({"op": "add", "path": item_path, "value": _canonical_doc(item)})
+                current.insert(new_idx, item.id)
+                continue
+            if current[new_idx] != item.id:
+                cur_idx = current.index(item.id)
+                operations.append({"op": "remove", "path": f"{collection_path}/{cur_idx}"})
+                operations.append({"op": "add", "path": item_path, "value": _canonical_doc(item)})
+                current.insert(new_idx, current.pop(cur_idx))
+                continue
+            operations.extend(
+                diff_submodel_docs(
+                    _canonical_doc(items1[index1[item.id]]),
+                    _canonical_doc(item),
+                    base_path=item_path,
                 )
-
-        logger.info(
-            f"Generated {len(operations)} JSON Patch operations "
-            f"for versions {version1} vs {version2}"
-        )
+            )
 
         return operations
 
@@ -341,10 +383,4 @@ class PackageDiffer:
 
     def _submodels_differ(self, sm1: Any, sm2: Any) -> bool:
         """Check if two submodels have different content."""
-        # Simple comparison - in production, would do deep comparison
-        return bool(
-            sm1.id_short != sm2.id_short
-            or sm1.description != sm2.description
-            or sm1.semantic_id != sm2.semantic_id
-            or len(sm1.submodel_elements or []) != len(sm2.submodel_elements or [])
-        )
+        return canonical_bytes_from_model(sm1) != canonical_bytes_from_model(sm2)
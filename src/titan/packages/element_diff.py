@@ -0,0 +1,267 @@
+"""Element-level structural diff for canonical AAS documents.
+
+Compares two canonical documents (submodels, shells) and emits JSON Patch
+style operations (RFC 6902) down to individual submodel elements:
+- Elements are matched by idShort (collections, entities, annotations)
+  or by index (SubmodelElementList items), and reported with idShortPath
+- Every subtree is summarized by a Merkle digest, so unchanged
+  collections are skipped with a single digest comparison
+- Leaf changes produce narrow operations (e.g. only ``/value``)
+
+Operation paths are JSON Pointers evaluated against the document as left
+by the preceding operations, so the list applies in order as an RFC 6902
+patch (e.g. with ``titan.core.json_patch.apply_patch``).
+
+Example:
+    ops = diff_submodel_docs(old_doc, new_doc, base_path="/submodels/0")
+    for op in ops:
+        print(op["op"], op["idShortPath"], op["path"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from titan.core.canonicalize import canonical_bytes
+from titan.core.json_patch import escape_token, patch_operation
+
+# Key holding nested elements for each container modelType
+CHILD_KEYS: dict[str, str] = {
+    "SubmodelElementCollection": "value",
+    "SubmodelElementList": "value",
+    "Entity": "statements",
+    "AnnotatedRelationshipElement": "annotations",
+}
+
+_DIGEST_SIZE = 16
+
+
+@dataclass(slots=True)
+class ElementDigest:
+    """Merkle digest of a document subtree.
+
+    ``own`` covers the element's attributes without nested elements,
+    ``digest`` covers the element together with all of its descendants.
+    """
+
+    digest: bytes
+    own: bytes
+    element: dict[str, Any]
+    child_key: str | None = None
+    children: list[ElementDigest] = field(default_factory=list)
+
+
+def _child_key_for(element: dict[str, Any]) -> str | None:
+    """Return the key holding nested elements, if the element is a container."""
+    model_type = element.get("modelType")
+    if model_type == "Submodel" or (model_type is None and "submodelElements" in element):
+        return "submodelElements"
+    if model_type in CHILD_KEYS:
+        return CHILD_KEYS[model_type]
+    return None
+
+
+def build_digest(element: dict[str, Any]) -> ElementDigest:
+    """Compute the Merkle digest tree for a canonical document or element."""
+    child_key = _child_key_for(element)
+    raw_children = element.get(child_key) if child_key else None
+
+    if not isinstance(raw_children, list):
+        own = hashlib.blake2b(canonical_bytes(element), digest_size=_DIGEST_SIZE).digest()
+        return ElementDigest(digest=own, own=own, element=element)
+
+    attributes = {k: v for k, v in element.items() if k != child_key}
+    own = hashlib.blake2b(canonical_bytes(attributes), digest_size=_DIGEST_SIZE).digest()
+
+    children = [build_digest(child) for child in raw_children if isinstance(child, dict)]
+    hasher = hashlib.blake2b(own, digest_size=_DIGEST_SIZE)
+    for child in children:
+        hasher.update(child.digest)
+
+    return ElementDigest(
+        digest=hasher.digest(),
+        own=own,
+        element=element,
+        child_key=child_key,
+        children=children,
+    )
+
+
+def diff_submodel_docs(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    base_path: str = "",
+) -> list[dict[str, Any]]:
+    """Generate element-level JSON Patch operations between two documents.
+
+    Args:
+        old: Base canonical document (e.g. a submodel)
+        new: Target canonical document
+        base_path: JSON Pointer prefix of the document within its container
+
+    Returns:
+        List of JSON Patch operations, each annotated with ``idShortPath``
+        (empty string for attributes of the document itself)
+    """
+    return diff_digests(build_digest(old), build_digest(new), base_path)
+
+
+def diff_digests(
+    old: ElementDigest,
+    new: ElementDigest,
+    base_path: str = "",
+) -> list[dict[str, Any]]:
+    """Generate JSON Patch operations between two precomputed digest trees."""
+    operations: list[dict[str, Any]] = []
+    _diff_node(old, new, base_path, "", operations)
+    return operations
+
+
+def _diff_node(
+    old: ElementDigest,
+    new: ElementDigest,
+    path: str,
+    id_short_path: str,
+    out: list[dict[str, Any]],
+) -> None:
+    """Recursively diff two digest nodes, skipping identical subtrees."""
+    if old.digest == new.digest:
+        return
+
+    # Containers of different shape cannot be diffed child by child
+    if old.child_key != new.child_key:
+        out.append(_op("replace", path, id_short_path, new.element))
+        return
+
+    if old.own != new.own:
+        _diff_attributes(old.element, new.element, old.child_key, path, id_short_path, out)
+
+    if old.child_key is None:
+        return
+
+    child_path = f"{path}/{escape_token(old.child_key)}"
+    if old.element.get("modelType") == "SubmodelElementList":
+        _diff_list_children(old, new, child_path, id_short_path, out)
+    else:
+        _diff_keyed_children(old, new, child_path, id_short_path, out)
+
+
+def _diff_attributes(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    child_key: str | None,
+    path: str,
+    id_short_path: str,
+    out: list[dict[str, Any]],
+) -> None:
+    """Emit operations for changed top-level attributes of a node."""
+    for key in old.keys() - new.keys():
+        if key != child_key:
+            out.append(_op("remove", f"{path}/{escape_token(key)}", id_short_path))
+
+    for key, value in new.items():
+        if key == child_key:
+            continue
+        attr_path = f"{path}/{escape_token(key)}"
+        if key not in old:
+            out.append(_op("add", attr_path, id_short_path, value))
+        elif old[key] != value:
+            out.append(_op("replace", attr_path, id_short_path, value))
+
+
+def _diff_keyed_children(
+    old: ElementDigest,
+    new: ElementDigest,
+    path: str,
+    id_short_path: str,
+    out: list[dict[str, Any]],
+) -> None:
+    """Diff children matched by idShort."""
+    old_children = _index_by_id_short(old.children)
+    new_children = _index_by_id_short(new.children)
+
+    # Removals in descending index order keep earlier indices valid
+    removed = [(idx, key) for key, (idx, _) in old_children.items() if key not in new_children]
+    for idx, key in sorted(removed, reverse=True):
+        out.append(_op("remove", f"{path}/{idx}", _join(id_short_path, key)))
+
+    # Track the array as the emitted operations leave it, so every path
+    # refers to the state after the operations before it
+    current = [key for key in old_children if key in new_children]
+    for key, (new_idx, new_child) in new_children.items():
+        child_id_path = _join(id_short_path, key)
+        if key not in old_children:
+            out.append(_op("add", f"{path}/{new_idx}", child_id_path, new_child.element))
+            current.insert(new_idx, key)
+            continue
+        if current[new_idx] != key:
+            # Reordered element: move it by removing and re-adding it whole
+            cur_idx = current.index(key)
+            out.append(_op("remove", f"{path}/{cur_idx}", child_id_path))
+            out.append(_op("add", f"{path}/{new_idx}", child_id_path, new_child.element))
+            current.insert(new_idx, current.pop(cur_idx))
+            continue
+        _, old_child = old_children[key]
+        _diff_node(old_child, new_child, f"{path}/{new_idx}", child_id_path, out)
+
+
+def _diff_list_children(
+    old: ElementDigest,
+    new: ElementDigest,
+    path: str,
+    id_short_path: str,
+    out: list[dict[str, Any]],
+) -> None:
+    """Diff SubmodelElementList items positionally."""
+    common = min(len(old.children), len(new.children))
+    for idx in range(common):
+        _diff_node(
+            old.children[idx],
+            new.children[idx],
+            f"{path}/{idx}",
+            f"{id_short_path}[{idx}]",
+            out,
+        )
+
+    for idx in range(len(old.children) - 1, common - 1, -1):
+        out.append(_op("remove", f"{path}/{idx}", f"{id_short_path}[{idx}]"))
+
+    for idx in range(common, len(new.children)):
+        out.append(
+            _op("add", f"{path}/{idx}", f"{id_short_path}[{idx}]", new.children[idx].element)
+        )
+
+
+def _index_by_id_short(
+    children: list[ElementDigest],
+) -> dict[str, tuple[int, ElementDigest]]:
+    """Map child idShort (or positional fallback) to (index, digest)."""
+    indexed: dict[str, tuple[int, ElementDigest]] = {}
+    for idx, child in enumerate(children):
+        id_short = child.element.get("idShort")
+        key = id_short if isinstance(id_short, str) and id_short else f"[{idx}]"
+        if key in indexed:
+            key = f"{key}[{idx}]"
+        indexed[key] = (idx, child)
+    return indexed
+
+
+def _join(parent: str, id_short: str) -> str:
+    """Append an idShort to an idShortPath."""
+    if not parent:
+        return id_short
+    if id_short.startswith("["):
+        return f"{parent}{id_short}"
+    return f"{parent}.{id_short}"
+
+
+def _op(
+    op: str,
+    path: str,
+    id_short_path: str,
+    value: Any = None,
+) -> dict[str, Any]:
+    """Build a JSON Patch operation annotated with its idShortPath."""
+    return patch_operation(op, path, value, idShortPath=id_short_path)
@@ -0,0 +1,164 @@
+"""Normalized asset-link index for discovery lookups.
+
+Discovery resolves asset identifiers (globalAssetId and specificAssetIds)
+to AAS identifiers. Instead of one JSONB containment scan per link over the
+full descriptor documents, every (name, value) pair is stored as a row in
+``asset_links``:
+- Rows are replaced whenever a descriptor or shell is written
+- A lookup request is one indexed query joined against a VALUES list
+- Only identifiers are returned, ordered by the first matching link
+
+Shell links are tenant-scoped by row-level security on ``asset_links``
+(the tenant column defaults to the transaction's tenant), so removing or
+resolving them never touches another tenant's shells. Descriptor links are
+shared, like the registry itself.
+
+Per Constraint AASd-116 the global asset ID is indexed with
+name="globalAssetId".
+
+Example:
+    index = AssetLinkIndex(session)
+    await index.replace(SOURCE_DESCRIPTOR, {descriptor.id: extract_asset_links(doc)})
+    ids = await index.lookup([("serialNumber", "SN-1")], limit=100)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Integer, Text, column, delete, func, insert, select, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from titan.persistence.bulk import chunked
+from titan.persistence.tables import AssetLinkTable
+
+# Link sources
+SOURCE_DESCRIPTOR = "descriptor"
+SOURCE_SHELL = "shell"
+
+GLOBAL_ASSET_ID = "globalAssetId"
+
+AssetLinkPair = tuple[str, str]
+
+
+def extract_asset_links(doc: dict[str, Any]) -> list[AssetLinkPair]:
+    """Collect the (name, value) asset links of a shell or descriptor document.
+
+    Reads the top-level fields (descriptors) and ``assetInformation``
+    (shells, and descriptors written by the discovery endpoints).
+    Duplicates are removed; order is preserved.
+    """
+    sources: list[dict[str, Any]] = [doc]
+    asset_info = doc.get("assetInformation")
+    if isinstance(asset_info, dict):
+        sources.append(asset_info)
+
+    links: dict[AssetLinkPair, None] = {}
+    for source in sources:
+        global_asset_id = source.get("globalAssetId")
+        if isinstance(global_asset_id, str) and global_asset_id:
+            links[(GLOBAL_ASSET_ID, global_asset_id)] = None
+        for specific_id in source.get("specificAssetIds") or []:
+            if not isinstance(specific_id, dict):
+                continue
+            name = specific_id.get("name")
+            value = specific_id.get("value")
+            if isinstance(name, str) and isinstance(value, str) and name and value:
+                links[(name, value)] = None
+    return list(links)
+
+
+class AssetLinkIndex:
+    """Maintains and queries the ``asset_links`` table."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def replace(
+        self, source: str, links_by_identifier: Mapping[str, Sequence[AssetLinkPair]]
+    ) -> None:
+        """Replace all links of the given AAS identifiers for one source."""
+        if not links_by_identifier:
+            return
+        await self.remove(source, list(links_by_identifier))
+
+        rows = [
+            {
+                "id": str(uuid4()),
+                "source": source,
+                "aas_identifier": identifier,
+                "name": name,
+                "value": value,
+            }
+            for identifier, links in links_by_identifier.items()
+            for name, value in links
+        ]
+        for chunk in chunked(rows):
+            await self.session.execute(insert(AssetLinkTable).values(list(chunk)))
+
+    async def remove(self, source: str, identifiers: Sequence[str]) -> None:
+        """Remove all links of the given AAS identifiers for one source."""
+        for chunk in chunked(identifiers):
+            await self.session.execute(
+                delete(AssetLinkTable).where(
+                    AssetLinkTable.source == source,
+                    AssetLinkTable.aas_identifier.in_(chunk),
+                )
+            )
+
+    async def lookup(
+        self,
+        links: Sequence[AssetLinkPair],
+        limit: int = 100,
+        sources: Sequence[str] = (SOURCE_DESCRIPTOR,),
+    ) -> list[str]:
+        """Resolve asset links to AAS identifiers.
+
+        Requests of up to BULK_CHUNK_SIZE links are resolved with a single
+        query; larger ones with one query per chunk.
+
+        Args:
+            links: (name, value) pairs; an AAS matches if it has any of them
+            limit: Maximum number of identifiers returned
+            sources: Link sources to consult
+
+        Returns:
+            Distinct AAS identifiers, ordered by the first link they match
+        """
+        found: dict[str, None] = {}
+        for chunk in chunked(list(dict.fromkeys(links))):
+            for identifier in await self._lookup_chunk(chunk, limit, sources):
+                found.setdefault(identifier, None)
+            if len(found) >= limit:
+                break
+        return list(found)[:limit]
+
+    async def _lookup_chunk(
+        self, links: Sequence[AssetLinkPair], limit: int, sources: Sequence[str]
+    ) -> list[str]:
+        requested = (
+            values(
+                column("ordinal", Integer),
+                column("name", Text),
+                column("value", Text),
+                name="requested",
+            )
+            .data([(ordinal, name, value) for ordinal, (name, value) in enumerate(links)])
+            .alias("requested")
+        )
+        stmt = (
+            select(AssetLinkTable.aas_identifier)
+            .join(
+                requested,
+                (AssetLinkTable.name == requested.c.name)
+                & (AssetLinkTable.value == requested.c.value),
+            )
+            .where(AssetLinkTable.source.in_(list(sources)))
+            .group_by(AssetLinkTable.aas_identifier)
+            .order_by(func.min(requested.c.ordinal), AssetLinkTable.aas_identifier)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,89 @@
+"""Set-based helpers for bulk writes.
+
+Bulk mutations (GraphQL createShells/deleteShells, registry ``$bulk``
+endpoints) create or delete thousands of entities in one request. Instead
+of one SELECT + INSERT/DELETE + flush per item, these helpers:
+- Check which identifiers already exist with one query per chunk
+- Insert rows as multi-row ``INSERT ... ON CONFLICT DO NOTHING RETURNING``
+- Delete with ``DELETE ... WHERE identifier IN (...) RETURNING``
+
+Chunks keep every statement well below the 32767 bind parameter limit of
+the Postgres wire protocol.
+
+Example:
+    existing = await existing_identifiers(session, AasTable, ids)
+    created = await insert_rows(session, AasTable, rows)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Rows (or identifiers) per statement
+BULK_CHUNK_SIZE = 1000
+
+T = TypeVar("T")
+
+
+def chunked(items: Sequence[T], size: int | None = None) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most ``size`` items."""
+    size = size or BULK_CHUNK_SIZE
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def existing_identifiers(
+    session: AsyncSession, table: Any, identifiers: Sequence[str]
+) -> set[str]:
+    """Return the subset of ``identifiers`` present in ``table``."""
+    found: set[str] = set()
+    for chunk in chunked(identifiers):
+        result = await session.execute(select(table.identifier).where(table.identifier.in_(chunk)))
+        found.update(result.scalars().all())
+    return found
+
+
+async def insert_rows(
+    session: AsyncSession, table: Any, rows: Sequence[dict[str, Any]]
+) -> set[str]:
+    """Insert rows, skipping identifiers that already exist.
+
+    Rows conflicting with an existing identifier (for example one created
+    concurrently after a pre-check) are left untouched.
+
+    Returns:
+        Identifiers of the rows actually inserted
+    """
+    inserted: set[str] = set()
+    for chunk in chunked(rows):
+        stmt = (
+            pg_insert(table)
+            .values(list(chunk))
+            .on_conflict_do_nothing()
+            .returning(table.identifier)
+        )
+        result = await session.execute(stmt)
+        inserted.update(result.scalars().all())
+    return inserted
+
+
+async def delete_identifiers(
+    session: AsyncSession, table: Any, identifiers: Sequence[str]
+) -> set[str]:
+    """Delete rows by identifier.
+
+    Returns:
+        Identifiers that existed and were deleted
+    """
+    deleted: set[str] = set()
+    for chunk in chunked(identifiers):
+        result = await session.execute(
+            delete(table).where(table.identifier.in_(chunk)).returning(table.identifier)
+        )
+        deleted.update(result.scalars().all())
+    return deleted
@@ -1,27 +1,64 @@
 """Async database engine and session factory.
 
 Provides PostgreSQL async connectivity using SQLAlchemy 2.0 asyncio
-extension with asyncpg driver.
+extension with asyncpg driver. Read-only requests are served from read
+replicas when ``DATABASE_REPLICA_URLS`` is set (see replicas). With
+``ENABLE_TENANT_ADMISSION`` each tenant holds at most its share of sessions;
+with ``ENABLE_TENANT_ISOLATION`` every transaction is bound to the current
+tenant for row-level security.
 """
 
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from titan.config import settings
+from titan.persistence.instrumentation import InstrumentedAsyncQueuePool, instrument_engine
+from titan.persistence.replicas import ReplicaSet, routing_var
+from titan.tenancy.admission import current_tenant, get_admission_controller
+from titan.tenancy.isolation import set_transaction_tenant
 
 # Module-level engine (initialized lazily)
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_replicas: ReplicaSet | None = None
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an engine with the shared pool settings."""
+    options: dict[str, Any] = {}
+    if settings.db_instrumentation:
+        options["poolclass"] = InstrumentedAsyncQueuePool
+    engine = create_async_engine(
+        url,
+        pool_size=settings.db_pool_size,  # Default 40 for 15K+ RPS
+        max_overflow=settings.db_max_overflow,  # Default 10 (50 max total)
+        pool_timeout=settings.db_pool_timeout,  # Default 30s
+        pool_recycle=settings.db_pool_recycle,  # Recycle connections after 30 minutes
+        pool_pre_ping=True,  # Verify connection health
+        echo=settings.env == "dev",  # Log SQL in dev
+        **options,
+    )
+    if settings.db_instrumentation:
+        # Statement latency, rows, bytes, pool wait (see instrumentation)
+        instrument_engine(engine)
+    if settings.enable_tenant_isolation and not event.contains(
+        Session, "after_begin", set_transaction_tenant
+    ):
+        # SET LOCAL app.tenant_id for the row-level security policies
+        event.listen(Session, "after_begin", set_transaction_tenant)
+    return engine
 
 
 def get_engine() -> AsyncEngine:
@@ -32,18 +69,21 @@ def get_engine() -> AsyncEngine:
     """
     global _engine
     if _engine is None:
-        _engine = create_async_engine(
-            settings.database_url,
-            pool_size=settings.db_pool_size,  # Default 40 for 15K+ RPS
-            max_overflow=settings.db_max_overflow,  # Default 10 (50 max total)
-            pool_timeout=settings.db_pool_timeout,  # Default 30s
-            pool_recycle=settings.db_pool_recycle,  # Recycle connections after 30 minutes
-            pool_pre_ping=True,  # Verify connection health
-            echo=settings.env == "dev",  # Log SQL in dev
-        )
+        _engine = _create_engine(settings.database_url)
     return _engine
 
 
+def get_replica_set() -> ReplicaSet | None:
+    """Get or create the read replica engines (None without replicas)."""
+    global _replicas
+    if _replicas is None:
+        urls = [url.strip() for url in settings.database_replica_urls.split(",") if url.strip()]
+        if not urls:
+            return None
+        _replicas = ReplicaSet([_create_engine(url) for url in urls])
+    return _replicas
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -59,16 +99,34 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide a session for FastAPI dependency injection.
 
+    Read-only requests get a replica session when replicas are configured
+    and one has replayed the client's consistency token; all other
+    requests get a primary session. Under tenant admission control the
+    session waits for one of the current tenant's session slots; a wait
+    that times out raises AdmissionRejectedError (served as 503).
+
     Usage:
         @router.get("/")
         async def handler(session: AsyncSession = Depends(get_session)):
             ...
     """
-    session = get_session_factory()()
-    try:
-        yield session
-    finally:
-        await session.close()
+    controller = get_admission_controller()
+    slot: AbstractAsyncContextManager[None] = (
+        controller.db_session(current_tenant()) if controller is not None else nullcontext()
+    )
+    async with slot:
+        session: AsyncSession | None = None
+        routing = routing_var.get()
+        if routing is not None and routing.read_only:
+            replicas = get_replica_set()
+            if replicas is not None:
+                session = await replicas.open_session(routing.min_lsn)
+        if session is None:
+            session = get_session_factory()()
+        try:
+            yield session
+        finally:
+            await session.close()
 
 
 @asynccontextmanager
@@ -105,11 +163,14 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _replicas
     if _engine is not None:
         await _engine.dispose()
         _engine = None
         _session_factory = None
+    if _replicas is not None:
+        await _replicas.dispose()
+        _replicas = None
 
 
 async def health_check() -> bool:
@@ -0,0 +1,374 @@
+"""SQLAlchemy engine and pool instrumentation.
+
+Hooks cursor and pool events of the engine created by ``get_engine`` and
+feeds the Prometheus metrics in titan.observability.metrics:
+- Per-statement latency, keyed by a normalized statement fingerprint
+  (literals and parameters replaced, IN/VALUES lists collapsed)
+- Rows returned or affected and estimated payload bytes
+- Pool checkout wait time and connections in use
+
+Statement statistics are also kept in-process (with latency sketches) for
+the dashboard database router.
+
+Per-request query budget: while a request is served inside
+``query_budget()``, every statement is counted by fingerprint. A statement
+executed ``DB_REPEATED_QUERY_THRESHOLD`` times or more in one request is
+reported as a probable N+1 pattern.
+
+Example:
+    engine = create_async_engine(url, poolclass=InstrumentedAsyncQueuePool)
+    instrument_engine(engine)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from titan.config import settings
+from titan.observability.metrics import (
+    record_db_pool_wait,
+    record_db_request_budget,
+    record_db_statement,
+    set_db_connections_active,
+)
+from titan.observability.profiling import get_collector
+from titan.observability.sketch import DDSketch
+
+# Fingerprints tracked in-process before further ones are grouped
+MAX_TRACKED_STATEMENTS = 500
+# Routes tracked by the query budget report
+MAX_TRACKED_ROUTES = 500
+OTHER = "<other>"
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'|%\(\w+\)s|\$\d+|\?|\b\d+(?:\.\d+)?\b")
+_PARAM_GROUP = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_GROUP_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+_TABLE = re.compile(r"\b(?:from|into|update|join)\s+\"?(\w+)\"?", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class StatementInfo:
+    """Normalized form of a SQL statement."""
+
+    fingerprint: str
+    text: str
+    operation: str
+    table: str
+
+
+@lru_cache(maxsize=4096)
+def analyze_statement(statement: str) -> StatementInfo:
+    """Normalize a statement and derive its fingerprint, operation and table.
+
+    Cached: SQLAlchemy reuses compiled statement strings, so the regexes
+    only run the first time a statement shape is seen.
+    """
+    normalized = _LITERAL.sub("?", statement)
+    normalized = _PARAM_GROUP.sub("(?)", normalized)
+    normalized = _GROUP_LIST.sub("(?)", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()[:2000]
+
+    words = normalized.split(" ", 1)
+    operation = words[0].lower() if words and words[0] else "other"
+    if operation not in ("select", "insert", "update", "delete", "with"):
+        operation = "other"
+    match = _TABLE.search(normalized)
+    table = match.group(1).lower() if match else "unknown"
+
+    fingerprint = hashlib.sha1(normalized.encode(), usedforsecurity=False).hexdigest()[:12]
+    return StatementInfo(fingerprint, normalized, operation, table)
+
+
+def payload_size(values: Any) -> int:
+    """Estimate the wire size of parameters or a result row."""
+    if values is None:
+        return 0
+    if isinstance(values, str | bytes | bytearray | memoryview):
+        return len(values)
+    if isinstance(values, dict):
+        values = values.values()
+    size = 0
+    try:
+        for value in values:
+            if isinstance(value, str | bytes | bytearray | memoryview):
+                size += len(value)
+            elif isinstance(value, list | tuple | dict):
+                size += payload_size(value)
+            else:
+                size += 8
+    except TypeError:
+        return 8
+    return size
+
+
+def _result_stats(cursor: Any) -> tuple[int, int]:
+    """Rows and estimated bytes of a statement's result.
+
+    The asyncpg adapter prefetches SELECT results into ``cursor._rows``,
+    so they can be measured before SQLAlchemy consumes them.
+    """
+    rows = getattr(cursor, "_rows", None)
+    if rows is not None and getattr(cursor, "description", None):
+        return len(rows), sum(payload_size(row) for row in rows)
+    return max(getattr(cursor, "rowcount", 0) or 0, 0), 0
+
+
+# =============================================================================
+# In-process statement statistics
+# =============================================================================
+
+
+@dataclass
+class StatementStats:
+    """Aggregated statistics for one statement fingerprint."""
+
+    fingerprint: str
+    text: str
+    operation: str
+    table: str
+    calls: int = 0
+    total_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    rows: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    sketch: DDSketch = field(default_factory=DDSketch, repr=False)
+
+    def record(self, duration_ms: float, rows: int, sent: int, received: int) -> None:
+        self.calls += 1
+        self.total_duration_ms += duration_ms
+        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+        self.rows += rows
+        self.bytes_sent += sent
+        self.bytes_received += received
+        self.sketch.add(duration_ms)
+
+    @property
+    def avg_duration_ms(self) -> float:
+        return self.total_duration_ms / self.calls if self.calls else 0.0
+
+
+@dataclass
+class RouteQueryStats:
+    """Query budget statistics for one route."""
+
+    path: str
+    requests: int = 0
+    total_queries: int = 0
+    max_queries: int = 0
+    repeated_requests: int = 0
+    worst_fingerprint: str | None = None
+    worst_repetitions: int = 0
+
+    @property
+    def avg_queries(self) -> float:
+        return self.total_queries / self.requests if self.requests else 0.0
+
+
+_statements: dict[str, StatementStats] = {}
+_routes: dict[str, RouteQueryStats] = {}
+_pool_wait = DDSketch()
+
+
+def _statement_stats(info: StatementInfo) -> StatementStats:
+    stats = _statements.get(info.fingerprint)
+    if stats is None:
+        if len(_statements) >= MAX_TRACKED_STATEMENTS:
+            stats = _statements.get(OTHER)
+            if stats is None:
+                stats = _statements[OTHER] = StatementStats(OTHER, OTHER, "other", OTHER)
+            return stats
+        stats = _statements[info.fingerprint] = StatementStats(
+            info.fingerprint, info.text, info.operation, info.table
+        )
+    return stats
+
+
+def get_statement_stats(fingerprint: str | None = None) -> list[StatementStats]:
+    """Statement statistics of this process (optionally one fingerprint)."""
+    if fingerprint is not None:
+        stats = _statements.get(fingerprint)
+        return [stats] if stats is not None else []
+    return list(_statements.values())
+
+
+def get_route_query_stats() -> list[RouteQueryStats]:
+    """Per-route query budget statistics of this process."""
+    return list(_routes.values())
+
+
+def get_pool_wait_stats() -> dict[str, Any]:
+    """Pool checkout wait statistics of this process (milliseconds)."""
+    return {
+        "checkouts": _pool_wait.count,
+        "avg_wait_ms": round(_pool_wait.avg, 3),
+        "p95_wait_ms": round(_pool_wait.quantile(0.95), 3),
+        "p99_wait_ms": round(_pool_wait.quantile(0.99), 3),
+        "max_wait_ms": round(_pool_wait.max, 3) if _pool_wait.count else 0.0,
+    }
+
+
+def reset_statistics() -> None:
+    """Clear in-process statement, route and pool statistics."""
+    _statements.clear()
+    _routes.clear()
+    _pool_wait.clear()
+
+
+# =============================================================================
+# Per-request query budget
+# =============================================================================
+
+
+@dataclass
+class QueryBudget:
+    """Statements executed while serving one request."""
+
+    queries: int = 0
+    duration_ms: float = 0.0
+    by_fingerprint: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Fingerprints executed at least ``threshold`` times, most frequent first."""
+        return [(fp, n) for fp, n in self.by_fingerprint.most_common() if n >= threshold]
+
+
+_budget_var: ContextVar[QueryBudget | None] = ContextVar("query_budget", default=None)
+
+
+@contextmanager
+def query_budget(path: str) -> Iterator[QueryBudget]:
+    """Count the statements executed in this context and report them for ``path``."""
+    budget = QueryBudget()
+    token = _budget_var.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget_var.reset(token)
+        report_query_budget(path, budget)
+
+
+def report_query_budget(path: str, budget: QueryBudget) -> None:
+    """Record a finished request's budget in metrics and the route report."""
+    repeated = budget.repeated(settings.db_repeated_query_threshold)
+    record_db_request_budget(path, budget.queries, bool(repeated))
+
+    route = _routes.get(path)
+    if route is None:
+        if len(_routes) >= MAX_TRACKED_ROUTES:
+            path = OTHER
+            route = _routes.get(OTHER)
+        if route is None:
+            route = _routes[path] = RouteQueryStats(path)
+    route.requests += 1
+    route.total_queries += budget.queries
+    route.max_queries = max(route.max_queries, budget.queries)
+    if repeated:
+        route.repeated_requests += 1
+        fingerprint, count = repeated[0]
+        if count >= route.worst_repetitions:
+            route.worst_fingerprint = fingerprint
+            route.worst_repetitions = count
+
+
+# =============================================================================
+# Engine and pool hooks
+# =============================================================================
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait."""
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            _pool_wait.add(waited * 1000)
+            record_db_pool_wait(waited)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info.setdefault("titan_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    starts = conn.info.get("titan_query_start")
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    rows, received = _result_stats(cursor)
+    if executemany and isinstance(parameters, list | tuple):
+        sent = len(statement) + sum(payload_size(p) for p in parameters)
+    else:
+        sent = len(statement) + payload_size(parameters)
+    observe_statement(statement, duration, rows, sent, received)
+
+
+def observe_statement(
+    statement: str, duration: float, rows: int, bytes_sent: int, bytes_received: int
+) -> None:
+    """Record one executed statement (also used by the raw asyncpg reads)."""
+    duration_ms = duration * 1000
+    info = analyze_statement(statement)
+    stats = _statement_stats(info)
+    stats.record(duration_ms, rows, bytes_sent, bytes_received)
+    # Label by the tracked fingerprint, so untracked shapes share "<other>"
+    record_db_statement(
+        stats.fingerprint, info.operation, info.table, duration, rows, bytes_sent, bytes_received
+    )
+    get_collector().record_db_query(duration_ms)
+
+    budget = _budget_var.get()
+    if budget is not None:
+        budget.queries += 1
+        budget.duration_ms += duration_ms
+        budget.by_fingerprint[info.fingerprint] += 1
+
+
+def _handle_error(context: Any) -> None:
+    connection = context.connection
+    if connection is not None:
+        starts = connection.info.get("titan_query_start")
+        if starts:
+            starts.pop()
+
+
+def _pool_changed(pool: Any) -> None:
+    checkedout = getattr(pool, "checkedout", None)
+    if checkedout is not None:
+        set_db_connections_active(checkedout())
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """Attach the statement and pool listeners to an engine (idempotent)."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+    pool = sync_engine.pool
+    event.listen(pool, "checkout", lambda *_: _pool_changed(pool))
+    event.listen(pool, "checkin", lambda *_: _pool_changed(pool))
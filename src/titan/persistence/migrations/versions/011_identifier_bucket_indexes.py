@@ -0,0 +1,41 @@
+"""Add identifier hash-bucket indexes for federation anti-entropy.
+
+Revision ID: 011_identifier_bucket_indexes
+Revises: 010_remove_package_dependencies
+Create Date: 2026-10-18
+
+The federation hash tree buckets entities by substr(md5(identifier), 1, 4).
+Expression indexes on that bucket let peers list a single differing leaf
+bucket without scanning the whole table.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers
+revision: str = "011_identifier_bucket_indexes"
+down_revision: str | None = "010_remove_package_dependencies"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX idx_aas_identifier_bucket ON aas
+        ((substr(md5(identifier), 1, 4)))
+    """)
+    op.execute("""
+        CREATE INDEX idx_submodels_identifier_bucket ON submodels
+        ((substr(md5(identifier), 1, 4)))
+    """)
+    op.execute("""
+        CREATE INDEX idx_concept_descriptions_identifier_bucket ON concept_descriptions
+        ((substr(md5(identifier), 1, 4)))
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_concept_descriptions_identifier_bucket", table_name="concept_descriptions")
+    op.drop_index("idx_submodels_identifier_bucket", table_name="submodels")
+    op.drop_index("idx_aas_identifier_bucket", table_name="aas")
@@ -0,0 +1,41 @@
+"""Coalesce edge pending changes per entity.
+
+Revision ID: 012_pending_change_coalescing
+Revises: 011_identifier_bucket_indexes
+Create Date: 2026-10-18
+
+The edge offline queue keeps at most one pending change per entity bound
+for the hub. A partial unique index on (entity_type, entity_id) backs the
+upsert used to collapse successive writes into one row.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers
+revision: str = "012_pending_change_coalescing"
+down_revision: str | None = "011_identifier_bucket_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep only the newest row per entity before enforcing uniqueness
+    op.execute("""
+        DELETE FROM federation_pending_changes p
+        USING federation_pending_changes newer
+        WHERE p.target_peer_id IS NULL
+          AND newer.target_peer_id IS NULL
+          AND p.entity_type = newer.entity_type
+          AND p.entity_id = newer.entity_id
+          AND (p.created_at, p.id) < (newer.created_at, newer.id)
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX uq_pending_entity ON federation_pending_changes
+        (entity_type, entity_id) WHERE target_peer_id IS NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_pending_entity", table_name="federation_pending_changes")
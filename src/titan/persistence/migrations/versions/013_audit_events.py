@@ -0,0 +1,46 @@
+"""Add audit_events table for the batched audit pipeline.
+
+Revision ID: 013_audit_events
+Revises: 012_pending_change_coalescing
+Create Date: 2026-10-18
+
+Audit events are buffered in memory and bulk-loaded with COPY by a
+background task. The full event is stored as JSONB; timestamp, actor and
+resource are promoted to indexed columns for filtering.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision: str = "013_audit_events"
+down_revision: str | None = "012_pending_change_coalescing"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_events",
+        sa.Column("event_id", postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("action", sa.String(50), nullable=False),
+        sa.Column("resource", sa.String(50), nullable=False),
+        sa.Column("resource_id", sa.Text, nullable=True),
+        sa.Column("user_id", sa.Text, nullable=True),
+        sa.Column("success", sa.Boolean, nullable=False),
+        sa.Column("event", postgresql.JSONB, nullable=False),
+    )
+    op.create_index("idx_audit_events_timestamp", "audit_events", ["timestamp"])
+    op.create_index("idx_audit_events_user", "audit_events", ["user_id", "timestamp"])
+    op.create_index("idx_audit_events_resource", "audit_events", ["resource", "resource_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_events_resource", table_name="audit_events")
+    op.drop_index("idx_audit_events_user", table_name="audit_events")
+    op.drop_index("idx_audit_events_timestamp", table_name="audit_events")
+    op.drop_table("audit_events")
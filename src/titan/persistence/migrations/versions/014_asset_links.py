@@ -0,0 +1,96 @@
+"""Add asset_links table for batched discovery lookups.
+
+Revision ID: 014_asset_links
+Revises: 013_audit_events
+Create Date: 2026-10-18
+
+Discovery lookups used one JSONB containment scan over aas_descriptors per
+requested asset link. Links are now normalized into (name, value) rows with
+a covering index so a whole lookup request is a single index-only query.
+Existing descriptors and shells are backfilled from their documents.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision: str = "014_asset_links"
+down_revision: str | None = "013_audit_events"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Links of registry descriptors: top-level fields and assetInformation
+BACKFILL_DESCRIPTORS = """
+INSERT INTO asset_links (id, source, aas_identifier, name, value)
+SELECT gen_random_uuid(), 'descriptor', identifier, name, value
+FROM (
+    SELECT d.identifier, 'globalAssetId' AS name, src.doc->>'globalAssetId' AS value
+    FROM aas_descriptors d,
+        LATERAL (VALUES (d.doc), (d.doc->'assetInformation')) AS src(doc)
+    WHERE src.doc->>'globalAssetId' <> ''
+    UNION
+    SELECT d.identifier, elem->>'name', elem->>'value'
+    FROM aas_descriptors d,
+        LATERAL (VALUES (d.doc), (d.doc->'assetInformation')) AS src(doc),
+        jsonb_array_elements(
+            CASE WHEN jsonb_typeof(src.doc->'specificAssetIds') = 'array'
+            THEN src.doc->'specificAssetIds' ELSE '[]'::jsonb END
+        ) AS elem
+    WHERE elem->>'name' <> '' AND elem->>'value' <> ''
+) AS links
+"""
+
+# Links of repository shells: assetInformation
+BACKFILL_SHELLS = """
+INSERT INTO asset_links (id, source, aas_identifier, name, value)
+SELECT gen_random_uuid(), 'shell', identifier, name, value
+FROM (
+    SELECT a.identifier, 'globalAssetId' AS name,
+        a.doc->'assetInformation'->>'globalAssetId' AS value
+    FROM aas a
+    WHERE a.doc->'assetInformation'->>'globalAssetId' <> ''
+    UNION
+    SELECT a.identifier, elem->>'name', elem->>'value'
+    FROM aas a,
+        jsonb_array_elements(
+            CASE WHEN jsonb_typeof(a.doc->'assetInformation'->'specificAssetIds') = 'array'
+            THEN a.doc->'assetInformation'->'specificAssetIds' ELSE '[]'::jsonb END
+        ) AS elem
+    WHERE elem->>'name' <> '' AND elem->>'value' <> ''
+) AS links
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_links",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=False),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("source", sa.String(16), nullable=False),
+        sa.Column("aas_identifier", sa.Text, nullable=False),
+        sa.Column("name", sa.Text, nullable=False),
+        sa.Column("value", sa.Text, nullable=False),
+    )
+    op.create_index(
+        "idx_asset_links_lookup",
+        "asset_links",
+        ["name", "value", "source", "aas_identifier"],
+    )
+    op.create_index("idx_asset_links_owner", "asset_links", ["source", "aas_identifier"])
+
+    op.execute(BACKFILL_DESCRIPTORS)
+    op.execute(BACKFILL_SHELLS)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_asset_links_owner", table_name="asset_links")
+    op.drop_index("idx_asset_links_lookup", table_name="asset_links")
+    op.drop_table("asset_links")
@@ -0,0 +1,204 @@
+"""Add tenant_id, hash partitioning and row-level security to repository tables.
+
+Revision ID: 015_tenant_partitioning
+Revises: 014_asset_links
+Create Date: 2026-10-18
+
+aas, submodels and concept_descriptions are rebuilt as tables hash-partitioned
+by tenant_id. Queries carry the tenant through a row-level security policy on
+app.tenant_id (set per transaction with set_config(..., true), i.e. SET LOCAL),
+so the planner prunes to one partition and each partition keeps its own,
+smaller GIN and identifier indexes. Identifiers become unique per tenant.
+
+Sessions that never set app.tenant_id work on the 'default' tenant, which is
+also the tenant of all existing rows. The policies are forced, so they apply
+to the owning role as well; the application role must not be a superuser or
+have BYPASSRLS.
+
+blob_assets gains tenant_id so its cascading foreign key can reference the
+partitioned submodels table.
+
+asset_links gains tenant_id (backfilled as 'default', like every existing
+shell) and a forced policy, so removing or looking up shell links only sees
+the current tenant's rows. Registry descriptors are not tenant-scoped, so
+descriptor links stay visible to every tenant.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers
+revision: str = "015_tenant_partitioning"
+down_revision: str | None = "014_asset_links"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Fixed at creation; changing it means rebuilding the tables
+PARTITIONS = 16
+
+TENANT = "COALESCE(NULLIF(current_setting('app.tenant_id', true), ''), 'default')"
+
+TABLES = ("aas", "submodels", "concept_descriptions")
+
+# Columns after the common (tenant_id, id, identifier, identifier_b64) prefix
+EXTRA_COLUMNS = {
+    "aas": "",
+    "submodels": "semantic_id TEXT, kind VARCHAR(20),",
+    "concept_descriptions": "",
+}
+
+# Secondary indexes (other than the per-tenant identifier uniques)
+INDEXES = {
+    "aas": [
+        "CREATE INDEX idx_aas_doc_gin ON aas USING GIN (doc jsonb_path_ops)",
+        "CREATE INDEX idx_aas_id_short ON aas ((doc->>'idShort'))",
+        "CREATE INDEX idx_aas_asset_kind ON aas ((doc->'assetInformation'->>'assetKind'))",
+        "CREATE INDEX idx_aas_identifier_bucket ON aas ((substr(md5(identifier), 1, 4)))",
+    ],
+    "submodels": [
+        "CREATE INDEX idx_submodels_doc_gin ON submodels USING GIN (doc jsonb_path_ops)",
+        "CREATE INDEX idx_submodels_id_short ON submodels ((doc->>'idShort'))",
+        "CREATE INDEX idx_submodels_semantic_id ON submodels (semantic_id)",
+        "CREATE INDEX idx_submodels_kind ON submodels (kind)",
+        "CREATE INDEX idx_submodels_identifier_bucket ON submodels "
+        "((substr(md5(identifier), 1, 4)))",
+    ],
+    "concept_descriptions": [
+        "CREATE INDEX idx_concept_descriptions_doc_gin ON concept_descriptions "
+        "USING GIN (doc jsonb_path_ops)",
+        "CREATE INDEX idx_concept_descriptions_identifier_bucket ON concept_descriptions "
+        "((substr(md5(identifier), 1, 4)))",
+    ],
+}
+
+# Indexes of the unpartitioned tables (downgrade)
+LEGACY_INDEXES = {
+    "aas": [
+        "CREATE UNIQUE INDEX idx_aas_identifier ON aas (identifier)",
+        "CREATE UNIQUE INDEX idx_aas_identifier_b64 ON aas (identifier_b64)",
+    ],
+    "submodels": [
+        "CREATE UNIQUE INDEX idx_submodels_identifier ON submodels (identifier)",
+        "CREATE UNIQUE INDEX idx_submodels_identifier_b64 ON submodels (identifier_b64)",
+    ],
+    "concept_descriptions": [
+        "CREATE UNIQUE INDEX idx_concept_descriptions_identifier "
+        "ON concept_descriptions (identifier)",
+        "CREATE UNIQUE INDEX idx_concept_descriptions_identifier_b64 "
+        "ON concept_descriptions (identifier_b64)",
+    ],
+}
+
+
+def _create_table(table: str, partitioned: bool) -> None:
+    tenant_column = f"tenant_id TEXT NOT NULL DEFAULT {TENANT}," if partitioned else ""
+    primary_key = "PRIMARY KEY (tenant_id, id)" if partitioned else "PRIMARY KEY (id)"
+    partition_by = "PARTITION BY HASH (tenant_id)" if partitioned else ""
+    op.execute(f"""
+        CREATE TABLE {table}_new (
+            {tenant_column}
+            id UUID NOT NULL,
+            identifier TEXT NOT NULL,
+            identifier_b64 VARCHAR(4000) NOT NULL,
+            {EXTRA_COLUMNS[table]}
+            doc JSONB NOT NULL,
+            doc_bytes BYTEA NOT NULL,
+            etag VARCHAR(64) NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            {primary_key}
+        ) {partition_by}
+    """)
+    if partitioned:
+        for remainder in range(PARTITIONS):
+            op.execute(f"""
+                CREATE TABLE {table}_p{remainder} PARTITION OF {table}_new
+                FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})
+            """)
+
+
+def _swap(table: str, columns: str) -> None:
+    """Copy rows into ``{table}_new`` and replace ``table`` with it."""
+    op.execute(f"INSERT INTO {table}_new ({columns}) SELECT {columns} FROM {table}")  # noqa: S608
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    op.execute(f"ALTER INDEX {table}_new_pkey RENAME TO {table}_pkey")
+
+
+def _columns(table: str) -> str:
+    extra = "semantic_id, kind, " if table == "submodels" else ""
+    return f"id, identifier, identifier_b64, {extra}doc, doc_bytes, etag, created_at, updated_at"
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE blob_assets DROP CONSTRAINT fk_blob_assets_submodel")
+
+    for table in TABLES:
+        _create_table(table, partitioned=True)
+        _swap(table, _columns(table))
+        op.execute(f"CREATE UNIQUE INDEX idx_{table}_identifier ON {table} (tenant_id, identifier)")
+        op.execute(
+            f"CREATE UNIQUE INDEX idx_{table}_identifier_b64 ON {table} (tenant_id, identifier_b64)"
+        )
+        for index in INDEXES[table]:
+            op.execute(index)
+        op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY")
+        op.execute(f"""
+            CREATE POLICY tenant_isolation ON {table}
+                USING (tenant_id = {TENANT})
+                WITH CHECK (tenant_id = {TENANT})
+        """)
+
+    op.execute(f"ALTER TABLE blob_assets ADD COLUMN tenant_id TEXT NOT NULL DEFAULT {TENANT}")
+    op.execute("""
+        ALTER TABLE blob_assets ADD CONSTRAINT fk_blob_assets_submodel
+        FOREIGN KEY (tenant_id, submodel_id) REFERENCES submodels (tenant_id, id)
+        ON DELETE CASCADE
+    """)
+
+    op.execute("ALTER TABLE asset_links ADD COLUMN tenant_id TEXT NOT NULL DEFAULT 'default'")
+    op.execute(f"ALTER TABLE asset_links ALTER COLUMN tenant_id SET DEFAULT {TENANT}")
+    op.execute("DROP INDEX idx_asset_links_lookup")
+    op.execute(
+        "CREATE INDEX idx_asset_links_lookup ON asset_links "
+        "(name, value, source, tenant_id, aas_identifier)"
+    )
+    op.execute("ALTER TABLE asset_links ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE asset_links FORCE ROW LEVEL SECURITY")
+    op.execute(f"""
+        CREATE POLICY tenant_isolation ON asset_links
+            USING (source <> 'shell' OR tenant_id = {TENANT})
+            WITH CHECK (source <> 'shell' OR tenant_id = {TENANT})
+    """)
+
+
+def downgrade() -> None:
+    # Rows of tenants other than 'default' cannot be represented without
+    # tenant_id (they would violate the global identifier uniques) and are
+    # dropped: the policies hide them from the copy below.
+    op.execute("DROP POLICY tenant_isolation ON asset_links")
+    op.execute("ALTER TABLE asset_links NO FORCE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE asset_links DISABLE ROW LEVEL SECURITY")
+    op.execute("DELETE FROM asset_links WHERE source = 'shell' AND tenant_id <> 'default'")
+    op.execute("DROP INDEX idx_asset_links_lookup")
+    op.execute("ALTER TABLE asset_links DROP COLUMN tenant_id")
+    op.execute(
+        "CREATE INDEX idx_asset_links_lookup ON asset_links (name, value, source, aas_identifier)"
+    )
+
+    op.execute("ALTER TABLE blob_assets DROP CONSTRAINT fk_blob_assets_submodel")
+    op.execute("DELETE FROM blob_assets WHERE tenant_id <> 'default'")
+    op.execute("ALTER TABLE blob_assets DROP COLUMN tenant_id")
+
+    for table in TABLES:
+        _create_table(table, partitioned=False)
+        _swap(table, _columns(table))
+        for index in LEGACY_INDEXES[table] + INDEXES[table]:
+            op.execute(index)
+
+    op.execute("""
+        ALTER TABLE blob_assets ADD CONSTRAINT fk_blob_assets_submodel
+        FOREIGN KEY (submodel_id) REFERENCES submodels (id) ON DELETE CASCADE
+    """)
@@ -0,0 +1,160 @@
+"""Raw asyncpg reads with named prepared statements.
+
+The hottest repository reads return ``(doc_bytes, etag)`` by key or a
+JSON page built by Postgres. Through ``AsyncSession.execute`` each of them
+still pays for statement cache lookup, parameter and result processing and
+Row construction. RawReader runs them directly on the session's pooled
+asyncpg connection instead:
+- Statements are prepared once per connection under a fixed name and the
+  PreparedStatement is kept in the connection's ``info`` dict
+- The session's connection is used, so reads join its transaction and
+  follow replica routing
+- Statements are still reported to the database instrumentation
+- Reads inside a transaction run in a savepoint, so a plan invalidated
+  by a schema change is re-prepared and retried without aborting it
+
+The raw path is used only when the session is bound to asyncpg and
+``DB_RAW_READS`` is enabled; repositories fall back to the ORM path
+otherwise. Disable it behind a transaction-pooling PgBouncer, which does
+not keep named prepared statements.
+
+Example:
+    reader = RawReader(session)
+    if reader.available:
+        doc = await reader.fetch_doc(SUBMODEL_BY_ID, identifier)
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from asyncpg.exceptions import InvalidCachedStatementError  # type: ignore[import-untyped]
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from titan.config import settings
+from titan.persistence.instrumentation import observe_statement, payload_size
+
+# Key of the per-connection prepared statement cache in ConnectionRecord.info
+PREPARED_INFO_KEY = "titan_prepared"
+
+
+@dataclass(frozen=True)
+class RawStatement:
+    """A statement with asyncpg ``$n`` placeholders and a stable name."""
+
+    name: str
+    sql: str
+
+
+def positional(sql: str, names: Sequence[str]) -> str:
+    """Rewrite ``:name`` bind parameters as ``$1..$n`` in ``names`` order."""
+    for index, name in enumerate(names, start=1):
+        sql = re.sub(rf"(?<!:):{name}\b", f"${index}", sql)
+    return sql
+
+
+@dataclass
+class _PreparedCache:
+    """Prepared statements of one DBAPI connection."""
+
+    statements: dict[str, Any] = field(default_factory=dict)
+    # Bumped when cached plans are invalidated (server names stay taken)
+    generation: int = 0
+
+
+class RawReader:
+    """Runs prepared read statements on a session's asyncpg connection."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    @property
+    def available(self) -> bool:
+        """Whether the raw path can be used for this session."""
+        if not settings.db_raw_reads:
+            return False
+        try:
+            return bool(self.session.get_bind().dialect.driver == "asyncpg")
+        except Exception:
+            return False
+
+    async def fetch(self, statement: RawStatement, *args: Any) -> list[Any]:
+        """Run a prepared statement and return its asyncpg Records.
+
+        A plan invalidated by a schema change (e.g. a migration) is
+        re-prepared and the statement retried once. Inside an open
+        transaction (always the case with tenant isolation, whose
+        ``after_begin`` hook runs set_config) the statement runs in a
+        savepoint, so the error only rolls back the savepoint and the
+        retry can use the same transaction.
+        """
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        assert driver is not None, "Raw reads need a live DBAPI connection"
+        cache: _PreparedCache = raw.info.setdefault(PREPARED_INFO_KEY, _PreparedCache())
+
+        start = time.perf_counter()
+        try:
+            rows = await self._fetch_guarded(driver, cache, statement, args)
+        except InvalidCachedStatementError:
+            # Schema changed under the plan: prepare under a new name
+            cache.statements.clear()
+            cache.generation += 1
+            rows = await self._fetch_guarded(driver, cache, statement, args)
+
+        if settings.db_instrumentation:
+            observe_statement(
+                statement.sql,
+                time.perf_counter() - start,
+                len(rows),
+                payload_size(args),
+                sum(payload_size(row) for row in rows),
+            )
+        return rows
+
+    @classmethod
+    async def _fetch_guarded(
+        cls, driver: Any, cache: _PreparedCache, statement: RawStatement, args: Sequence[Any]
+    ) -> list[Any]:
+        """Fetch, inside a savepoint when a transaction is open."""
+        if not driver.is_in_transaction():
+            return await cls._fetch_prepared(driver, cache, statement, args)
+        async with driver.transaction():
+            return await cls._fetch_prepared(driver, cache, statement, args)
+
+    @staticmethod
+    async def _fetch_prepared(
+        driver: Any, cache: _PreparedCache, statement: RawStatement, args: Sequence[Any]
+    ) -> list[Any]:
+        prepared = cache.statements.get(statement.name)
+        if prepared is None:
+            prepared = await driver.prepare(
+                statement.sql, name=f"{statement.name}_{cache.generation}"
+            )
+            cache.statements[statement.name] = prepared
+        rows: list[Any] = await prepared.fetch(*args)
+        return rows
+
+    async def fetch_doc(self, statement: RawStatement, key: str) -> tuple[bytes, str] | None:
+        """Fetch one ``(doc_bytes, etag)`` row by key."""
+        rows = await self.fetch(statement, key)
+        if not rows:
+            return None
+        return (rows[0][0], rows[0][1])
+
+    async def fetch_docs(
+        self, statement: RawStatement, keys: Sequence[str]
+    ) -> dict[str, tuple[bytes, str]]:
+        """Fetch ``(key, doc_bytes, etag)`` rows for many keys."""
+        rows = await self.fetch(statement, list(keys))
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    async def fetch_value(self, statement: RawStatement, *args: Any) -> Any:
+        """Fetch the first column of the first row (None without rows)."""
+        rows = await self.fetch(statement, *args)
+        return rows[0][0] if rows else None
@@ -9,7 +9,9 @@ Supports discovery queries by globalAssetId, specificAssetIds, and semanticId.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
+from uuid import uuid4
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +22,12 @@ from titan.core.model.registry import (
     AssetAdministrationShellDescriptor,
     SubmodelDescriptor,
 )
+from titan.persistence.asset_links import (
+    SOURCE_DESCRIPTOR,
+    AssetLinkIndex,
+    extract_asset_links,
+)
+from titan.persistence.bulk import delete_identifiers, existing_identifiers, insert_rows
 from titan.persistence.tables import (
     AasDescriptorTable,
     SubmodelDescriptorTable,
@@ -34,10 +42,14 @@ def _doc_bytes_and_etag(doc: dict[str, Any]) -> tuple[bytes, str]:
 
 
 class AasDescriptorRepository:
-    """Repository for AAS Descriptor operations."""
+    """Repository for AAS Descriptor operations.
+
+    Writes keep the ``asset_links`` discovery index in sync.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.asset_links = AssetLinkIndex(session)
 
     # -------------------------------------------------------------------------
     # Fast path: bytes operations
@@ -110,6 +122,7 @@ class AasDescriptorRepository:
         )
         self.session.add(row)
         await self.session.flush()
+        await self.asset_links.replace(SOURCE_DESCRIPTOR, {descriptor.id: extract_asset_links(doc)})
         return (doc_bytes, etag)
 
     async def update(
@@ -134,6 +147,9 @@ class AasDescriptorRepository:
         row.etag = etag
 
         await self.session.flush()
+        if identifier != descriptor.id:
+            await self.asset_links.remove(SOURCE_DESCRIPTOR, [identifier])
+        await self.asset_links.replace(SOURCE_DESCRIPTOR, {descriptor.id: extract_asset_links(doc)})
         return (doc_bytes, etag)
 
     async def delete(self, identifier: str) -> bool:
@@ -146,6 +162,7 @@ class AasDescriptorRepository:
 
         await self.session.delete(row)
         await self.session.flush()
+        await self.asset_links.remove(SOURCE_DESCRIPTOR, [identifier])
         return True
 
     async def exists(self, identifier: str) -> bool:
@@ -154,6 +171,47 @@ class AasDescriptorRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def existing_identifiers(self, identifiers: Sequence[str]) -> set[str]:
+        """Return which of ``identifiers`` already exist (one query per chunk)."""
+        return await existing_identifiers(self.session, AasDescriptorTable, identifiers)
+
+    async def create_many(
+        self, descriptors: Sequence[AssetAdministrationShellDescriptor]
+    ) -> set[str]:
+        """Create many AAS descriptors with multi-row inserts.
+
+        Returns:
+            Identifiers actually created (existing ones are skipped)
+        """
+        rows = []
+        links: dict[str, list[tuple[str, str]]] = {}
+        for descriptor in descriptors:
+            doc = descriptor.model_dump(by_alias=True, exclude_none=True)
+            doc_bytes, etag = _doc_bytes_and_etag(doc)
+            links[descriptor.id] = extract_asset_links(doc)
+            rows.append(
+                {
+                    "id": str(uuid4()),
+                    "identifier": descriptor.id,
+                    "identifier_b64": encode_id_to_b64url(descriptor.id),
+                    "global_asset_id": descriptor.global_asset_id,
+                    "doc": doc,
+                    "doc_bytes": doc_bytes,
+                    "etag": etag,
+                }
+            )
+        created = await insert_rows(self.session, AasDescriptorTable, rows)
+        await self.asset_links.replace(
+            SOURCE_DESCRIPTOR, {identifier: links[identifier] for identifier in sorted(created)}
+        )
+        return created
+
+    async def delete_many(self, identifiers: Sequence[str]) -> set[str]:
+        """Delete many AAS descriptors; returns the identifiers deleted."""
+        deleted = await delete_identifiers(self.session, AasDescriptorTable, identifiers)
+        await self.asset_links.remove(SOURCE_DESCRIPTOR, sorted(deleted))
+        return deleted
+
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[tuple[bytes, str]]:
         """List all AAS descriptors (fast path)."""
         stmt = (
@@ -340,6 +398,40 @@ class SubmodelDescriptorRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def existing_identifiers(self, identifiers: Sequence[str]) -> set[str]:
+        """Return which of ``identifiers`` already exist (one query per chunk)."""
+        return await existing_identifiers(self.session, SubmodelDescriptorTable, identifiers)
+
+    async def create_many(self, descriptors: Sequence[SubmodelDescriptor]) -> set[str]:
+        """Create many Submodel descriptors with multi-row inserts.
+
+        Returns:
+            Identifiers actually created (existing ones are skipped)
+        """
+        rows = []
+        for descriptor in descriptors:
+            doc = descriptor.model_dump(by_alias=True, exclude_none=True)
+            doc_bytes, etag = _doc_bytes_and_etag(doc)
+            semantic_id = None
+            if descriptor.semantic_id and descriptor.semantic_id.keys:
+                semantic_id = descriptor.semantic_id.keys[-1].value
+            rows.append(
+                {
+                    "id": str(uuid4()),
+                    "identifier": descriptor.id,
+                    "identifier_b64": encode_id_to_b64url(descriptor.id),
+                    "semantic_id": semantic_id,
+                    "doc": doc,
+                    "doc_bytes": doc_bytes,
+                    "etag": etag,
+                }
+            )
+        return await insert_rows(self.session, SubmodelDescriptorTable, rows)
+
+    async def delete_many(self, identifiers: Sequence[str]) -> set[str]:
+        """Delete many Submodel descriptors; returns the identifiers deleted."""
+        return await delete_identifiers(self.session, SubmodelDescriptorTable, identifiers)
+
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[tuple[bytes, str]]:
         """List all Submodel descriptors (fast path)."""
         stmt = (
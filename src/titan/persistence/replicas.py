@@ -0,0 +1,146 @@
+"""Read-replica routing with read-your-writes consistency.
+
+When ``DATABASE_REPLICA_URLS`` is set, sessions handed out for read-only
+requests (GET/HEAD) are bound to a streaming replica, chosen round-robin,
+while every other request keeps using the primary. Read-modify-write flows
+(PUT/PATCH/POST/DELETE handlers) therefore never read from a replica.
+
+Read-your-writes uses a per-client consistency token:
+- After a request commits on the primary, the response carries the
+  primary's WAL position in the ``X-Consistency-Token`` header
+- A client sending that token back is only served by a replica that has
+  replayed at least that position (``pg_last_wal_replay_lsn()``);
+  otherwise the read falls back to the primary
+
+Example:
+    replicas = ReplicaSet([create_async_engine(url) for url in urls])
+    session = await replicas.open_session(min_lsn=parse_lsn(token))
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_HEADER = "x-consistency-token"
+
+# Methods whose handlers only read and may be served by a replica
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+# Seconds a replica that failed a consistency check is skipped
+REPLICA_RETRY_SECONDS = 5.0
+
+
+@dataclass
+class ReadRouting:
+    """Routing decision for the request being served."""
+
+    read_only: bool
+    min_lsn: int | None = None
+    wrote: bool = False
+
+
+routing_var: ContextVar[ReadRouting | None] = ContextVar("read_routing", default=None)
+
+
+def parse_lsn(value: str | None) -> int | None:
+    """Parse a PostgreSQL LSN (``16/B374D848``) into an integer."""
+    if not value:
+        return None
+    high, sep, low = value.strip().partition("/")
+    if not sep:
+        return None
+    try:
+        return (int(high, 16) << 32) | int(low, 16)
+    except ValueError:
+        return None
+
+
+def format_lsn(lsn: int) -> str:
+    """Format an integer LSN in PostgreSQL notation."""
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+def _mark_write(session: Session) -> None:
+    """Session ``after_commit`` hook: remember that this request wrote."""
+    routing = routing_var.get()
+    if routing is not None:
+        routing.wrote = True
+
+
+async def primary_lsn(engine: AsyncEngine) -> int | None:
+    """Current WAL write position of the primary."""
+    async with engine.connect() as conn:
+        value = await conn.scalar(text("SELECT pg_current_wal_lsn()::text"))
+    return parse_lsn(value)
+
+
+class ReplicaSet:
+    """Round-robin pool of replica session factories."""
+
+    def __init__(self, engines: list[AsyncEngine]) -> None:
+        """Initialize the replica set.
+
+        Args:
+            engines: One engine per replica
+        """
+        self.engines = engines
+        self._factories = [
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in engines
+        ]
+        # Highest replay position seen per replica (only ever grows)
+        self._replayed = [0] * len(engines)
+        self._skip_until = [0.0] * len(engines)
+        self._next = 0
+        if not event.contains(Session, "after_commit", _mark_write):
+            event.listen(Session, "after_commit", _mark_write)
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    async def open_session(self, min_lsn: int | None = None) -> AsyncSession | None:
+        """Open a session on a replica that has replayed ``min_lsn``.
+
+        Returns:
+            A replica session, or None when no replica is fresh enough
+        """
+        now = time.monotonic()
+        for _ in range(len(self._factories)):
+            index = self._next
+            self._next = (index + 1) % len(self._factories)
+            if self._skip_until[index] > now:
+                continue
+
+            session = self._factories[index]()
+            if min_lsn is None or self._replayed[index] >= min_lsn:
+                return session
+
+            try:
+                value = await session.scalar(text("SELECT pg_last_wal_replay_lsn()::text"))
+            except Exception:
+                logger.warning("Replica %d failed its consistency check", index, exc_info=True)
+                self._skip_until[index] = now + REPLICA_RETRY_SECONDS
+                await session.close()
+                continue
+
+            replayed = parse_lsn(value)
+            if replayed is not None:
+                self._replayed[index] = max(self._replayed[index], replayed)
+                if replayed >= min_lsn:
+                    return session
+            await session.close()
+        return None
+
+    async def dispose(self) -> None:
+        """Close all replica connections."""
+        for engine in self.engines:
+            await engine.dispose()
@@ -1,7 +1,8 @@
 """Repository pattern for AAS persistence.
 
 Provides fast/slow path methods:
-- Fast path: get_bytes() returns raw bytes for streaming (no Python object hydration)
+- Fast path: get_bytes() returns raw bytes for streaming (no Python object hydration);
+  it selects only (doc_bytes, etag) so the JSONB doc is never transferred
 - Slow path: get_model() returns Pydantic model for projection/transformation
 
 The fast path is the key performance optimization for read-heavy workloads.
@@ -14,17 +15,24 @@ SQL-Level Pagination (The "Pagination Paradox" Fix):
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 from uuid import uuid4
 
 import orjson
-from sqlalchemy import select, text
+from sqlalchemy import String, func, literal, select, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from titan.core.canonicalize import canonical_bytes, canonical_bytes_from_model
 from titan.core.ids import encode_id_to_b64url
 from titan.core.model import AssetAdministrationShell, ConceptDescription, Submodel
+from titan.persistence.asset_links import SOURCE_SHELL, AssetLinkIndex, extract_asset_links
+from titan.persistence.bulk import delete_identifiers, existing_identifiers, insert_rows
+from titan.persistence.raw import RawReader, RawStatement, positional
 from titan.persistence.tables import (
     AasTable,
     BlobAssetTable,
@@ -59,15 +67,200 @@ def _doc_bytes_and_etag(doc: dict[str, Any]) -> tuple[bytes, str]:
     return doc_bytes, generate_etag(doc_bytes)
 
 
+def _defer_documents(table: Any) -> tuple[Any, ...]:
+    """Loader options skipping the JSONB and bytes document columns.
+
+    Used when a row is loaded only to be rewritten or deleted, so Postgres
+    does not detoast and ship documents that are about to be replaced.
+    """
+    return (defer(table.doc), defer(table.doc_bytes))
+
+
+def _projected_doc(table: Any, keys: Sequence[str] | None) -> Any:
+    """Column expression for a document narrowed to its top-level ``keys``.
+
+    With ``keys=None`` the whole JSONB document is selected. Otherwise
+    Postgres builds a smaller object so unrequested members (typically
+    large submodelElements trees) never leave the database. Missing keys
+    come back as JSON null.
+    """
+    if keys is None:
+        return table.doc.label("doc")
+    pairs: list[Any] = []
+    for key in keys:
+        pairs.extend((literal(key, String), table.doc[key]))
+    return func.jsonb_build_object(*pairs, type_=JSONB).label("doc")
+
+
+def _page_documents(rows: Sequence[Any], limit: int) -> tuple[list[dict[str, Any]], str | None]:
+    """Split a limit+1 result into documents and the next created_at cursor."""
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+    docs = [{k: v for k, v in row.doc.items() if v is not None} for row in rows]
+    next_cursor = rows[-1].created_at.isoformat() if rows and has_more else None
+    return docs, next_cursor
+
+
+def _parse_cursor(cursor: str) -> datetime:
+    return datetime.fromisoformat(cursor.replace("Z", "+00:00"))
+
+
+# -----------------------------------------------------------------------------
+# Hot read statements (ORM text and raw prepared forms, see persistence.raw)
+# -----------------------------------------------------------------------------
+
+_AAS_PAGE_SQL = """
+WITH page AS (
+    SELECT doc, created_at
+    FROM aas
+    WHERE (CAST(:cursor AS text) IS NULL OR created_at > CAST(:cursor AS timestamptz))
+    ORDER BY created_at
+    LIMIT :limit
+),
+next_cursor AS (
+    SELECT created_at::text as cursor
+    FROM page
+    ORDER BY created_at DESC
+    LIMIT 1
+),
+has_more AS (
+    SELECT EXISTS(
+        SELECT 1 FROM aas
+        WHERE created_at > (SELECT MAX(created_at) FROM page)
+    ) as more
+)
+SELECT json_build_object(
+    'result', COALESCE((SELECT json_agg(doc) FROM page), '[]'::json),
+    'paging_metadata', CASE
+        WHEN (SELECT more FROM has_more) THEN
+            json_build_object('cursor', (SELECT cursor FROM next_cursor))
+        ELSE NULL
+    END
+)::text as response
+"""
+
+_SUBMODEL_PAGE_SQL = """
+WITH page AS (
+    SELECT doc, created_at
+    FROM submodels
+    WHERE (CAST(:cursor AS text) IS NULL OR created_at > CAST(:cursor AS timestamptz))
+      AND (CAST(:semantic_id AS text) IS NULL OR semantic_id = :semantic_id)
+    ORDER BY created_at
+    LIMIT :limit
+),
+next_cursor AS (
+    SELECT created_at::text as cursor
+    FROM page
+    ORDER BY created_at DESC
+    LIMIT 1
+),
+has_more AS (
+    SELECT EXISTS(
+        SELECT 1 FROM submodels
+        WHERE created_at > (SELECT MAX(created_at) FROM page)
+          AND (CAST(:semantic_id AS text) IS NULL OR semantic_id = :semantic_id)
+    ) as more
+)
+SELECT json_build_object(
+    'result', COALESCE((SELECT json_agg(doc) FROM page), '[]'::json),
+    'paging_metadata', CASE
+        WHEN (SELECT more FROM has_more) THEN
+            json_build_object('cursor', (SELECT cursor FROM next_cursor))
+        ELSE NULL
+    END
+)::text as response
+"""
+
+_CONCEPT_DESCRIPTION_PAGE_SQL = """
+WITH page AS (
+    SELECT doc, created_at
+    FROM concept_descriptions
+    WHERE (CAST(:cursor AS text) IS NULL OR created_at > CAST(:cursor AS timestamptz))
+    ORDER BY created_at
+    LIMIT :limit
+),
+next_cursor AS (
+    SELECT created_at::text as cursor
+    FROM page
+    ORDER BY created_at DESC
+    LIMIT 1
+),
+has_more AS (
+    SELECT EXISTS(
+        SELECT 1 FROM concept_descriptions
+        WHERE created_at > (SELECT MAX(created_at) FROM page)
+    ) as more
+)
+SELECT json_build_object(
+    'result', COALESCE((SELECT json_agg(doc) FROM page), '[]'::json),
+    'paging_metadata', CASE
+        WHEN (SELECT more FROM has_more) THEN
+            json_build_object('cursor', (SELECT cursor FROM next_cursor))
+        ELSE NULL
+    END
+)::text as response
+"""
+
+AAS_BY_B64 = RawStatement(
+    "titan_aas_by_b64", "SELECT doc_bytes, etag FROM aas WHERE identifier_b64 = $1"
+)
+AAS_BY_ID = RawStatement("titan_aas_by_id", "SELECT doc_bytes, etag FROM aas WHERE identifier = $1")
+AAS_MANY = RawStatement(
+    "titan_aas_many",
+    "SELECT identifier, doc_bytes, etag FROM aas WHERE identifier = ANY($1::text[])",
+)
+AAS_PAGE = RawStatement("titan_aas_page", positional(_AAS_PAGE_SQL, ("cursor", "limit")))
+
+SUBMODEL_BY_B64 = RawStatement(
+    "titan_submodel_by_b64", "SELECT doc_bytes, etag FROM submodels WHERE identifier_b64 = $1"
+)
+SUBMODEL_BY_ID = RawStatement(
+    "titan_submodel_by_id", "SELECT doc_bytes, etag FROM submodels WHERE identifier = $1"
+)
+SUBMODEL_MANY = RawStatement(
+    "titan_submodel_many",
+    "SELECT identifier, doc_bytes, etag FROM submodels WHERE identifier = ANY($1::text[])",
+)
+SUBMODEL_PAGE = RawStatement(
+    "titan_submodel_page",
+    positional(_SUBMODEL_PAGE_SQL, ("cursor", "limit", "semantic_id")),
+)
+
+CONCEPT_DESCRIPTION_BY_B64 = RawStatement(
+    "titan_cd_by_b64",
+    "SELECT doc_bytes, etag FROM concept_descriptions WHERE identifier_b64 = $1",
+)
+CONCEPT_DESCRIPTION_BY_ID = RawStatement(
+    "titan_cd_by_id", "SELECT doc_bytes, etag FROM concept_descriptions WHERE identifier = $1"
+)
+CONCEPT_DESCRIPTION_MANY = RawStatement(
+    "titan_cd_many",
+    "SELECT identifier, doc_bytes, etag FROM concept_descriptions "
+    "WHERE identifier = ANY($1::text[])",
+)
+CONCEPT_DESCRIPTION_PAGE = RawStatement(
+    "titan_cd_page", positional(_CONCEPT_DESCRIPTION_PAGE_SQL, ("cursor", "limit"))
+)
+
+
 class BaseRepository(Generic[T, TableT]):
     """Base repository with common CRUD operations."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.raw = RawReader(session)
 
 
 class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
-    """Repository for Asset Administration Shell operations."""
+    """Repository for Asset Administration Shell operations.
+
+    Writes keep the shell rows of the ``asset_links`` discovery index in sync.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        self.asset_links = AssetLinkIndex(session)
 
     # -------------------------------------------------------------------------
     # Fast path: bytes operations (no model hydration)
@@ -82,9 +275,13 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         Returns:
             Tuple of (doc_bytes, etag) or None if not found.
         """
-        stmt = select(AasTable).where(AasTable.identifier_b64 == identifier_b64)
+        if self.raw.available:
+            return await self.raw.fetch_doc(AAS_BY_B64, identifier_b64)
+        stmt = select(AasTable.doc_bytes, AasTable.etag).where(
+            AasTable.identifier_b64 == identifier_b64
+        )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
 
@@ -92,14 +289,31 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
 
     async def get_bytes_by_id(self, identifier: str) -> tuple[bytes, str] | None:
         """Fast path: get by original identifier."""
-        stmt = select(AasTable).where(AasTable.identifier == identifier)
+        if self.raw.available:
+            return await self.raw.fetch_doc(AAS_BY_ID, identifier)
+        stmt = select(AasTable.doc_bytes, AasTable.etag).where(AasTable.identifier == identifier)
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
 
         return (row.doc_bytes, row.etag)
 
+    async def get_bytes_many(self, identifiers: Sequence[str]) -> dict[str, tuple[bytes, str]]:
+        """Fast path: batch get (doc_bytes, etag) of shells by identifier.
+
+        Missing identifiers are absent from the result.
+        """
+        if not identifiers:
+            return {}
+        if self.raw.available:
+            return await self.raw.fetch_docs(AAS_MANY, identifiers)
+        stmt = select(AasTable.identifier, AasTable.doc_bytes, AasTable.etag).where(
+            AasTable.identifier.in_(identifiers)
+        )
+        result = await self.session.execute(stmt)
+        return {row.identifier: (row.doc_bytes, row.etag) for row in result.all()}
+
     # -------------------------------------------------------------------------
     # Slow path: model operations (for projections/transformations)
     # -------------------------------------------------------------------------
@@ -151,6 +365,7 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         )
         self.session.add(row)
         await self.session.flush()
+        await self.asset_links.replace(SOURCE_SHELL, {aas.id: extract_asset_links(doc)})
         return (doc_bytes, etag)
 
     async def update(
@@ -161,7 +376,11 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         Returns:
             Tuple of (doc_bytes, etag) or None if not found.
         """
-        stmt = select(AasTable).where(AasTable.identifier == identifier)
+        stmt = (
+            select(AasTable)
+            .where(AasTable.identifier == identifier)
+            .options(*_defer_documents(AasTable))
+        )
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
         if row is None:
@@ -178,6 +397,9 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         row.etag = etag
 
         await self.session.flush()
+        if identifier != aas.id:
+            await self.asset_links.remove(SOURCE_SHELL, [identifier])
+        await self.asset_links.replace(SOURCE_SHELL, {aas.id: extract_asset_links(doc)})
         return (doc_bytes, etag)
 
     async def delete(self, identifier: str) -> bool:
@@ -186,7 +408,11 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         Returns:
             True if deleted, False if not found.
         """
-        stmt = select(AasTable).where(AasTable.identifier == identifier)
+        stmt = (
+            select(AasTable)
+            .where(AasTable.identifier == identifier)
+            .options(*_defer_documents(AasTable))
+        )
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
         if row is None:
@@ -194,6 +420,7 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
 
         await self.session.delete(row)
         await self.session.flush()
+        await self.asset_links.remove(SOURCE_SHELL, [identifier])
         return True
 
     async def exists(self, identifier: str) -> bool:
@@ -202,15 +429,75 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    # -------------------------------------------------------------------------
+    # Bulk operations (set-based, no per-item flush)
+    # -------------------------------------------------------------------------
+
+    async def existing_identifiers(self, identifiers: Sequence[str]) -> set[str]:
+        """Return which of ``identifiers`` already exist (one query per chunk)."""
+        return await existing_identifiers(self.session, AasTable, identifiers)
+
+    async def create_many(
+        self, models: Sequence[AssetAdministrationShell]
+    ) -> dict[str, tuple[bytes, str]]:
+        """Create many AAS with multi-row inserts.
+
+        Identifiers that already exist are skipped rather than failing the
+        batch.
+
+        Returns:
+            Mapping of created identifier to (doc_bytes, etag)
+        """
+        rows: list[dict[str, Any]] = []
+        written: dict[str, tuple[bytes, str]] = {}
+        links: dict[str, list[tuple[str, str]]] = {}
+        for aas in models:
+            doc = aas.model_dump(by_alias=True, exclude_none=True)
+            doc_bytes = canonical_bytes_from_model(aas)
+            etag = generate_etag(doc_bytes)
+            rows.append(
+                {
+                    "id": str(uuid4()),
+                    "identifier": aas.id,
+                    "identifier_b64": encode_id_to_b64url(aas.id),
+                    "doc": doc,
+                    "doc_bytes": doc_bytes,
+                    "etag": etag,
+                }
+            )
+            written[aas.id] = (doc_bytes, etag)
+            links[aas.id] = extract_asset_links(doc)
+
+        inserted = await insert_rows(self.session, AasTable, rows)
+        await self.asset_links.replace(
+            SOURCE_SHELL, {identifier: links[identifier] for identifier in sorted(inserted)}
+        )
+        return {identifier: pair for identifier, pair in written.items() if identifier in inserted}
+
+    async def delete_many(self, identifiers: Sequence[str]) -> set[str]:
+        """Delete many AAS in set-based statements.
+
+        Returns:
+            Identifiers that existed and were deleted
+        """
+        deleted = await delete_identifiers(self.session, AasTable, identifiers)
+        await self.asset_links.remove(SOURCE_SHELL, sorted(deleted))
+        return deleted
+
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[tuple[bytes, str]]:
         """List all AAS (fast path).
 
         Returns:
             List of (doc_bytes, etag) tuples.
         """
-        stmt = select(AasTable.doc).order_by(AasTable.created_at).limit(limit).offset(offset)
+        stmt = (
+            select(AasTable.doc_bytes, AasTable.etag)
+            .order_by(AasTable.created_at)
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.session.execute(stmt)
-        return [_doc_bytes_and_etag(row.doc) for row in result.all()]
+        return [(row.doc_bytes, row.etag) for row in result.all()]
 
     # -------------------------------------------------------------------------
     # Batch operations (for GraphQL DataLoaders)
@@ -232,9 +519,9 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         if not identifiers:
             return {}
 
-        stmt = select(AasTable).where(AasTable.identifier.in_(identifiers))
+        stmt = select(AasTable.identifier, AasTable.doc).where(AasTable.identifier.in_(identifiers))
         result = await self.session.execute(stmt)
-        rows = {row.identifier: row for row in result.scalars().all()}
+        rows = {row.identifier: row for row in result.all()}
 
         return {
             id: AssetAdministrationShell.model_validate(rows[id].doc) if id in rows else None
@@ -255,7 +542,9 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         Returns:
             Tuple of (list of models, next cursor or None)
         """
-        stmt = select(AasTable).order_by(AasTable.created_at).limit(limit + 1)
+        stmt = (
+            select(AasTable.doc, AasTable.created_at).order_by(AasTable.created_at).limit(limit + 1)
+        )
         if cursor:
             from datetime import datetime
 
@@ -263,7 +552,7 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
             stmt = stmt.where(AasTable.created_at > cursor_dt)
 
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
 
         # Determine if there's a next page
         has_more = len(rows) > limit
@@ -275,6 +564,47 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
 
         return models, next_cursor
 
+    async def list_projected(
+        self,
+        keys: Sequence[str] | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        id_short: str | None = None,
+        asset_kind: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List raw AAS documents with filters evaluated in SQL.
+
+        Filters use JSONB containment so they can be answered from the
+        GIN index on ``doc``; only the requested top-level keys are returned
+        and no Pydantic models are built.
+
+        Args:
+            keys: Top-level document keys to return (None for all)
+            limit: Maximum items per page
+            cursor: Cursor from previous page (created_at timestamp)
+            id_short: Only shells with this idShort
+            asset_kind: Only shells with this assetInformation.assetKind
+
+        Returns:
+            Tuple of (list of documents, next cursor or None)
+        """
+        stmt = (
+            select(_projected_doc(AasTable, keys), AasTable.created_at)
+            .order_by(AasTable.created_at)
+            .limit(limit + 1)
+        )
+        if cursor:
+            stmt = stmt.where(AasTable.created_at > _parse_cursor(cursor))
+        if id_short is not None:
+            stmt = stmt.where(AasTable.doc.contains({"idShort": id_short}))
+        if asset_kind is not None:
+            stmt = stmt.where(
+                AasTable.doc.contains({"assetInformation": {"assetKind": asset_kind}})
+            )
+
+        result = await self.session.execute(stmt)
+        return _page_documents(result.all(), limit)
+
     async def list_paged_zero_copy(
         self,
         limit: int = 100,
@@ -295,40 +625,13 @@ class AasRepository(BaseRepository[AssetAdministrationShell, AasTable]):
         """
         # Use parameterized SQL to avoid injection and keep parsing in Postgres.
         # PostgreSQL builds the complete JSON response.
-        query = text(
-            """
-            WITH page AS (
-                SELECT doc, created_at
-                FROM aas
-                WHERE (CAST(:cursor AS text) IS NULL OR created_at > CAST(:cursor AS timestamptz))
-                ORDER BY created_at
-                LIMIT :limit
-            ),
-            next_cursor AS (
-                SELECT created_at::text as cursor
-                FROM page
-                ORDER BY created_at DESC
-                LIMIT 1
-            ),
-            has_more AS (
-                SELECT EXISTS(
-                    SELECT 1 FROM aas
-                    WHERE created_at > (SELECT MAX(created_at) FROM page)
-                ) as more
+        if self.raw.available:
+            row = await self.raw.fetch_value(AAS_PAGE, cursor, limit)
+        else:
+            result = await self.session.execute(
+                text(_AAS_PAGE_SQL), {"limit": limit, "cursor": cursor}
             )
-            SELECT json_build_object(
-                'result', COALESCE((SELECT json_agg(doc) FROM page), '[]'::json),
-                'paging_metadata', CASE
-                    WHEN (SELECT more FROM has_more) THEN
-                        json_build_object('cursor', (SELECT cursor FROM next_cursor))
-                    ELSE NULL
-                END
-            )::text as response
-            """
-        )
-
-        result = await self.session.execute(query, {"limit": limit, "cursor": cursor})
-        row = result.scalar_one_or_none()
+            row = result.scalar_one_or_none()
 
         if row is None:
             # Empty result
@@ -371,9 +674,13 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
 
     async def get_bytes(self, identifier_b64: str) -> tuple[bytes, str] | None:
         """Fast path: get raw canonical bytes and etag."""
-        stmt = select(SubmodelTable).where(SubmodelTable.identifier_b64 == identifier_b64)
+        if self.raw.available:
+            return await self.raw.fetch_doc(SUBMODEL_BY_B64, identifier_b64)
+        stmt = select(SubmodelTable.doc_bytes, SubmodelTable.etag).where(
+            SubmodelTable.identifier_b64 == identifier_b64
+        )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
 
@@ -381,14 +688,33 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
 
     async def get_bytes_by_id(self, identifier: str) -> tuple[bytes, str] | None:
         """Fast path: get by original identifier."""
-        stmt = select(SubmodelTable).where(SubmodelTable.identifier == identifier)
+        if self.raw.available:
+            return await self.raw.fetch_doc(SUBMODEL_BY_ID, identifier)
+        stmt = select(SubmodelTable.doc_bytes, SubmodelTable.etag).where(
+            SubmodelTable.identifier == identifier
+        )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
 
         return (row.doc_bytes, row.etag)
 
+    async def get_bytes_many(self, identifiers: Sequence[str]) -> dict[str, tuple[bytes, str]]:
+        """Fast path: batch get (doc_bytes, etag) of submodels by identifier.
+
+        Missing identifiers are absent from the result.
+        """
+        if not identifiers:
+            return {}
+        if self.raw.available:
+            return await self.raw.fetch_docs(SUBMODEL_MANY, identifiers)
+        stmt = select(SubmodelTable.identifier, SubmodelTable.doc_bytes, SubmodelTable.etag).where(
+            SubmodelTable.identifier.in_(identifiers)
+        )
+        result = await self.session.execute(stmt)
+        return {row.identifier: (row.doc_bytes, row.etag) for row in result.all()}
+
     # -------------------------------------------------------------------------
     # Slow path: model operations
     # -------------------------------------------------------------------------
@@ -467,7 +793,11 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
 
     async def update(self, identifier: str, submodel: Submodel) -> tuple[bytes, str] | None:
         """Update an existing Submodel."""
-        stmt = select(SubmodelTable).where(SubmodelTable.identifier == identifier)
+        stmt = (
+            select(SubmodelTable)
+            .where(SubmodelTable.identifier == identifier)
+            .options(*_defer_documents(SubmodelTable))
+        )
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
         if row is None:
@@ -544,7 +874,11 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
 
     async def delete(self, identifier: str) -> bool:
         """Delete a Submodel."""
-        stmt = select(SubmodelTable).where(SubmodelTable.identifier == identifier)
+        stmt = (
+            select(SubmodelTable)
+            .where(SubmodelTable.identifier == identifier)
+            .options(*_defer_documents(SubmodelTable))
+        )
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
         if row is None:
@@ -582,26 +916,35 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[tuple[bytes, str]]:
         """List all Submodels (fast path)."""
         stmt = (
-            select(SubmodelTable.doc).order_by(SubmodelTable.created_at).limit(limit).offset(offset)
+            select(SubmodelTable.doc_bytes, SubmodelTable.etag)
+            .order_by(SubmodelTable.created_at)
+            .limit(limit)
+            .offset(offset)
         )
         result = await self.session.execute(stmt)
-        return [_doc_bytes_and_etag(row.doc) for row in result.all()]
+        return [(row.doc_bytes, row.etag) for row in result.all()]
 
     async def find_by_semantic_id(
         self, semantic_id: str, limit: int = 100
     ) -> list[tuple[bytes, str]]:
         """Find Submodels by semantic ID (fast path)."""
         stmt = (
-            select(SubmodelTable.doc).where(SubmodelTable.semantic_id == semantic_id).limit(limit)
+            select(SubmodelTable.doc_bytes, SubmodelTable.etag)
+            .where(SubmodelTable.semantic_id == semantic_id)
+            .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return [_doc_bytes_and_etag(row.doc) for row in result.all()]
+        return [(row.doc_bytes, row.etag) for row in result.all()]
 
     async def find_by_kind(self, kind: str, limit: int = 100) -> list[tuple[bytes, str]]:
         """Find Submodels by kind (Template or Instance)."""
-        stmt = select(SubmodelTable.doc).where(SubmodelTable.kind == kind).limit(limit)
+        stmt = (
+            select(SubmodelTable.doc_bytes, SubmodelTable.etag)
+            .where(SubmodelTable.kind == kind)
+            .limit(limit)
+        )
         result = await self.session.execute(stmt)
-        return [_doc_bytes_and_etag(row.doc) for row in result.all()]
+        return [(row.doc_bytes, row.etag) for row in result.all()]
 
     # -------------------------------------------------------------------------
     # Batch operations (for GraphQL DataLoaders)
@@ -621,9 +964,11 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
         if not identifiers:
             return {}
 
-        stmt = select(SubmodelTable).where(SubmodelTable.identifier.in_(identifiers))
+        stmt = select(SubmodelTable.identifier, SubmodelTable.doc).where(
+            SubmodelTable.identifier.in_(identifiers)
+        )
         result = await self.session.execute(stmt)
-        rows = {row.identifier: row for row in result.scalars().all()}
+        rows = {row.identifier: row for row in result.all()}
 
         return {
             id: Submodel.model_validate(rows[id].doc) if id in rows else None for id in identifiers
@@ -647,9 +992,9 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
             return {}
 
         # First, load all shells to get their submodel references
-        stmt = select(AasTable).where(AasTable.identifier.in_(shell_ids))
+        stmt = select(AasTable.identifier, AasTable.doc).where(AasTable.identifier.in_(shell_ids))
         result = await self.session.execute(stmt)
-        shells = {row.identifier: row for row in result.scalars().all()}
+        shells = {row.identifier: row for row in result.all()}
 
         # Extract all submodel references from shells
         submodel_ids: set[str] = set()
@@ -705,7 +1050,11 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
         Returns:
             Tuple of (list of models, next cursor or None)
         """
-        stmt = select(SubmodelTable).order_by(SubmodelTable.created_at).limit(limit + 1)
+        stmt = (
+            select(SubmodelTable.doc, SubmodelTable.created_at)
+            .order_by(SubmodelTable.created_at)
+            .limit(limit + 1)
+        )
         if cursor:
             from datetime import datetime
 
@@ -713,7 +1062,7 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
             stmt = stmt.where(SubmodelTable.created_at > cursor_dt)
 
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
 
         # Determine if there's a next page
         has_more = len(rows) > limit
@@ -725,6 +1074,45 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
 
         return models, next_cursor
 
+    async def list_projected(
+        self,
+        keys: Sequence[str] | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        semantic_id: str | None = None,
+        id_short: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List raw submodel documents with filters evaluated in SQL.
+
+        ``semantic_id`` matches the indexed semantic_id column (the last key
+        of the submodel's semanticId), as the REST listing does; ``id_short``
+        uses JSONB containment on the GIN-indexed ``doc``.
+
+        Args:
+            keys: Top-level document keys to return (None for all)
+            limit: Maximum items per page
+            cursor: Cursor from previous page (created_at timestamp)
+            semantic_id: Only submodels with this semantic ID
+            id_short: Only submodels with this idShort
+
+        Returns:
+            Tuple of (list of documents, next cursor or None)
+        """
+        stmt = (
+            select(_projected_doc(SubmodelTable, keys), SubmodelTable.created_at)
+            .order_by(SubmodelTable.created_at)
+            .limit(limit + 1)
+        )
+        if cursor:
+            stmt = stmt.where(SubmodelTable.created_at > _parse_cursor(cursor))
+        if semantic_id is not None:
+            stmt = stmt.where(SubmodelTable.semantic_id == semantic_id)
+        if id_short is not None:
+            stmt = stmt.where(SubmodelTable.doc.contains({"idShort": id_short}))
+
+        result = await self.session.execute(stmt)
+        return _page_documents(result.all(), limit)
+
     async def list_paged_zero_copy(
         self,
         limit: int = 100,
@@ -741,45 +1129,14 @@ class SubmodelRepository(BaseRepository[Submodel, SubmodelTable]):
         Returns:
             PagedResult with response_bytes ready to stream
         """
-        query = text(
-            """
-            WITH page AS (
-                SELECT doc, created_at
-                FROM submodels
-                WHERE (CAST(:cursor AS text) IS NULL OR created_at > CAST(:cursor AS timestamptz))
-                  AND (CAST(:semantic_id AS text) IS NULL OR semantic_id = :semantic_id)
-                ORDER BY created_at
-                LIMIT :limit
-            ),
-            next_cursor AS (
-                SELECT created_at::text as cursor
-                FROM page
-                ORDER BY created_at DESC
-                LIMIT 1
-            ),
-            has_more AS (
-                SELECT EXISTS(
-                    SELECT 1 FROM submodels
-                    WHERE created_at > (SELECT MAX(created_at) FROM page)
-                      AND (CAST(:semantic_id AS text) IS NULL OR semantic_id = :semantic_id)
-                ) as more
+        if self.raw.available:
+            row = await self.raw.fetch_value(SUBMODEL_PAGE, cursor, limit, semantic_id)
+        else:
+            result = await self.session.execute(
+                text(_SUBMODEL_PAGE_SQL),
+                {"limit": limit, "cursor": cursor, "semantic_id": semantic_id},
             )
-            SELECT json_build_object(
-                'result', COALESCE((SELECT json_agg(doc) FROM page), '[]'::json),
-                'paging_metadata', CASE
-                    WHEN (SELECT more FROM has_more) THEN
-                        json_build_object('cursor', (SELECT cursor FROM next_cursor))
-                    ELSE NULL
-                END
-            )::text as response
-            """
-        )
-
-        result = await self.session.execute(
-            query,
-            {"limit": limit, "cursor": cursor, "semantic_id": semantic_id},
-        )
-        row = result.scalar_one_or_none()
+            row = result.scalar_one_or_none()
 
         if row is None:
             empty_response = orjson.dumps({"result": [], "paging_metadata": None})
@@ -808,14 +1165,17 @@ class ConceptDescriptionRepository:
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.raw = RawReader(session)
 
     async def get_bytes(self, identifier_b64: str) -> tuple[bytes, str] | None:
         """Fast path: get raw canonical bytes and etag."""
-        stmt = select(ConceptDescriptionTable).where(
+        if self.raw.available:
+            return await self.raw.fetch_doc(CONCEPT_DESCRIPTION_BY_B64, identifier_b64)
+        stmt = select(ConceptDescriptionTable.doc_bytes, ConceptDescriptionTable.etag).where(
             ConceptDescriptionTable.identifier_b64 == identifier_b64
         )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
 
@@ -823,26 +1183,45 @@ class ConceptDescriptionRepository:
 
     async def get_bytes_by_id(self, identifier: str) -> tuple[bytes, str] | None:
         """Fast path: get by original identifier."""
-        stmt = select(ConceptDescriptionTable).where(
+        if self.raw.available:
+            return await self.raw.fetch_doc(CONCEPT_DESCRIPTION_BY_ID, identifier)
+        stmt = select(ConceptDescriptionTable.doc_bytes, ConceptDescriptionTable.etag).where(
             ConceptDescriptionTable.identifier == identifier
         )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
 
         return (row.doc_bytes, row.etag)
 
+    async def get_bytes_many(self, identifiers: Sequence[str]) -> dict[str, tuple[bytes, str]]:
+        """Fast path: batch get (doc_bytes, etag) of concept descriptions by identifier.
+
+        Missing identifiers are absent from the result.
+        """
+        if not identifiers:
+            return {}
+        if self.raw.available:
+            return await self.raw.fetch_docs(CONCEPT_DESCRIPTION_MANY, identifiers)
+        stmt = select(
+            ConceptDescriptionTable.identifier,
+            ConceptDescriptionTable.doc_bytes,
+            ConceptDescriptionTable.etag,
+        ).where(ConceptDescriptionTable.identifier.in_(identifiers))
+        result = await self.session.execute(stmt)
+        return {row.identifier: (row.doc_bytes, row.etag) for row in result.all()}
+
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[tuple[bytes, str]]:
         """List all ConceptDescriptions (fast path)."""
         stmt = (
-            select(ConceptDescriptionTable.doc)
+            select(ConceptDescriptionTable.doc_bytes, ConceptDescriptionTable.etag)
             .order_by(ConceptDescriptionTable.created_at)
             .limit(limit)
             .offset(offset)
         )
         result = await self.session.execute(stmt)
-        return [_doc_bytes_and_etag(row.doc) for row in result.all()]
+        return [(row.doc_bytes, row.etag) for row in result.all()]
 
     # -------------------------------------------------------------------------
     # Slow path: model operations (with Pydantic hydration)
@@ -857,11 +1236,11 @@ class ConceptDescriptionRepository:
         Returns:
             ConceptDescription model or None if not found
         """
-        stmt = select(ConceptDescriptionTable).where(
+        stmt = select(ConceptDescriptionTable.doc).where(
             ConceptDescriptionTable.identifier == identifier
         )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.first()
         if row is None:
             return None
         return ConceptDescription.model_validate(row.doc)
@@ -905,8 +1284,10 @@ class ConceptDescriptionRepository:
         Returns:
             Tuple of (doc_bytes, etag) or None if not found
         """
-        stmt = select(ConceptDescriptionTable).where(
-            ConceptDescriptionTable.identifier == identifier
+        stmt = (
+            select(ConceptDescriptionTable)
+            .where(ConceptDescriptionTable.identifier == identifier)
+            .options(*_defer_documents(ConceptDescriptionTable))
         )
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
@@ -932,8 +1313,10 @@ class ConceptDescriptionRepository:
         Returns:
             True if deleted, False if not found
         """
-        stmt = select(ConceptDescriptionTable).where(
-            ConceptDescriptionTable.identifier == identifier
+        stmt = (
+            select(ConceptDescriptionTable)
+            .where(ConceptDescriptionTable.identifier == identifier)
+            .options(*_defer_documents(ConceptDescriptionTable))
         )
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
@@ -977,40 +1360,13 @@ class ConceptDescriptionRepository:
         """
         # For now, simplified query without is_case_of filter
         # (isCaseOf would require JSONB path query)
-        query = text(
-            """
-            WITH page AS (
-                SELECT doc, created_at
-                FROM concept_descriptions
-                WHERE (CAST(:cursor AS text) IS NULL OR created_at > CAST(:cursor AS timestamptz))
-                ORDER BY created_at
-                LIMIT :limit
-            ),
-            next_cursor AS (
-                SELECT created_at::text as cursor
-                FROM page
-                ORDER BY created_at DESC
-                LIMIT 1
-            ),
-            has_more AS (
-                SELECT EXISTS(
-                    SELECT 1 FROM concept_descriptions
-                    WHERE created_at > (SELECT MAX(created_at) FROM page)
-                ) as more
+        if self.raw.available:
+            row = await self.raw.fetch_value(CONCEPT_DESCRIPTION_PAGE, cursor, limit)
+        else:
+            result = await self.session.execute(
+                text(_CONCEPT_DESCRIPTION_PAGE_SQL), {"limit": limit, "cursor": cursor}
             )
-            SELECT json_build_object(
-                'result', COALESCE((SELECT json_agg(doc) FROM page), '[]'::json),
-                'paging_metadata', CASE
-                    WHEN (SELECT more FROM has_more) THEN
-                        json_build_object('cursor', (SELECT cursor FROM next_cursor))
-                    ELSE NULL
-                END
-            )::text as response
-            """
-        )
-
-        result = await self.session.execute(query, {"limit": limit, "cursor": cursor})
-        row = result.scalar_one_or_none()
+            row = result.scalar_one_or_none()
 
         if row is None:
             empty_response = orjson.dumps({"result": [], "paging_metadata": None})
@@ -5,6 +5,12 @@ Each table stores both JSONB (for queries) and canonical bytes (for streaming):
 - doc_bytes: BYTEA column with canonical JSON for fast streaming reads
 
 The etag is SHA256 of doc_bytes for conditional requests.
+
+The repository tables (aas, submodels, concept_descriptions) carry a
+tenant_id. Migrations hash-partition them by tenant and protect them with
+row-level security; the tenant defaults to the transaction's app.tenant_id
+setting, so inserts never set it explicitly. asset_links is protected the
+same way, without partitioning.
 """
 
 from __future__ import annotations
@@ -16,6 +22,7 @@ from uuid import uuid4
 
 from sqlalchemy import (
     BigInteger,
+    Boolean,
     DateTime,
     ForeignKey,
     Index,
@@ -23,6 +30,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -34,6 +42,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# Tenant of the current transaction (see RLSPolicy.tenant_expression)
+TENANT_ID_DEFAULT = text("COALESCE(NULLIF(current_setting('app.tenant_id', true), ''), 'default')")
+
+
 def generate_etag(doc_bytes: bytes) -> str:
     """Generate ETag from canonical JSON bytes."""
     return hashlib.sha256(doc_bytes).hexdigest()
@@ -52,13 +64,14 @@ class AasTable(Base):
         UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4())
     )
 
+    # Owning tenant (unique identifiers are per tenant)
+    tenant_id: Mapped[str] = mapped_column(Text, nullable=False, server_default=TENANT_ID_DEFAULT)
+
     # AAS identifier (the user-facing identifier)
-    identifier: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
+    identifier: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Base64URL encoded identifier for path matching
-    identifier_b64: Mapped[str] = mapped_column(
-        String(4000), unique=True, nullable=False, index=True
-    )
+    identifier_b64: Mapped[str] = mapped_column(String(4000), nullable=False)
 
     # JSONB for queries and filters
     doc: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -84,6 +97,9 @@ class AasTable(Base):
 
     # Indexes for common queries
     __table_args__ = (
+        # Identifiers are unique per tenant
+        Index("idx_aas_identifier", tenant_id, identifier, unique=True),
+        Index("idx_aas_identifier_b64", tenant_id, identifier_b64, unique=True),
         # GIN index for JSONB containment queries
         Index("idx_aas_doc_gin", doc, postgresql_using="gin"),
         # Index on global asset ID (extracted from JSONB)
@@ -91,6 +107,8 @@ class AasTable(Base):
             "idx_aas_global_asset_id",
             doc["assetInformation"]["globalAssetId"].astext,
         ),
+        # Hash-tree bucket of the identifier (federation anti-entropy)
+        Index("idx_aas_identifier_bucket", func.substr(func.md5(identifier), 1, 4)),
     )
 
 
@@ -108,13 +126,14 @@ class SubmodelTable(Base):
         UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4())
     )
 
+    # Owning tenant (unique identifiers are per tenant)
+    tenant_id: Mapped[str] = mapped_column(Text, nullable=False, server_default=TENANT_ID_DEFAULT)
+
     # Submodel identifier
-    identifier: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
+    identifier: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Base64URL encoded identifier
-    identifier_b64: Mapped[str] = mapped_column(
-        String(4000), unique=True, nullable=False, index=True
-    )
+    identifier_b64: Mapped[str] = mapped_column(String(4000), nullable=False)
 
     # Extracted semantic ID for efficient queries
     semantic_id: Mapped[str | None] = mapped_column(Text, nullable=True, index=True)
@@ -146,8 +165,13 @@ class SubmodelTable(Base):
 
     # Indexes
     __table_args__ = (
+        # Identifiers are unique per tenant
+        Index("idx_submodels_identifier", tenant_id, identifier, unique=True),
+        Index("idx_submodels_identifier_b64", tenant_id, identifier_b64, unique=True),
         # GIN index for JSONB containment queries
         Index("idx_submodels_doc_gin", doc, postgresql_using="gin"),
+        # Hash-tree bucket of the identifier (federation anti-entropy)
+        Index("idx_submodels_identifier_bucket", func.substr(func.md5(identifier), 1, 4)),
     )
 
 
@@ -164,13 +188,14 @@ class ConceptDescriptionTable(Base):
         UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4())
     )
 
+    # Owning tenant (unique identifiers are per tenant)
+    tenant_id: Mapped[str] = mapped_column(Text, nullable=False, server_default=TENANT_ID_DEFAULT)
+
     # ConceptDescription identifier
-    identifier: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
+    identifier: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Base64URL encoded identifier
-    identifier_b64: Mapped[str] = mapped_column(
-        String(4000), unique=True, nullable=False, index=True
-    )
+    identifier_b64: Mapped[str] = mapped_column(String(4000), nullable=False)
 
     # JSONB for queries and filters
     doc: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -196,8 +221,16 @@ class ConceptDescriptionTable(Base):
 
     # Indexes
     __table_args__ = (
+        # Identifiers are unique per tenant
+        Index("idx_concept_descriptions_identifier", tenant_id, identifier, unique=True),
+        Index("idx_concept_descriptions_identifier_b64", tenant_id, identifier_b64, unique=True),
         # GIN index for JSONB containment queries
         Index("idx_concept_descriptions_doc_gin", doc, postgresql_using="gin"),
+        # Hash-tree bucket of the identifier (federation anti-entropy)
+        Index(
+            "idx_concept_descriptions_identifier_bucket",
+            func.substr(func.md5(identifier), 1, 4),
+        ),
     )
 
 
@@ -248,6 +281,45 @@ class AasDescriptorTable(Base):
     )
 
 
+class AssetLinkTable(Base):
+    """Normalized asset links for discovery lookups.
+
+    One row per (name, value) asset identifier of an AAS, maintained on
+    descriptor and shell writes. The global asset ID is stored with
+    name="globalAssetId" (Constraint AASd-116). ``source`` records whether
+    the link came from a registry descriptor or a repository shell.
+
+    Shell links belong to the shell's tenant and are protected by
+    row-level security; descriptor links, like the registry, are shared.
+    """
+
+    __tablename__ = "asset_links"
+
+    # Primary key (internal UUID)
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4())
+    )
+
+    tenant_id: Mapped[str] = mapped_column(Text, nullable=False, server_default=TENANT_ID_DEFAULT)
+
+    # "descriptor" or "shell"
+    source: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    # AAS identifier the link resolves to
+    aas_identifier: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Asset identifier name/value pair
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        # Covering index: lookups are index-only scans returning identifiers
+        Index("idx_asset_links_lookup", "name", "value", "source", "tenant_id", "aas_identifier"),
+        # Replacing or removing the links of one AAS
+        Index("idx_asset_links_owner", "source", "aas_identifier"),
+    )
+
+
 class SubmodelDescriptorTable(Base):
     """Submodel Registry descriptor table.
 
@@ -311,6 +383,9 @@ class BlobAssetTable(Base):
         UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4())
     )
 
+    # Tenant of the parent submodel (part of the foreign key to the partitioned table)
+    tenant_id: Mapped[str] = mapped_column(Text, nullable=False, server_default=TENANT_ID_DEFAULT)
+
     # Reference to the parent submodel
     submodel_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False, index=True)
 
@@ -523,7 +598,17 @@ class FederationPendingChangeTable(Base):
         onupdate=func.now(),
     )
 
-    __table_args__ = (Index("idx_pending_priority", priority, created_at),)
+    __table_args__ = (
+        Index("idx_pending_priority", priority, created_at),
+        # One pending change per entity for the hub queue (edge coalescing)
+        Index(
+            "uq_pending_entity",
+            entity_type,
+            entity_id,
+            unique=True,
+            postgresql_where=target_peer_id.is_(None),
+        ),
+    )
 
 
 class FederationSyncLogTable(Base):
@@ -631,3 +716,33 @@ class OperationInvocationTable(Base):
         # Index for correlation ID lookups (OPC-UA/Modbus response mapping)
         Index("idx_op_invocations_correlation", correlation_id),
     )
+
+
+# =============================================================================
+# Audit Tables
+# =============================================================================
+
+
+class AuditEventTable(Base):
+    """Append-only audit trail written by the batched audit pipeline.
+
+    Rows are bulk-loaded with COPY; the full event is kept in ``event`` and
+    the commonly filtered attributes are promoted to columns.
+    """
+
+    __tablename__ = "audit_events"
+
+    event_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    action: Mapped[str] = mapped_column(String(50), nullable=False)
+    resource: Mapped[str] = mapped_column(String(50), nullable=False)
+    resource_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    user_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    success: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    event: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("idx_audit_events_timestamp", timestamp),
+        Index("idx_audit_events_user", user_id, timestamp),
+        Index("idx_audit_events_resource", resource, resource_id),
+    )
@@ -7,16 +7,23 @@ ABAC extends RBAC by evaluating policies against attributes:
 - Environment attributes (time, IP address, location)
 
 This provides fine-grained access control beyond role-based permissions.
+
+Policies are compiled into an index keyed by (action, resource type), so a
+request only evaluates the policies that can apply to it. Decisions of
+policies that depend only on subject, tenant, action and resource are
+memoized for a short TTL.
 """
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from ipaddress import ip_address, ip_network
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
 from typing import Any
 
 from titan.security.oidc import User
@@ -97,6 +104,21 @@ class ABACPolicy(ABC):
     name: str = "unnamed_policy"
     priority: int = 100  # Lower = higher priority
 
+    # Scope used by the policy index (None = applies to every action/type)
+    actions: frozenset[Action] | None = None
+    resource_types: frozenset[ResourceType] | None = None
+
+    # True when the decision depends only on the user's subject and tenant
+    # and on the action and resource (type, id, owner, tenant), so it can
+    # be memoized. Policies reading time, IP or free-form attributes are not.
+    cacheable: bool = False
+
+    def applies_to(self, action: Action, resource_type: ResourceType) -> bool:
+        """Whether the policy can decide for this action and resource type."""
+        return (self.actions is None or action in self.actions) and (
+            self.resource_types is None or resource_type in self.resource_types
+        )
+
     @abstractmethod
     def evaluate(self, context: PolicyContext) -> PolicyResult:
         """Evaluate the policy against the context.
@@ -115,6 +137,7 @@ class AllowOwnerPolicy(ABACPolicy):
 
     name = "allow_owner"
     priority = 10
+    cacheable = True
 
     def evaluate(self, context: PolicyContext) -> PolicyResult:
         if context.resource_owner is None:
@@ -143,6 +166,7 @@ class TenantIsolationPolicy(ABACPolicy):
 
     name = "tenant_isolation"
     priority = 5
+    cacheable = True
 
     def evaluate(self, context: PolicyContext) -> PolicyResult:
         if context.resource_tenant is None:
@@ -224,6 +248,52 @@ class TimeBasedPolicy(ABACPolicy):
         )
 
 
+class IPPrefixTrie:
+    """Binary prefix trie for longest-prefix membership tests.
+
+    Lookups walk at most 32 (IPv4) or 128 (IPv6) bits regardless of how
+    many networks are stored.
+    """
+
+    def __init__(self, networks: Iterable[IPv4Network | IPv6Network] = ()):
+        # One root per IP version; a node is [child0, child1, terminal]
+        self._roots: dict[int, list[Any]] = {4: [None, None, False], 6: [None, None, False]}
+        for network in networks:
+            self.add(network)
+
+    def add(self, network: IPv4Network | IPv6Network) -> None:
+        node = self._roots[network.version]
+        bits = network.max_prefixlen
+        value = int(network.network_address)
+        for i in range(network.prefixlen):
+            if node[2]:
+                return  # Covered by a shorter prefix
+            bit = (value >> (bits - 1 - i)) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, False]
+            node = node[bit]
+        node[2] = True
+        node[0] = node[1] = None
+
+    def contains(self, address: str) -> bool:
+        """Whether ``address`` lies in any stored network.
+
+        Raises:
+            ValueError: If ``address`` is not a valid IP address
+        """
+        parsed = ip_address(address)
+        node = self._roots[parsed.version]
+        bits = parsed.max_prefixlen
+        value = int(parsed)
+        for i in range(bits):
+            if node[2]:
+                return True
+            node = node[(value >> (bits - 1 - i)) & 1]
+            if node is None:
+                return False
+        return bool(node[2])
+
+
 class IPAllowlistPolicy(ABACPolicy):
     """Restrict access to specific IP ranges."""
 
@@ -237,6 +307,7 @@ class IPAllowlistPolicy(ABACPolicy):
             allowed_networks: List of CIDR notation networks (e.g., ["10.0.0.0/8"])
         """
         self.allowed_networks = [ip_network(net) for net in allowed_networks]
+        self._trie = IPPrefixTrie(self.allowed_networks)
 
     def evaluate(self, context: PolicyContext) -> PolicyResult:
         if context.client_ip is None:
@@ -247,7 +318,7 @@ class IPAllowlistPolicy(ABACPolicy):
             )
 
         try:
-            client = ip_address(context.client_ip)
+            allowed = self._trie.contains(context.client_ip)
         except ValueError:
             return PolicyResult(
                 decision=PolicyDecision.DENY,
@@ -255,13 +326,12 @@ class IPAllowlistPolicy(ABACPolicy):
                 reason=f"Invalid IP address: {context.client_ip}",
             )
 
-        for network in self.allowed_networks:
-            if client in network:
-                return PolicyResult(
-                    decision=PolicyDecision.NOT_APPLICABLE,
-                    policy_name=self.name,
-                    reason="IP in allowed network",
-                )
+        if allowed:
+            return PolicyResult(
+                decision=PolicyDecision.NOT_APPLICABLE,
+                policy_name=self.name,
+                reason="IP in allowed network",
+            )
 
         return PolicyResult(
             decision=PolicyDecision.DENY,
@@ -286,6 +356,8 @@ class ResourceTypePolicy(ABACPolicy):
             allowed_resources: Mapping of actions to allowed resource types
         """
         self.allowed_resources = allowed_resources
+        self.actions = frozenset(action for action, types in allowed_resources.items() if types)
+        self.cacheable = True
 
     def evaluate(self, context: PolicyContext) -> PolicyResult:
         allowed = self.allowed_resources.get(context.action, set())
@@ -320,43 +392,143 @@ class CustomPolicy(ABACPolicy):
         name: str,
         evaluator: Callable[[PolicyContext], PolicyResult],
         priority: int = 100,
+        actions: Iterable[Action] | None = None,
+        resource_types: Iterable[ResourceType] | None = None,
+        cacheable: bool = False,
     ):
         self.name = name
         self.priority = priority
+        self.actions = frozenset(actions) if actions is not None else None
+        self.resource_types = frozenset(resource_types) if resource_types is not None else None
+        self.cacheable = cacheable
         self._evaluator = evaluator
 
     def evaluate(self, context: PolicyContext) -> PolicyResult:
         return self._evaluator(context)
 
 
+# Cached outcome of a bucket's cacheable policies: (position, result) of the
+# first decisive one, or None when none of them decided
+_CachedOutcome = tuple[int, PolicyResult] | None
+
+
+def _decision_key(context: PolicyContext) -> tuple[Any, ...]:
+    return (
+        context.user.sub,
+        context.user.tenant_id,
+        context.action,
+        context.resource_type,
+        context.resource_id,
+        context.resource_owner,
+        context.resource_tenant,
+    )
+
+
+class DecisionCache:
+    """Short-lived LRU of memoized policy outcomes."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 5.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[Any, ...], tuple[_CachedOutcome, float]] = OrderedDict()
+
+    def get(self, key: tuple[Any, ...]) -> tuple[bool, _CachedOutcome]:
+        """Return (hit, outcome)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        outcome, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return False, None
+        return True, outcome
+
+    def put(self, key: tuple[Any, ...], outcome: _CachedOutcome) -> None:
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return
+        self._entries[key] = (outcome, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True)
+class PolicyBucket:
+    """Policies applicable to one (action, resource type), in priority order."""
+
+    policies: tuple[ABACPolicy, ...]
+    # Positions of cacheable and non-cacheable policies within ``policies``
+    cacheable: tuple[int, ...]
+    dynamic: tuple[int, ...]
+
+
+class CompiledPolicies:
+    """Policies indexed by (action, resource type)."""
+
+    def __init__(self, policies: Iterable[ABACPolicy]):
+        ordered = tuple(policies)
+        self.buckets: dict[tuple[Action, ResourceType], PolicyBucket] = {}
+        for action in Action:
+            for resource_type in ResourceType:
+                applicable = tuple(p for p in ordered if p.applies_to(action, resource_type))
+                self.buckets[(action, resource_type)] = PolicyBucket(
+                    policies=applicable,
+                    cacheable=tuple(i for i, p in enumerate(applicable) if p.cacheable),
+                    dynamic=tuple(i for i, p in enumerate(applicable) if not p.cacheable),
+                )
+
+    def bucket(self, action: Action, resource_type: ResourceType) -> PolicyBucket:
+        return self.buckets[(action, resource_type)]
+
+
 class ABACEngine:
     """Engine for evaluating ABAC policies.
 
     Policies are evaluated in priority order (lower = higher priority).
     The first ALLOW or DENY result is returned.
     If all policies return NOT_APPLICABLE, access is denied by default.
+
+    Policies are compiled into a (action, resource type) index when added or
+    removed; modify them through add_policy/remove_policy (or call compile()
+    after changing ``policies`` directly).
     """
 
     def __init__(
         self,
         policies: list[ABACPolicy] | None = None,
         default_deny: bool = True,
+        decision_cache_size: int = 10000,
+        decision_cache_ttl: float = 5.0,
     ):
         """Initialize ABAC engine.
 
         Args:
             policies: List of policies to evaluate
             default_deny: If True, deny when no policy matches
+            decision_cache_size: Maximum memoized decisions (0 disables)
+            decision_cache_ttl: Seconds a memoized decision stays valid
         """
         self.policies = policies or []
         self.default_deny = default_deny
-        # Sort by priority
+        self.decision_cache = DecisionCache(decision_cache_size, decision_cache_ttl)
+        self.compile()
+
+    def compile(self) -> None:
+        """Sort policies, rebuild the index and drop memoized decisions."""
         self.policies.sort(key=lambda p: p.priority)
+        self._compiled = CompiledPolicies(self.policies)
+        self.decision_cache.clear()
 
     def add_policy(self, policy: ABACPolicy) -> None:
         """Add a policy to the engine."""
         self.policies.append(policy)
-        self.policies.sort(key=lambda p: p.priority)
+        self.compile()
 
     def remove_policy(self, name: str) -> bool:
         """Remove a policy by name.
@@ -366,6 +538,7 @@ class ABACEngine:
         for i, policy in enumerate(self.policies):
             if policy.name == name:
                 del self.policies[i]
+                self.compile()
                 return True
         return False
 
@@ -382,7 +555,11 @@ class ABACEngine:
         return result.decision == PolicyDecision.ALLOW
 
     def evaluate(self, context: PolicyContext) -> PolicyResult:
-        """Evaluate all policies and return the final decision.
+        """Evaluate applicable policies and return the final decision.
+
+        Only policies indexed for the context's action and resource type
+        run. The outcome of cacheable policies is memoized; non-cacheable
+        policies ranked before the memoized decision still run every time.
 
         Args:
             context: The policy evaluation context
@@ -390,11 +567,23 @@ class ABACEngine:
         Returns:
             PolicyResult with the final decision
         """
-        for policy in self.policies:
-            result = policy.evaluate(context)
-
-            if result.decision in (PolicyDecision.ALLOW, PolicyDecision.DENY):
-                return result
+        bucket = self._compiled.bucket(context.action, context.resource_type)
+
+        outcome: _CachedOutcome = None
+        if bucket.cacheable:
+            key = _decision_key(context)
+            hit, outcome = self.decision_cache.get(key)
+            if not hit:
+                outcome = self._first_decision(bucket, bucket.cacheable, context)
+                self.decision_cache.put(key, outcome)
+
+        cutoff = outcome[0] if outcome is not None else len(bucket.policies)
+        dynamic = tuple(i for i in bucket.dynamic if i < cutoff)
+        decided = self._first_decision(bucket, dynamic, context)
+        if decided is not None:
+            return decided[1]
+        if outcome is not None:
+            return outcome[1]
 
         # No policy made a decision
         if self.default_deny:
@@ -410,6 +599,16 @@ class ABACEngine:
                 reason="No policy denied access (default allow)",
             )
 
+    @staticmethod
+    def _first_decision(
+        bucket: PolicyBucket, positions: tuple[int, ...], context: PolicyContext
+    ) -> _CachedOutcome:
+        for i in positions:
+            result = bucket.policies[i].evaluate(context)
+            if result.decision in (PolicyDecision.ALLOW, PolicyDecision.DENY):
+                return i, result
+        return None
+
     def evaluate_all(self, context: PolicyContext) -> list[PolicyResult]:
         """Evaluate all policies and return all results.
 
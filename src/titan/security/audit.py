@@ -23,6 +23,10 @@ Example:
         user_id="user@example.com",
         success=True,
     )
+
+When an AuditPipeline is attached (see titan.security.audit_pipeline),
+events are queued in memory and written in batches by a background task
+instead of being serialized and logged on the request path.
 """
 
 from __future__ import annotations
@@ -33,9 +37,12 @@ import os
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    from titan.security.audit_pipeline import AuditPipeline
+
 # Dedicated audit logger - separate from application logs
 audit_logger = logging.getLogger("titan.audit")
 
@@ -136,6 +143,24 @@ class AuditEvent:
         return json.dumps(data, default=str)
 
 
+def audit_log_level(action: AuditAction, success: bool) -> int:
+    """Determine log level based on action type and success."""
+    if not success:
+        if action in (AuditAction.AUTH_FAILURE, AuditAction.ACCESS_DENIED):
+            return logging.WARNING
+        return logging.ERROR
+
+    if action in (
+        AuditAction.DELETE,
+        AuditAction.CONFIG_CHANGE,
+        AuditAction.USER_DELETE,
+        AuditAction.ROLE_REVOKE,
+    ):
+        return logging.WARNING
+
+    return logging.INFO
+
+
 class AuditLog:
     """Audit logging service.
 
@@ -146,10 +171,18 @@ class AuditLog:
     - Syslog
     - Cloud logging services
     - SIEM systems
+
+    With a running ``pipeline`` attached, events are handed to it instead
+    and written asynchronously in batches.
     """
 
-    def __init__(self, logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        pipeline: AuditPipeline | None = None,
+    ):
         self.logger = logger or audit_logger
+        self.pipeline = pipeline
 
     async def log(
         self,
@@ -209,6 +242,10 @@ class AuditLog:
             error_message=error_message,
         )
 
+        if self.pipeline is not None and self.pipeline.running:
+            await self.pipeline.submit(event)
+            return event
+
         # Log at appropriate level based on action type
         log_level = self._get_log_level(action, success)
         self.logger.log(log_level, event.to_json())
@@ -217,20 +254,7 @@ class AuditLog:
 
     def _get_log_level(self, action: AuditAction, success: bool) -> int:
         """Determine log level based on action type and success."""
-        if not success:
-            if action in (AuditAction.AUTH_FAILURE, AuditAction.ACCESS_DENIED):
-                return logging.WARNING
-            return logging.ERROR
-
-        if action in (
-            AuditAction.DELETE,
-            AuditAction.CONFIG_CHANGE,
-            AuditAction.USER_DELETE,
-            AuditAction.ROLE_REVOKE,
-        ):
-            return logging.WARNING
-
-        return logging.INFO
+        return audit_log_level(action, success)
 
     # Convenience methods for common operations
 
@@ -0,0 +1,530 @@
+"""Non-blocking, batched audit event pipeline.
+
+AuditLog.log hands events to an AuditPipeline instead of serializing and
+writing them on the request path:
+- Events go into a bounded in-memory buffer (O(1), no I/O)
+- A background task drains the buffer in batches of ``batch_size`` or
+  every ``flush_interval`` seconds, whichever comes first
+- Each batch is written to every configured sink
+
+Sinks:
+- LoggerAuditSink: the ``titan.audit`` logger (previous behaviour)
+- RotatingFileAuditSink: JSON lines with size-based rotation
+- RedisStreamAuditSink: one pipelined XADD per batch
+- PostgresAuditSink: COPY into the ``audit_events`` table
+
+When the buffer is full the overflow policy decides: drop the oldest
+event, drop the new event, or make the caller wait for space. Drops and
+sink failures are counted in AuditPipelineStats and Prometheus metrics.
+
+Example:
+    pipeline = AuditPipeline([PostgresAuditSink()], overflow=OverflowPolicy.BLOCK)
+    await pipeline.start()
+    get_audit_log().pipeline = pipeline
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, Any
+
+from titan.config import settings
+from titan.observability.metrics import record_audit_events, set_audit_queue_depth
+from titan.security.audit import AuditEvent, audit_log_level, audit_logger
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with a new event when the buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
+# =============================================================================
+# Sinks
+# =============================================================================
+
+
+class AuditSink(ABC):
+    """Destination for batches of audit events."""
+
+    name: str = "sink"
+
+    @abstractmethod
+    async def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        """Write a batch of events (raise on failure)."""
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the sink."""
+        return None
+
+
+class LoggerAuditSink(AuditSink):
+    """Write events through the audit logger, one record per event."""
+
+    name = "logger"
+
+    def __init__(self, logger: logging.Logger | None = None):
+        self.logger = logger or audit_logger
+
+    async def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        for event in events:
+            self.logger.log(audit_log_level(event.action, event.success), event.to_json())
+
+
+class RotatingFileAuditSink(AuditSink):
+    """Append events as JSON lines, rotating by size.
+
+    Each batch is one write in a worker thread; ``path`` is renamed to
+    ``path.1`` (and older files shifted) once it would exceed ``max_bytes``.
+    """
+
+    name = "file"
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024, backup_count: int = 10):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._stream: IO[bytes] | None = None
+
+    async def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        payload = b"".join(event.to_json().encode() + b"\n" for event in events)
+        await asyncio.to_thread(self._write, payload)
+
+    def _write(self, payload: bytes) -> None:
+        if self._stream is None:
+            self._stream = self.path.open("ab")
+        if self._stream.tell() and self._stream.tell() + len(payload) > self.max_bytes:
+            self._rotate()
+        assert self._stream is not None
+        self._stream.write(payload)
+        self._stream.flush()
+
+    def _rotate(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{i}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._stream = self.path.open("ab")
+
+    async def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class RedisStreamAuditSink(AuditSink):
+    """Append events to a Redis stream with one pipeline per batch."""
+
+    name = "redis"
+
+    def __init__(self, stream: str = "titan:audit", maxlen: int = 1_000_000):
+        self.stream = stream
+        self.maxlen = maxlen
+
+    async def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        from titan.cache.redis import get_redis
+
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(
+                    self.stream,
+                    {"data": event.to_json()},
+                    maxlen=self.maxlen,
+                    approximate=True,
+                )
+            await pipe.execute()
+
+
+class PostgresAuditSink(AuditSink):
+    """Bulk-load events into ``audit_events`` with COPY."""
+
+    name = "postgres"
+
+    COLUMNS = (
+        "event_id",
+        "timestamp",
+        "action",
+        "resource",
+        "resource_id",
+        "user_id",
+        "success",
+        "event",
+    )
+
+    @staticmethod
+    def to_record(event: AuditEvent) -> tuple[Any, ...]:
+        return (
+            event.event_id,
+            event.timestamp,
+            event.action.value,
+            event.resource.value,
+            event.resource_id,
+            event.user_id,
+            event.success,
+            event.to_json(),
+        )
+
+    async def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        from titan.persistence.db import get_engine
+
+        records = [self.to_record(event) for event in events]
+        async with get_engine().connect() as conn:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+                "audit_events",
+                records=records,
+                columns=list(self.COLUMNS),
+            )
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+
+@dataclass
+class SinkStats:
+    """Counters for one audit sink."""
+
+    written: int = 0
+    # Events in failed write attempts (retries included)
+    failed: int = 0
+    # Events given up after failures
+    lost: int = 0
+    # Events waiting to be retried
+    pending: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "written": self.written,
+            "failed": self.failed,
+            "lost": self.lost,
+            "pending": self.pending,
+        }
+
+
+@dataclass
+class AuditPipelineStats:
+    """Counters for the audit pipeline.
+
+    ``written`` counts events every sink has written; ``failed`` counts
+    events at least one sink gave up on.
+    """
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+    queue_depth: int = 0
+    sinks: dict[str, SinkStats] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "queueDepth": self.queue_depth,
+            "sinks": {name: stats.to_dict() for name, stats in self.sinks.items()},
+        }
+
+
+@dataclass
+class _Batch:
+    """Events taken from the buffer, tracked until every sink is done."""
+
+    events: list[AuditEvent]
+    remaining: int
+    lost: bool = False
+
+
+@dataclass
+class _SinkState:
+    """Retry queue and backoff of one sink."""
+
+    sink: AuditSink
+    stats: SinkStats
+    retry: deque[_Batch] = field(default_factory=deque)
+    failures: int = 0
+    next_retry: float = 0.0
+
+
+class AuditPipeline:
+    """Bounded buffer of audit events drained by a background task."""
+
+    def __init__(
+        self,
+        sinks: Sequence[AuditSink],
+        buffer_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 30.0,
+    ):
+        self.sinks = list(sinks)
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.stats = AuditPipelineStats()
+        self._sink_states = [_SinkState(sink, SinkStats()) for sink in self.sinks]
+        for state in self._sink_states:
+            self.stats.sinks[state.sink.name] = state.stats
+        self._buffer: deque[AuditEvent] = deque()
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def submit(self, event: AuditEvent) -> bool:
+        """Queue an event for writing.
+
+        Returns:
+            False if the event was dropped by the overflow policy
+        """
+        while len(self._buffer) >= self.buffer_size:
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                self._dropped(1)
+                return False
+            if self.overflow == OverflowPolicy.DROP_OLDEST:
+                self._buffer.popleft()
+                self._dropped(1)
+                break
+            self._space.clear()
+            self._wakeup.set()
+            await self._space.wait()
+
+        self._buffer.append(event)
+        self.stats.enqueued += 1
+        self._update_queue_depth()
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _update_queue_depth(self) -> None:
+        self.stats.queue_depth = len(self._buffer)
+        set_audit_queue_depth(len(self._buffer))
+
+    async def start(self) -> None:
+        """Start the background writer."""
+        if self.running:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Audit pipeline started (sinks={[s.name for s in self.sinks]}, "
+            f"buffer={self.buffer_size}, overflow={self.overflow.value})"
+        )
+
+    async def stop(self) -> None:
+        """Flush remaining events, stop the writer and close sinks.
+
+        Failed batches get one last retry; whatever a sink still cannot
+        write is given up.
+        """
+        self._stopping = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+        for state in self._sink_states:
+            await self._retry(state, force=True)
+            while state.retry:
+                self._give_up(state, state.retry.popleft())
+        for sink in self.sinks:
+            try:
+                await sink.close()
+            except Exception as e:
+                logger.warning(f"Failed to close audit sink {sink.name}: {e}")
+        logger.info("Audit pipeline stopped")
+
+    async def flush(self) -> None:
+        """Write everything currently buffered."""
+        while self._buffer:
+            await self._write_next_batch()
+
+    async def _run(self) -> None:
+        while True:
+            if len(self._buffer) < self.batch_size and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+            if self._buffer:
+                await self._write_next_batch()
+            elif self._stopping:
+                return
+            else:
+                for state in self._sink_states:
+                    await self._retry(state)
+
+    async def _write_next_batch(self) -> None:
+        count = min(self.batch_size, len(self._buffer))
+        # One hold per sink plus one released once the batch is dispatched
+        batch = _Batch([self._buffer.popleft() for _ in range(count)], len(self._sink_states) + 1)
+        self._space.set()
+        self._update_queue_depth()
+        self.stats.batches += 1
+
+        for state in self._sink_states:
+            await self._retry(state)
+            if state.retry:
+                # Keep the sink's events in order behind the failed batches
+                self._requeue(state, batch)
+            elif await self._write(state, batch):
+                self._done(batch)
+            else:
+                self._requeue(state, batch)
+        self._done(batch)
+
+    async def _write(self, state: _SinkState, batch: _Batch) -> bool:
+        """Write one batch to a sink, recording the outcome."""
+        try:
+            await state.sink.write_batch(batch.events)
+        except Exception as e:
+            state.stats.failed += len(batch.events)
+            state.failures += 1
+            backoff = min(self.max_retry_backoff, self.retry_backoff * 2 ** (state.failures - 1))
+            state.next_retry = time.monotonic() + backoff
+            logger.warning(
+                f"Audit sink {state.sink.name} failed to write {len(batch.events)} events "
+                f"(retry in {backoff:.1f}s): {e}"
+            )
+            return False
+        state.stats.written += len(batch.events)
+        state.failures = 0
+        return True
+
+    async def _retry(self, state: _SinkState, force: bool = False) -> None:
+        """Retry a sink's failed batches in order once its backoff has passed."""
+        if not state.retry or (not force and time.monotonic() < state.next_retry):
+            return
+        while state.retry:
+            batch = state.retry[0]
+            if not await self._write(state, batch):
+                return
+            state.retry.popleft()
+            state.stats.pending -= len(batch.events)
+            self._done(batch)
+
+    def _requeue(self, state: _SinkState, batch: _Batch) -> None:
+        """Keep a batch for retry, giving up the oldest beyond the buffer bound."""
+        state.retry.append(batch)
+        state.stats.pending += len(batch.events)
+        while state.stats.pending > self.buffer_size and len(state.retry) > 1:
+            self._give_up(state, state.retry.popleft())
+
+    def _give_up(self, state: _SinkState, batch: _Batch) -> None:
+        count = len(batch.events)
+        state.stats.pending -= count
+        state.stats.lost += count
+        logger.error(f"Audit sink {state.sink.name} gave up on {count} events")
+        if not batch.lost:
+            batch.lost = True
+            self.stats.failed += count
+            record_audit_events("failed", count)
+        self._done(batch)
+
+    def _done(self, batch: _Batch) -> None:
+        """Count a batch as finished by one sink."""
+        batch.remaining -= 1
+        if batch.remaining == 0 and not batch.lost:
+            self.stats.written += len(batch.events)
+            record_audit_events("written", len(batch.events))
+
+    def _dropped(self, count: int) -> None:
+        self.stats.dropped += count
+        record_audit_events("dropped", count)
+
+
+def create_audit_sinks(names: str | None = None) -> list[AuditSink]:
+    """Build sinks from a comma-separated list (defaults to AUDIT_SINKS)."""
+    sinks: list[AuditSink] = []
+    for name in (names or settings.audit_sinks).split(","):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name == "logger":
+            sinks.append(LoggerAuditSink())
+        elif name == "file":
+            if not settings.audit_log_file:
+                raise ValueError("AUDIT_LOG_FILE is required for the file audit sink")
+            sinks.append(RotatingFileAuditSink(settings.audit_log_file))
+        elif name == "redis":
+            sinks.append(RedisStreamAuditSink(settings.audit_redis_stream))
+        elif name == "postgres":
+            sinks.append(PostgresAuditSink())
+        else:
+            raise ValueError(f"Unknown audit sink: {name}")
+    return sinks
+
+
+# Global pipeline (started in the application lifespan)
+_pipeline: AuditPipeline | None = None
+
+
+async def start_audit_pipeline() -> AuditPipeline:
+    """Create and start the global pipeline and attach it to the audit log."""
+    from titan.security.audit import get_audit_log
+
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = AuditPipeline(
+            create_audit_sinks(),
+            buffer_size=settings.audit_buffer_size,
+            batch_size=settings.audit_batch_size,
+            flush_interval=settings.audit_flush_interval,
+            overflow=OverflowPolicy(settings.audit_overflow_policy),
+        )
+    await _pipeline.start()
+    get_audit_log().pipeline = _pipeline
+    return _pipeline
+
+
+async def stop_audit_pipeline() -> None:
+    """Flush and stop the global pipeline."""
+    from titan.security.audit import get_audit_log
+
+    global _pipeline
+    if _pipeline is None:
+        return
+    get_audit_log().pipeline = None
+    await _pipeline.stop()
+    _pipeline = None
+
+
+def get_audit_pipeline() -> AuditPipeline | None:
+    """Return the global pipeline, if started."""
+    return _pipeline
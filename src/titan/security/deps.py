@@ -43,6 +43,8 @@ def _get_abac_engine() -> ABACEngine | None:
     if _ABAC_ENGINE is None:
         _ABAC_ENGINE = create_default_engine()
         _ABAC_ENGINE.default_deny = settings.abac_default_deny
+        _ABAC_ENGINE.decision_cache.max_entries = settings.abac_decision_cache_size
+        _ABAC_ENGINE.decision_cache.ttl = settings.abac_decision_cache_ttl
     return _ABAC_ENGINE
 
 
@@ -81,28 +83,30 @@ def _get_resource_id(request: Request, params: list[str] | None) -> str | None:
     return "/".join(parts)
 
 
+_PERMISSION_TO_ABAC: dict[Permission, tuple[Action, ResourceType]] = {
+    Permission.READ_AAS: (Action.READ, ResourceType.AAS),
+    Permission.CREATE_AAS: (Action.CREATE, ResourceType.AAS),
+    Permission.UPDATE_AAS: (Action.UPDATE, ResourceType.AAS),
+    Permission.DELETE_AAS: (Action.DELETE, ResourceType.AAS),
+    Permission.READ_SUBMODEL: (Action.READ, ResourceType.SUBMODEL),
+    Permission.CREATE_SUBMODEL: (Action.CREATE, ResourceType.SUBMODEL),
+    Permission.UPDATE_SUBMODEL: (Action.UPDATE, ResourceType.SUBMODEL),
+    Permission.DELETE_SUBMODEL: (Action.DELETE, ResourceType.SUBMODEL),
+    Permission.READ_DESCRIPTOR: (Action.READ, ResourceType.DESCRIPTOR),
+    Permission.CREATE_DESCRIPTOR: (Action.CREATE, ResourceType.DESCRIPTOR),
+    Permission.UPDATE_DESCRIPTOR: (Action.UPDATE, ResourceType.DESCRIPTOR),
+    Permission.DELETE_DESCRIPTOR: (Action.DELETE, ResourceType.DESCRIPTOR),
+    Permission.READ_CONCEPT_DESCRIPTION: (Action.READ, ResourceType.CONCEPT_DESCRIPTION),
+    Permission.CREATE_CONCEPT_DESCRIPTION: (Action.CREATE, ResourceType.CONCEPT_DESCRIPTION),
+    Permission.UPDATE_CONCEPT_DESCRIPTION: (Action.UPDATE, ResourceType.CONCEPT_DESCRIPTION),
+    Permission.DELETE_CONCEPT_DESCRIPTION: (Action.DELETE, ResourceType.CONCEPT_DESCRIPTION),
+    Permission.ADMIN: (Action.READ, ResourceType.AAS),
+}
+
+
 def _permission_to_abac(permission: Permission) -> tuple[Action, ResourceType]:
     """Map RBAC permission to ABAC action and resource type."""
-    mapping: dict[Permission, tuple[Action, ResourceType]] = {
-        Permission.READ_AAS: (Action.READ, ResourceType.AAS),
-        Permission.CREATE_AAS: (Action.CREATE, ResourceType.AAS),
-        Permission.UPDATE_AAS: (Action.UPDATE, ResourceType.AAS),
-        Permission.DELETE_AAS: (Action.DELETE, ResourceType.AAS),
-        Permission.READ_SUBMODEL: (Action.READ, ResourceType.SUBMODEL),
-        Permission.CREATE_SUBMODEL: (Action.CREATE, ResourceType.SUBMODEL),
-        Permission.UPDATE_SUBMODEL: (Action.UPDATE, ResourceType.SUBMODEL),
-        Permission.DELETE_SUBMODEL: (Action.DELETE, ResourceType.SUBMODEL),
-        Permission.READ_DESCRIPTOR: (Action.READ, ResourceType.DESCRIPTOR),
-        Permission.CREATE_DESCRIPTOR: (Action.CREATE, ResourceType.DESCRIPTOR),
-        Permission.UPDATE_DESCRIPTOR: (Action.UPDATE, ResourceType.DESCRIPTOR),
-        Permission.DELETE_DESCRIPTOR: (Action.DELETE, ResourceType.DESCRIPTOR),
-        Permission.READ_CONCEPT_DESCRIPTION: (Action.READ, ResourceType.CONCEPT_DESCRIPTION),
-        Permission.CREATE_CONCEPT_DESCRIPTION: (Action.CREATE, ResourceType.CONCEPT_DESCRIPTION),
-        Permission.UPDATE_CONCEPT_DESCRIPTION: (Action.UPDATE, ResourceType.CONCEPT_DESCRIPTION),
-        Permission.DELETE_CONCEPT_DESCRIPTION: (Action.DELETE, ResourceType.CONCEPT_DESCRIPTION),
-        Permission.ADMIN: (Action.READ, ResourceType.AAS),
-    }
-    return mapping.get(permission, (Action.READ, ResourceType.AAS))
+    return _PERMISSION_TO_ABAC.get(permission, (Action.READ, ResourceType.AAS))
 
 
 async def get_current_user(
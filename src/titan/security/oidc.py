@@ -6,11 +6,18 @@ Supports:
 - Token expiry validation
 - Issuer and audience validation
 - Role extraction from claims
+- Verified-token cache: repeated bearer tokens skip signature verification
+- Background JWKS refresh (single-flight, stale-while-revalidate) with an
+  immediate rate-limited refresh when a token names an unknown key id
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -34,6 +41,11 @@ class OIDCConfig:
     roles_claim: str = "roles"
     client_id: str | None = None
     jwks_cache_seconds: int = 3600
+    # Minimum interval between refreshes forced by unknown key ids
+    jwks_min_refresh_seconds: int = 30
+    # Verified-token cache (0 disables)
+    token_cache_size: int = 10000
+    token_cache_seconds: int = 300
 
     def __post_init__(self) -> None:
         """Set JWKS URI from issuer if not provided."""
@@ -73,6 +85,56 @@ class User:
         return self.is_admin or "writer" in self.roles or "titan:write" in self.roles
 
 
+class VerifiedTokenCache:
+    """Bounded LRU of verified tokens.
+
+    Keyed by the SHA-256 of the raw token so tokens are not kept in memory.
+    An entry expires at the token's ``exp`` claim, or after ``max_age``
+    seconds, whichever comes first.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_age: float = 300.0):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: OrderedDict[bytes, tuple[User, float]] = OrderedDict()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes, now: float | None = None) -> User | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if (now if now is not None else time.time()) >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, key: bytes, user: User, now: float | None = None) -> None:
+        if self.max_entries <= 0:
+            return
+        now = now if now is not None else time.time()
+        expires_at = now + self.max_age
+        exp = user.claims.get("exp")
+        if isinstance(exp, int | float):
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+        self._entries[key] = (user, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class TokenValidator:
     """Validates JWT tokens from OIDC provider."""
 
@@ -80,10 +142,19 @@ class TokenValidator:
         self.config = config
         self._jwks: dict[str, Any] | None = None
         self._jwks_fetched_at: datetime | None = None
+        self._refresh_task: asyncio.Task[dict[str, Any]] | None = None
+        self._last_refresh = 0.0
+        self.token_cache = VerifiedTokenCache(
+            max_entries=config.token_cache_size,
+            max_age=config.token_cache_seconds,
+        )
 
     async def validate_token(self, token: str) -> User:
         """Validate JWT token and return user.
 
+        Tokens verified earlier are served from the verified-token cache
+        until they expire.
+
         Args:
             token: The JWT access token (without "Bearer " prefix)
 
@@ -93,8 +164,16 @@ class TokenValidator:
         Raises:
             InvalidTokenError: If token is invalid
         """
+        cache_key = VerifiedTokenCache.key(token)
+        cached = self.token_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Get JWKS keys
         jwks = await self._get_jwks()
+        kid = _token_kid(token)
+        if kid is not None and not _has_kid(jwks, kid):
+            jwks = await self._refresh_for_unknown_kid(kid, jwks)
 
         try:
             # Decode and verify token
@@ -112,7 +191,7 @@ class TokenValidator:
             raise InvalidTokenError(f"Invalid token: {e}") from e
 
         # Extract user info
-        return User(
+        user = User(
             sub=payload.get("sub", ""),
             email=payload.get("email"),
             name=payload.get("name") or payload.get("preferred_username"),
@@ -120,6 +199,8 @@ class TokenValidator:
             tenant_id=payload.get("tenant_id") or payload.get("tenant"),
             claims=payload,
         )
+        self.token_cache.put(cache_key, user)
+        return user
 
     def _extract_roles(self, payload: dict[str, Any]) -> list[str]:
         """Extract roles from token claims."""
@@ -151,16 +232,45 @@ class TokenValidator:
         return list(set(roles))  # Deduplicate
 
     async def _get_jwks(self) -> dict[str, Any]:
-        """Get JWKS keys, with caching."""
-        # Check if we need to refresh (cache with configurable TTL)
+        """Get JWKS keys, with caching.
+
+        Only the first call waits for the IdP. Once keys are cached, an
+        expired set keeps being served while one background task refreshes
+        it, so concurrent requests never stampede the IdP.
+        """
         now = datetime.now(UTC)
         if self._jwks is not None and self._jwks_fetched_at is not None:
             age = (now - self._jwks_fetched_at).total_seconds()
-            if age < self.config.jwks_cache_seconds:
-                assert self._jwks is not None
-                return self._jwks
+            if age >= self.config.jwks_cache_seconds:
+                self._start_refresh()
+            return self._jwks
+
+        return await asyncio.shield(self._start_refresh())
 
-        # Fetch JWKS
+    async def _refresh_for_unknown_kid(self, kid: str, jwks: dict[str, Any]) -> dict[str, Any]:
+        """Refresh immediately when a token is signed with an unknown key.
+
+        Forced refreshes are rate limited so tokens with made-up key ids
+        cannot be used to hammer the IdP.
+        """
+        if time.monotonic() - self._last_refresh < self.config.jwks_min_refresh_seconds:
+            return jwks
+        logger.info(f"Unknown JWKS key id {kid!r}, refreshing keys")
+        try:
+            return await asyncio.shield(self._start_refresh())
+        except InvalidTokenError:
+            return jwks
+
+    def _start_refresh(self) -> asyncio.Task[dict[str, Any]]:
+        """Return the in-flight refresh task, starting one if needed."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch_jwks())
+            self._refresh_task.add_done_callback(_consume_task_error)
+        return self._refresh_task
+
+    async def _fetch_jwks(self) -> dict[str, Any]:
+        """Fetch JWKS from the IdP, falling back to the cached set."""
+        self._last_refresh = time.monotonic()
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.get(
@@ -168,10 +278,7 @@ class TokenValidator:
                     timeout=10.0,
                 )
                 response.raise_for_status()
-                self._jwks = response.json()
-                self._jwks_fetched_at = now
-                logger.info(f"Fetched JWKS from {self.config.jwks_uri}")
-                return self._jwks
+                jwks: dict[str, Any] = response.json()
         except Exception as e:
             if self._jwks is not None:
                 logger.warning(f"Failed to refresh JWKS, using cached: {e}")
@@ -179,6 +286,36 @@ class TokenValidator:
                 return self._jwks
             raise InvalidTokenError(f"Failed to fetch JWKS: {e}") from e
 
+        if self._jwks is not None and jwks != self._jwks:
+            # Keys rotated: tokens verified with removed keys must be re-checked
+            self.token_cache.clear()
+        self._jwks = jwks
+        self._jwks_fetched_at = datetime.now(UTC)
+        logger.info(f"Fetched JWKS from {self.config.jwks_uri}")
+        return jwks
+
+
+def _token_kid(token: str) -> str | None:
+    """Key id from the token header (None if absent or unparsable)."""
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except JWTError:
+        return None
+    return kid if isinstance(kid, str) else None
+
+
+def _has_kid(jwks: dict[str, Any], kid: str) -> bool:
+    keys = jwks.get("keys")
+    if not isinstance(keys, list):
+        return True
+    return any(isinstance(key, dict) and key.get("kid") == kid for key in keys)
+
+
+def _consume_task_error(task: asyncio.Task[Any]) -> None:
+    """Mark background refresh failures as retrieved (they are logged)."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"JWKS refresh failed: {task.exception()}")
+
 
 class InvalidTokenError(Exception):
     """Raised when token validation fails."""
@@ -209,6 +346,9 @@ def get_token_validator() -> TokenValidator | None:
         roles_claim=settings.oidc_roles_claim or "roles",
         client_id=settings.oidc_client_id,
         jwks_cache_seconds=settings.oidc_jwks_cache_seconds,
+        jwks_min_refresh_seconds=settings.oidc_jwks_min_refresh_seconds,
+        token_cache_size=settings.oidc_token_cache_size,
+        token_cache_seconds=settings.oidc_token_cache_seconds,
     )
     _validator = TokenValidator(config)
 
@@ -19,6 +19,10 @@ Example:
     verifier = RequestVerifier(secret_key)
     if not verifier.verify_request(request):
         raise HTTPException(401, "Invalid signature")
+
+SignatureMiddleware verifies bodies incrementally: the body hash is
+updated chunk by chunk as the downstream app reads it, so signed uploads
+use constant memory.
 """
 
 from __future__ import annotations
@@ -30,7 +34,8 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from starlette.types import Receive, Scope, Send
+from starlette.datastructures import URL, Headers
+from starlette.types import Message, Receive, Scope, Send
 
 if TYPE_CHECKING:
     from starlette.requests import Request
@@ -151,6 +156,22 @@ class RequestSigner:
 
         return headers
 
+    def signature_for(
+        self, method: str, path: str, query: str, timestamp: int, body_hash: str
+    ) -> str:
+        """Compute the signature for a request whose body is already hashed.
+
+        ``body_hash`` is the base64-encoded SHA-256 digest of the body.
+        """
+        components = SignatureComponents(
+            method=method,
+            path=path,
+            query=query,
+            timestamp=str(timestamp),
+            body_hash=body_hash,
+        )
+        return self._compute_signature(components.to_canonical_string())
+
     def _hash_body(self, body: bytes | None) -> str:
         """Hash the request body."""
         if body is None or len(body) == 0:
@@ -246,6 +267,40 @@ class RequestVerifier:
         # Compare signatures using constant-time comparison
         return hmac.compare_digest(signature, expected_signature)
 
+    def check_headers(self, headers: Headers) -> tuple[str, int] | None:
+        """Validate signature headers before the body is read.
+
+        Returns:
+            (signature, timestamp), or None if headers are missing, malformed
+            or the timestamp is outside the tolerance window
+        """
+        signature = headers.get(SIGNATURE_HEADER)
+        timestamp_str = headers.get(TIMESTAMP_HEADER)
+        if not signature or not timestamp_str:
+            return None
+        try:
+            timestamp = int(timestamp_str)
+        except ValueError:
+            return None
+        if abs(int(time.time()) - timestamp) > self.timestamp_tolerance:
+            return None
+        return signature, timestamp
+
+    def verify_digest(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        timestamp: int,
+        signature: str,
+        body_digest: bytes,
+    ) -> bool:
+        """Verify a signature against a precomputed SHA-256 body digest."""
+        expected = self._signer.signature_for(
+            method, path, query, timestamp, base64.b64encode(body_digest).decode("ascii")
+        )
+        return hmac.compare_digest(signature, expected)
+
     def verify_components(
         self,
         method: str,
@@ -320,33 +375,41 @@ class SignatureMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Create request object and read body
-        from starlette.requests import Request
-
-        request = Request(scope, receive)
-        body = await request.body()
-
-        # Verify signature
-        if not self.verifier.verify_request(request, body):
-            # Return 401 Unauthorized
-            response_body = b'{"error": "Invalid or missing request signature"}'
-            await send(
-                {
-                    "type": "http.response.start",
-                    "status": 401,
-                    "headers": [[b"content-type", b"application/json"]],
-                }
-            )
-            await send(
-                {
-                    "type": "http.response.body",
-                    "body": response_body,
-                }
-            )
+        # Reject missing or stale signatures before reading any body
+        checked = self.verifier.check_headers(Headers(scope=scope))
+        if checked is None:
+            await _send_unauthorized(send)
             return
 
-        # Continue to next middleware/route
-        await self.app(scope, receive, send)
+        signature, timestamp = checked
+        url = URL(scope=scope)
+        verification = _StreamingVerification(
+            verifier=self.verifier,
+            method=scope["method"],
+            path=url.path,
+            query=url.query or "",
+            timestamp=timestamp,
+            signature=signature,
+            receive=receive,
+        )
+
+        async def verified_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Never commit a response before the whole body was verified
+                await verification.finish()
+            if verification.valid is False:
+                return
+            verification.response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, verification.receive, verified_send)
+        except Exception:
+            if verification.valid is not False:
+                raise
+
+        if verification.valid is False and not verification.response_started:
+            await _send_unauthorized(send)
 
     def _should_verify(self, path: str) -> bool:
         """Check if a path should have its signature verified."""
@@ -366,6 +429,91 @@ class SignatureMiddleware:
         return False
 
 
+class _StreamingVerification:
+    """Hashes a request body as it streams through and checks the signature.
+
+    The final body chunk is only released to the application once the
+    signature matches; on mismatch the application receives
+    ``http.disconnect`` instead, so it never sees a complete (unverified)
+    request.
+    """
+
+    def __init__(
+        self,
+        verifier: RequestVerifier,
+        method: str,
+        path: str,
+        query: str,
+        timestamp: int,
+        signature: str,
+        receive: Receive,
+    ):
+        self._verifier = verifier
+        self._method = method
+        self._path = path
+        self._query = query
+        self._timestamp = timestamp
+        self._signature = signature
+        self._receive = receive
+        self._hasher = hashlib.sha256()
+        # None until the whole body has been hashed
+        self.valid: bool | None = None
+        self.response_started = False
+
+    async def receive(self) -> Message:
+        if self.valid is False:
+            return {"type": "http.disconnect"}
+        if self.valid is True:
+            return await self._receive()
+
+        message = await self._receive()
+        if message["type"] != "http.request":
+            return message
+        self._hasher.update(message.get("body", b""))
+        if not message.get("more_body", False):
+            self._complete()
+            if not self.valid:
+                return {"type": "http.disconnect"}
+        return message
+
+    async def finish(self) -> None:
+        """Hash (and discard) any body the application did not read."""
+        while self.valid is None:
+            message = await self._receive()
+            if message["type"] != "http.request":
+                self.valid = False
+                return
+            self._hasher.update(message.get("body", b""))
+            if not message.get("more_body", False):
+                self._complete()
+
+    def _complete(self) -> None:
+        self.valid = self._verifier.verify_digest(
+            self._method,
+            self._path,
+            self._query,
+            self._timestamp,
+            self._signature,
+            self._hasher.digest(),
+        )
+
+
+async def _send_unauthorized(send: Send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [[b"content-type", b"application/json"]],
+        }
+    )
+    await send(
+        {
+            "type": "http.response.body",
+            "body": b'{"error": "Invalid or missing request signature"}',
+        }
+    )
+
+
 def generate_secret_key(length: int = 32) -> str:
     """Generate a cryptographically secure secret key.
 
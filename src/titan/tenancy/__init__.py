@@ -3,8 +3,10 @@
 Provides tenant isolation for SaaS deployment:
 - TenantContext: Request-scoped tenant information
 - TenantMiddleware: Extract tenant from requests
+- AuthenticatedTenantMiddleware: Tenant of the verified token (isolation)
 - TenantFilter: Database query isolation
 - TenantCacheKey: Tenant-scoped cache keys
+- AdmissionController: Weighted fair admission and per-tenant quotas
 
 Example:
     from fastapi import FastAPI
@@ -20,6 +22,12 @@ Example:
         ...
 """
 
+from titan.tenancy.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    TenantQuota,
+    get_admission_controller,
+)
 from titan.tenancy.context import (
     DEFAULT_TENANT,
     AsyncTenantScope,
@@ -41,9 +49,12 @@ from titan.tenancy.isolation import (
     TenantIsolationError,
     ensure_tenant_field,
     get_rls_migration_sql,
+    set_transaction_tenant,
     validate_tenant_access,
 )
 from titan.tenancy.middleware import (
+    AuthenticatedTenantMiddleware,
+    TenantAdmissionMiddleware,
     TenantExtractionError,
     TenantMiddleware,
     get_tenant_from_request,
@@ -64,8 +75,15 @@ __all__ = [
     "require_tenant",
     # Middleware
     "TenantMiddleware",
+    "AuthenticatedTenantMiddleware",
     "TenantExtractionError",
     "get_tenant_from_request",
+    "TenantAdmissionMiddleware",
+    # Admission control
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "TenantQuota",
+    "get_admission_controller",
     # Isolation
     "TenantFilter",
     "TenantCacheKey",
@@ -75,4 +93,5 @@ __all__ = [
     "RLSPolicy",
     "RLS_POLICIES",
     "get_rls_migration_sql",
+    "set_transaction_tenant",
 ]
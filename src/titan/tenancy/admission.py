@@ -0,0 +1,384 @@
+"""Tenant-aware admission control with weighted fair queuing.
+
+Keeps one tenant's bulk import or huge listing from monopolizing the
+worker's event loop, database pool and cache for everyone else:
+- Requests: at most ``max_in_flight`` requests are served at once per
+  worker, and at most ``max_concurrency`` per tenant. Requests beyond that
+  wait in a per-tenant FIFO. Freed slots go to the waiting tenant with the
+  lowest virtual time (start-time fair queuing), which advances by
+  ``1 / weight`` per admitted request. Tenants therefore share capacity in
+  proportion to their weights regardless of how many requests they queue.
+- Database: each tenant holds at most ``db_sessions`` database sessions at
+  once (by default a share of the pool), enforced by ``get_session``.
+- Cache: each tenant may write at most ``cache_bytes`` to the cache per
+  cache TTL window; further writes are skipped (reads fall back to the
+  database) instead of evicting other tenants' entries.
+
+Limits are per worker process. Per-tenant overrides come from
+``TENANT_QUOTAS`` (JSON), e.g.
+``{"acme": {"weight": 4, "maxConcurrency": 128}}``.
+
+Example:
+    controller = AdmissionController(max_in_flight=256)
+    async with controller.admit("acme"):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from titan.config import settings
+from titan.observability.metrics import (
+    record_tenant_admission,
+    record_tenant_cache_rejected,
+    set_tenant_db_sessions,
+    set_tenant_requests_in_flight,
+)
+from titan.tenancy.context import DEFAULT_TENANT, get_current_tenant_or_none
+
+# Tenants tracked individually; further tenants share one state
+MAX_TRACKED_TENANTS = 1000
+OTHER_TENANTS = "<other>"
+
+# Tenant the current request was admitted as (set by TenantAdmissionMiddleware)
+admission_tenant_var: ContextVar[str | None] = ContextVar("admission_tenant", default=None)
+
+
+def current_tenant() -> str:
+    """Tenant that database sessions and cache writes are accounted to.
+
+    Falls back to the admitted tenant when no tenant context is set. Row-level
+    security and cache key scoping use the tenant context only.
+    """
+    return get_current_tenant_or_none() or admission_tenant_var.get() or DEFAULT_TENANT
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request is not admitted.
+
+    Attributes:
+        status_code: 429 when the tenant's queue is full, 503 on queue timeout
+        retry_after: Suggested client back-off in seconds
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+@dataclass
+class TenantQuota:
+    """Resource limits of one tenant."""
+
+    # Requests served concurrently
+    max_concurrency: int
+    # Share of contended capacity relative to other tenants
+    weight: float = 1.0
+    # Database sessions held concurrently
+    db_sessions: int = 0
+    # Bytes written to the cache per cache TTL window
+    cache_bytes: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], default: TenantQuota) -> TenantQuota:
+        """Build a quota from a TENANT_QUOTAS entry, filling gaps from ``default``."""
+        return cls(
+            max_concurrency=int(data.get("maxConcurrency", default.max_concurrency)),
+            weight=max(float(data.get("weight", default.weight)), 0.001),
+            db_sessions=int(data.get("dbSessions", default.db_sessions)),
+            cache_bytes=int(data.get("cacheBytes", default.cache_bytes)),
+        )
+
+
+@dataclass
+class _TenantState:
+    tenant: str
+    quota: TenantQuota
+    in_flight: int = 0
+    virtual_time: float = 0.0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+    db_sessions: int = 0
+    db_waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+    cache_window: int = -1
+    cache_bytes: int = 0
+    admitted: int = 0
+    rejected: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tenant": self.tenant,
+            "weight": self.quota.weight,
+            "maxConcurrency": self.quota.max_concurrency,
+            "inFlight": self.in_flight,
+            "queued": len(self.waiters),
+            "dbSessions": self.db_sessions,
+            "dbSessionLimit": self.quota.db_sessions,
+            "cacheBytes": self.cache_bytes,
+            "cacheBytesLimit": self.quota.cache_bytes,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionController:
+    """Per-worker admission controller shared by all tenants."""
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        default_quota: TenantQuota | None = None,
+        quotas: dict[str, TenantQuota] | None = None,
+        queue_timeout: float = 5.0,
+        max_queue: int = 100,
+        cache_window_seconds: float = 3600.0,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            max_in_flight: Requests served concurrently across all tenants
+            default_quota: Quota of tenants without an override
+            quotas: Per-tenant quota overrides
+            queue_timeout: Seconds a request may wait for admission
+            max_queue: Requests a tenant may have waiting
+            cache_window_seconds: Window of the cache byte quota (cache TTL)
+        """
+        self.max_in_flight = max_in_flight
+        self.default_quota = default_quota or TenantQuota(max_concurrency=max_in_flight)
+        self.quotas = quotas or {}
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self.cache_window_seconds = cache_window_seconds
+        self.in_flight = 0
+        self._virtual_clock = 0.0
+        self._tenants: dict[str, _TenantState] = {}
+
+    def _state(self, tenant: str) -> _TenantState:
+        state = self._tenants.get(tenant)
+        if state is None:
+            if len(self._tenants) >= MAX_TRACKED_TENANTS and tenant not in self.quotas:
+                tenant = OTHER_TENANTS
+                state = self._tenants.get(tenant)
+            if state is None:
+                quota = self.quotas.get(tenant, self.default_quota)
+                state = self._tenants[tenant] = _TenantState(tenant, quota)
+        return state
+
+    # -------------------------------------------------------------------------
+    # Request admission
+    # -------------------------------------------------------------------------
+
+    async def acquire(self, tenant: str) -> None:
+        """Wait until a request of ``tenant`` may be served.
+
+        Raises:
+            AdmissionRejectedError: If the tenant's queue is full or the wait
+                exceeds ``queue_timeout``
+        """
+        state = self._state(tenant)
+        if (
+            self.in_flight < self.max_in_flight
+            and state.in_flight < state.quota.max_concurrency
+            and not state.waiters
+        ):
+            self._grant(state)
+            record_tenant_admission(state.tenant, "admitted")
+            return
+
+        if len(state.waiters) >= self.max_queue:
+            state.rejected += 1
+            record_tenant_admission(state.tenant, "rejected")
+            raise AdmissionRejectedError(
+                f"Too many queued requests for tenant '{state.tenant}'", 429, 1
+            )
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(future)
+        record_tenant_admission(state.tenant, "queued")
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                # Granted while timing out or being cancelled: hand the slot on
+                self.release(tenant)
+            elif future in state.waiters:
+                state.waiters.remove(future)
+            if isinstance(e, TimeoutError):
+                state.rejected += 1
+                record_tenant_admission(state.tenant, "timeout")
+                raise AdmissionRejectedError(
+                    f"Request of tenant '{state.tenant}' was not admitted in time",
+                    503,
+                    max(1, math.ceil(self.queue_timeout)),
+                ) from None
+            raise
+        record_tenant_admission(state.tenant, "admitted", time.perf_counter() - start)
+
+    def release(self, tenant: str) -> None:
+        """Release a slot taken by ``acquire`` and admit waiting requests."""
+        state = self._state(tenant)
+        state.in_flight -= 1
+        self.in_flight -= 1
+        set_tenant_requests_in_flight(state.tenant, state.in_flight)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, tenant: str) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of the block."""
+        await self.acquire(tenant)
+        try:
+            yield
+        finally:
+            self.release(tenant)
+
+    def _grant(self, state: _TenantState) -> None:
+        # Start tag: a tenant returning from idle starts at the current clock
+        start_tag = max(state.virtual_time, self._virtual_clock)
+        self._virtual_clock = start_tag
+        state.virtual_time = start_tag + 1.0 / state.quota.weight
+        state.in_flight += 1
+        state.admitted += 1
+        self.in_flight += 1
+        set_tenant_requests_in_flight(state.tenant, state.in_flight)
+
+    def _dispatch(self) -> None:
+        """Give free slots to eligible waiting tenants, lowest virtual time first."""
+        while self.in_flight < self.max_in_flight:
+            eligible = [
+                state
+                for state in self._tenants.values()
+                if state.waiters and state.in_flight < state.quota.max_concurrency
+            ]
+            if not eligible:
+                return
+            state = min(eligible, key=lambda s: max(s.virtual_time, self._virtual_clock))
+            future = state.waiters.popleft()
+            if future.done():
+                continue
+            self._grant(state)
+            future.set_result(None)
+
+    # -------------------------------------------------------------------------
+    # Database sessions
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def db_session(self, tenant: str) -> AsyncIterator[None]:
+        """Hold one of the tenant's database session slots.
+
+        Raises:
+            AdmissionRejectedError: 503 if no slot frees up within
+                ``db_pool_timeout``
+        """
+        state = self._state(tenant)
+        limit = state.quota.db_sessions
+        if limit > 0 and (state.db_sessions >= limit or state.db_waiters):
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            state.db_waiters.append(future)
+            try:
+                await asyncio.wait_for(future, settings.db_pool_timeout)
+            except BaseException as e:
+                if future.done() and not future.cancelled():
+                    self._release_db(state)
+                elif future in state.db_waiters:
+                    state.db_waiters.remove(future)
+                if isinstance(e, TimeoutError):
+                    raise AdmissionRejectedError(
+                        f"No database session of tenant '{state.tenant}' became available",
+                        503,
+                        max(1, math.ceil(settings.db_pool_timeout)),
+                    ) from None
+                raise
+        else:
+            state.db_sessions += 1
+        set_tenant_db_sessions(state.tenant, state.db_sessions)
+        try:
+            yield
+        finally:
+            self._release_db(state)
+
+    def _release_db(self, state: _TenantState) -> None:
+        # The slot passes directly to the next waiter (count unchanged)
+        while state.db_waiters:
+            future = state.db_waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        state.db_sessions -= 1
+        set_tenant_db_sessions(state.tenant, state.db_sessions)
+
+    # -------------------------------------------------------------------------
+    # Cache quota
+    # -------------------------------------------------------------------------
+
+    def charge_cache(self, tenant: str, size: int, now: float | None = None) -> bool:
+        """Account ``size`` cached bytes to ``tenant``; False when over quota."""
+        state = self._state(tenant)
+        limit = state.quota.cache_bytes
+        if limit <= 0:
+            return True
+        window = int((time.time() if now is None else now) // self.cache_window_seconds)
+        if window != state.cache_window:
+            state.cache_window = window
+            state.cache_bytes = 0
+        if state.cache_bytes + size > limit:
+            record_tenant_cache_rejected(state.tenant)
+            return False
+        state.cache_bytes += size
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current per-tenant usage."""
+        return {
+            "maxInFlight": self.max_in_flight,
+            "inFlight": self.in_flight,
+            "tenants": [state.to_dict() for state in self._tenants.values()],
+        }
+
+
+_controller: AdmissionController | None = None
+
+
+def get_admission_controller() -> AdmissionController | None:
+    """Get the process-wide controller (None unless ENABLE_TENANT_ADMISSION)."""
+    global _controller
+    if _controller is None and settings.enable_tenant_admission:
+        pool_total = settings.db_pool_size + settings.db_max_overflow
+        default = TenantQuota(
+            max_concurrency=settings.tenant_max_concurrency,
+            db_sessions=max(1, math.ceil(pool_total * settings.tenant_db_pool_share)),
+            cache_bytes=settings.tenant_cache_bytes,
+        )
+        _controller = AdmissionController(
+            max_in_flight=settings.tenant_max_in_flight,
+            default_quota=default,
+            quotas={
+                tenant: TenantQuota.from_dict(data, default)
+                for tenant, data in settings.tenant_quotas.items()
+            },
+            queue_timeout=settings.tenant_queue_timeout,
+            max_queue=settings.tenant_max_queue,
+        )
+    return _controller
+
+
+def charge_tenant_cache(size: int, tenant: str | None = None) -> bool:
+    """Account a cache write to ``tenant`` (default: current); False when over quota.
+
+    Background writers, such as the event workers, pass the tenant that
+    published the change, since their own task has no request tenant.
+    """
+    controller = get_admission_controller()
+    if controller is None:
+        return True
+    return controller.charge_cache(tenant or current_tenant(), size)
@@ -3,7 +3,7 @@
 Provides tenant-scoped access:
 - TenantFilter: SQLAlchemy filter for tenant isolation
 - TenantCacheKey: Tenant-prefixed cache key generation
-- Row-Level Security (RLS) helpers
+- Row-Level Security (RLS) helpers and per-transaction tenant propagation
 
 Example:
     from titan.tenancy.isolation import TenantFilter, TenantCacheKey
@@ -21,7 +21,10 @@ import hashlib
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
-from titan.tenancy.context import get_current_tenant, require_tenant
+from sqlalchemy import Connection, text
+from sqlalchemy.orm import Session
+
+from titan.tenancy.context import DEFAULT_TENANT, get_current_tenant, require_tenant
 
 T = TypeVar("T")
 
@@ -190,13 +193,33 @@ def ensure_tenant_field(data: dict[str, Any], field: str = "tenant_id") -> dict[
 class RLSPolicy:
     """Row-Level Security policy definition.
 
-    Represents a PostgreSQL RLS policy for tenant isolation.
+    Represents a PostgreSQL RLS policy for tenant isolation. With a
+    ``default_tenant``, sessions that never set the session variable see
+    (and write) that tenant's rows instead of none.
     """
 
     table_name: str
     policy_name: str = "tenant_isolation"
     tenant_column: str = "tenant_id"
     session_variable: str = "app.tenant_id"
+    default_tenant: str | None = None
+    # Apply the policy to the table owner too
+    force: bool = False
+    # Rows matching this SQL condition are shared by all tenants
+    shared_condition: str | None = None
+
+    def tenant_expression(self) -> str:
+        """SQL expression for the session's tenant.
+
+        Returns:
+            SQL expression
+        """
+        if self.default_tenant is None:
+            return f"current_setting('{self.session_variable}')"
+        return (
+            f"COALESCE(NULLIF(current_setting('{self.session_variable}', true), ''), "
+            f"'{self.default_tenant}')"
+        )
 
     def enable_rls_sql(self) -> str:
         """Generate SQL to enable RLS on table.
@@ -204,7 +227,10 @@ class RLSPolicy:
         Returns:
             SQL statement
         """
-        return f"ALTER TABLE {self.table_name} ENABLE ROW LEVEL SECURITY;"
+        sql = f"ALTER TABLE {self.table_name} ENABLE ROW LEVEL SECURITY;"
+        if self.force:
+            sql += f"\nALTER TABLE {self.table_name} FORCE ROW LEVEL SECURITY;"
+        return sql
 
     def create_policy_sql(self) -> str:
         """Generate SQL to create the RLS policy.
@@ -212,10 +238,13 @@ class RLSPolicy:
         Returns:
             SQL statement
         """
+        predicate = f"{self.tenant_column} = {self.tenant_expression()}"
+        if self.shared_condition is not None:
+            predicate = f"{self.shared_condition} OR {predicate}"
         return f"""
 CREATE POLICY {self.policy_name} ON {self.table_name}
-    USING ({self.tenant_column} = current_setting('{self.session_variable}'))
-    WITH CHECK ({self.tenant_column} = current_setting('{self.session_variable}'));
+    USING ({predicate})
+    WITH CHECK ({predicate});
 """
 
     def drop_policy_sql(self) -> str:
@@ -237,12 +266,32 @@ CREATE POLICY {self.policy_name} ON {self.table_name}
         """
         return f"SET {self.session_variable} = '{tenant_id}';"
 
+    def set_local_tenant_sql(self) -> str:
+        """Generate SQL to set the tenant for the current transaction only.
+
+        Equivalent to ``SET LOCAL`` but takes the tenant as the bind
+        parameter ``:tenant_id``, so it is never interpolated.
+
+        Returns:
+            SQL statement
+        """
+        return f"SELECT set_config('{self.session_variable}', :tenant_id, true)"
+
 
-# Pre-defined RLS policies for common tables
+# Pre-defined RLS policies for the repository tables (see migration 015)
 RLS_POLICIES = {
-    "shells": RLSPolicy(table_name="shells"),
-    "submodels": RLSPolicy(table_name="submodels"),
-    "concept_descriptions": RLSPolicy(table_name="concept_descriptions"),
+    "aas": RLSPolicy(table_name="aas", default_tenant=DEFAULT_TENANT, force=True),
+    "submodels": RLSPolicy(table_name="submodels", default_tenant=DEFAULT_TENANT, force=True),
+    "concept_descriptions": RLSPolicy(
+        table_name="concept_descriptions", default_tenant=DEFAULT_TENANT, force=True
+    ),
+    # Descriptor links follow the registry, which is not tenant-scoped
+    "asset_links": RLSPolicy(
+        table_name="asset_links",
+        default_tenant=DEFAULT_TENANT,
+        force=True,
+        shared_condition="source <> 'shell'",
+    ),
 }
 
 
@@ -259,3 +308,18 @@ def get_rls_migration_sql() -> str:
         statements.append(policy.create_policy_sql())
 
     return "\n".join(statements)
+
+
+# All repository policies share the session variable
+_SET_LOCAL_TENANT = text(RLS_POLICIES["aas"].set_local_tenant_sql())
+
+
+def set_transaction_tenant(session: Session, transaction: Any, connection: Connection) -> None:
+    """Session ``after_begin`` hook: bind the current tenant to the transaction.
+
+    Runs once per transaction (``SET LOCAL`` semantics), so pooled
+    connections never carry a tenant over to the next checkout. Only the
+    tenant context (AuthenticatedTenantMiddleware, TenantScope) counts; the
+    admission tenant is used for accounting only.
+    """
+    connection.execute(_SET_LOCAL_TENANT, {"tenant_id": get_current_tenant()})
@@ -5,6 +5,13 @@ Extracts tenant information from requests:
 - JWT claims
 - Subdomain
 
+TenantMiddleware trusts whatever the client sends and suits deployments
+where a gateway sets the header. AuthenticatedTenantMiddleware takes the
+tenant from the verified bearer token instead, which row-level security
+and tenant cache keys rely on (ENABLE_TENANT_ISOLATION).
+
+TenantAdmissionMiddleware applies tenant admission control (see admission).
+
 Example:
     from fastapi import FastAPI
     from titan.tenancy.middleware import TenantMiddleware
@@ -19,13 +26,25 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
-
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from titan.config import settings
+from titan.tenancy.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    admission_tenant_var,
+    get_admission_controller,
+)
 from titan.tenancy.context import (
+    DEFAULT_TENANT,
     TenantContext,
+    TenantScope,
     clear_tenant,
+    get_current_tenant_or_none,
     set_tenant_context,
 )
 
@@ -273,3 +292,181 @@ def get_tenant_from_request(request: Request) -> str | None:
         return request.state.tenant_id
 
     return None
+
+
+async def authenticated_tenant(headers: Headers) -> str | None:
+    """Return the tenant claim of the request's verified bearer token.
+
+    Returns None without a (valid) token or when OIDC is not configured;
+    invalid tokens are rejected with 401 later by the security dependencies.
+    Verified tokens are cached, so the dependencies do not verify twice.
+    """
+    from titan.security.oidc import InvalidTokenError, get_token_validator
+
+    authorization = headers.get("authorization", "")
+    if not authorization.startswith("Bearer "):
+        return None
+    validator = get_token_validator()
+    if validator is None:
+        return None
+    try:
+        user = await validator.validate_token(authorization[7:])
+    except InvalidTokenError:
+        return None
+    return user.tenant_id
+
+
+class AuthenticatedTenantMiddleware:
+    """Sets the tenant context from the authenticated user.
+
+    The tenant is the ``tenant_id`` claim of the verified bearer token, or
+    the default tenant for requests without one. An X-Tenant-ID header
+    naming another tenant is rejected with 403 rather than trusted; only
+    without OIDC under ALLOW_ANONYMOUS_ADMIN (local development, where
+    every caller is admin anyway) does the header select the tenant.
+
+    Runs as pure ASGI middleware, so the application executes in the same
+    task and sees the tenant for row-level security and cache keys.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Tenant-ID",
+        excluded_paths: list[str] | None = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            header_name: Header a client may use to assert its tenant
+            excluded_paths: Paths served without a tenant context
+        """
+        self.app = app
+        self.header_name = header_name
+        self.excluded_paths = excluded_paths or ["/health", "/ready", "/metrics"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or any(
+            scope["path"].startswith(path) for path in self.excluded_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        from titan.security.oidc import get_token_validator
+
+        headers = Headers(scope=scope)
+        token_tenant = await authenticated_tenant(headers)
+        tenant = token_tenant or DEFAULT_TENANT
+        source = "token" if token_tenant else "default"
+        asserted = headers.get(self.header_name)
+        if asserted and asserted != tenant:
+            if get_token_validator() is None and settings.allow_anonymous_admin:
+                tenant, source = asserted, "header"
+            else:
+                response = JSONResponse(
+                    status_code=403,
+                    content={
+                        "messages": [
+                            {
+                                "code": "Forbidden",
+                                "messageType": "Error",
+                                "text": f"{self.header_name} does not match the "
+                                "authenticated tenant",
+                            }
+                        ]
+                    },
+                )
+                await response(scope, receive, send)
+                return
+
+        with TenantScope(tenant, metadata={"source": source}):
+            await self.app(scope, receive, send)
+
+
+class TenantAdmissionMiddleware:
+    """Middleware admitting requests through the tenant admission controller.
+
+    The tenant is taken from the tenant context (AuthenticatedTenantMiddleware),
+    else the tenant claim of the verified bearer token. Unauthenticated
+    requests share the default tenant's queue, so a client cannot claim
+    fresh slots or fill another tenant's queue by choosing a header value.
+    Requests that are not admitted get 429 (tenant queue full) or 503
+    (queue timeout) with a Retry-After header.
+
+    Runs as pure ASGI middleware, so the application executes in the same
+    task and sees the admitted tenant for database and cache quotas.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController | None = None,
+        excluded_paths: list[str] | None = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            controller: Admission controller (default: the process-wide one)
+            excluded_paths: Paths admitted without control
+        """
+        self.app = app
+        self.controller = controller
+        self.excluded_paths = excluded_paths or ["/health", "/ready", "/metrics"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        controller = self.controller or get_admission_controller()
+        if (
+            scope["type"] != "http"
+            or controller is None
+            or any(scope["path"].startswith(path) for path in self.excluded_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        tenant = (
+            get_current_tenant_or_none()
+            or await authenticated_tenant(Headers(scope=scope))
+            or DEFAULT_TENANT
+        )
+        try:
+            await controller.acquire(tenant)
+        except AdmissionRejectedError as e:
+            await admission_rejected_response(e)(scope, receive, send)
+            return
+
+        token = admission_tenant_var.set(tenant)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission_tenant_var.reset(token)
+            controller.release(tenant)
+
+
+def admission_rejected_response(exc: AdmissionRejectedError) -> JSONResponse:
+    """Build the 429/503 response for a rejected request, with Retry-After."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            "messages": [
+                {
+                    "code": "TooManyRequests" if exc.status_code == 429 else "ServiceUnavailable",
+                    "messageType": "Error",
+                    "text": str(exc),
+                }
+            ]
+        },
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def admission_rejected_exception_handler(
+    request: Request, exc: AdmissionRejectedError
+) -> JSONResponse:
+    """Exception handler for admission rejections raised inside the app.
+
+    Covers waits that happen after request admission, such as a database
+    session slot that does not free up in time.
+    """
+    return admission_rejected_response(exc)
@@ -0,0 +1,341 @@
+"""Tests for the pure ASGI API middleware stack."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from titan.api.middleware import (
+    CachingMiddleware,
+    CompressionMiddleware,
+    CorrelationMiddleware,
+    RateLimitMiddleware,
+    ReadRoutingMiddleware,
+    read_routing,
+)
+from titan.api.middleware.rate_limit import (
+    GCRARateLimiter,
+    RateLimitConfig,
+    SlidingWindowRateLimiter,
+)
+from titan.observability.logging import correlation_id_var, request_id_var
+from titan.persistence.replicas import routing_var
+
+LARGE_JSON = b'{"value": "' + b"x" * 2000 + b'"}'
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """Create a basic FastAPI app for testing."""
+    app = FastAPI()
+
+    @app.get("/shells")
+    def shells() -> Response:
+        return Response(content=LARGE_JSON, media_type="application/json")
+
+    @app.get("/small")
+    def small() -> dict[str, str]:
+        return {"message": "ok"}
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([LARGE_JSON, LARGE_JSON]), media_type="application/json")
+
+    @app.get("/context")
+    def context(request: Request) -> dict[str, str | None]:
+        return {
+            "state": request.state.request_id,
+            "var": request_id_var.get(),
+            "correlation": correlation_id_var.get(),
+        }
+
+    @app.post("/shells")
+    def create() -> dict[str, str]:
+        return {"message": "created"}
+
+    return app
+
+
+class TestCachingMiddleware:
+    def test_public_cache_for_anonymous_get(self, app: FastAPI) -> None:
+        app.add_middleware(CachingMiddleware, default_max_age=10, stale_while_revalidate=5)
+
+        response = TestClient(app).get("/shells")
+
+        assert response.headers["Cache-Control"] == "public, max-age=10, stale-while-revalidate=5"
+        assert response.headers["Vary"] == "Accept, Accept-Encoding, Authorization"
+
+    def test_private_cache_with_authorization(self, app: FastAPI) -> None:
+        app.add_middleware(CachingMiddleware)
+
+        response = TestClient(app).get("/shells", headers={"Authorization": "Bearer t"})
+
+        assert response.headers["Cache-Control"].startswith("private")
+
+    def test_private_cache_under_tenant_isolation(self, app: FastAPI) -> None:
+        app.add_middleware(CachingMiddleware, tenant_header="X-Tenant-ID")
+
+        response = TestClient(app).get("/shells", headers={"X-Tenant-ID": "acme"})
+
+        assert response.headers["Cache-Control"].startswith("private")
+        assert response.headers["Vary"] == "Accept, Accept-Encoding, Authorization, X-Tenant-ID"
+
+    def test_non_get_untouched(self, app: FastAPI) -> None:
+        app.add_middleware(CachingMiddleware)
+
+        response = TestClient(app).post("/shells")
+
+        assert "Cache-Control" not in response.headers
+
+
+class TestCompressionMiddleware:
+    def test_gzip_large_json(self, app: FastAPI) -> None:
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        response = TestClient(app).get("/shells", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert int(response.headers["Content-Length"]) < len(LARGE_JSON)
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert response.content == LARGE_JSON
+
+    def test_quality_values_respected(self, app: FastAPI) -> None:
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        response = TestClient(app).get(
+            "/shells", headers={"Accept-Encoding": "br;q=0, zstd;q=0, gzip;q=0.5"}
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.content == LARGE_JSON
+
+    def test_small_response_untouched(self, app: FastAPI) -> None:
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        response = TestClient(app).get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.json() == {"message": "ok"}
+
+    def test_streaming_response_passthrough(self, app: FastAPI) -> None:
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        response = TestClient(app).get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.content == LARGE_JSON * 2
+
+    def test_no_accept_encoding(self, app: FastAPI) -> None:
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        response = TestClient(app).get("/shells", headers={"Accept-Encoding": "identity"})
+
+        assert "Content-Encoding" not in response.headers
+
+
+class TestCorrelationMiddleware:
+    def test_ids_visible_to_handler_and_response(self, app: FastAPI) -> None:
+        app.add_middleware(CorrelationMiddleware)
+
+        response = TestClient(app).get(
+            "/context", headers={"x-request-id": "req-1", "x-correlation-id": "corr-1"}
+        )
+
+        assert response.json() == {"state": "req-1", "var": "req-1", "correlation": "corr-1"}
+        assert response.headers["x-request-id"] == "req-1"
+        assert response.headers["x-correlation-id"] == "corr-1"
+
+    def test_generates_request_id(self, app: FastAPI) -> None:
+        app.add_middleware(CorrelationMiddleware)
+
+        response = TestClient(app).get("/small")
+
+        assert response.headers["x-request-id"]
+        assert response.headers["x-correlation-id"] == response.headers["x-request-id"]
+
+
+class TestReadRoutingMiddleware:
+    @pytest.fixture
+    def routing_app(self, app: FastAPI) -> FastAPI:
+        @app.get("/routing")
+        def read() -> dict[str, object]:
+            routing = routing_var.get()
+            return {"read_only": routing.read_only, "min_lsn": routing.min_lsn}
+
+        @app.post("/routing")
+        def write() -> dict[str, str]:
+            routing_var.get().wrote = True  # As set by the session after_commit hook
+            return {"message": "written"}
+
+        app.add_middleware(ReadRoutingMiddleware)
+        return app
+
+    def test_read_request_marked_with_token(self, routing_app: FastAPI) -> None:
+        response = TestClient(routing_app).get("/routing", headers={"x-consistency-token": "0/10"})
+
+        assert response.json() == {"read_only": True, "min_lsn": 16}
+        assert "x-consistency-token" not in response.headers
+
+    def test_write_returns_token(
+        self, routing_app: FastAPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fake_primary_lsn(engine: object) -> int:
+            return (1 << 32) | 0xFF
+
+        monkeypatch.setattr(read_routing, "get_engine", lambda: None)
+        monkeypatch.setattr(read_routing, "primary_lsn", fake_primary_lsn)
+
+        response = TestClient(routing_app).post("/routing")
+
+        assert response.headers["x-consistency-token"] == "1/FF"
+
+
+class FakeLimiter:
+    def __init__(self, allowed: bool) -> None:
+        self.allowed = allowed
+        self.keys: list[str] = []
+
+    async def is_allowed(self, key: str) -> tuple[bool, dict[str, str]]:
+        self.keys.append(key)
+        return self.allowed, {"X-RateLimit-Limit": "1", "X-RateLimit-Remaining": "0"}
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture(autouse=True)
+    def fake_redis(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import titan.cache as cache_module
+
+        async def get_redis() -> None:
+            return None
+
+        monkeypatch.setattr(cache_module, "get_redis", get_redis)
+
+    def make_client(self, app: FastAPI, limiter: FakeLimiter) -> TestClient:
+        middleware = RateLimitMiddleware(app, config=RateLimitConfig(bypass_prefixes=["/small"]))
+        middleware._limiter = limiter  # type: ignore[assignment]
+        return TestClient(middleware)
+
+    def test_allowed_request_gets_headers(self, app: FastAPI) -> None:
+        limiter = FakeLimiter(allowed=True)
+        client = self.make_client(app, limiter)
+
+        response = client.get("/shells", headers={"x-forwarded-for": "10.0.0.1, 10.0.0.2"})
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "1"
+        assert limiter.keys[0].startswith("ratelimit:ip:")
+
+    def test_rejected_request(self, app: FastAPI) -> None:
+        limiter = FakeLimiter(allowed=False)
+        client = self.make_client(app, limiter)
+
+        response = client.get("/shells", headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == 429
+        assert response.json()["messages"][0]["code"] == "TooManyRequests"
+        assert limiter.keys[0].startswith("ratelimit:token:")
+
+    def test_bypass_prefix(self, app: FastAPI) -> None:
+        limiter = FakeLimiter(allowed=False)
+        client = self.make_client(app, limiter)
+
+        assert client.get("/small").status_code == 200
+        assert limiter.keys == []
+
+
+class FakeScript:
+    """Stands in for the GCRA Lua script: a bucket of ``tokens``."""
+
+    def __init__(self, tokens: int) -> None:
+        self.tokens = tokens
+        self.calls: list[tuple[list[str], list[float]]] = []
+
+    async def __call__(self, keys: list[str], args: list[float]) -> list[int]:
+        self.calls.append((keys, args))
+        granted = min(int(args[2]), self.tokens)
+        self.tokens -= granted
+        if granted == 0:
+            return [0, 0, 1500, 60000]
+        return [granted, self.tokens, 0, 60000]
+
+
+class FakeScriptRedis:
+    def __init__(self, script: FakeScript) -> None:
+        self.script = script
+
+    def register_script(self, source: str) -> FakeScript:
+        assert "TIME" in source
+        return self.script
+
+
+class TestGCRARateLimiter:
+    def make_limiter(self, tokens: int, **config: object) -> tuple[GCRARateLimiter, FakeScript]:
+        script = FakeScript(tokens)
+        limiter = GCRARateLimiter(
+            FakeScriptRedis(script),  # type: ignore[arg-type]
+            RateLimitConfig(requests_per_window=10, window_seconds=60, **config),  # type: ignore[arg-type]
+        )
+        return limiter, script
+
+    async def test_one_script_call_per_request(self) -> None:
+        limiter, script = self.make_limiter(tokens=2)
+
+        allowed, headers = await limiter.is_allowed("ratelimit:ip:a")
+
+        assert allowed
+        assert headers["X-RateLimit-Limit"] == "10"
+        assert headers["X-RateLimit-Remaining"] == "1"
+        # One token per 6 s, burst of 10, one token requested
+        assert script.calls == [(["ratelimit:ip:a:gcra"], [6000.0, 10, 1])]
+
+    async def test_denied_with_retry_after(self) -> None:
+        limiter, _ = self.make_limiter(tokens=0)
+
+        allowed, headers = await limiter.is_allowed("ratelimit:ip:a")
+
+        assert not allowed
+        assert headers["Retry-After"] == "2"
+        assert headers["X-RateLimit-Remaining"] == "0"
+
+    async def test_local_batch_reserves_tokens(self) -> None:
+        limiter, script = self.make_limiter(tokens=8, local_batch=5)
+
+        results = [await limiter.is_allowed("ratelimit:ip:a") for _ in range(9)]
+
+        assert [allowed for allowed, _ in results] == [True] * 8 + [False]
+        # 5 + 3 granted, then one denied call; the denial is cached locally
+        assert [args[2] for _, args in script.calls] == [5, 5, 5]
+        assert results[0][1]["X-RateLimit-Remaining"] == "7"
+        assert not (await limiter.is_allowed("ratelimit:ip:a"))[0]
+        assert len(script.calls) == 3
+
+    async def test_concurrent_misses_share_one_refill(self) -> None:
+        limiter, script = self.make_limiter(tokens=100, local_batch=10)
+
+        results = await asyncio.gather(*(limiter.is_allowed("ratelimit:ip:a") for _ in range(10)))
+
+        assert all(allowed for allowed, _ in results)
+        assert len(script.calls) == 1
+
+    async def test_unused_reservation_expires(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        limiter, script = self.make_limiter(tokens=100, local_batch=5, local_ttl_seconds=1.0)
+        now = [1000.0]
+        monkeypatch.setattr("titan.api.middleware.rate_limit.time.monotonic", lambda: now[0])
+
+        await limiter.is_allowed("ratelimit:ip:a")
+        now[0] += 2
+        await limiter.is_allowed("ratelimit:ip:a")
+
+        assert len(script.calls) == 2
+
+    def test_middleware_selects_algorithm(self, app: FastAPI) -> None:
+        redis = FakeScriptRedis(FakeScript(1))
+        gcra = RateLimitMiddleware(app, config=RateLimitConfig())
+        sliding = RateLimitMiddleware(app, config=RateLimitConfig(algorithm="sliding_window"))
+
+        assert isinstance(gcra._get_limiter(redis), GCRARateLimiter)  # type: ignore[arg-type]
+        assert isinstance(sliding._get_limiter(redis), SlidingWindowRateLimiter)  # type: ignore[arg-type]
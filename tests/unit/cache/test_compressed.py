@@ -0,0 +1,174 @@
+"""Tests for pre-compressed cache variants."""
+
+from __future__ import annotations
+
+import gzip
+from typing import Any
+
+import pytest
+from starlette.requests import Request
+
+from titan.api.deps import cached_encoded_response, encoded_json_response
+from titan.cache import RedisCache
+from titan.cache.compressed import SUPPORTED_ENCODINGS, compress, negotiate_encoding
+from titan.cache.keys import CacheKeys
+from titan.config import settings
+
+DOC = b'{"id": "urn:example:aas:1", "description": "' + b"x" * 2000 + b'"}'
+
+
+class FakeCache:
+    """Stores compressed variants in a dict."""
+
+    def __init__(self) -> None:
+        self.variants: dict[str, bytes] = {}
+        self.sets = 0
+
+    async def get_compressed(self, *key: Any) -> bytes | None:
+        return self.variants.get(CacheKeys.compressed(*key))
+
+    async def set_compressed(self, entity_type, identifier_b64, etag, encoding, data, variant=""):
+        self.sets += 1
+        key = CacheKeys.compressed(entity_type, identifier_b64, etag, encoding, variant)
+        self.variants[key] = data
+
+
+def make_request(accept_encoding: str | None) -> Request:
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestNegotiateEncoding:
+    def test_server_preference_on_tie(self) -> None:
+        assert negotiate_encoding("gzip, br", supported=("br", "gzip")) == "br"
+
+    def test_quality_values(self) -> None:
+        assert negotiate_encoding("br;q=0.2, gzip;q=0.8", supported=("br", "gzip")) == "gzip"
+
+    def test_zero_quality_excludes(self) -> None:
+        assert negotiate_encoding("gzip;q=0", supported=("gzip",)) is None
+
+    def test_wildcard(self) -> None:
+        assert negotiate_encoding("*", supported=("zstd", "gzip")) == "zstd"
+        assert negotiate_encoding("*, zstd;q=0", supported=("zstd", "gzip")) == "gzip"
+
+    def test_identity_only(self) -> None:
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("") is None
+
+
+class TestCompress:
+    @pytest.mark.parametrize("encoding", SUPPORTED_ENCODINGS)
+    def test_smaller_than_input(self, encoding: str) -> None:
+        assert len(compress(DOC, encoding)) < len(DOC)
+
+    def test_gzip_is_deterministic(self) -> None:
+        assert compress(DOC, "gzip") == compress(DOC, "gzip")
+        assert gzip.decompress(compress(DOC, "gzip")) == DOC
+
+    def test_unknown_encoding(self) -> None:
+        with pytest.raises(ValueError):
+            compress(DOC, "deflate")
+
+    def test_key_scoped_by_etag_and_variant(self) -> None:
+        key = CacheKeys.compressed("aas", "abc", "etag1", "br")
+        assert key == "titan:aas:abc:enc::br:etag1"
+        assert key != CacheKeys.compressed("aas", "abc", "etag2", "br")
+        assert key != CacheKeys.compressed("aas", "abc", "etag1", "br", "level=core")
+
+
+class TestEncodedJsonResponse:
+    @pytest.mark.asyncio
+    async def test_first_request_compresses_then_hits(self) -> None:
+        cache = FakeCache()
+        request = make_request("gzip")
+
+        first = await encoded_json_response(request, cache, "aas", "abc", DOC, "e1")  # type: ignore[arg-type]
+        second = await encoded_json_response(request, cache, "aas", "abc", DOC, "e1")  # type: ignore[arg-type]
+
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert first.headers["ETag"] == '"e1"'
+        assert first.headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(first.body) == DOC
+        assert second.body == first.body
+        assert cache.sets == 1
+
+    @pytest.mark.asyncio
+    async def test_new_etag_is_new_variant(self) -> None:
+        cache = FakeCache()
+        request = make_request("gzip")
+
+        await encoded_json_response(request, cache, "aas", "abc", DOC, "e1")  # type: ignore[arg-type]
+        await encoded_json_response(request, cache, "aas", "abc", DOC, "e2")  # type: ignore[arg-type]
+
+        assert cache.sets == 2
+
+    @pytest.mark.asyncio
+    async def test_identity_without_accept_encoding(self) -> None:
+        cache = FakeCache()
+
+        response = await encoded_json_response(
+            make_request(None),
+            cache,  # type: ignore[arg-type]
+            "aas",
+            "abc",
+            DOC,
+            "e1",
+        )
+
+        assert "Content-Encoding" not in response.headers
+        assert response.body == DOC
+        assert cache.sets == 0
+
+    @pytest.mark.asyncio
+    async def test_small_documents_not_compressed(self) -> None:
+        cache = FakeCache()
+
+        response = await encoded_json_response(
+            make_request("gzip"),
+            cache,  # type: ignore[arg-type]
+            "aas",
+            "abc",
+            b"{}",
+            "e1",
+        )
+
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_cached_projection_lookup(self) -> None:
+        cache = FakeCache()
+        request = make_request("gzip")
+
+        assert (
+            await cached_encoded_response(request, cache, "sm", "abc", "e1", "level=core")  # type: ignore[arg-type]
+            is None
+        )
+        await encoded_json_response(
+            request,
+            cache,  # type: ignore[arg-type]
+            "sm",
+            "abc",
+            DOC,
+            "e1",
+            "level=core",
+        )
+        hit = await cached_encoded_response(request, cache, "sm", "abc", "e1", "level=core")  # type: ignore[arg-type]
+
+        assert hit is not None
+        assert gzip.decompress(hit.body) == DOC
+
+
+class TestPrecompression:
+    def test_disabled_by_default(self) -> None:
+        assert RedisCache(client=None)._precompressed("aas", "abc", DOC, "e1") == []  # type: ignore[arg-type]
+
+    def test_configured_encodings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "cache_precompress_encodings", "gzip, unknown")
+
+        variants = RedisCache(client=None)._precompressed("aas", "abc", DOC, "e1")  # type: ignore[arg-type]
+
+        assert [key for key, _ in variants] == [CacheKeys.compressed("aas", "abc", "e1", "gzip")]
+        assert gzip.decompress(variants[0][1]) == DOC
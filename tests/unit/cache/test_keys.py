@@ -2,7 +2,12 @@
 
 import base64
 
+import pytest
+
 from titan.cache.keys import CacheKeys
+from titan.config import settings
+from titan.tenancy.admission import admission_tenant_var
+from titan.tenancy.context import TenantScope
 
 
 class TestCacheKeys:
@@ -59,3 +64,43 @@ class TestCacheKeys:
         """Invalid key returns None."""
         assert CacheKeys.parse_key("invalid") is None
         assert CacheKeys.parse_key("other:prefix:key") is None
+
+
+class TestTenantScopedKeys:
+    """Test tenant scoping of cache keys."""
+
+    def test_default_tenant_keys_are_unscoped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The default tenant keeps the plain key schema."""
+        monkeypatch.setattr(settings, "enable_tenant_isolation", True)
+
+        assert CacheKeys.aas_bytes("abc123") == "titan:aas:abc123:bytes"
+
+    def test_tenant_keys_are_scoped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Other tenants get a tenant segment after the prefix."""
+        monkeypatch.setattr(settings, "enable_tenant_isolation", True)
+
+        with TenantScope("acme"):
+            key = CacheKeys.aas_bytes("abc123")
+
+        assert key == "titan:tenant:acme:aas:abc123:bytes"
+        assert CacheKeys.parse_key(key) == {
+            "prefix": "titan",
+            "entity_type": "aas",
+            "identifier_b64": "abc123",
+            "variant": "bytes",
+            "tenant": "acme",
+        }
+
+    def test_admission_tenant_does_not_scope(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the tenant context scopes keys, not the admitted tenant."""
+        monkeypatch.setattr(settings, "enable_tenant_isolation", True)
+        token = admission_tenant_var.set("acme")
+        try:
+            assert CacheKeys.aas_bytes("abc123") == "titan:aas:abc123:bytes"
+        finally:
+            admission_tenant_var.reset(token)
+
+    def test_unscoped_without_isolation(self) -> None:
+        """Keys are not scoped unless tenant isolation is enabled."""
+        with TenantScope("acme"):
+            assert CacheKeys.aas_bytes("abc123") == "titan:aas:abc123:bytes"
@@ -0,0 +1,32 @@
+"""Shared unit test fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def make_session() -> Callable[..., MagicMock]:
+    """Factory for mock sessions whose successive executes return identifiers.
+
+    Each positional argument is the ``scalars().all()`` result of one
+    ``execute`` call, in order.
+    """
+
+    def factory(*returned: list[str]) -> MagicMock:
+        results = []
+        for identifiers in returned:
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = identifiers
+            results.append(result)
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=results)
+        session.flush = AsyncMock()
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        return session
+
+    return factory
@@ -0,0 +1,77 @@
+"""Tests for the JSON Pointer / JSON Patch helpers."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from titan.core.json_patch import (
+    PatchError,
+    apply_patch,
+    escape_token,
+    make_patch,
+    patch_operation,
+    unescape_token,
+)
+
+
+class TestPatch:
+    """Test make_patch / apply_patch."""
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 3]}),
+            ({"a": {"x": [{"k": 1}]}}, {"a": {"x": [{"k": 2}, {"k": 3}]}, "c": None}),
+            ({"a/b": {"~": 1}}, {"a/b": {"~": 2}}),
+            ([1, 2], {"a": 1}),
+        ],
+    )
+    def test_round_trip(self, old: object, new: object) -> None:
+        """Applying the generated patch yields the target document."""
+        ops = make_patch(old, new)
+        assert apply_patch(copy.deepcopy(old), ops) == new
+
+    def test_value_change_is_narrow(self) -> None:
+        """A changed leaf produces a single replace operation."""
+        old = {"submodelElements": [{"idShort": "T", "value": "1"}]}
+        new = {"submodelElements": [{"idShort": "T", "value": "2"}]}
+
+        assert make_patch(old, new) == [
+            {"op": "replace", "path": "/submodelElements/0/value", "value": "2"}
+        ]
+
+    def test_replace_preserves_key_order(self) -> None:
+        """Replacing a member keeps its position in the object."""
+        doc = apply_patch({"a": 1, "b": 2}, [{"op": "replace", "path": "/a", "value": 3}])
+        assert list(doc) == ["a", "b"]
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            {"op": "replace", "path": "/missing", "value": 1},
+            {"op": "remove", "path": "/list/5"},
+            {"op": "add", "path": "/list/x", "value": 1},
+            {"op": "move", "path": "/a", "from": "/b"},
+        ],
+    )
+    def test_invalid_operations_raise(self, op: dict) -> None:
+        """Unsupported ops and missing paths raise PatchError."""
+        with pytest.raises(PatchError):
+            apply_patch({"a": 1, "list": [1]}, [op])
+
+    def test_pointer_tokens_round_trip(self) -> None:
+        """RFC 6901 escaping of "~" and "/" is reversible."""
+        assert escape_token("a/b~c") == "a~1b~0c"
+        assert unescape_token(escape_token("a/b~c")) == "a/b~c"
+
+    def test_patch_operation_members(self) -> None:
+        """Remove carries no value; extra members are kept."""
+        assert patch_operation("remove", "/a") == {"op": "remove", "path": "/a"}
+        assert patch_operation("add", "/a", 1, idShortPath="A") == {
+            "op": "add",
+            "path": "/a",
+            "idShortPath": "A",
+            "value": 1,
+        }
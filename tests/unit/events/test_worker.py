@@ -0,0 +1,88 @@
+"""Tests for the event writers' tenant handling."""
+
+from __future__ import annotations
+
+import pytest
+
+from titan.cache.keys import CacheKeys
+from titan.events import EventType, InMemoryEventBus, MicroBatchWriter, SingleWriter
+from titan.events.schemas import AasEvent, SubmodelEvent
+from titan.tenancy.context import TenantScope, get_current_tenant_or_none
+
+
+class KeyRecordingCache:
+    """Records the keys cache writes and invalidations would touch."""
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.charged: list[str | None] = []
+
+    async def set_aas(
+        self, identifier_b64: str, doc_bytes: bytes, etag: str, tenant: str | None = None
+    ) -> None:
+        self.keys.append(CacheKeys.aas_bytes(identifier_b64))
+        self.charged.append(tenant)
+
+    async def set_submodel(
+        self, identifier_b64: str, doc_bytes: bytes, etag: str, tenant: str | None = None
+    ) -> None:
+        self.keys.append(CacheKeys.submodel_bytes(identifier_b64))
+        self.charged.append(tenant)
+
+    async def invalidate_submodel_elements(self, identifier_b64: str) -> None:
+        self.keys.append(CacheKeys.submodel_element_value(identifier_b64, "*"))
+
+
+@pytest.fixture(autouse=True)
+def isolation(monkeypatch: pytest.MonkeyPatch) -> None:
+    from titan.config import settings
+
+    monkeypatch.setattr(settings, "enable_tenant_isolation", True)
+
+
+def make_event(event_class: type[AasEvent] | type[SubmodelEvent], tenant: str | None) -> object:
+    kwargs = {
+        "event_type": EventType.UPDATED,
+        "identifier": "urn:x",
+        "identifier_b64": "dXJuOng",
+        "doc_bytes": b"{}",
+        "etag": "e1",
+    }
+    if tenant is None:
+        return event_class(**kwargs)
+    with TenantScope(tenant):
+        return event_class(**kwargs)
+
+
+class TestEventTenant:
+    def test_event_records_publishing_tenant(self) -> None:
+        assert make_event(AasEvent, "acme").tenant_id == "acme"  # type: ignore[attr-defined]
+        assert make_event(AasEvent, None).tenant_id == "default"  # type: ignore[attr-defined]
+
+
+class TestSingleWriter:
+    async def test_cache_keys_follow_event_tenant(self) -> None:
+        cache = KeyRecordingCache()
+        writer = SingleWriter(InMemoryEventBus(), cache, session_factory=None)  # type: ignore[arg-type]
+
+        await writer._handle_event(make_event(SubmodelEvent, "acme"))  # type: ignore[arg-type]
+        await writer._handle_event(make_event(AasEvent, None))  # type: ignore[arg-type]
+
+        assert cache.keys[0].startswith("titan:tenant:acme:sm:")
+        assert cache.keys[1].startswith("titan:tenant:acme:sm:")
+        assert cache.keys[2] == "titan:aas:dXJuOng:bytes"
+        assert cache.charged == ["acme", "default"]
+        # The worker's own context is left untouched
+        assert get_current_tenant_or_none() is None
+
+
+class TestMicroBatchWriter:
+    async def test_cache_keys_follow_event_tenant(self) -> None:
+        cache = KeyRecordingCache()
+        writer = MicroBatchWriter(InMemoryEventBus(), cache, session_factory=None)  # type: ignore[arg-type]
+
+        await writer._update_cache(make_event(AasEvent, "acme"))  # type: ignore[arg-type]
+
+        assert cache.keys == ["titan:tenant:acme:aas:dXJuOng:bytes"]
+        assert cache.charged == ["acme"]
+        assert get_current_tenant_or_none() is None
@@ -0,0 +1,169 @@
+"""Tests for applying batched federation changes."""
+
+from __future__ import annotations
+
+import copy
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from titan.core.canonicalize import canonical_bytes
+from titan.core.json_patch import make_patch
+from titan.federation.apply import ChangeBatchApplier
+from titan.persistence.tables import generate_etag
+
+
+def make_session(existing: dict[str, str]) -> MagicMock:
+    """Mock session returning ``existing`` (identifier -> etag) for lookups."""
+    session = MagicMock()
+
+    rows = [MagicMock(identifier=k, etag=v) for k, v in existing.items()]
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute = AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def begin_nested():
+        yield
+
+    session.begin_nested = begin_nested
+    return session
+
+
+def change(change_id: str, operation: str, entity_id: str, etag: str | None = None) -> dict:
+    """Build a change in SyncChange.to_dict() format."""
+    return {
+        "changeId": change_id,
+        "entityType": "aas",
+        "entityId": entity_id,
+        "operation": operation,
+        "doc": None
+        if operation == "delete"
+        else {
+            "modelType": "AssetAdministrationShell",
+            "id": entity_id,
+            "assetInformation": {"assetKind": "Instance", "globalAssetId": "urn:asset"},
+        },
+        "etag": etag,
+    }
+
+
+class TestChangeBatchApplier:
+    """Test ChangeBatchApplier."""
+
+    @pytest.fixture
+    def repo(self) -> AsyncMock:
+        repo = AsyncMock()
+        repo.create.return_value = (b"{}", "etag-new")
+        repo.update.return_value = (b"{}", "etag-updated")
+        repo.delete.return_value = True
+        return repo
+
+    async def test_applies_creates_updates_and_deletes(self, repo: AsyncMock) -> None:
+        """Changes are routed to create/update/delete based on existing state."""
+        session = make_session({"urn:a": "etag-a", "urn:b": "etag-b"})
+        applier = ChangeBatchApplier(session)
+        applier._repos["aas"] = repo
+
+        results = await applier.apply(
+            [
+                change("c1", "create", "urn:new"),
+                change("c2", "create", "urn:a"),  # exists -> update
+                change("c3", "delete", "urn:b"),
+                change("c4", "delete", "urn:missing"),
+            ]
+        )
+
+        assert [(r.change_id, r.status, r.operation) for r in results] == [
+            ("c1", "applied", "create"),
+            ("c2", "applied", "update"),
+            ("c3", "applied", "delete"),
+            ("c4", "skipped", None),
+        ]
+        # One lookup query for the aas entity type
+        assert session.execute.await_count == 1
+
+    async def test_unchanged_etag_is_skipped(self, repo: AsyncMock) -> None:
+        """Replayed updates with the current etag are not re-applied."""
+        applier = ChangeBatchApplier(make_session({"urn:a": "etag-a"}))
+        applier._repos["aas"] = repo
+
+        results = await applier.apply([change("c1", "update", "urn:a", etag="etag-a")])
+
+        assert results[0].status == "skipped"
+        repo.update.assert_not_awaited()
+
+    async def test_failure_is_isolated(self, repo: AsyncMock) -> None:
+        """A failing change does not prevent the rest of the batch."""
+        repo.create.side_effect = [RuntimeError("boom"), (b"{}", "etag-2")]
+        applier = ChangeBatchApplier(make_session({}))
+        applier._repos["aas"] = repo
+
+        results = await applier.apply(
+            [change("c1", "create", "urn:1"), change("c2", "create", "urn:2")]
+        )
+
+        assert results[0].status == "failed"
+        assert results[0].error == "boom"
+        assert results[1].status == "applied"
+        assert results[1].to_dict() == {"changeId": "c2", "status": "applied", "etag": "etag-2"}
+
+    async def test_unknown_entity_type_fails(self) -> None:
+        """Unknown entity types are reported as failed."""
+        applier = ChangeBatchApplier(make_session({}))
+        bad = change("c1", "create", "urn:1")
+        bad["entityType"] = "widget"
+
+        results = await applier.apply([bad])
+
+        assert results[0].status == "failed"
+
+
+class TestPatchedChanges:
+    """Test applying JSON Patch deltas."""
+
+    @pytest.fixture
+    def stored_doc(self) -> dict:
+        return change("c0", "update", "urn:a")["doc"]
+
+    def make_applier(self, stored_doc: dict) -> tuple[ChangeBatchApplier, AsyncMock]:
+        stored_bytes = canonical_bytes(stored_doc)
+        repo = AsyncMock()
+        repo.get_bytes_by_id.return_value = (stored_bytes, generate_etag(stored_bytes))
+        repo.update.return_value = (b"{}", "etag-updated")
+        applier = ChangeBatchApplier(make_session({"urn:a": generate_etag(stored_bytes)}))
+        applier._repos["aas"] = repo
+        return applier, repo
+
+    def patched(self, stored_doc: dict, base_etag: str) -> dict:
+        target = copy.deepcopy(stored_doc)
+        target["idShort"] = "Renamed"
+        delta = change("c1", "update", "urn:a")
+        delta.update(
+            doc=None,
+            patch=make_patch(stored_doc, target),
+            baseEtag=base_etag,
+            etag=generate_etag(canonical_bytes(target)),
+        )
+        return delta
+
+    async def test_patch_applied_against_base(self, stored_doc: dict) -> None:
+        """A patch against the stored version updates the entity."""
+        applier, repo = self.make_applier(stored_doc)
+        base = generate_etag(canonical_bytes(stored_doc))
+
+        [result] = await applier.apply([self.patched(stored_doc, base)])
+
+        assert result.status == "applied"
+        assert repo.update.await_args.args[1].id_short == "Renamed"
+
+    async def test_stale_base_reports_mismatch(self, stored_doc: dict) -> None:
+        """A patch against an older version is not applied."""
+        applier, repo = self.make_applier(stored_doc)
+
+        [result] = await applier.apply([self.patched(stored_doc, "etag-old")])
+
+        assert result.status == "base_mismatch"
+        assert result.to_dict()["status"] == "base_mismatch"
+        repo.update.assert_not_awaited()
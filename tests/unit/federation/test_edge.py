@@ -0,0 +1,348 @@
+"""Tests for the edge offline queue and batched pushes."""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+
+from titan.core.json_patch import apply_patch
+from titan.federation.edge import (
+    EdgeConfig,
+    EdgeController,
+    OfflineQueue,
+    PendingChange,
+    SyncPriority,
+)
+from titan.federation.peer import PeerCapabilities
+from titan.federation.wire import SUPPORTED_ENCODINGS, decode_body
+from titan.persistence.tables import generate_etag
+
+
+def change(
+    entity_id: str,
+    action: str = "update",
+    data: bytes | None = b"{}",
+    priority: SyncPriority = SyncPriority.NORMAL,
+) -> PendingChange:
+    """Build a pending submodel change."""
+    return PendingChange(
+        id=f"change-{entity_id}-{action}",
+        entity_type="submodel",
+        entity_id=entity_id,
+        action=action,
+        data=data,
+        priority=priority,
+    )
+
+
+class MemoryStore:
+    """In-memory PendingChangeStore keyed like the database table."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], PendingChange] = {}
+
+    async def load(self) -> list[PendingChange]:
+        rows = sorted(self.rows.values(), key=lambda c: c.created_at)
+        return [replace(row, data=None) for row in rows]
+
+    async def load_payloads(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], bytes]:
+        return {key: self.rows[key].data for key in keys if self.rows[key].data is not None}
+
+    async def save(self, change: PendingChange) -> None:
+        self.rows[(change.entity_type, change.entity_id)] = replace(change)
+
+    async def save_attempts(self, change: PendingChange) -> None:
+        row = self.rows[(change.entity_type, change.entity_id)]
+        row.attempts = change.attempts
+        row.last_error = change.last_error
+
+    async def delete(self, entity_type: str, entity_id: str) -> None:
+        self.rows.pop((entity_type, entity_id), None)
+
+    async def clear(self) -> None:
+        self.rows.clear()
+
+
+class TestOfflineQueue:
+    """Test OfflineQueue."""
+
+    async def test_successive_updates_coalesce(self) -> None:
+        """Updates to one entity collapse into a single change."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:1", "create", b"a"))
+        await queue.put(change("urn:1", "update", b"bbb"))
+        await queue.put(change("urn:1", "update", b"cc", SyncPriority.HIGH))
+
+        [pending] = queue.ordered()
+        assert pending.action == "create"
+        assert pending.data == b"cc"
+        assert pending.priority == SyncPriority.HIGH
+        assert pending.id == "change-urn:1-create"
+        assert queue.bytes_pending == 2
+
+    async def test_create_then_delete_cancels(self) -> None:
+        """Deleting an entity that never reached the hub drops both changes."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:1", "create"))
+        await queue.put(change("urn:1", "delete", None))
+
+        assert len(queue) == 0
+        assert queue.bytes_pending == 0
+
+    async def test_delete_after_attempted_create_is_queued(self) -> None:
+        """A create that may have reached the hub is followed by a delete."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:1", "create"))
+        await queue.record_failure(queue.ordered()[0], "timeout")
+        await queue.put(change("urn:1", "delete", None))
+
+        [pending] = queue.ordered()
+        assert pending.action == "delete"
+
+    async def test_delete_during_in_flight_create_is_queued(self) -> None:
+        """A create the hub applies while a delete arrives is not left behind."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:1", "create"))
+        [in_flight] = queue.ordered()
+        await queue.checkout([in_flight])
+        await queue.put(change("urn:1", "delete", None))
+
+        # The hub applied the create; the delete must still be pushed
+        assert not await queue.acknowledge(in_flight)
+        [pending] = queue.ordered()
+        assert pending.action == "delete"
+        # Still known as sent when coalesced again, e.g. after a restart
+        await queue.put(change("urn:1", "create", b"x"))
+        await queue.put(change("urn:1", "delete", None))
+        assert queue.ordered()[0].action == "delete"
+
+    async def test_delete_then_create_becomes_update(self) -> None:
+        """Recreating a deleted entity updates it on the hub."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:1", "delete", None))
+        await queue.put(change("urn:1", "create", b"x"))
+
+        assert queue.ordered()[0].action == "update"
+
+    async def test_drain_order_is_priority_then_age(self) -> None:
+        """High-priority changes drain first, each priority in FIFO order."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:low", priority=SyncPriority.LOW))
+        await queue.put(change("urn:n1"))
+        await queue.put(change("urn:high", priority=SyncPriority.HIGH))
+        await queue.put(change("urn:n2"))
+
+        assert [c.entity_id for c in queue.ordered()] == [
+            "urn:high",
+            "urn:n1",
+            "urn:n2",
+            "urn:low",
+        ]
+
+    async def test_full_queue_evicts_oldest_low_priority(self) -> None:
+        """A full queue makes room by dropping the oldest low-priority change."""
+        queue = OfflineQueue(max_size=3)
+        await queue.put(change("urn:low1", data=b"1234", priority=SyncPriority.LOW))
+        await queue.put(change("urn:n1"))
+        await queue.put(change("urn:low2", priority=SyncPriority.LOW))
+
+        assert await queue.put(change("urn:n2"))
+        assert {c.entity_id for c in queue.ordered()} == {"urn:n1", "urn:low2", "urn:n2"}
+        assert queue.bytes_pending == 6
+
+        assert await queue.put(change("urn:n3"))
+        assert not await queue.put(change("urn:n4"))
+        assert len(queue) == 3
+
+    async def test_acknowledge_keeps_newer_coalesced_write(self) -> None:
+        """A write coalesced while the old one was in flight is not lost."""
+        queue = OfflineQueue(max_size=10)
+        await queue.put(change("urn:1", data=b"old"))
+        [in_flight] = queue.ordered()
+        await queue.put(change("urn:1", data=b"new"))
+
+        assert not await queue.acknowledge(in_flight)
+        assert queue.ordered()[0].data == b"new"
+
+        assert await queue.acknowledge(queue.ordered()[0])
+        assert len(queue) == 0
+
+    async def test_heaps_stay_bounded_under_priority_churn(self) -> None:
+        """Stale heap entries are compacted."""
+        queue = OfflineQueue(max_size=10)
+        for i in range(500):
+            await queue.put(change("urn:1", priority=SyncPriority.LOW))
+            await queue.put(change(f"urn:{i % 5}", priority=SyncPriority.HIGH))
+            await queue.acknowledge(queue.ordered()[0])
+
+        assert sum(len(h) for h in queue._heaps.values()) < 200
+
+    async def test_store_survives_restart(self) -> None:
+        """Queued changes are written through and restored on load."""
+        store = MemoryStore()
+        queue = OfflineQueue(max_size=10, store=store)
+        await queue.put(change("urn:1", data=b"aa"))
+        await queue.put(change("urn:2", "create", b"b"))
+        await queue.put(change("urn:2", "delete", None))
+        await queue.put(change("urn:3", data=b"ccc"))
+
+        restored = OfflineQueue(max_size=10, store=store)
+        assert await restored.load() == 2
+        assert [c.entity_id for c in restored.ordered()] == ["urn:1", "urn:3"]
+        assert restored.bytes_pending == 5
+
+    async def test_store_backed_queue_keeps_payloads_out_of_memory(self) -> None:
+        """Only metadata is held in memory; checkout reads payloads back."""
+        store = MemoryStore()
+        queue = OfflineQueue(max_size=10, store=store)
+        await queue.put(change("urn:1", data=b"aa"))
+        await queue.put(change("urn:2", "create", b"bbb"))
+        await queue.put(change("urn:2", "update", b"cccc"))
+
+        assert [c.data for c in queue.ordered()] == [None, None]
+        assert queue.bytes_pending == 6
+
+        loaded = await queue.checkout(queue.ordered())
+        assert [(c.entity_id, c.action, c.data) for c in loaded] == [
+            ("urn:1", "update", b"aa"),
+            ("urn:2", "create", b"cccc"),
+        ]
+
+        await queue.record_failure(queue.ordered()[0], "timeout")
+        assert store.rows[("submodel", "urn:1")].data == b"aa"
+        assert store.rows[("submodel", "urn:1")].attempts == 1
+
+
+class TestEdgeControllerQueue:
+    """Test EdgeController integration with the offline queue."""
+
+    async def test_status_and_sync_drain_queue(self) -> None:
+        """Pushed changes are removed and failures are counted."""
+        store = MemoryStore()
+        controller = EdgeController(EdgeConfig(hub_url="http://hub"), store=store)
+        await controller.queue_change(change("urn:ok", data=b"123"))
+        await controller.queue_change(change("urn:fail", data=b"45"))
+
+        assert controller.status.pending_changes == 2
+        assert controller.status.bytes_pending == 5
+
+        async def push(client, pending):
+            # Payloads are read back from the store for the push
+            return pending.entity_id == "urn:ok" and pending.data == b"123"
+
+        controller._push_change = push  # type: ignore[method-assign]
+        controller._pull_from_hub = AsyncMock(return_value=0)  # type: ignore[method-assign]
+
+        result = await controller._sync_to_hub()
+
+        assert result["pushed"] == 1
+        [remaining] = controller.get_pending_changes()
+        assert remaining.entity_id == "urn:fail"
+        assert remaining.attempts == 1
+        assert list(store.rows) == [("submodel", "urn:fail")]
+
+        assert await controller.clear_pending() == 1
+        assert store.rows == {}
+
+
+class FakeHub:
+    """Minimal hub implementing the bulk change endpoint."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict] = {}
+        self.requests: list[list[dict]] = []
+
+    async def post(self, url: str, content: bytes, headers: dict) -> MagicMock:
+        payload = orjson.loads(decode_body(content, headers.get("Content-Encoding")))
+        self.requests.append(payload["changes"])
+        results = []
+        for wire in payload["changes"]:
+            entity_id = wire["entityId"]
+            if "patch" in wire:
+                current = self.docs.get(entity_id)
+                if current is None or etag_of(current) != wire["baseEtag"]:
+                    results.append({"changeId": wire["changeId"], "status": "base_mismatch"})
+                    continue
+                doc = apply_patch(copy.deepcopy(current), wire["patch"])
+            else:
+                doc = wire["doc"]
+            self.docs[entity_id] = doc
+            results.append(
+                {"changeId": wire["changeId"], "status": "applied", "etag": etag_of(doc)}
+            )
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"results": results}
+        return response
+
+
+def etag_of(doc: dict) -> str:
+    return generate_etag(orjson.dumps(doc))
+
+
+def sensor_submodel(value: str) -> bytes:
+    """A submodel with many properties, one of which changes."""
+    elements = [
+        {
+            "modelType": "Property",
+            "idShort": f"Sensor{i}",
+            "valueType": "xs:double",
+            "value": value if i == 0 else f"{i * 1.37:.3f}",
+        }
+        for i in range(200)
+    ]
+    return orjson.dumps({"modelType": "Submodel", "id": "urn:sm", "submodelElements": elements})
+
+
+class TestEdgeDeltaSync:
+    """Test compressed, delta-encoded batched pushes."""
+
+    def make_controller(self) -> EdgeController:
+        controller = EdgeController(EdgeConfig(hub_url="http://hub"))
+        controller._hub_capabilities = PeerCapabilities(
+            bulk_sync=True, delta_sync=True, sync_encodings=list(SUPPORTED_ENCODINGS)
+        )
+        controller._pull_from_hub = AsyncMock(return_value=0)  # type: ignore[method-assign]
+        return controller
+
+    async def test_value_change_sends_small_delta(self) -> None:
+        """After the first full push, value changes are sent as patches."""
+        controller = self.make_controller()
+        hub = FakeHub()
+
+        await controller.queue_change(change("urn:sm", "create", sensor_submodel("0")))
+        await controller._push_batched(hub, {"pushed": 0, "errors": []})
+        full_bytes = controller.status.bytes_sent
+
+        await controller.queue_change(change("urn:sm", "update", sensor_submodel("42")))
+        result = {"pushed": 0, "errors": []}
+        await controller._push_batched(hub, result)
+        delta_bytes = controller.status.bytes_sent - full_bytes
+        document_bytes = len(sensor_submodel("42"))
+
+        assert result["pushed"] == 1
+        assert "patch" in hub.requests[-1][0]
+        assert hub.docs["urn:sm"] == orjson.loads(sensor_submodel("42"))
+        # Previously every update uploaded the whole uncompressed document
+        assert document_bytes > 10 * delta_bytes
+        assert full_bytes < document_bytes
+        assert len(controller._pending_queue) == 0
+
+    async def test_base_mismatch_falls_back_to_full_document(self) -> None:
+        """A patch the hub cannot apply is resent with the full document."""
+        controller = self.make_controller()
+        hub = FakeHub()
+
+        await controller.queue_change(change("urn:sm", "create", sensor_submodel("0")))
+        await controller._push_batched(hub, {"pushed": 0, "errors": []})
+        hub.docs["urn:sm"]["idShort"] = "ChangedOnHub"
+
+        await controller.queue_change(change("urn:sm", "update", sensor_submodel("7")))
+        await controller._push_batched(hub, {"pushed": 0, "errors": []})
+
+        assert "patch" in hub.requests[-2][0]
+        assert hub.requests[-1][0]["doc"] is not None
+        assert hub.docs["urn:sm"] == orjson.loads(sensor_submodel("7"))
+        assert len(controller._pending_queue) == 0
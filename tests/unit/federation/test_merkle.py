@@ -0,0 +1,285 @@
+"""Tests for hash-tree anti-entropy."""
+
+from __future__ import annotations
+
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from titan.federation import FederationSync, SyncMode
+from titan.federation.edge import EdgeConfig, EdgeController
+from titan.federation.merkle import (
+    DatabaseMerkleIndex,
+    MerkleTree,
+    StaticMerkleIndex,
+    bucket_of,
+    entity_hash,
+    reconcile,
+)
+from titan.federation.peer import Peer, PeerCapabilities, PeerRegistry, PeerStatus
+from titan.tenancy.context import TenantScope, get_current_tenant
+
+
+def make_entries(count: int) -> dict[str, str]:
+    """Build identifier -> etag pairs."""
+    return {f"urn:example:sm:{i}": f"etag-{i}" for i in range(count)}
+
+
+class CountingIndex(StaticMerkleIndex):
+    """Static index that records how many nodes and buckets were requested."""
+
+    def __init__(self, entries: dict[str, dict[str, str]]) -> None:
+        super().__init__(entries)
+        self.node_requests = 0
+        self.nodes_requested = 0
+        self.buckets_requested = 0
+
+    async def nodes(self, entity_type: str, prefixes: list[str]) -> dict:
+        self.node_requests += 1
+        self.nodes_requested += len(prefixes)
+        return await super().nodes(entity_type, prefixes)
+
+    async def bucket_entries(self, entity_type: str, buckets: list[str]) -> dict[str, str]:
+        self.buckets_requested += len(buckets)
+        return await super().bucket_entries(entity_type, buckets)
+
+
+class TestMerkleTree:
+    """Test MerkleTree construction."""
+
+    def test_root_aggregates_all_entities(self) -> None:
+        """Root digest is the XOR of all entity hashes."""
+        entries = make_entries(100)
+        tree = MerkleTree.from_entries(entries.items())
+
+        expected = 0
+        for identifier, etag in entries.items():
+            expected ^= entity_hash(identifier, etag)
+
+        assert tree.root.digest == expected
+        assert tree.root.count == 100
+
+    def test_parent_is_xor_of_children(self) -> None:
+        """Every internal node aggregates its children."""
+        tree = MerkleTree.from_entries(make_entries(500).items())
+
+        for prefix in ["", "a", "3f"]:
+            children = tree.children(prefix)
+            digest = 0
+            for child in children.values():
+                digest ^= child.digest
+            assert digest == tree.node(prefix).digest
+            assert sum(c.count for c in children.values()) == tree.node(prefix).count
+
+    def test_order_independent(self) -> None:
+        """Insertion order does not affect the tree."""
+        entries = list(make_entries(50).items())
+        assert (
+            MerkleTree.from_entries(entries).root == MerkleTree.from_entries(reversed(entries)).root
+        )
+
+    def test_leaf_buckets_use_identifier_hash(self) -> None:
+        """Leaves are keyed by the md5 prefix of the identifier."""
+        tree = MerkleTree.from_entries([("urn:x", "e1")])
+        assert tree.node(bucket_of("urn:x")).count == 1
+        assert len(bucket_of("urn:x")) == tree.depth
+
+
+class TestReconcile:
+    """Test reconcile between two indexes."""
+
+    async def test_identical_repositories_exchange_only_root(self) -> None:
+        """Equal trees stop after comparing the root."""
+        entries = make_entries(1000)
+        local = CountingIndex({"submodel": dict(entries)})
+        remote = CountingIndex({"submodel": dict(entries)})
+
+        delta = await reconcile(local, remote, "submodel")
+
+        assert delta.is_empty
+        assert remote.node_requests == 1
+        assert remote.buckets_requested == 0
+
+    async def test_finds_changed_new_and_missing_entities(self) -> None:
+        """Changed, remote-only and local-only entities are reported."""
+        entries = make_entries(5000)
+        remote_entries = dict(entries)
+        remote_entries["urn:example:sm:7"] = "etag-7-v2"
+        remote_entries["urn:example:sm:new"] = "etag-new"
+        del remote_entries["urn:example:sm:42"]
+
+        local = CountingIndex({"submodel": entries})
+        remote = CountingIndex({"submodel": remote_entries})
+
+        delta = await reconcile(local, remote, "submodel")
+
+        assert delta.changed == {
+            "urn:example:sm:7": "etag-7-v2",
+            "urn:example:sm:new": "etag-new",
+        }
+        assert delta.local_etags == {"urn:example:sm:7": "etag-7"}
+        assert delta.missing_remote == {"urn:example:sm:42"}
+        # Only the differing buckets are listed, one request per tree level
+        assert remote.buckets_requested == len(delta.buckets) <= 3
+        assert remote.node_requests == 5
+
+    async def test_empty_local_repository(self) -> None:
+        """An empty local side pulls everything from the remote."""
+        remote = StaticMerkleIndex({"aas": make_entries(20)})
+        delta = await reconcile(StaticMerkleIndex({}), remote, "aas")
+
+        assert len(delta.changed) == 20
+
+
+class TestDatabaseMerkleIndex:
+    """Test the tree cache of the database index."""
+
+    def session_factory(self, leaves: dict[str, list[tuple[str, int, int]]]) -> MagicMock:
+        """Session factory whose leaf query returns the current tenant's rows."""
+
+        async def execute(query: object) -> MagicMock:
+            result = MagicMock()
+            result.all.return_value = [
+                MagicMock(bucket=bucket, digest=digest, cnt=cnt)
+                for bucket, digest, cnt in leaves[get_current_tenant()]
+            ]
+            return result
+
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=execute)
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        return factory
+
+    async def test_trees_are_cached_per_tenant(self) -> None:
+        """A tree built for one tenant is never served to another."""
+        factory = self.session_factory({"acme": [("0000", 1, 1)], "beta": [("ffff", 2, 3)]})
+        index = DatabaseMerkleIndex(factory, ttl=60)
+
+        with TenantScope("acme"):
+            acme = await index.tree("submodel")
+        with TenantScope("beta"):
+            beta = await index.tree("submodel")
+        with TenantScope("acme"):
+            again = await index.tree("submodel")
+
+        assert acme.root.count == 1
+        assert beta.root.count == 3
+        assert again is acme
+        assert factory.call_count == 2
+
+    async def test_invalidate_drops_trees_of_all_tenants(self) -> None:
+        """Invalidating an entity type forgets every tenant's tree."""
+        factory = self.session_factory({"acme": [("0000", 1, 1)], "beta": [("ffff", 2, 3)]})
+        index = DatabaseMerkleIndex(factory, ttl=60)
+        for tenant in ("acme", "beta"):
+            with TenantScope(tenant):
+                await index.tree("submodel")
+
+        index.invalidate("submodel")
+        with TenantScope("beta"):
+            await index.tree("submodel")
+
+        assert factory.call_count == 3
+
+
+class TestFederationSyncMerklePull:
+    """Test FederationSync pulling through the hash tree."""
+
+    async def test_pull_fetches_only_changed_entities(self) -> None:
+        """Only entities in differing buckets are fetched from the peer."""
+        entries = make_entries(200)
+        remote_entries = dict(entries)
+        remote_entries["urn:example:sm:3"] = "etag-3-v2"
+
+        registry = PeerRegistry()
+        peer = Peer(
+            id="peer1",
+            url="http://peer1.example.com",
+            status=PeerStatus.ONLINE,
+            capabilities=PeerCapabilities(merkle_sync=True),
+        )
+        registry.register(peer)
+        sync = FederationSync(
+            registry=registry,
+            mode=SyncMode.PULL,
+            merkle_index=StaticMerkleIndex({"submodel": entries}),
+        )
+
+        client = AsyncMock()
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"id": "urn:example:sm:3"}
+        client.get.return_value = response
+
+        with patch(
+            "titan.federation.sync.RemoteMerkleIndex",
+            return_value=StaticMerkleIndex({"submodel": remote_entries}),
+        ):
+            pulled, conflicts = await sync._pull_entity_type(client, peer, "submodel", "/submodels")
+
+        assert (pulled, conflicts) == (1, 0)
+        assert client.get.await_count == 1
+        assert client.get.await_args.args[0].startswith("http://peer1.example.com/submodels/")
+
+
+class TestEdgeMerklePull:
+    """Test EdgeController pulling through the hash tree."""
+
+    async def test_only_differing_entities_processed(self) -> None:
+        """Entities whose fetched ETag matches the local one are skipped."""
+        entries = make_entries(50)
+        remote_entries = dict(entries)
+        remote_entries["urn:example:sm:3"] = "etag-3-v2"
+        remote_entries["urn:example:sm:5"] = "etag-5-v2"
+
+        controller = EdgeController(EdgeConfig(hub_url="http://hub"))
+        controller.set_merkle_index(StaticMerkleIndex({"submodel": entries}))
+
+        async def get(url: str) -> MagicMock:
+            # sm:5 was reverted on the hub after the bucket listing
+            etag = "etag-5" if url.endswith(_b64("urn:example:sm:5")) else "etag-3-v2"
+            response = MagicMock(status_code=200, headers={"ETag": f'"{etag}"'})
+            response.json.return_value = {"id": "urn:example:sm:3"}
+            return response
+
+        client = AsyncMock()
+        client.get.side_effect = get
+        processed: list[dict] = []
+
+        async def process(entity_type: str, item: dict) -> None:
+            processed.append(item)
+
+        with (
+            patch(
+                "titan.federation.edge.RemoteMerkleIndex",
+                return_value=StaticMerkleIndex({"submodel": remote_entries}),
+            ),
+            patch.object(controller, "_process_pulled_item", side_effect=process),
+        ):
+            pulled = await controller._pull_entity_type_merkle(client, "submodel", "/submodels")
+
+        assert pulled == 1
+        assert processed == [{"id": "urn:example:sm:3", "_etag": "etag-3-v2"}]
+
+
+def _b64(identifier: str) -> str:
+    return base64.urlsafe_b64encode(identifier.encode()).decode().rstrip("=")
+
+
+class TestFederationRouterWiring:
+    """Test the app's federation sync singleton."""
+
+    def test_sync_uses_database_merkle_index(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The running app pulls through the hash tree when peers support it."""
+        from titan.api.routers import federation as router
+        from titan.federation.merkle import DatabaseMerkleIndex
+
+        monkeypatch.setattr(router, "_federation_sync", None)
+        monkeypatch.setattr(router, "_merkle_index", None)
+
+        sync = router.get_federation_sync()
+
+        assert isinstance(sync.merkle_index, DatabaseMerkleIndex)
+        assert sync.merkle_index is router.get_merkle_index()
@@ -1,5 +1,6 @@
 """Tests for federation synchronization."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -600,6 +601,166 @@ class TestFederationSyncPush:
         mock_client.delete.assert_called()
 
 
+class TestBulkPush:
+    """Test batched, concurrent push to peers."""
+
+    @pytest.fixture
+    def registry(self) -> PeerRegistry:
+        """Create a registry with two bulk-capable peers."""
+        registry = PeerRegistry()
+        for i in (1, 2):
+            registry.register(
+                Peer(
+                    id=f"peer{i}",
+                    url=f"http://peer{i}.example.com",
+                    status=PeerStatus.ONLINE,
+                    capabilities=PeerCapabilities(bulk_sync=True),
+                )
+            )
+        return registry
+
+    @staticmethod
+    def _bulk_client(fail_peer: str | None = None) -> AsyncMock:
+        """Mock client acknowledging every change in a bulk request."""
+        mock_client = AsyncMock()
+        mock_client.__aenter__.return_value = mock_client
+        mock_client.__aexit__.return_value = None
+
+        async def post(url: str, json: dict) -> MagicMock:
+            response = MagicMock()
+            if fail_peer and fail_peer in url:
+                response.status_code = 503
+                return response
+            response.status_code = 200
+            response.json.return_value = {
+                "results": [
+                    {"changeId": c["changeId"], "status": "applied"} for c in json["changes"]
+                ]
+            }
+            return response
+
+        mock_client.post.side_effect = post
+        return mock_client
+
+    @patch("titan.federation.sync.httpx.AsyncClient")
+    async def test_changes_are_batched(
+        self, mock_client_class: MagicMock, registry: PeerRegistry
+    ) -> None:
+        """Changes are pushed in batches of push_batch_size per peer."""
+        sync = FederationSync(registry=registry, mode=SyncMode.PUSH, push_batch_size=100)
+        for i in range(250):
+            sync.track_change("aas", f"urn:example:shell:{i}", "update", doc={"id": str(i)})
+
+        mock_client = self._bulk_client()
+        mock_client_class.return_value = mock_client
+
+        result = await sync.sync_once()
+
+        assert result["pushed"] == 500
+        assert result["peers_synced"] == 2
+        # 3 batches per peer, no per-change requests
+        assert mock_client.post.await_count == 6
+        assert mock_client.put.await_count == 0
+        for call in mock_client.post.await_args_list:
+            assert call.args[0].endswith("/federation/sync/changes")
+        assert len(sync.change_queue) == 0
+
+    @patch("titan.federation.sync.httpx.AsyncClient")
+    async def test_changes_kept_until_all_peers_acknowledge(
+        self, mock_client_class: MagicMock, registry: PeerRegistry
+    ) -> None:
+        """Changes stay queued when any peer failed to acknowledge them."""
+        sync = FederationSync(registry=registry, mode=SyncMode.PUSH)
+        sync.track_change("aas", "urn:example:shell:1", "update", doc={"id": "1"})
+
+        mock_client_class.return_value = self._bulk_client(fail_peer="peer2")
+
+        result = await sync.sync_once()
+
+        assert result["pushed"] == 1
+        assert len(sync.change_queue) == 1
+
+    @patch("titan.federation.sync.httpx.AsyncClient")
+    async def test_unacknowledged_changes_retried_with_delta_sync(
+        self, mock_client_class: MagicMock, registry: PeerRegistry
+    ) -> None:
+        """A failed peer's last_sync does not advance past undelivered changes."""
+        sync = FederationSync(registry=registry, mode=SyncMode.PUSH, delta_sync_enabled=True)
+        sync.track_change("aas", "urn:example:shell:1", "update", doc={"id": "1"})
+
+        mock_client_class.return_value = self._bulk_client(fail_peer="peer2")
+        await sync.sync_once()
+
+        assert registry.get("peer1").last_sync is not None
+        assert registry.get("peer2").last_sync is None
+
+        mock_client = self._bulk_client()
+        mock_client_class.return_value = mock_client
+        result = await sync.sync_once()
+
+        # Only peer2 still needed the change
+        assert result["pushed"] == 1
+        assert mock_client.post.await_args.args[0].startswith("http://peer2")
+        assert len(sync.change_queue) == 0
+
+    @patch("titan.federation.sync.httpx.AsyncClient")
+    async def test_changes_of_one_entity_arrive_in_order(
+        self, mock_client_class: MagicMock, registry: PeerRegistry
+    ) -> None:
+        """Concurrent lanes never reorder the changes of an entity."""
+        sync = FederationSync(
+            registry=registry, mode=SyncMode.PUSH, push_batch_size=1, max_in_flight_per_peer=4
+        )
+        for operation in ("create", "update", "delete"):
+            for i in range(8):
+                sync.track_change("aas", f"urn:example:shell:{i}", operation, doc={"id": str(i)})
+
+        received: list[tuple[str, str]] = []
+        delays = {"create": 0.03, "update": 0.01, "delete": 0.0}
+
+        async def post(url: str, json: dict) -> MagicMock:
+            [change] = json["changes"]
+            # Earlier operations are slower, so concurrent sends would reorder
+            await asyncio.sleep(delays[change["operation"]])
+            if url.startswith("http://peer1"):
+                received.append((change["entityId"], change["operation"]))
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "results": [{"changeId": change["changeId"], "status": "applied"}]
+            }
+            return response
+
+        mock_client = self._bulk_client()
+        mock_client.post.side_effect = post
+        mock_client_class.return_value = mock_client
+
+        await sync.sync_once()
+
+        assert len(received) == 24
+        for i in range(8):
+            operations = [op for entity, op in received if entity == f"urn:example:shell:{i}"]
+            assert operations == ["create", "update", "delete"]
+
+    @patch("titan.federation.sync.httpx.AsyncClient")
+    async def test_later_changes_wait_for_unacknowledged_change(
+        self, mock_client_class: MagicMock, registry: PeerRegistry
+    ) -> None:
+        """After a change fails, the entity's later changes are held back."""
+        sync = FederationSync(registry=registry, mode=SyncMode.PUSH, push_batch_size=1)
+        sync.track_change("aas", "urn:example:shell:1", "create", doc={"id": "1"})
+        sync.track_change("aas", "urn:example:shell:1", "delete")
+
+        mock_client = self._bulk_client(fail_peer="peer")
+        mock_client_class.return_value = mock_client
+
+        await sync.sync_once()
+
+        # One rejected create per peer; the delete was never sent
+        assert mock_client.post.await_count == 2
+        assert len(sync.change_queue) == 2
+
+
 class TestDeltaSync:
     """Test delta sync behavior."""
 
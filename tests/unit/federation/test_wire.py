@@ -0,0 +1,44 @@
+"""Tests for the compact sync wire format."""
+
+from __future__ import annotations
+
+import pytest
+
+from titan.federation.wire import (
+    SUPPORTED_ENCODINGS,
+    choose_encoding,
+    decode_body,
+    encode_body,
+)
+
+
+class TestBodyEncoding:
+    """Test body compression helpers."""
+
+    @pytest.mark.parametrize("encoding", [None, *SUPPORTED_ENCODINGS])
+    def test_round_trip(self, encoding: str | None) -> None:
+        """Encoded bodies decode to the JSON payload."""
+        payload = {"changes": [{"changeId": str(i)} for i in range(100)]}
+        body = encode_body(payload, encoding)
+
+        assert decode_body(body, encoding) == encode_body(payload, None)
+        if encoding:
+            assert len(body) < len(encode_body(payload, None))
+
+    def test_unsupported_encoding(self) -> None:
+        """Unknown encodings are rejected."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            decode_body(b"", "compress")
+
+    def test_decode_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Bodies that inflate past the limit are rejected."""
+        monkeypatch.setattr("titan.federation.wire.MAX_DECODED_SIZE", 1024)
+        body = encode_body({"x": "0" * 10_000}, "gzip")
+
+        with pytest.raises(ValueError, match="too large"):
+            decode_body(body, "gzip")
+
+    def test_choose_encoding_prefers_local_order(self) -> None:
+        """The first locally supported encoding offered by the peer wins."""
+        assert choose_encoding(["gzip", *SUPPORTED_ENCODINGS]) == SUPPORTED_ENCODINGS[0]
+        assert choose_encoding([]) is None
@@ -0,0 +1,18 @@
+"""GraphQL test fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from titan.graphql.query_cache import get_persisted_queries, get_query_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_query_cache() -> Iterator[None]:
+    """Keep cached results from leaking between tests with different mocks."""
+    get_query_cache().clear()
+    yield
+    get_query_cache().clear()
+    get_persisted_queries().clear()
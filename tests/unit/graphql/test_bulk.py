@@ -0,0 +1,137 @@
+"""Tests for set-based GraphQL bulk mutations."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from titan.graphql import schema
+from titan.graphql.dataloaders import DataLoaderContext
+
+CREATE_SHELLS = """
+    mutation Create($inputs: [ShellInput!]!) {
+        createShells(inputs: $inputs) { success shell { id } error { code } }
+    }
+"""
+
+DELETE_SHELLS = """
+    mutation Delete($ids: [String!]!) {
+        deleteShells(ids: $ids) { success id error { code } }
+    }
+"""
+
+
+def shell_input(identifier: str) -> dict[str, str]:
+    return {"id": identifier, "assetKind": "INSTANCE", "globalAssetId": "urn:asset"}
+
+
+@pytest.fixture
+def make_context(make_session) -> Callable[..., DataLoaderContext]:
+    """Factory for admin contexts whose successive executes return identifiers."""
+
+    def factory(*returned: list[str]) -> DataLoaderContext:
+        user = MagicMock()
+        user.roles = ["admin"]
+        return DataLoaderContext(make_session(*returned), user=user)
+
+    return factory
+
+
+@pytest.fixture
+def side_effects(monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, MagicMock]:
+    """Replace the Redis cache and event bus used after commit."""
+    cache = MagicMock()
+    cache.set_aas_many = AsyncMock()
+    cache.delete_aas_many = AsyncMock()
+    bus = MagicMock()
+    bus.publish_many = AsyncMock()
+    monkeypatch.setattr("titan.graphql.bulk.get_redis", AsyncMock())
+    monkeypatch.setattr("titan.graphql.bulk.RedisCache", lambda _client: cache)
+    monkeypatch.setattr("titan.graphql.bulk.get_event_bus", lambda: bus)
+    return cache, bus
+
+
+class TestCreateShells:
+    @pytest.mark.asyncio
+    async def test_one_precheck_and_one_insert(self, make_context, side_effects) -> None:
+        """Existing and in-batch duplicate IDs fail; the rest insert together."""
+        cache, bus = side_effects
+        # Pre-check finds urn:b; the insert returns urn:a and urn:c; then the
+        # asset-link index is replaced (one DELETE, one INSERT)
+        context = make_context(["urn:b"], ["urn:a", "urn:c"], [], [])
+        inputs = [shell_input(i) for i in ("urn:a", "urn:b", "urn:a", "urn:c")]
+
+        result = await schema.execute(
+            CREATE_SHELLS, variable_values={"inputs": inputs}, context_value=context
+        )
+
+        assert result.errors is None
+        items = result.data["createShells"]
+        assert [item["success"] for item in items] == [True, False, False, True]
+        assert items[1]["error"]["code"] == "DUPLICATE_ID"
+        assert items[2]["error"]["code"] == "DUPLICATE_ID"
+        assert context.session.execute.await_count == 4
+        context.session.flush.assert_not_called()
+        context.session.commit.assert_awaited_once()
+
+        cached = cache.set_aas_many.await_args.args[0]
+        assert len(cached) == 2
+        events = bus.publish_many.await_args.args[0]
+        assert [event.identifier for event in events] == ["urn:a", "urn:c"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_insert_reported_as_duplicate(
+        self, make_context, side_effects
+    ) -> None:
+        """An ID skipped by ON CONFLICT after the pre-check is a duplicate."""
+        cache, bus = side_effects
+        context = make_context([], ["urn:a"], [], [])
+        inputs = [shell_input("urn:a"), shell_input("urn:b")]
+
+        result = await schema.execute(
+            CREATE_SHELLS, variable_values={"inputs": inputs}, context_value=context
+        )
+
+        items = result.data["createShells"]
+        assert items[0]["success"] is True
+        assert items[1]["error"]["code"] == "DUPLICATE_ID"
+        assert items[1]["shell"] is None
+        assert len(cache.set_aas_many.await_args.args[0]) == 1
+        assert [event.identifier for event in bus.publish_many.await_args.args[0]] == ["urn:a"]
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_skips_side_effects(self, make_context, side_effects) -> None:
+        cache, bus = side_effects
+        context = make_context([], ["urn:a"], [], [])
+        context.session.commit.side_effect = RuntimeError("connection lost")
+
+        result = await schema.execute(
+            CREATE_SHELLS,
+            variable_values={"inputs": [shell_input("urn:a")]},
+            context_value=context,
+        )
+
+        assert result.data["createShells"][0]["error"]["code"] == "INTERNAL_ERROR"
+        cache.set_aas_many.assert_not_awaited()
+        bus.publish_many.assert_not_awaited()
+
+
+class TestDeleteShells:
+    @pytest.mark.asyncio
+    async def test_single_delete_statement(self, make_context, side_effects) -> None:
+        cache, bus = side_effects
+        # DELETE ... RETURNING, then the asset-link index cleanup
+        context = make_context(["urn:a"], [])
+
+        result = await schema.execute(
+            DELETE_SHELLS, variable_values={"ids": ["urn:a", "urn:x"]}, context_value=context
+        )
+
+        items = result.data["deleteShells"]
+        assert items[0] == {"success": True, "id": "urn:a", "error": None}
+        assert items[1]["error"]["code"] == "NOT_FOUND"
+        assert context.session.execute.await_count == 2
+        assert len(cache.delete_aas_many.await_args.args[0]) == 1
+        assert bus.publish_many.await_args.args[0][0].identifier == "urn:a"
@@ -0,0 +1,160 @@
+"""Tests for selection-aware GraphQL list execution."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from titan.graphql import schema
+from titan.graphql.dataloaders import DataLoaderContext
+from titan.graphql.execution import plan_shell_query, plan_submodel_query
+
+
+def make_context(docs: list[dict]) -> tuple[DataLoaderContext, AsyncMock]:
+    """Context whose session returns ``docs`` as projected rows."""
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = [
+        MagicMock(doc=doc, created_at=datetime(2026, 1, 1, i, tzinfo=UTC))
+        for i, doc in enumerate(docs)
+    ]
+    session.execute = AsyncMock(return_value=result)
+    return DataLoaderContext(session), session.execute
+
+
+def compiled_sql(execute: AsyncMock) -> str:
+    """SQL of the statement passed to session.execute."""
+    stmt = execute.await_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+SUBMODEL_DOC = {
+    "modelType": "Submodel",
+    "id": "urn:example:sm:1",
+    "idShort": "Nameplate",
+    "kind": "Instance",
+    "submodelElements": [
+        {"modelType": "Property", "idShort": "Serial", "valueType": "xs:string", "value": "42"}
+    ],
+}
+
+
+class TestPlans:
+    """Test mapping selections to load plans."""
+
+    def test_scalar_selection_skips_hydration(self) -> None:
+        plan = plan_submodel_query({"id", "idShort"})
+        assert plan.hydrate is False
+        assert plan.keys == ("id", "idShort")
+
+    def test_nested_selection_hydrates_narrowed_document(self) -> None:
+        plan = plan_submodel_query({"id", "semanticId"})
+        assert plan.hydrate is True
+        assert plan.keys == ("modelType", "id", "semanticId")
+
+    def test_shell_summary_includes_asset_information(self) -> None:
+        plan = plan_shell_query({"idShort", "submodels"})
+        assert plan.hydrate is False
+        assert plan.keys == ("id", "assetInformation", "idShort")
+
+    def test_unknown_field_loads_whole_document(self) -> None:
+        plan = plan_shell_query({"id", "somethingNew"})
+        assert plan.keys is None
+        assert plan.hydrate is True
+
+
+class TestSubmodelListExecution:
+    """Test the submodels resolver end to end against a mock session."""
+
+    @pytest.mark.asyncio
+    async def test_scalar_query_selects_only_requested_keys(self) -> None:
+        """Only requested keys are selected and Pydantic is not involved."""
+        ctx, execute = make_context([{"id": "urn:example:sm:1", "idShort": "Nameplate"}])
+        query = """
+            query {
+                submodels(semanticId: "urn:sem:1", idShort: "Nameplate") {
+                    edges { id ...Names }
+                }
+            }
+            fragment Names on Submodel { idShort }
+        """
+
+        with patch("titan.graphql.execution.PydanticSubmodel.model_validate") as validate:
+            result = await schema.execute(query, context_value=ctx)
+
+        assert result.errors is None
+        assert result.data["submodels"]["edges"] == [
+            {"id": "urn:example:sm:1", "idShort": "Nameplate"}
+        ]
+        validate.assert_not_called()
+
+        sql = compiled_sql(execute)
+        assert "jsonb_build_object" in sql
+        assert "submodels.semantic_id = " in sql
+        assert "submodels.doc @> " in sql
+        params = execute.await_args.args[0].compile(dialect=postgresql.dialect()).params
+        assert "submodelElements" not in params.values()
+
+    @pytest.mark.asyncio
+    async def test_element_query_hydrates(self) -> None:
+        """Selecting submodelElements validates and converts the document."""
+        ctx, _ = make_context([SUBMODEL_DOC])
+        query = """
+            query {
+                submodels {
+                    edges { id submodelElements { ... on Property { idShort value } } }
+                }
+            }
+        """
+
+        result = await schema.execute(query, context_value=ctx)
+
+        assert result.errors is None
+        assert result.data["submodels"]["edges"][0]["submodelElements"] == [
+            {"idShort": "Serial", "value": "42"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_from_extra_row(self) -> None:
+        """A limit+1 row signals another page."""
+        ctx, _ = make_context([{"id": f"urn:example:sm:{i}"} for i in range(3)])
+        query = "query { submodels(first: 2) { edges { id } pageInfo { hasNextPage endCursor } } }"
+
+        result = await schema.execute(query, context_value=ctx)
+
+        assert result.errors is None
+        assert len(result.data["submodels"]["edges"]) == 2
+        assert result.data["submodels"]["pageInfo"] == {
+            "hasNextPage": True,
+            "endCursor": "2026-01-01T01:00:00+00:00",
+        }
+
+
+class TestShellListExecution:
+    """Test the shells resolver end to end against a mock session."""
+
+    @pytest.mark.asyncio
+    async def test_asset_kind_filter_pushed_down(self) -> None:
+        """The assetKind filter becomes a JSONB containment predicate."""
+        ctx, execute = make_context(
+            [{"id": "urn:example:aas:1", "assetInformation": {"assetKind": "Type"}}]
+        )
+        query = """
+            query {
+                shells(assetKind: TYPE) { edges { id assetInformation { assetKind } } }
+            }
+        """
+
+        result = await schema.execute(query, context_value=ctx)
+
+        assert result.errors is None
+        assert result.data["shells"]["edges"] == [
+            {"id": "urn:example:aas:1", "assetInformation": {"assetKind": "TYPE"}}
+        ]
+        stmt = execute.await_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "aas.doc @> " in str(compiled)
+        assert {"assetInformation": {"assetKind": "Type"}} in compiled.params.values()
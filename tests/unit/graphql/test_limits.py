@@ -0,0 +1,113 @@
+"""Tests for GraphQL query cost and depth limits."""
+
+from __future__ import annotations
+
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import strawberry
+from graphql import parse
+
+from titan.graphql import schema
+from titan.graphql.dataloaders import DataLoaderContext
+from titan.graphql.limits import QueryCostLimiter, analyze_query
+from titan.graphql.schema import Mutation, Query
+
+NESTED_QUERY = """
+    query Nested($n: Int) {
+        shells(first: $n) {
+            edges {
+                id
+                submodels {
+                    id
+                    submodelElements { ... on Property { idShort } }
+                }
+            }
+            pageInfo { hasNextPage }
+        }
+    }
+"""
+
+
+def make_context() -> DataLoaderContext:
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    return DataLoaderContext(session)
+
+
+class TestAnalyzeQuery:
+    """Test the cost model."""
+
+    def test_page_size_multiplies_nested_lists(self) -> None:
+        """Cost grows with first and with each nested unpaginated list."""
+        document = parse(NESTED_QUERY)
+
+        small = analyze_query(schema._schema, document, variables={"n": 10}, default_list_size=10)
+        large = analyze_query(schema._schema, document, variables={"n": 100}, default_list_size=10)
+
+        # shells(1) + pageInfo(1) + edges(1 + n * submodels(1 + 10 * submodelElements(1)))
+        assert small.cost == 1 + 1 + 1 + 10 * (1 + 10 * 1)
+        assert large.cost == 1 + 1 + 1 + 100 * (1 + 10 * 1)
+        assert large.depth == 5
+
+    def test_unresolved_variable_uses_argument_default(self) -> None:
+        """Without a value, first falls back to the schema default (100)."""
+        document = parse(NESTED_QUERY)
+        cost = analyze_query(schema._schema, document, default_list_size=10)
+        assert cost.cost == 1 + 1 + 1 + 100 * (1 + 10 * 1)
+
+    def test_fragments_and_introspection(self) -> None:
+        """Fragment spreads are expanded; introspection is free."""
+        document = parse(
+            """
+            query { submodel(id: "x") { ...Fields } __schema { types { name } } }
+            fragment Fields on Submodel { id semanticId { keys { value } } }
+            """
+        )
+        cost = analyze_query(schema._schema, document, default_list_size=10)
+        # submodel(1 + semanticId(1 + keys(1 + 10 * 0)))
+        assert cost.cost == 3
+        assert cost.depth == 4
+
+
+class TestQueryCostLimiter:
+    """Test rejection before execution."""
+
+    @pytest.mark.asyncio
+    async def test_expensive_query_rejected(self) -> None:
+        """Queries over the cost limit are not executed."""
+        context = make_context()
+
+        result = await schema.execute(
+            NESTED_QUERY, variable_values={"n": 100000}, context_value=context
+        )
+
+        assert result.data is None
+        assert result.errors[0].extensions["code"] == "QUERY_TOO_COMPLEX"
+        context.session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deep_query_rejected(self) -> None:
+        """Queries nested beyond max_depth are rejected."""
+        limited = strawberry.Schema(
+            query=Query,
+            mutation=Mutation,
+            extensions=[partial(QueryCostLimiter, max_depth=3)],
+        )
+
+        result = await limited.execute(NESTED_QUERY, context_value=make_context())
+
+        assert result.errors[0].extensions["code"] == "QUERY_TOO_DEEP"
+
+    @pytest.mark.asyncio
+    async def test_cost_reported_in_extensions(self) -> None:
+        """Accepted queries report their estimated cost."""
+        result = await schema.execute(
+            "query { shells(first: 5) { edges { id } } }", context_value=make_context()
+        )
+
+        assert result.errors is None
+        assert result.extensions["cost"] == {"cost": 2, "depth": 3}
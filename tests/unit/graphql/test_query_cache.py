@@ -0,0 +1,214 @@
+"""Tests for GraphQL persisted queries and the result cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from titan.events.schemas import (
+    EventType,
+    PackageEvent,
+    PackageEventType,
+    SubmodelElementEvent,
+    SubmodelEvent,
+)
+from titan.graphql import schema
+from titan.graphql.dataloaders import DataLoaderContext
+from titan.graphql.query_cache import (
+    QueryResultCache,
+    ReadSet,
+    get_query_cache,
+    query_hash,
+)
+
+DASHBOARD_QUERY = "query Dashboard { submodels(first: 10) { edges { id idShort } } }"
+
+
+def make_context() -> DataLoaderContext:
+    """Context whose session returns one submodel row per query."""
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = [
+        MagicMock(
+            doc={"id": "urn:example:sm:1", "idShort": "Nameplate"},
+            created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+    ]
+    session.execute = AsyncMock(return_value=result)
+    return DataLoaderContext(session)
+
+
+def submodel_event(identifier: str) -> SubmodelEvent:
+    return SubmodelEvent(
+        event_type=EventType.UPDATED,
+        identifier=identifier,
+        identifier_b64="x",
+        etag="etag-2",
+    )
+
+
+class TestQueryResultCache:
+    """Test QueryResultCache bookkeeping."""
+
+    def test_entity_read_evicted_by_matching_event(self) -> None:
+        cache = QueryResultCache()
+        reads = ReadSet()
+        reads.add("submodel", "urn:a")
+        cache.put("k", {"x": 1}, reads, cache.generation())
+
+        assert cache.invalidate("submodel", "urn:b") == 0
+        assert cache.get("k") is not None
+        assert cache.invalidate("submodel", "urn:a") == 1
+        assert cache.get("k") is None
+
+    def test_type_read_evicted_by_any_event_of_type(self) -> None:
+        cache = QueryResultCache()
+        reads = ReadSet()
+        reads.add_type("aas")
+        cache.put("k", {"x": 1}, reads, cache.generation())
+
+        cache.invalidate("submodel", "urn:a")
+        assert cache.get("k") is not None
+        cache.invalidate("aas", "urn:new")
+        assert cache.get("k") is None
+
+    def test_result_computed_during_write_not_stored(self) -> None:
+        """A result started before an event for its entities is discarded."""
+        cache = QueryResultCache()
+        reads = ReadSet()
+        reads.add_type("submodel")
+        generation = cache.generation()
+
+        cache.invalidate("submodel", "urn:a")
+
+        assert cache.put("k", {"x": 1}, reads, generation) is False
+        assert len(cache) == 0
+
+    def test_lru_bound(self) -> None:
+        cache = QueryResultCache(max_entries=2)
+        reads = ReadSet(entity_types={"aas"})
+        for key in ("a", "b", "c"):
+            cache.put(key, {}, reads, cache.generation())
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_element_event_invalidates_parent_submodel(self) -> None:
+        cache = QueryResultCache()
+        reads = ReadSet()
+        reads.add("submodel", "urn:a")
+        cache.put("k", {}, reads, cache.generation())
+
+        await cache.handle_event(
+            SubmodelElementEvent(
+                event_type=EventType.UPDATED,
+                submodel_identifier="urn:a",
+                submodel_identifier_b64="x",
+                id_short_path="Serial",
+            )
+        )
+
+        assert cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_non_entity_events_are_ignored(self) -> None:
+        cache = QueryResultCache()
+        reads = ReadSet()
+        reads.add_type("submodel")
+        cache.put("k", {}, reads, cache.generation())
+
+        await cache.handle_event(
+            PackageEvent(event_type=PackageEventType.UPLOADED, package_id="pkg-1")
+        )
+
+        assert cache.get("k") is not None
+
+
+class TestResultCaching:
+    """Test caching through schema execution."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_is_cache_hit(self) -> None:
+        """The second identical query does not touch the database."""
+        context = make_context()
+
+        first = await schema.execute(DASHBOARD_QUERY, context_value=context)
+        second = await schema.execute(DASHBOARD_QUERY, context_value=make_context())
+
+        assert first.extensions["cacheHit"] is False
+        assert second.extensions["cacheHit"] is True
+        assert second.data == first.data
+        context.session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_event_invalidates_cached_result(self) -> None:
+        """An entity event for the listed type forces re-execution."""
+        await schema.execute(DASHBOARD_QUERY, context_value=make_context())
+
+        await get_query_cache().handle_event(submodel_event("urn:example:sm:1"))
+        context = make_context()
+        result = await schema.execute(DASHBOARD_QUERY, context_value=context)
+
+        assert result.extensions["cacheHit"] is False
+        context.session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_variables_are_part_of_key(self) -> None:
+        query = "query Q($n: Int) { submodels(first: $n) { edges { id } } }"
+        await schema.execute(query, variable_values={"n": 1}, context_value=make_context())
+
+        result = await schema.execute(query, variable_values={"n": 2}, context_value=make_context())
+
+        assert result.extensions["cacheHit"] is False
+
+    @pytest.mark.asyncio
+    async def test_mutation_clears_cache(self) -> None:
+        await schema.execute(DASHBOARD_QUERY, context_value=make_context())
+        assert len(get_query_cache()) == 1
+
+        await schema.execute(
+            'mutation { deleteSubmodel(id: "urn:example:sm:1") { success } }',
+            context_value=make_context(),
+        )
+
+        assert len(get_query_cache()) == 0
+
+
+class TestPersistedQueries:
+    """Test automatic persisted queries."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_hash_then_register(self) -> None:
+        """Unknown hashes ask for the query; afterwards the hash suffices."""
+        digest = query_hash(DASHBOARD_QUERY)
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": digest}}
+
+        missing = await schema.execute(
+            None, context_value=make_context(), operation_extensions=extensions
+        )
+        assert missing.errors[0].message == "PersistedQueryNotFound"
+        assert missing.errors[0].extensions["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+        registered = await schema.execute(
+            DASHBOARD_QUERY, context_value=make_context(), operation_extensions=extensions
+        )
+        assert registered.errors is None
+
+        by_hash = await schema.execute(
+            None, context_value=make_context(), operation_extensions=extensions
+        )
+        assert by_hash.errors is None
+        assert by_hash.data == registered.data
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_rejected(self) -> None:
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": "0" * 64}}
+
+        result = await schema.execute(
+            DASHBOARD_QUERY, context_value=make_context(), operation_extensions=extensions
+        )
+
+        assert result.errors[0].extensions["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
@@ -1,18 +1,31 @@
 """Tests for performance profiling."""
 
+import asyncio
+import time
+from typing import Any
+
+import orjson
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from titan.config import settings
+from titan.observability import profiling
 from titan.observability.profiling import (
+    OTHER_ENDPOINT,
+    SNAPSHOT_KEY,
     EndpointStats,
     ProfileCollector,
     ProfileStats,
     ProfilingMiddleware,
     RequestStats,
     get_collector,
+    load_cluster_endpoint_stats,
     profile_request,
+    publish_snapshot,
     reset_collector,
+    start_snapshot_publisher,
+    stop_snapshot_publisher,
 )
 
 
@@ -184,6 +197,48 @@ class TestProfileCollector:
         assert stats.total_requests == 0
         assert stats.cache_hits == 0
 
+    def test_endpoint_percentiles(self, collector: ProfileCollector) -> None:
+        """Each endpoint has its own latency percentiles."""
+        for i in range(100):
+            collector.record_request("/fast", "GET", 200, float(i + 1))
+            collector.record_request("/slow", "GET", 200, float(i + 1) * 10)
+
+        stats = {s.path: s for s in collector.get_endpoint_stats()}
+
+        assert stats["/fast"].percentile(99) == pytest.approx(99, rel=0.02)
+        assert stats["/slow"].percentile(99) == pytest.approx(990, rel=0.02)
+        assert stats["/slow"].percentile(50, recent=True) == pytest.approx(500, rel=0.02)
+
+    def test_max_endpoints(self) -> None:
+        """Endpoints beyond the limit are grouped under one entry."""
+        collector = ProfileCollector(max_endpoints=2)
+
+        for i in range(5):
+            collector.record_request(f"/path/{i}", "GET", 200, 1.0)
+
+        paths = {s.path: s.request_count for s in collector.get_endpoint_stats()}
+        assert paths == {"/path/0": 1, "/path/1": 1, OTHER_ENDPOINT: 3}
+        assert collector.get_stats().total_requests == 5
+
+    def test_merge_snapshots(self) -> None:
+        """Snapshots from several workers merge into cluster-wide stats."""
+        first, second = ProfileCollector(), ProfileCollector()
+        for i in range(50):
+            first.record_request("/shells", "GET", 200, float(i + 1))
+            second.record_request("/shells", "GET", 500, float(i + 51))
+
+        merged = ProfileCollector.merge_snapshots(
+            [orjson.loads(orjson.dumps(c.snapshot())) for c in (first, second)]
+        )
+
+        assert len(merged) == 1
+        shells = merged[0]
+        assert shells.request_count == 100
+        assert shells.error_count == 50
+        assert shells.min_duration_ms == 1.0
+        assert shells.percentile(99) == pytest.approx(99.5, abs=1)
+        assert shells.percentile(50, recent=True) == pytest.approx(50.5, abs=1)
+
     def test_max_history(self) -> None:
         """History is trimmed to max size."""
         collector = ProfileCollector(max_history=10)
@@ -194,6 +249,69 @@ class TestProfileCollector:
         assert len(collector._request_history) == 10
 
 
+class FakeRedis:
+    """Minimal in-memory stand-in for the snapshot hash."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, bytes]] = {}
+        self.writes = 0
+
+    async def hset(self, key: str, field: str, value: bytes) -> None:
+        self.writes += 1
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key: str) -> dict[str, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        self.writes += 1
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+
+class TestClusterSnapshots:
+    """Tests for publishing and merging instance snapshots."""
+
+    @pytest.fixture
+    def redis(self, monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+        fake = FakeRedis()
+
+        async def get_redis() -> Any:
+            return fake
+
+        monkeypatch.setattr("titan.cache.redis.get_redis", get_redis)
+        return fake
+
+    async def test_publish_prunes_stale_and_load_is_read_only(self, redis: FakeRedis) -> None:
+        """Publishers drop stopped instances; loading only reads."""
+        stale = {"timestamp": time.time() - 3600, "endpoints": []}
+        redis.hashes[SNAPSHOT_KEY] = {"gone": orjson.dumps(stale)}
+        collector = ProfileCollector()
+        collector.record_request("/shells", "GET", 200, 5.0)
+
+        await publish_snapshot(collector)
+        assert set(redis.hashes[SNAPSHOT_KEY]) == {settings.instance_id}
+
+        redis.hashes[SNAPSHOT_KEY]["gone"] = orjson.dumps(stale)
+        writes = redis.writes
+        stats = await load_cluster_endpoint_stats()
+
+        assert [(s.path, s.request_count) for s in stats] == [("/shells", 1)]
+        assert redis.writes == writes
+
+    async def test_publisher_publishes_periodically(self, redis: FakeRedis) -> None:
+        """The background publisher keeps the snapshot fresh."""
+        reset_collector()
+        start_snapshot_publisher(0.01)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await stop_snapshot_publisher()
+
+        assert redis.writes >= 2
+        assert profiling._publisher_task is None
+
+
 class TestGlobalCollector:
     """Tests for global collector functions."""
 
@@ -270,3 +388,21 @@ class TestProfilingMiddleware:
 
         stats = collector.get_stats()
         assert stats.total_errors == 1
+
+    def test_middleware_groups_by_route_template(self) -> None:
+        """Requests are recorded per route, not per concrete path."""
+        app = FastAPI()
+        collector = ProfileCollector()
+        app.add_middleware(ProfilingMiddleware, collector=collector)
+
+        @app.get("/shells/{shell_id}")
+        async def get_shell(shell_id: str) -> dict[str, str]:
+            return {"id": shell_id}
+
+        client = TestClient(app)
+        client.get("/shells/a")
+        client.get("/shells/b")
+
+        [endpoint] = collector.get_endpoint_stats()
+        assert endpoint.path == "/shells/{shell_id}"
+        assert endpoint.request_count == 2
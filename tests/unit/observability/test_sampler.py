@@ -0,0 +1,107 @@
+"""Tests for the sampling CPU profiler."""
+
+import asyncio
+import time
+
+import pytest
+
+from titan.observability.logging import request_scope_var
+from titan.observability.sampler import (
+    SPEEDSCOPE_SCHEMA,
+    SamplerBusyError,
+    StackSampler,
+    profile_cpu,
+    signal_mode_available,
+)
+
+
+def busy_work(seconds: float) -> int:
+    """Burn CPU in a recognizable frame."""
+    deadline = time.process_time() + seconds
+    total = 0
+    while time.process_time() < deadline:
+        total += sum(range(500))
+    return total
+
+
+async def profile_busy_task(mode: str, scope: dict | None = None) -> StackSampler:
+    async def handler() -> None:
+        if scope is not None:
+            request_scope_var.set(scope)
+        for _ in range(5):
+            busy_work(0.04)
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(handler(), name="busy-request")
+    sampler = StackSampler(interval=0.002, mode=mode)
+    sampler.start()
+    try:
+        await task
+    finally:
+        sampler.stop()
+    return sampler
+
+
+class TestStackSampler:
+    """Tests for StackSampler."""
+
+    def test_thread_mode_samples_task_stacks(self) -> None:
+        sampler = asyncio.run(profile_busy_task("thread"))
+
+        assert sampler.samples > 0
+        collapsed = sampler.to_collapsed()
+        assert "busy_work (" in collapsed
+        assert "[task] busy-request" in collapsed
+
+    @pytest.mark.skipif(not signal_mode_available(), reason="SIGPROF not available")
+    def test_signal_mode_labels_route(self) -> None:
+        route = type("Route", (), {"path": "/shells/{aas_identifier}"})()
+        scope = {"type": "http", "method": "GET", "path": "/shells/abc", "route": route}
+
+        sampler = asyncio.run(profile_busy_task("signal", scope))
+
+        assert sampler.samples > 0
+        hottest = sampler.to_collapsed().splitlines()[0]
+        assert hottest.startswith("[route] GET /shells/{aas_identifier};[task] busy-request;")
+        assert "busy_work (" in hottest
+
+    def test_collapsed_format(self) -> None:
+        sampler = StackSampler()
+        sampler.stacks[("main (app.py:1)", "handler (app.py:10)")] = 3
+        sampler.stacks[("main (app.py:1)", "a;b (app.py:20)")] = 1
+
+        assert sampler.to_collapsed() == (
+            "main (app.py:1);handler (app.py:10) 3\nmain (app.py:1);a,b (app.py:20) 1\n"
+        )
+
+    def test_speedscope_format(self) -> None:
+        sampler = StackSampler(interval=0.01)
+        sampler.stacks[("main", "handler")] = 3
+        sampler.stacks[("main", "other")] = 1
+
+        profile = sampler.to_speedscope()
+
+        assert profile["$schema"] == SPEEDSCOPE_SCHEMA
+        assert [f["name"] for f in profile["shared"]["frames"]] == ["main", "handler", "other"]
+        sampled = profile["profiles"][0]
+        assert sampled["samples"] == [[0, 1], [0, 2]]
+        assert sampled["weights"] == pytest.approx([0.03, 0.01])
+        assert sampled["endValue"] == pytest.approx(0.04)
+
+    def test_only_one_sampler_at_a_time(self) -> None:
+        async def run() -> None:
+            first = StackSampler(mode="thread")
+            first.start()
+            try:
+                with pytest.raises(SamplerBusyError):
+                    await profile_cpu(0.01, mode="thread")
+            finally:
+                first.stop()
+            # Released after stop
+            await profile_cpu(0.01, mode="thread")
+
+        asyncio.run(run())
+
+    def test_invalid_mode(self) -> None:
+        with pytest.raises(ValueError):
+            StackSampler(mode="perf")
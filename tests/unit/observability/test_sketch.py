@@ -0,0 +1,98 @@
+"""Tests for streaming quantile sketches."""
+
+import random
+
+import pytest
+
+from titan.observability.sketch import DDSketch, WindowedSketch
+
+
+def exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestDDSketch:
+    """Tests for DDSketch."""
+
+    def test_empty(self) -> None:
+        assert DDSketch().quantile(0.5) == 0.0
+
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99])
+    def test_relative_accuracy(self, q: float) -> None:
+        """Estimates stay within the configured relative error."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(2, 1) for _ in range(10000)]
+        sketch = DDSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        expected = exact_quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+    def test_min_max_and_zero(self) -> None:
+        sketch = DDSketch()
+        for value in (0.0, 5.0, 10.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0) == 0.0
+        assert sketch.quantile(1) == 10.0
+        assert sketch.zero_count == 1
+        assert sketch.avg == 5.0
+
+    def test_merge_matches_single_sketch(self) -> None:
+        """Merging per-worker sketches equals sketching all values at once."""
+        combined, first, second = DDSketch(), DDSketch(), DDSketch()
+        for i in range(1, 1001):
+            combined.add(float(i))
+            (first if i % 2 else second).add(float(i))
+
+        first.merge(second)
+
+        assert first.count == combined.count
+        assert first.bins == combined.bins
+        assert first.quantile(0.99) == combined.quantile(0.99)
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        with pytest.raises(ValueError):
+            DDSketch(0.01).merge(DDSketch(0.02))
+
+    def test_bins_are_bounded(self) -> None:
+        sketch = DDSketch(max_bins=16)
+        for i in range(1, 10000):
+            sketch.add(float(i))
+
+        assert len(sketch.bins) <= 16
+        assert sketch.quantile(0.99) == pytest.approx(9900, rel=0.01)
+
+    def test_round_trip(self) -> None:
+        sketch = DDSketch()
+        for i in range(100):
+            sketch.add(i * 0.5)
+
+        restored = DDSketch.from_dict(sketch.to_dict())
+
+        assert restored.bins == sketch.bins
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+        assert (restored.min, restored.max) == (sketch.min, sketch.max)
+
+
+class TestWindowedSketch:
+    """Tests for WindowedSketch."""
+
+    def test_old_intervals_expire(self) -> None:
+        window = WindowedSketch(interval=10, intervals=3)
+        window.add(1000.0, now=0)
+        window.add(1.0, now=25)
+
+        assert window.merged(now=25).count == 2
+        # t=0 slot is outside [10, 40)
+        assert window.merged(now=35).count == 1
+        assert window.merged(now=35).quantile(0.99) == pytest.approx(1.0, rel=0.01)
+
+    def test_wrapped_slot_is_cleared(self) -> None:
+        window = WindowedSketch(interval=10, intervals=2)
+        window.add(5.0, now=0)
+        window.add(7.0, now=20)  # Same slot as t=0, next epoch
+
+        assert window.merged(now=20).count == 1
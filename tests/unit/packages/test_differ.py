@@ -0,0 +1,249 @@
+"""Tests for element-level package version diffing."""
+
+from __future__ import annotations
+
+import copy
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from titan.compat.aasx import AasxPackage
+from titan.core.json_patch import apply_patch
+from titan.core.model import Submodel
+from titan.packages.differ import DiffCache, PackageDiffer, _canonical_doc, _diff_cache
+from titan.packages.element_diff import build_digest, diff_submodel_docs
+from titan.persistence.tables import AasxPackageTable
+
+
+def make_submodel(temperature: str = "25.0", extra: bool = False) -> dict:
+    """Build a canonical submodel document with nested collections."""
+    status = [
+        {
+            "modelType": "Property",
+            "idShort": f"Flag{i}",
+            "valueType": "xs:boolean",
+            "value": "true",
+        }
+        for i in range(50)
+    ]
+    elements = [
+        {
+            "modelType": "Property",
+            "idShort": "Temperature",
+            "valueType": "xs:double",
+            "value": temperature,
+        },
+        {"modelType": "SubmodelElementCollection", "idShort": "Status", "value": status},
+        {
+            "modelType": "SubmodelElementList",
+            "idShort": "Readings",
+            "typeValueListElement": "Property",
+            "valueTypeListElement": "xs:int",
+            "value": [
+                {"modelType": "Property", "valueType": "xs:int", "value": "1"},
+                {"modelType": "Property", "valueType": "xs:int", "value": "2"},
+            ],
+        },
+    ]
+    if extra:
+        elements.append(
+            {"modelType": "Property", "idShort": "Pressure", "valueType": "xs:int", "value": "7"}
+        )
+    return {
+        "modelType": "Submodel",
+        "id": "urn:example:submodel:1",
+        "idShort": "Sensors",
+        "submodelElements": elements,
+    }
+
+
+class TestElementDiff:
+    """Tests for diff_submodel_docs."""
+
+    def test_identical_documents_produce_no_operations(self) -> None:
+        """Equal documents yield an empty diff."""
+        assert diff_submodel_docs(make_submodel(), make_submodel()) == []
+
+    def test_identical_subtrees_share_digest(self) -> None:
+        """Unchanged collections have equal digests and are skipped."""
+        old = build_digest(make_submodel("1"))
+        new = build_digest(make_submodel("2"))
+
+        assert old.digest != new.digest
+        assert old.children[1].digest == new.children[1].digest
+
+    def test_value_change_emits_narrow_replace(self) -> None:
+        """Changing a property value only replaces that value."""
+        ops = diff_submodel_docs(make_submodel("25.0"), make_submodel("30.0"), "/submodels/0")
+
+        assert ops == [
+            {
+                "op": "replace",
+                "path": "/submodels/0/submodelElements/0/value",
+                "idShortPath": "Temperature",
+                "value": "30.0",
+            }
+        ]
+
+    def test_nested_collection_change(self) -> None:
+        """Changes inside collections are keyed by idShortPath."""
+        new = make_submodel()
+        new["submodelElements"][1]["value"][7]["value"] = "false"
+
+        ops = diff_submodel_docs(make_submodel(), new)
+
+        assert len(ops) == 1
+        assert ops[0]["idShortPath"] == "Status.Flag7"
+        assert ops[0]["path"] == "/submodelElements/1/value/7/value"
+
+    def test_added_and_removed_elements(self) -> None:
+        """Added and removed elements are reported as add/remove."""
+        ops = diff_submodel_docs(make_submodel(), make_submodel(extra=True))
+        assert ops[0]["op"] == "add"
+        assert ops[0]["idShortPath"] == "Pressure"
+        assert ops[0]["path"] == "/submodelElements/3"
+
+        ops = diff_submodel_docs(make_submodel(extra=True), make_submodel())
+        assert ops == [{"op": "remove", "path": "/submodelElements/3", "idShortPath": "Pressure"}]
+
+    def test_list_items_diffed_by_index(self) -> None:
+        """SubmodelElementList items are matched positionally."""
+        new = make_submodel()
+        new["submodelElements"][2]["value"][1]["value"] = "3"
+        new["submodelElements"][2]["value"].append(
+            {"modelType": "Property", "valueType": "xs:int", "value": "4"}
+        )
+
+        ops = diff_submodel_docs(make_submodel(), new)
+
+        assert [(op["op"], op["idShortPath"]) for op in ops] == [
+            ("replace", "Readings[1]"),
+            ("add", "Readings[2]"),
+        ]
+
+    def test_model_type_change_replaces_element(self) -> None:
+        """Switching a leaf to a container replaces the whole element."""
+        new = make_submodel()
+        new["submodelElements"][0] = {
+            "modelType": "SubmodelElementCollection",
+            "idShort": "Temperature",
+            "value": [],
+        }
+
+        ops = diff_submodel_docs(make_submodel(), new)
+
+        assert ops == [
+            {
+                "op": "replace",
+                "path": "/submodelElements/0",
+                "idShortPath": "Temperature",
+                "value": new["submodelElements"][0],
+            }
+        ]
+
+    def test_patch_applies_in_sequence(self) -> None:
+        """Paths follow the running index, so the patch rebuilds the target."""
+        old = make_submodel()
+        old["submodelElements"][1]["value"].insert(
+            0, {"modelType": "Property", "idShort": "Mode", "valueType": "xs:int", "value": "1"}
+        )
+        new = make_submodel("30.0", extra=True)
+        new["submodelElements"].insert(
+            0, {"modelType": "Property", "idShort": "Speed", "valueType": "xs:int", "value": "9"}
+        )
+        new["submodelElements"][2]["value"][3]["value"] = "false"
+        new["submodelElements"][2]["value"].insert(
+            10, {"modelType": "Property", "idShort": "Extra", "valueType": "xs:int", "value": "2"}
+        )
+        new["submodelElements"][1:4] = [new["submodelElements"][3], *new["submodelElements"][1:3]]
+
+        ops = diff_submodel_docs(old, new)
+
+        assert apply_patch(copy.deepcopy(old), ops) == new
+
+
+class TestDiffCache:
+    """Tests for DiffCache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Oldest entry is evicted when the cache is full."""
+        cache = DiffCache(max_entries=2)
+        cache.put(("a", "b"), [])
+        cache.put(("b", "c"), [])
+        cache.get(("a", "b"))
+        cache.put(("c", "d"), [])
+
+        assert cache.get(("a", "b")) == []
+        assert cache.get(("b", "c")) is None
+        assert len(cache) == 2
+
+    def test_returned_diff_is_a_copy(self) -> None:
+        """Mutating a returned diff does not change the cached entry."""
+        cache = DiffCache()
+        operations = [{"op": "replace", "path": "/a", "value": {"x": 1}}]
+        cache.put(("a", "b"), operations)
+        operations.clear()
+
+        first = cache.get(("a", "b"))
+        assert first is not None
+        first[0]["value"]["x"] = 2
+        first.append({"op": "remove", "path": "/b"})
+
+        assert cache.get(("a", "b")) == [{"op": "replace", "path": "/a", "value": {"x": 1}}]
+
+
+class TestPackageDifferDiff:
+    """Tests for PackageDiffer.diff."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        _diff_cache.clear()
+
+    async def test_diff_is_element_level_and_cached(self) -> None:
+        """Diff emits element operations and is only computed once per pair."""
+        differ = PackageDiffer()
+        pkg1 = AasxPackageTable(id="pkg-1", storage_uri="blob://v1", version=1)
+        pkg2 = AasxPackageTable(id="pkg-2", storage_uri="blob://v2", version=2)
+        parsed1 = AasxPackage(submodels=[Submodel.model_validate(make_submodel("1"))])
+        parsed2 = AasxPackage(submodels=[Submodel.model_validate(make_submodel("2"))])
+
+        differ._get_version_packages = AsyncMock(return_value=(pkg1, pkg2))  # type: ignore[method-assign]
+        differ.importer.import_from_stream = AsyncMock(side_effect=[parsed1, parsed2])  # type: ignore[method-assign]
+
+        with patch(
+            "titan.api.routers.aasx._retrieve_package", AsyncMock(return_value=b"")
+        ) as retrieve:
+            first = await differ.diff(AsyncMock(), "pkg-2", 1, 2)
+            second = await differ.diff(AsyncMock(), "pkg-2", 1, 2)
+
+        assert first == second
+        assert first is not second
+        assert first == [
+            {
+                "op": "replace",
+                "path": "/submodels/0/submodelElements/0/value",
+                "idShortPath": "Temperature",
+                "value": "2",
+            }
+        ]
+        assert retrieve.await_count == 2
+
+    def test_identifiable_patch_applies_in_sequence(self) -> None:
+        """Removed, added, reordered and modified submodels rebuild the target."""
+
+        def submodel(sm_id: str, temperature: str = "25.0") -> Submodel:
+            return Submodel.model_validate({**make_submodel(temperature), "id": sm_id})
+
+        old_items = [submodel("urn:a"), submodel("urn:b"), submodel("urn:c"), submodel("urn:d")]
+        new_items = [
+            submodel("urn:e"),
+            submodel("urn:d", "30.0"),
+            submodel("urn:a"),
+            submodel("urn:c", "40.0"),
+        ]
+
+        ops = PackageDiffer()._diff_identifiables("/submodels", old_items, new_items)
+
+        env = {"submodels": [_canonical_doc(item) for item in old_items]}
+        assert apply_patch(env, ops) == {"submodels": [_canonical_doc(item) for item in new_items]}
+        assert {"op": "remove", "path": "/submodels/1"} in ops
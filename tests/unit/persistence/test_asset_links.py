@@ -0,0 +1,259 @@
+"""Tests for the normalized asset-link discovery index."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from titan.core.model import AssetAdministrationShell
+from titan.core.model.registry import AssetAdministrationShellDescriptor
+from titan.persistence.asset_links import (
+    SOURCE_DESCRIPTOR,
+    SOURCE_SHELL,
+    AssetLinkIndex,
+    extract_asset_links,
+)
+from titan.persistence.registry import AasDescriptorRepository
+from titan.persistence.repositories import AasRepository
+from titan.persistence.tables import AssetLinkTable
+
+
+def statement(session: MagicMock, call: int = 0):
+    return session.execute.await_args_list[call].args[0]
+
+
+def compiled(session: MagicMock, call: int = 0) -> str:
+    return str(statement(session, call).compile(dialect=postgresql.dialect()))
+
+
+def make_shell(identifier: str, serial_number: str) -> AssetAdministrationShell:
+    return AssetAdministrationShell.model_validate(
+        {
+            "modelType": "AssetAdministrationShell",
+            "id": identifier,
+            "assetInformation": {
+                "assetKind": "Instance",
+                "globalAssetId": "urn:asset",
+                "specificAssetIds": [{"name": "serialNumber", "value": serial_number}],
+            },
+        }
+    )
+
+
+class MemoryAssetLinks:
+    """In-memory ``asset_links`` table fed by the statements the index executes.
+
+    Other statements go to the session's original ``execute`` mock.
+    """
+
+    def __init__(self, session: MagicMock) -> None:
+        self.rows: set[tuple[str, str, str, str]] = set()
+        self._execute = session.execute
+        session.execute = AsyncMock(side_effect=self.execute)
+
+    async def execute(self, stmt):
+        table = getattr(stmt, "table", None)
+        if getattr(table, "name", None) != AssetLinkTable.__tablename__:
+            return await self._execute(stmt)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        if stmt.is_insert:
+            count = sum(1 for key in params if key.startswith("id_m"))
+            self.rows.update(
+                (
+                    params[f"source_m{i}"],
+                    params[f"aas_identifier_m{i}"],
+                    params[f"name_m{i}"],
+                    params[f"value_m{i}"],
+                )
+                for i in range(count)
+            )
+        else:
+            self.rows = {
+                row
+                for row in self.rows
+                if row[0] != params["source_1"] or row[1] not in params["aas_identifier_1"]
+            }
+        return MagicMock()
+
+    def links(self, source: str, identifier: str) -> set[tuple[str, str]]:
+        return {(name, value) for s, i, name, value in self.rows if (s, i) == (source, identifier)}
+
+
+class TestExtractAssetLinks:
+    def test_descriptor_top_level_fields(self) -> None:
+        doc = {
+            "id": "urn:aas:1",
+            "globalAssetId": "urn:asset:1",
+            "specificAssetIds": [
+                {"name": "serialNumber", "value": "SN-1"},
+                {"name": "", "value": "ignored"},
+            ],
+        }
+
+        assert extract_asset_links(doc) == [
+            ("globalAssetId", "urn:asset:1"),
+            ("serialNumber", "SN-1"),
+        ]
+
+    def test_asset_information_is_merged_without_duplicates(self) -> None:
+        doc = {
+            "globalAssetId": "urn:asset:1",
+            "assetInformation": {
+                "globalAssetId": "urn:asset:1",
+                "specificAssetIds": [{"name": "partId", "value": "P-7"}],
+            },
+        }
+
+        assert extract_asset_links(doc) == [
+            ("globalAssetId", "urn:asset:1"),
+            ("partId", "P-7"),
+        ]
+
+    def test_missing_fields(self) -> None:
+        assert extract_asset_links({"id": "urn:aas:1", "specificAssetIds": None}) == []
+
+
+class TestLookup:
+    @pytest.mark.asyncio
+    async def test_single_query_for_all_links(self, make_session) -> None:
+        session = make_session(["urn:aas:2", "urn:aas:1"])
+        links = [("globalAssetId", "urn:asset:1"), ("serialNumber", "SN-1")]
+
+        found = await AssetLinkIndex(session).lookup(links, limit=10)
+
+        assert found == ["urn:aas:2", "urn:aas:1"]
+        session.execute.assert_awaited_once()
+        sql = compiled(session)
+        assert "FROM asset_links JOIN (VALUES" in sql
+        assert "GROUP BY asset_links.aas_identifier" in sql
+        assert "ORDER BY min(requested.ordinal)" in sql
+        assert "doc" not in sql
+        params = statement(session).compile(dialect=postgresql.dialect()).params
+        assert params["source_1"] == [SOURCE_DESCRIPTOR]
+        assert params["param_7"] == 10
+
+    @pytest.mark.asyncio
+    async def test_large_requests_are_chunked_and_merged(
+        self, make_session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("titan.persistence.bulk.BULK_CHUNK_SIZE", 2)
+        session = make_session(["urn:aas:1", "urn:aas:2"], ["urn:aas:2", "urn:aas:3"])
+        links = [("n", str(i)) for i in range(4)]
+
+        found = await AssetLinkIndex(session).lookup(links, limit=10)
+
+        assert found == ["urn:aas:1", "urn:aas:2", "urn:aas:3"]
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_once_limit_is_reached(
+        self, make_session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("titan.persistence.bulk.BULK_CHUNK_SIZE", 1)
+        session = make_session(["urn:aas:1"], ["urn:aas:2"])
+
+        found = await AssetLinkIndex(session).lookup([("n", "1"), ("n", "2")], limit=1)
+
+        assert found == ["urn:aas:1"]
+        session.execute.assert_awaited_once()
+
+
+class TestMaintenance:
+    @pytest.mark.asyncio
+    async def test_replace_deletes_then_inserts_multi_row(self, make_session) -> None:
+        session = make_session([], [])
+
+        await AssetLinkIndex(session).replace(
+            SOURCE_SHELL, {"urn:aas:1": [("globalAssetId", "urn:asset:1"), ("sn", "1")]}
+        )
+
+        assert "DELETE FROM asset_links" in compiled(session, 0)
+        insert = compiled(session, 1)
+        assert insert.count("INSERT INTO asset_links") == 1
+        assert "(%(id_m0)s" in insert and "(%(id_m1)s" in insert
+
+    @pytest.mark.asyncio
+    async def test_replace_with_no_links_only_removes(self, make_session) -> None:
+        session = make_session([])
+
+        await AssetLinkIndex(session).replace(SOURCE_DESCRIPTOR, {"urn:aas:1": []})
+
+        session.execute.assert_awaited_once()
+        assert "DELETE FROM asset_links" in compiled(session)
+
+
+class TestRepositoryHooks:
+    @pytest.mark.asyncio
+    async def test_shell_create_many_indexes_inserted_only(self, make_session) -> None:
+        # Insert returns urn:a only; then link DELETE and INSERT
+        session = make_session(["urn:a"], [], [])
+        shells = [make_shell(identifier, "SN-1") for identifier in ("urn:a", "urn:b")]
+
+        await AasRepository(session).create_many(shells)
+
+        rows = statement(session, 2).compile(dialect=postgresql.dialect()).params
+        identifiers = {v for k, v in rows.items() if k.startswith("aas_identifier_m")}
+        assert identifiers == {"urn:a"}
+        assert rows["source_m0"] == SOURCE_SHELL
+
+    @pytest.mark.asyncio
+    async def test_shell_delete_many_removes_links(self, make_session) -> None:
+        session = make_session(["urn:a"], [])
+
+        deleted = await AasRepository(session).delete_many(["urn:a", "urn:x"])
+
+        assert deleted == {"urn:a"}
+        cleanup = statement(session, 1).compile(dialect=postgresql.dialect())
+        assert "DELETE FROM asset_links" in str(cleanup)
+        assert cleanup.params["aas_identifier_1"] == ["urn:a"]
+
+
+class TestLinksFollowWrites:
+    """Index contents after repository writes."""
+
+    @pytest.mark.asyncio
+    async def test_shell_update_replaces_links(self, make_session) -> None:
+        """Updating a shell drops its old links, including under a renamed ID."""
+        # One SELECT for the row being updated; link statements hit the table
+        session = make_session([])
+        table = MemoryAssetLinks(session)
+        repo = AasRepository(session)
+        await repo.create(make_shell("urn:a", "SN-1"))
+        await repo.create(make_shell("urn:b", "SN-1"))
+
+        await repo.update("urn:a", make_shell("urn:a2", "SN-2"))
+
+        assert table.links(SOURCE_SHELL, "urn:a") == set()
+        assert table.links(SOURCE_SHELL, "urn:a2") == {
+            ("globalAssetId", "urn:asset"),
+            ("serialNumber", "SN-2"),
+        }
+        assert ("serialNumber", "SN-1") in table.links(SOURCE_SHELL, "urn:b")
+
+    @pytest.mark.asyncio
+    async def test_descriptor_update_keeps_shell_links(self, make_session) -> None:
+        """Replacing descriptor links leaves the shell links of the same AAS alone."""
+        session = make_session([])
+        table = MemoryAssetLinks(session)
+        await AasRepository(session).create(make_shell("urn:a", "SN-1"))
+        repo = AasDescriptorRepository(session)
+        await repo.create(
+            AssetAdministrationShellDescriptor.model_validate(
+                {"id": "urn:a", "globalAssetId": "urn:asset:old"}
+            )
+        )
+
+        await repo.update(
+            "urn:a",
+            AssetAdministrationShellDescriptor.model_validate(
+                {"id": "urn:a", "globalAssetId": "urn:asset:new"}
+            ),
+        )
+
+        assert table.links(SOURCE_DESCRIPTOR, "urn:a") == {("globalAssetId", "urn:asset:new")}
+        assert table.links(SOURCE_SHELL, "urn:a") == {
+            ("globalAssetId", "urn:asset"),
+            ("serialNumber", "SN-1"),
+        }
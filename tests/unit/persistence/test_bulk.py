@@ -0,0 +1,171 @@
+"""Tests for set-based bulk persistence helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from titan.api.routers.registry import _bulk_upsert
+from titan.core.model import AssetAdministrationShell
+from titan.core.model.registry import AssetAdministrationShellDescriptor
+from titan.persistence.bulk import chunked, delete_identifiers, existing_identifiers, insert_rows
+from titan.persistence.repositories import AasRepository
+from titan.persistence.tables import AasTable
+
+
+def compiled(session: MagicMock, call: int = 0) -> str:
+    stmt = session.execute.await_args_list[call].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def make_shell(identifier: str) -> AssetAdministrationShell:
+    return AssetAdministrationShell.model_validate(
+        {
+            "modelType": "AssetAdministrationShell",
+            "id": identifier,
+            "assetInformation": {"assetKind": "Instance", "globalAssetId": "urn:asset"},
+        }
+    )
+
+
+def make_descriptor(identifier: str, id_short: str = "v1") -> AssetAdministrationShellDescriptor:
+    return AssetAdministrationShellDescriptor.model_validate(
+        {"id": identifier, "idShort": id_short}
+    )
+
+
+class MemoryDescriptorRepository:
+    """Descriptor repository backed by a dict.
+
+    Identifiers in ``created_concurrently`` appear between the pre-check and
+    the insert, like rows committed by a concurrent request.
+    """
+
+    def __init__(
+        self,
+        existing: Sequence[str] = (),
+        created_concurrently: Sequence[str] = (),
+    ) -> None:
+        self.rows: dict[str, AssetAdministrationShellDescriptor | None] = dict.fromkeys(existing)
+        self.created_concurrently = created_concurrently
+
+    async def existing_identifiers(self, identifiers: Sequence[str]) -> set[str]:
+        return {identifier for identifier in identifiers if identifier in self.rows}
+
+    async def create_many(
+        self, descriptors: Sequence[AssetAdministrationShellDescriptor]
+    ) -> set[str]:
+        for identifier in self.created_concurrently:
+            self.rows.setdefault(identifier, None)
+        inserted = {d.id for d in descriptors if d.id not in self.rows}
+        self.rows.update({d.id: d for d in descriptors if d.id in inserted})
+        return inserted
+
+    async def update(
+        self, identifier: str, descriptor: AssetAdministrationShellDescriptor
+    ) -> tuple[bytes, str] | None:
+        if identifier not in self.rows:
+            return None
+        self.rows[identifier] = descriptor
+        return b"", "etag"
+
+
+class TestChunked:
+    def test_splits_into_bounded_chunks(self) -> None:
+        assert [list(c) for c in chunked([1, 2, 3, 4, 5], 2)] == [[1, 2], [3, 4], [5]]
+
+
+class TestBulkStatements:
+    """One statement per chunk instead of one per item."""
+
+    @pytest.mark.asyncio
+    async def test_existing_identifiers_single_query(self, make_session) -> None:
+        session = make_session(["urn:a"])
+
+        found = await existing_identifiers(session, AasTable, ["urn:a", "urn:b"])
+
+        assert found == {"urn:a"}
+        session.execute.assert_awaited_once()
+        assert "aas.identifier IN" in compiled(session)
+
+    @pytest.mark.asyncio
+    async def test_insert_rows_is_multi_row_on_conflict(self, make_session) -> None:
+        session = make_session(["urn:a", "urn:b"])
+        rows = [
+            {"identifier": f"urn:{x}", "identifier_b64": x, "doc": {}, "doc_bytes": b"", "etag": x}
+            for x in "ab"
+        ]
+
+        inserted = await insert_rows(session, AasTable, rows)
+
+        assert inserted == {"urn:a", "urn:b"}
+        sql = compiled(session)
+        assert sql.count("INSERT INTO aas") == 1
+        assert "ON CONFLICT DO NOTHING" in sql
+        assert "RETURNING aas.identifier" in sql
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(
+        self, make_session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("titan.persistence.bulk.BULK_CHUNK_SIZE", 2)
+        ids = ["urn:1", "urn:2", "urn:3"]
+        session = make_session(["urn:1"], ["urn:3"])
+
+        deleted = await delete_identifiers(session, AasTable, ids)
+
+        assert deleted == {"urn:1", "urn:3"}
+        assert session.execute.await_count == 2
+        assert "DELETE FROM aas" in compiled(session)
+
+
+class TestAasCreateMany:
+    @pytest.mark.asyncio
+    async def test_returns_bytes_and_etag_for_inserted_only(self, make_session) -> None:
+        """Identifiers lost to a concurrent insert are not reported as created."""
+        session = make_session(["urn:a"], [], [])
+        repo = AasRepository(session)
+
+        created = await repo.create_many([make_shell("urn:a"), make_shell("urn:b")])
+
+        assert set(created) == {"urn:a"}
+        doc_bytes, etag = created["urn:a"]
+        assert b'"urn:a"' in doc_bytes
+        assert len(etag) == 64
+        session.flush.assert_not_called()
+
+
+class TestBulkUpsert:
+    """Results of the registry ``$bulk`` upsert."""
+
+    @pytest.mark.asyncio
+    async def test_existing_and_repeated_identifiers_are_updated(self) -> None:
+        """Existing rows are updated and the last duplicate in a batch wins."""
+        repo = MemoryDescriptorRepository(existing=["urn:a"])
+        batch = [
+            make_descriptor("urn:a", "a2"),
+            make_descriptor("urn:b", "b1"),
+            make_descriptor("urn:b", "b2"),
+        ]
+
+        created, updated = await _bulk_upsert(repo, batch)
+
+        assert (created, updated) == (1, 2)
+        assert {i: d.id_short for i, d in repo.rows.items() if d} == {"urn:a": "a2", "urn:b": "b2"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_create_is_updated_not_lost(self) -> None:
+        """A row created after the pre-check is overwritten with the batch's descriptor."""
+        repo = MemoryDescriptorRepository(created_concurrently=["urn:c"])
+
+        created, updated = await _bulk_upsert(
+            repo, [make_descriptor("urn:c", "mine"), make_descriptor("urn:d")]
+        )
+
+        assert (created, updated) == (1, 1)
+        descriptor = repo.rows["urn:c"]
+        assert descriptor is not None
+        assert descriptor.id_short == "mine"
@@ -0,0 +1,124 @@
+"""Tests for SQLAlchemy statement and pool instrumentation."""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from titan.persistence import instrumentation
+from titan.persistence.instrumentation import (
+    OTHER,
+    analyze_statement,
+    get_route_query_stats,
+    get_statement_stats,
+    instrument_engine,
+    observe_statement,
+    query_budget,
+    reset_statistics,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_statistics() -> Iterator[None]:
+    reset_statistics()
+    yield
+    reset_statistics()
+
+
+class TestAnalyzeStatement:
+    """Tests for statement fingerprinting."""
+
+    def test_parameters_and_literals_normalized(self) -> None:
+        first = analyze_statement("SELECT * FROM aas WHERE id = $1 AND kind = 'Instance'")
+        second = analyze_statement("SELECT *  FROM aas\nWHERE id = $2 AND kind = 'Type'")
+
+        assert first.fingerprint == second.fingerprint
+        assert first.text == "SELECT * FROM aas WHERE id = ? AND kind = ?"
+        assert (first.operation, first.table) == ("select", "aas")
+
+    def test_in_lists_collapse(self) -> None:
+        short = analyze_statement("SELECT id FROM submodels WHERE id IN ($1, $2)")
+        long = analyze_statement("SELECT id FROM submodels WHERE id IN ($1, $2, $3, $4, $5)")
+
+        assert short.fingerprint == long.fingerprint
+
+    def test_values_rows_collapse(self) -> None:
+        one = analyze_statement("INSERT INTO asset_links (a, b) VALUES ($1, $2)")
+        many = analyze_statement("INSERT INTO asset_links (a, b) VALUES ($1, $2), ($3, $4)")
+
+        assert one.fingerprint == many.fingerprint
+        assert (one.operation, one.table) == ("insert", "asset_links")
+
+
+class TestInstrumentEngine:
+    """Tests for engine listeners on a sync SQLite engine."""
+
+    def test_records_statements(self) -> None:
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        instrument_engine(engine)  # Idempotent
+
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT)"))
+            for i in range(3):
+                conn.execute(text("INSERT INTO items VALUES (:id, :name)"), {"id": i, "name": "x"})
+            rows = conn.execute(text("SELECT id, name FROM items")).fetchall()
+
+        assert len(rows) == 3
+        by_operation = {s.operation: s for s in get_statement_stats()}
+        insert = by_operation["insert"]
+        assert insert.calls == 3
+        assert insert.table == "items"
+        assert insert.bytes_sent > 0
+        assert by_operation["select"].calls == 1
+
+    def test_query_budget_flags_repeated_statements(self) -> None:
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+
+        with engine.connect() as conn, query_budget("/shells/{id}") as budget:
+            for i in range(12):
+                conn.execute(text("SELECT :id"), {"id": i})
+
+        assert budget.queries == 12
+        assert budget.repeated(10)[0][1] == 12
+
+        (route,) = get_route_query_stats()
+        assert route.path == "/shells/{id}"
+        assert route.requests == 1
+        assert route.repeated_requests == 1
+        assert route.worst_repetitions == 12
+
+    def test_statements_outside_budget_not_counted(self) -> None:
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+
+        with query_budget("/shells") as budget:
+            pass
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert budget.queries == 0
+        assert get_route_query_stats()[0].repeated_requests == 0
+
+    def test_metric_label_folds_untracked_fingerprints(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        labels: list[str] = []
+        monkeypatch.setattr(instrumentation, "MAX_TRACKED_STATEMENTS", 2)
+        monkeypatch.setattr(
+            instrumentation,
+            "record_db_statement",
+            lambda fingerprint, *args: labels.append(fingerprint),
+        )
+
+        for statement in (
+            "SELECT * FROM aas",
+            "SELECT * FROM submodels",
+            "SELECT * FROM concept_descriptions",
+            "SELECT * FROM packages",
+        ):
+            observe_statement(statement, 0.001, 1, 10, 10)
+
+        assert labels[2:] == [OTHER, OTHER]
+        assert len(set(labels)) == 3
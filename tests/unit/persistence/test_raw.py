@@ -0,0 +1,163 @@
+"""Tests for raw asyncpg prepared-statement reads."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncpg.exceptions import InvalidCachedStatementError
+
+from titan.config import settings
+from titan.persistence.instrumentation import get_statement_stats, reset_statistics
+from titan.persistence.raw import PREPARED_INFO_KEY, RawReader, RawStatement, positional
+from titan.persistence.repositories import (
+    AAS_PAGE,
+    SUBMODEL_BY_ID,
+    SUBMODEL_PAGE,
+    SubmodelRepository,
+)
+
+STATEMENT = RawStatement("titan_test", "SELECT doc_bytes, etag FROM submodels WHERE id = $1")
+
+
+def make_session(rows: list[tuple], driver: str = "asyncpg") -> tuple[MagicMock, MagicMock]:
+    """Mock session on a raw connection whose statements return ``rows``."""
+    prepared = MagicMock()
+    prepared.fetch = AsyncMock(return_value=rows)
+    raw = MagicMock()
+    raw.info = {}
+    raw.driver_connection.prepare = AsyncMock(return_value=prepared)
+    raw.driver_connection.is_in_transaction.return_value = False
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+
+    session = MagicMock()
+    session.get_bind.return_value.dialect.driver = driver
+    session.connection = AsyncMock(return_value=connection)
+    session.execute = AsyncMock()
+    return session, raw
+
+
+class TestPositional:
+    def test_rewrites_named_parameters(self) -> None:
+        sql = positional(
+            "WHERE a = :cursor AND b < :limit AND c::text = :cursor", ("cursor", "limit")
+        )
+
+        assert sql == "WHERE a = $1 AND b < $2 AND c::text = $1"
+
+    def test_page_statements_are_fully_positional(self) -> None:
+        assert ":cursor" not in AAS_PAGE.sql
+        assert "$3 AS text" in SUBMODEL_PAGE.sql
+        assert "::text" in SUBMODEL_PAGE.sql
+
+
+class TestRawReader:
+    def test_available_only_for_asyncpg(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        assert RawReader(make_session([])[0]).available
+        assert not RawReader(make_session([], driver="psycopg")[0]).available
+
+        monkeypatch.setattr(settings, "db_raw_reads", False)
+        assert not RawReader(make_session([])[0]).available
+
+    async def test_prepares_once_per_connection(self) -> None:
+        session, raw = make_session([(b"{}", "etag-1")])
+        reader = RawReader(session)
+
+        assert await reader.fetch_doc(STATEMENT, "urn:x") == (b"{}", "etag-1")
+        assert await reader.fetch_doc(STATEMENT, "urn:y") == (b"{}", "etag-1")
+
+        raw.driver_connection.prepare.assert_awaited_once_with(STATEMENT.sql, name="titan_test_0")
+        assert "titan_test" in raw.info[PREPARED_INFO_KEY].statements
+
+    async def test_invalidated_plan_is_reprepared_and_retried(self) -> None:
+        session, raw = make_session([])
+        prepared = raw.driver_connection.prepare.return_value
+        prepared.fetch.side_effect = [InvalidCachedStatementError("changed"), [(b"{}", "e")]]
+        reader = RawReader(session)
+
+        assert await reader.fetch(STATEMENT, "urn:x") == [(b"{}", "e")]
+
+        names = [call.kwargs["name"] for call in raw.driver_connection.prepare.await_args_list]
+        assert names == ["titan_test_0", "titan_test_1"]
+
+    async def test_invalidated_plan_in_transaction_retried_in_savepoint(self) -> None:
+        session, raw = make_session([])
+        driver = raw.driver_connection
+        driver.is_in_transaction.return_value = True
+        savepoint = driver.transaction.return_value
+        savepoint.__aenter__ = AsyncMock()
+        savepoint.__aexit__ = AsyncMock(return_value=False)
+        prepared = driver.prepare.return_value
+        prepared.fetch.side_effect = [InvalidCachedStatementError("changed"), [(b"{}", "e")]]
+        reader = RawReader(session)
+
+        assert await reader.fetch(STATEMENT, "urn:x") == [(b"{}", "e")]
+
+        names = [call.kwargs["name"] for call in driver.prepare.await_args_list]
+        assert names == ["titan_test_0", "titan_test_1"]
+        # The failed attempt's savepoint was rolled back, not the transaction
+        first_exit, second_exit = savepoint.__aexit__.await_args_list
+        assert first_exit.args[0] is InvalidCachedStatementError
+        assert second_exit.args[0] is None
+
+    async def test_no_savepoint_outside_transaction(self) -> None:
+        session, raw = make_session([(b"{}", "e")])
+
+        await RawReader(session).fetch(STATEMENT, "urn:x")
+
+        raw.driver_connection.transaction.assert_not_called()
+
+    async def test_fetch_docs_and_value(self) -> None:
+        session, _ = make_session([("urn:a", b"{}", "etag-a")])
+        reader = RawReader(session)
+
+        assert await reader.fetch_docs(STATEMENT, ["urn:a", "urn:b"]) == {
+            "urn:a": (b"{}", "etag-a")
+        }
+        assert await reader.fetch_value(STATEMENT, "urn:a") == "urn:a"
+
+    async def test_reported_to_instrumentation(self) -> None:
+        reset_statistics()
+        session, _ = make_session([(b"{}", "etag-1")])
+
+        await RawReader(session).fetch(STATEMENT, "urn:x")
+
+        (stats,) = get_statement_stats()
+        assert stats.calls == 1
+        assert stats.rows == 1
+        assert stats.table == "submodels"
+        reset_statistics()
+
+
+class TestRepositoryRawPath:
+    async def test_get_bytes_by_id_skips_orm(self) -> None:
+        session, raw = make_session([(b"{}", "etag-1")])
+
+        result = await SubmodelRepository(session).get_bytes_by_id("urn:x")
+
+        assert result == (b"{}", "etag-1")
+        session.execute.assert_not_awaited()
+        raw.driver_connection.prepare.assert_awaited_once_with(
+            SUBMODEL_BY_ID.sql, name=f"{SUBMODEL_BY_ID.name}_0"
+        )
+
+    async def test_get_bytes_many_binds_one_array(self) -> None:
+        session, raw = make_session([("urn:a", b"{}", "etag-a")])
+
+        result = await SubmodelRepository(session).get_bytes_many(["urn:a", "urn:b"])
+
+        assert result == {"urn:a": (b"{}", "etag-a")}
+        prepared = raw.driver_connection.prepare.return_value
+        prepared.fetch.assert_awaited_once_with(["urn:a", "urn:b"])
+
+    async def test_paged_listing_uses_prepared_page(self) -> None:
+        page = '{"result": [{"id": "urn:a"}], "paging_metadata": null}'
+        session, raw = make_session([(page,)])
+
+        result = await SubmodelRepository(session).list_paged_zero_copy(limit=10)
+
+        assert result.count == 1
+        assert result.next_cursor is None
+        prepared = raw.driver_connection.prepare.return_value
+        prepared.fetch.assert_awaited_once_with(None, 10, None)
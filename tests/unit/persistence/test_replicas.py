@@ -0,0 +1,120 @@
+"""Tests for read-replica routing."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from titan.persistence import db
+from titan.persistence.replicas import (
+    ReadRouting,
+    ReplicaSet,
+    format_lsn,
+    parse_lsn,
+    routing_var,
+)
+
+
+def make_replicas(*replayed: str | Exception) -> tuple[ReplicaSet, list[MagicMock]]:
+    """Replica set whose sessions report the given replay positions."""
+    replicas = ReplicaSet([])
+    sessions = []
+    for value in replayed:
+        session = MagicMock()
+        session.close = AsyncMock()
+        if isinstance(value, Exception):
+            session.scalar = AsyncMock(side_effect=value)
+        else:
+            session.scalar = AsyncMock(return_value=value)
+        sessions.append(session)
+    replicas._factories = [lambda s=s: s for s in sessions]
+    replicas._replayed = [0] * len(sessions)
+    replicas._skip_until = [0.0] * len(sessions)
+    return replicas, sessions
+
+
+class TestLsn:
+    def test_round_trip(self) -> None:
+        lsn = parse_lsn("16/B374D848")
+
+        assert lsn == (0x16 << 32) | 0xB374D848
+        assert format_lsn(lsn) == "16/B374D848"
+
+    @pytest.mark.parametrize("value", [None, "", "garbage", "zz/1"])
+    def test_invalid(self, value: str | None) -> None:
+        assert parse_lsn(value) is None
+
+
+class TestReplicaSet:
+    @pytest.mark.asyncio
+    async def test_round_robin_without_token(self) -> None:
+        replicas, sessions = make_replicas("0/1", "0/1")
+
+        assert await replicas.open_session() is sessions[0]
+        assert await replicas.open_session() is sessions[1]
+        assert await replicas.open_session() is sessions[0]
+        sessions[0].scalar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_replica_behind_token(self) -> None:
+        replicas, sessions = make_replicas("0/100", "0/300")
+
+        session = await replicas.open_session(min_lsn=parse_lsn("0/200"))
+
+        assert session is sessions[1]
+        sessions[0].close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_none_when_all_replicas_behind(self) -> None:
+        replicas, _ = make_replicas("0/100")
+
+        assert await replicas.open_session(min_lsn=parse_lsn("0/200")) is None
+
+    @pytest.mark.asyncio
+    async def test_replay_position_is_cached(self) -> None:
+        replicas, sessions = make_replicas("0/300")
+
+        await replicas.open_session(min_lsn=parse_lsn("0/200"))
+        await replicas.open_session(min_lsn=parse_lsn("0/250"))
+
+        sessions[0].scalar.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_replica_is_skipped(self) -> None:
+        replicas, sessions = make_replicas(OSError("down"), "0/300")
+
+        assert await replicas.open_session(min_lsn=1) is sessions[1]
+        assert await replicas.open_session(min_lsn=1) is sessions[1]
+        sessions[0].scalar.assert_awaited_once()
+
+
+class TestGetSession:
+    @pytest.mark.asyncio
+    async def test_read_requests_use_replica(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        replicas, sessions = make_replicas("0/1")
+        monkeypatch.setattr(db, "_replicas", replicas)
+
+        token = routing_var.set(ReadRouting(read_only=True))
+        try:
+            generator = db.get_session()
+            assert await anext(generator) is sessions[0]
+            await generator.aclose()
+        finally:
+            routing_var.reset(token)
+
+    @pytest.mark.asyncio
+    async def test_writes_use_primary(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        replicas, _ = make_replicas("0/1")
+        primary = MagicMock()
+        primary.close = AsyncMock()
+        monkeypatch.setattr(db, "_replicas", replicas)
+        monkeypatch.setattr(db, "get_session_factory", lambda: lambda: primary)
+
+        token = routing_var.set(ReadRouting(read_only=False))
+        try:
+            generator = db.get_session()
+            assert await anext(generator) is primary
+            await generator.aclose()
+        finally:
+            routing_var.reset(token)
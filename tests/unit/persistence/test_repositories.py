@@ -0,0 +1,77 @@
+"""Tests for repository fast-path query shapes."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from titan.persistence.repositories import (
+    AasRepository,
+    ConceptDescriptionRepository,
+    SubmodelRepository,
+)
+
+
+def selected_columns(stmt) -> set[str]:
+    """Return the column names in a statement's SELECT list."""
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    select_list = re.split(r"\s+FROM\s+", sql, maxsplit=1)[0].removeprefix("SELECT ")
+    return {re.sub(r"^\w+\.", "", col.strip()) for col in select_list.split(",")}
+
+
+def make_session(row=None) -> MagicMock:
+    """Mock session returning ``row`` for any query."""
+    result = MagicMock()
+    result.first.return_value = row
+    result.scalar_one_or_none.return_value = row
+    result.all.return_value = [row] if row is not None else []
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+REPOSITORIES = [AasRepository, SubmodelRepository, ConceptDescriptionRepository]
+
+
+class TestFastPathReads:
+    """Fast-path reads transfer only (doc_bytes, etag)."""
+
+    @pytest.mark.parametrize("repo_cls", REPOSITORIES)
+    @pytest.mark.parametrize("method", ["get_bytes", "get_bytes_by_id"])
+    async def test_selects_only_bytes_and_etag(self, repo_cls, method: str) -> None:
+        """The JSONB doc column is never selected."""
+        session = make_session(MagicMock(doc_bytes=b"{}", etag="etag-1"))
+
+        result = await getattr(repo_cls(session), method)("urn:x")
+
+        assert result == (b"{}", "etag-1")
+        stmt = session.execute.await_args.args[0]
+        assert selected_columns(stmt) == {"doc_bytes", "etag"}
+
+    @pytest.mark.parametrize("repo_cls", REPOSITORIES)
+    async def test_list_all_returns_stored_bytes(self, repo_cls) -> None:
+        """Listing returns stored bytes instead of re-serializing JSONB."""
+        session = make_session(MagicMock(doc_bytes=b'{"id":"urn:x"}', etag="etag-1"))
+
+        assert await repo_cls(session).list_all() == [(b'{"id":"urn:x"}', "etag-1")]
+        stmt = session.execute.await_args.args[0]
+        assert selected_columns(stmt) == {"doc_bytes", "etag"}
+
+
+class TestDeferredDocuments:
+    """Rows loaded for rewrite or delete skip the document columns."""
+
+    @pytest.mark.parametrize("repo_cls", REPOSITORIES)
+    async def test_delete_defers_documents(self, repo_cls) -> None:
+        """Delete loads the row without doc or doc_bytes."""
+        session = make_session(None)
+
+        assert await repo_cls(session).delete("urn:x") is False
+
+        columns = selected_columns(session.execute.await_args.args[0])
+        assert "doc" not in columns
+        assert "doc_bytes" not in columns
+        assert "identifier" in columns
@@ -6,6 +6,7 @@ Tests ABAC policies, engine, and common policy types.
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from ipaddress import ip_network
 from unittest.mock import MagicMock
 
 import pytest
@@ -16,6 +17,7 @@ from titan.security.abac import (
     AllowOwnerPolicy,
     CustomPolicy,
     IPAllowlistPolicy,
+    IPPrefixTrie,
     PolicyContext,
     PolicyDecision,
     PolicyResult,
@@ -494,3 +496,92 @@ class TestCreateDefaultEngine:
 
         assert result.decision == PolicyDecision.DENY
         assert result.policy_name == "tenant_isolation"
+
+
+class TestIPPrefixTrie:
+    """Tests for the IP allowlist prefix trie."""
+
+    def test_membership(self):
+        trie = IPPrefixTrie([ip_network("10.0.0.0/8"), ip_network("192.168.1.0/24")])
+
+        assert trie.contains("10.255.0.1")
+        assert trie.contains("192.168.1.77")
+        assert not trie.contains("192.168.2.1")
+        assert not trie.contains("::1")
+
+    def test_ipv6_and_host_routes(self):
+        trie = IPPrefixTrie([ip_network("2001:db8::/32"), ip_network("203.0.113.5/32")])
+
+        assert trie.contains("2001:db8::1")
+        assert trie.contains("203.0.113.5")
+        assert not trie.contains("203.0.113.6")
+
+    def test_invalid_address_raises(self):
+        with pytest.raises(ValueError):
+            IPPrefixTrie().contains("not-an-ip")
+
+
+class TestCompiledEvaluation:
+    """Tests for the policy index and decision cache."""
+
+    def test_policies_indexed_by_action_and_type(self, mock_user):
+        """Policies scoped to other actions are never evaluated."""
+        evaluator = MagicMock(
+            return_value=PolicyResult(decision=PolicyDecision.DENY, policy_name="deletes")
+        )
+        engine = ABACEngine(
+            policies=[CustomPolicy("deletes", evaluator, actions=[Action.DELETE])],
+            default_deny=False,
+        )
+
+        read = engine.evaluate(PolicyContext(user=mock_user, resource_type=ResourceType.AAS))
+        delete = engine.evaluate(
+            PolicyContext(user=mock_user, resource_type=ResourceType.AAS, action=Action.DELETE)
+        )
+
+        assert read.decision == PolicyDecision.ALLOW
+        assert delete.decision == PolicyDecision.DENY
+        evaluator.assert_called_once()
+
+    def test_cacheable_decision_memoized(self, mock_user):
+        evaluator = MagicMock(
+            return_value=PolicyResult(decision=PolicyDecision.ALLOW, policy_name="c")
+        )
+        engine = ABACEngine(policies=[CustomPolicy("c", evaluator, cacheable=True)])
+        ctx = PolicyContext(user=mock_user, resource_type=ResourceType.AAS, resource_id="a")
+
+        for _ in range(3):
+            assert engine.is_allowed(ctx)
+        engine.evaluate(
+            PolicyContext(user=mock_user, resource_type=ResourceType.AAS, resource_id="b")
+        )
+
+        assert evaluator.call_count == 2
+
+    def test_higher_priority_dynamic_policy_still_runs(self, mock_user):
+        """A cached ALLOW does not bypass an IP policy ranked before it."""
+        allow = CustomPolicy(
+            "c",
+            lambda _ctx: PolicyResult(decision=PolicyDecision.ALLOW, policy_name="c"),
+            priority=50,
+            cacheable=True,
+        )
+        engine = ABACEngine(policies=[allow, IPAllowlistPolicy(["10.0.0.0/8"])])
+
+        inside = PolicyContext(user=mock_user, resource_type=ResourceType.AAS, client_ip="10.1.1.1")
+        outside = PolicyContext(user=mock_user, resource_type=ResourceType.AAS, client_ip="8.8.8.8")
+
+        assert engine.is_allowed(inside)
+        assert not engine.is_allowed(outside)
+        assert len(engine.decision_cache) == 1
+
+    def test_policy_changes_clear_cache(self, mock_user):
+        engine = create_default_engine()
+        ctx = PolicyContext(
+            user=mock_user, resource_type=ResourceType.AAS, resource_owner=mock_user.sub
+        )
+        assert engine.is_allowed(ctx)
+
+        engine.remove_policy("allow_owner")
+
+        assert not engine.is_allowed(ctx)
@@ -0,0 +1,237 @@
+"""Tests for the batched audit pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Sequence
+from unittest.mock import MagicMock
+
+import pytest
+
+from titan.security.audit import AuditAction, AuditEvent, AuditLog, AuditResource
+from titan.security.audit_pipeline import (
+    AuditPipeline,
+    AuditSink,
+    OverflowPolicy,
+    PostgresAuditSink,
+    RotatingFileAuditSink,
+)
+
+
+class RecordingSink(AuditSink):
+    name = "recording"
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[AuditEvent]] = []
+        self.fail = fail
+
+    async def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        if self.fail:
+            raise RuntimeError("sink down")
+        self.batches.append(list(events))
+
+
+def event(resource_id: str = "urn:x") -> AuditEvent:
+    return AuditEvent(action=AuditAction.READ, resource=AuditResource.AAS, resource_id=resource_id)
+
+
+class TestAuditPipeline:
+    @pytest.mark.asyncio
+    async def test_events_written_in_batches(self) -> None:
+        sink = RecordingSink()
+        pipeline = AuditPipeline([sink], batch_size=2)
+
+        for i in range(5):
+            assert await pipeline.submit(event(str(i)))
+        await pipeline.flush()
+
+        assert [len(batch) for batch in sink.batches] == [2, 2, 1]
+        assert pipeline.stats.written == 5
+        assert pipeline.stats.batches == 3
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_tracks_enqueued_events(self) -> None:
+        pipeline = AuditPipeline([RecordingSink()], batch_size=10)
+
+        for i in range(3):
+            await pipeline.submit(event(str(i)))
+        assert pipeline.stats.queue_depth == 3
+
+        await pipeline.flush()
+        assert pipeline.stats.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_background_task_drains_on_interval(self) -> None:
+        sink = RecordingSink()
+        pipeline = AuditPipeline([sink], batch_size=100, flush_interval=0.01)
+        await pipeline.start()
+
+        await pipeline.submit(event())
+        await asyncio.sleep(0.05)
+        assert sink.batches == [[sink.batches[0][0]]]
+
+        await pipeline.submit(event())
+        await pipeline.stop()
+        assert pipeline.stats.written == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self) -> None:
+        sink = RecordingSink()
+        pipeline = AuditPipeline([sink], buffer_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+
+        for name in ("a", "b", "c"):
+            await pipeline.submit(event(name))
+        await pipeline.flush()
+
+        assert [e.resource_id for e in sink.batches[0]] == ["b", "c"]
+        assert pipeline.stats.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_newest(self) -> None:
+        sink = RecordingSink()
+        pipeline = AuditPipeline([sink], buffer_size=2, overflow=OverflowPolicy.DROP_NEWEST)
+
+        results = [await pipeline.submit(event(name)) for name in ("a", "b", "c")]
+        await pipeline.flush()
+
+        assert results == [True, True, False]
+        assert [e.resource_id for e in sink.batches[0]] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_space(self) -> None:
+        sink = RecordingSink()
+        pipeline = AuditPipeline(
+            [sink], buffer_size=1, batch_size=1, flush_interval=10, overflow=OverflowPolicy.BLOCK
+        )
+        await pipeline.start()
+
+        await pipeline.submit(event("a"))
+        await asyncio.wait_for(pipeline.submit(event("b")), timeout=1)
+        await pipeline.stop()
+
+        assert pipeline.stats.dropped == 0
+        assert pipeline.stats.written == 2
+
+    @pytest.mark.asyncio
+    async def test_sink_failure_counted_per_sink(self) -> None:
+        good = RecordingSink()
+        bad = RecordingSink(fail=True)
+        bad.name = "bad"
+        pipeline = AuditPipeline([bad, good])
+
+        await pipeline.submit(event())
+        await pipeline.flush()
+
+        assert pipeline.stats.sinks["bad"].failed == 1
+        assert pipeline.stats.sinks["bad"].pending == 1
+        assert pipeline.stats.sinks["recording"].written == 1
+        assert len(good.batches) == 1
+        # Not lost yet: the failed sink retries the batch
+        assert pipeline.stats.failed == 0
+
+        await pipeline.stop()
+
+        assert pipeline.stats.failed == 1
+        assert pipeline.stats.sinks["bad"].lost == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_retried_in_order_after_backoff(self) -> None:
+        sink = RecordingSink(fail=True)
+        pipeline = AuditPipeline([sink], batch_size=1, retry_backoff=0.02)
+
+        await pipeline.submit(event("a"))
+        await pipeline.flush()
+        sink.fail = False
+        # Still backing off: queued behind the failed batch, not written ahead of it
+        await pipeline.submit(event("b"))
+        await pipeline.flush()
+        assert sink.batches == []
+
+        await asyncio.sleep(0.03)
+        await pipeline.submit(event("c"))
+        await pipeline.flush()
+
+        assert [batch[0].resource_id for batch in sink.batches] == ["a", "b", "c"]
+        assert pipeline.stats.written == 3
+        assert pipeline.stats.failed == 0
+        assert pipeline.stats.sinks["recording"].pending == 0
+
+    @pytest.mark.asyncio
+    async def test_background_task_retries_without_new_events(self) -> None:
+        sink = RecordingSink(fail=True)
+        pipeline = AuditPipeline([sink], flush_interval=0.01, retry_backoff=0.01)
+        await pipeline.start()
+
+        await pipeline.submit(event("a"))
+        await asyncio.sleep(0.03)
+        sink.fail = False
+        await asyncio.sleep(0.05)
+
+        assert [batch[0].resource_id for batch in sink.batches] == ["a"]
+        await pipeline.stop()
+        assert pipeline.stats.written == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_queue_bounded_by_buffer_size(self) -> None:
+        sink = RecordingSink(fail=True)
+        pipeline = AuditPipeline([sink], buffer_size=2, batch_size=1)
+
+        for name in ("a", "b", "c"):
+            await pipeline.submit(event(name))
+            await pipeline.flush()
+
+        stats = pipeline.stats.sinks["recording"]
+        assert stats.pending == 2
+        assert stats.lost == 1
+        assert pipeline.stats.failed == 1
+
+
+class TestAuditLogIntegration:
+    @pytest.mark.asyncio
+    async def test_running_pipeline_replaces_synchronous_logging(self) -> None:
+        logger = MagicMock()
+        sink = RecordingSink()
+        pipeline = AuditPipeline([sink], flush_interval=10)
+        audit = AuditLog(logger=logger, pipeline=pipeline)
+        await pipeline.start()
+
+        await audit.log_data_access(AuditAction.READ, AuditResource.SUBMODEL, "urn:sm")
+
+        logger.log.assert_not_called()
+        assert pipeline.stats.enqueued == 1
+        await pipeline.stop()
+        assert sink.batches[0][0].resource_id == "urn:sm"
+
+    @pytest.mark.asyncio
+    async def test_stopped_pipeline_falls_back_to_logger(self) -> None:
+        logger = MagicMock()
+        audit = AuditLog(logger=logger, pipeline=AuditPipeline([RecordingSink()]))
+
+        await audit.log(action=AuditAction.LOGIN)
+
+        logger.log.assert_called_once()
+
+
+class TestSinks:
+    @pytest.mark.asyncio
+    async def test_file_sink_rotates(self, tmp_path) -> None:
+        path = tmp_path / "audit.log"
+        sink = RotatingFileAuditSink(str(path), max_bytes=600, backup_count=2)
+
+        for _ in range(3):
+            await sink.write_batch([event()])
+        await sink.close()
+
+        assert (tmp_path / "audit.log.1").exists()
+        lines = path.read_text().splitlines()
+        assert json.loads(lines[-1])["resource_id"] == "urn:x"
+
+    def test_postgres_record_matches_columns(self) -> None:
+        record = PostgresAuditSink.to_record(event("urn:r"))
+
+        assert len(record) == len(PostgresAuditSink.COLUMNS)
+        values = dict(zip(PostgresAuditSink.COLUMNS, record, strict=True))
+        assert values["action"] == "read"
+        assert values["resource_id"] == "urn:r"
+        assert json.loads(values["event"])["event_id"] == values["event_id"]
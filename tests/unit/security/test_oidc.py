@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 
 import pytest
-from jose import JWTError
+from jose import JWTError, jwt
 from jose.exceptions import ExpiredSignatureError
 
 from titan.security.oidc import InvalidTokenError, OIDCConfig, TokenValidator
@@ -127,3 +129,107 @@ async def test_get_jwks_fallback_to_cache(monkeypatch: pytest.MonkeyPatch) -> No
 
     jwks = await validator._get_jwks()
     assert jwks == {"keys": ["cached"]}
+
+
+def count_decodes(monkeypatch: pytest.MonkeyPatch, payload: dict[str, object]) -> dict[str, int]:
+    calls = {"count": 0}
+
+    def fake_decode(*_args: object, **_kwargs: object) -> dict[str, object]:
+        calls["count"] += 1
+        return payload
+
+    monkeypatch.setattr("titan.security.oidc.jwt.decode", fake_decode)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_verified_token_cache_skips_signature_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    validator = TokenValidator(OIDCConfig(issuer="https://issuer", audience="titan"))
+    validator._jwks = {"keys": []}
+    validator._jwks_fetched_at = datetime.now(UTC)
+    exp = int(datetime.now(UTC).timestamp()) + 600
+    calls = count_decodes(monkeypatch, {"sub": "alice", "exp": exp})
+
+    first = await validator.validate_token("token-a")
+    second = await validator.validate_token("token-a")
+    await validator.validate_token("token-b")
+
+    assert first is second
+    assert calls["count"] == 2
+
+
+def test_verified_token_cache_honours_exp_and_bound() -> None:
+    from titan.security.oidc import User, VerifiedTokenCache
+
+    cache = VerifiedTokenCache(max_entries=2, max_age=300)
+    cache.put(b"a", User(sub="a", claims={"exp": 1010}), now=1000)
+    cache.put(b"b", User(sub="b"), now=1000)
+    cache.put(b"expired", User(sub="x", claims={"exp": 999}), now=1000)
+
+    assert cache.get(b"a", now=1009) is not None
+    assert cache.get(b"a", now=1010) is None
+    assert cache.get(b"b", now=1299) is not None
+    assert cache.get(b"b", now=1300) is None
+    assert cache.get(b"expired", now=1000) is None
+
+    for key in (b"1", b"2", b"3"):
+        cache.put(key, User(sub="u"), now=1000)
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_jwks_refreshed_once_in_background(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Concurrent requests with stale keys are served immediately; one fetch runs."""
+    validator = TokenValidator(
+        OIDCConfig(issuer="https://issuer", audience="titan", jwks_cache_seconds=1)
+    )
+    validator._jwks = {"keys": ["old"]}
+    validator._jwks_fetched_at = datetime.now(UTC) - timedelta(seconds=120)
+    calls = {"count": 0}
+
+    async def fake_fetch(self: TokenValidator) -> dict[str, object]:
+        calls["count"] += 1
+        await asyncio.sleep(0)
+        self._jwks = {"keys": ["new"]}
+        self._jwks_fetched_at = datetime.now(UTC)
+        return self._jwks
+
+    monkeypatch.setattr(TokenValidator, "_fetch_jwks", fake_fetch)
+
+    results = await asyncio.gather(*(validator._get_jwks() for _ in range(10)))
+    assert all(result == {"keys": ["old"]} for result in results)
+
+    await validator._refresh_task
+    assert calls["count"] == 1
+    assert await validator._get_jwks() == {"keys": ["new"]}
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_forces_rate_limited_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    validator = TokenValidator(OIDCConfig(issuer="https://issuer", audience="titan"))
+    validator._jwks = {"keys": [{"kid": "k1"}]}
+    validator._jwks_fetched_at = datetime.now(UTC)
+    fetched: list[int] = []
+
+    async def fake_fetch(self: TokenValidator) -> dict[str, object]:
+        self._last_refresh = time.monotonic()
+        fetched.append(1)
+        self._jwks = {"keys": [{"kid": "k1"}, {"kid": "k2"}]}
+        return self._jwks
+
+    monkeypatch.setattr(TokenValidator, "_fetch_jwks", fake_fetch)
+    seen_keys: list[object] = []
+
+    def fake_decode(_token: str, keys: object, **_kwargs: object) -> dict[str, object]:
+        seen_keys.append(keys)
+        return {"sub": "alice"}
+
+    monkeypatch.setattr("titan.security.oidc.jwt.decode", fake_decode)
+
+    rotated = jwt.encode({"sub": "alice"}, "secret", headers={"kid": "k2"})
+    await validator.validate_token(rotated)
+    unknown = jwt.encode({"sub": "mallory"}, "secret", headers={"kid": "k9"})
+    await validator.validate_token(unknown)
+
+    assert len(fetched) == 1
+    assert seen_keys[0] == {"keys": [{"kid": "k1"}, {"kid": "k2"}]}
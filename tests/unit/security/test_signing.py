@@ -0,0 +1,125 @@
+"""Tests for streaming request signature verification."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from titan.security.signing import RequestSigner, SignatureMiddleware
+
+SECRET = "test-secret"
+
+
+def make_scope(headers: dict[str, str], path: str = "/api/upload") -> dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "server": ("testserver", 80),
+        "scheme": "http",
+        "root_path": "",
+    }
+
+
+def chunked_receive(chunks: list[bytes]):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    delivered: list[int] = []
+
+    async def receive() -> dict[str, Any]:
+        delivered.append(1)
+        return messages.pop(0)
+
+    return receive, delivered
+
+
+class ReadingApp:
+    """App that streams the body, recording the largest chunk it saw."""
+
+    def __init__(self) -> None:
+        self.received: list[bytes] = []
+        self.completed = False
+
+    async def __call__(self, scope, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise RuntimeError("client disconnected")
+            self.received.append(message["body"])
+            if not message.get("more_body"):
+                break
+        self.completed = True
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def run(app, scope, receive) -> list[dict[str, Any]]:
+    sent: list[dict[str, Any]] = []
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    await SignatureMiddleware(app, secret_key=SECRET, protected_paths=["/api/"])(
+        scope, receive, send
+    )
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_valid_signature_streams_body_through() -> None:
+    chunks = [b"a" * 1024, b"b" * 1024, b"c" * 10]
+    headers = RequestSigner(SECRET).sign_request("POST", "/api/upload", body=b"".join(chunks))
+    app = ReadingApp()
+    receive, _ = chunked_receive(chunks)
+
+    sent = await run(app, make_scope(headers), receive)
+
+    assert app.received == chunks
+    assert sent[0]["status"] == 201
+
+
+@pytest.mark.asyncio
+async def test_tampered_body_rejected_before_app_completes() -> None:
+    headers = RequestSigner(SECRET).sign_request("POST", "/api/upload", body=b"original")
+    app = ReadingApp()
+    receive, _ = chunked_receive([b"tam", b"pered"])
+
+    sent = await run(app, make_scope(headers), receive)
+
+    # The app saw the first chunk but never the final one
+    assert app.received == [b"tam"]
+    assert app.completed is False
+    assert sent[0]["status"] == 401
+
+
+@pytest.mark.asyncio
+async def test_missing_signature_rejected_without_reading_body() -> None:
+    app = ReadingApp()
+    receive, delivered = chunked_receive([b"x"])
+
+    sent = await run(app, make_scope({}), receive)
+
+    assert sent[0]["status"] == 401
+    assert delivered == []
+
+
+@pytest.mark.asyncio
+async def test_early_response_waits_for_verification() -> None:
+    """An app answering without reading the body cannot bypass verification."""
+
+    async def eager_app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"done"})
+
+    headers = RequestSigner(SECRET).sign_request("POST", "/api/upload", body=b"signed")
+    receive, delivered = chunked_receive([b"unsig", b"ned"])
+
+    sent = await run(eager_app, make_scope(headers), receive)
+
+    assert len(delivered) == 2
+    assert [m.get("status") for m in sent if m["type"] == "http.response.start"] == [401]
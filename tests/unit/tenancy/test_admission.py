@@ -0,0 +1,267 @@
+"""Tests for tenant admission control."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from titan.security import oidc
+from titan.security.oidc import User
+from titan.tenancy import admission
+from titan.tenancy.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    TenantQuota,
+    charge_tenant_cache,
+    current_tenant,
+)
+from titan.tenancy.context import TenantScope
+from titan.tenancy.middleware import (
+    TenantAdmissionMiddleware,
+    admission_rejected_exception_handler,
+)
+
+
+class TenantTokenValidator:
+    """Token validator whose tokens are the tenant ids."""
+
+    async def validate_token(self, token: str) -> User:
+        return User(sub="user", tenant_id=token)
+
+
+async def settle() -> None:
+    """Let woken waiters run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmission:
+    async def test_fast_path_within_capacity(self) -> None:
+        controller = AdmissionController(max_in_flight=2)
+
+        async with controller.admit("acme"):
+            assert controller.in_flight == 1
+        assert controller.in_flight == 0
+
+    async def test_per_tenant_concurrency_cap(self) -> None:
+        controller = AdmissionController(
+            max_in_flight=10, default_quota=TenantQuota(max_concurrency=1)
+        )
+        await controller.acquire("acme")
+
+        waiting = asyncio.create_task(controller.acquire("acme"))
+        await settle()
+        assert not waiting.done()
+
+        # Other tenants are not blocked by acme's cap
+        await asyncio.wait_for(controller.acquire("globex"), 1)
+
+        controller.release("acme")
+        await asyncio.wait_for(waiting, 1)
+
+    async def test_weighted_fair_order(self) -> None:
+        controller = AdmissionController(
+            max_in_flight=1,
+            default_quota=TenantQuota(max_concurrency=10),
+            quotas={"gold": TenantQuota(max_concurrency=10, weight=3)},
+        )
+        await controller.acquire("blocker")
+
+        order: list[str] = []
+
+        async def request(tenant: str) -> None:
+            await controller.acquire(tenant)
+            order.append(tenant)
+            controller.release(tenant)
+
+        tasks = [asyncio.create_task(request("bronze")) for _ in range(4)]
+        tasks += [asyncio.create_task(request("gold")) for _ in range(4)]
+        await settle()
+
+        controller.release("blocker")
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+
+        # Gold (weight 3) is served about three times as often while both wait
+        assert order[:4].count("gold") == 3
+
+    async def test_full_queue_rejected_with_429(self) -> None:
+        controller = AdmissionController(
+            max_in_flight=1, default_quota=TenantQuota(max_concurrency=1), max_queue=1
+        )
+        await controller.acquire("acme")
+        waiting = asyncio.create_task(controller.acquire("acme"))
+        await settle()
+
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await controller.acquire("acme")
+
+        assert exc.value.status_code == 429
+        waiting.cancel()
+
+    async def test_queue_timeout_rejected_with_503(self) -> None:
+        controller = AdmissionController(max_in_flight=1, queue_timeout=0.01)
+        await controller.acquire("acme")
+
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await controller.acquire("globex")
+
+        assert exc.value.status_code == 503
+        assert exc.value.retry_after == 1
+        assert controller.snapshot()["tenants"][1]["queued"] == 0
+
+
+class TestDbSessions:
+    async def test_sessions_limited_per_tenant(self) -> None:
+        controller = AdmissionController(
+            max_in_flight=10, default_quota=TenantQuota(max_concurrency=10, db_sessions=1)
+        )
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with controller.db_session("acme"):
+                entered.set()
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await entered.wait()
+
+        slot = controller.db_session("acme")
+        second = asyncio.create_task(slot.__aenter__())
+        await settle()
+        assert not second.done()
+
+        release.set()
+        await asyncio.wait_for(holder, 1)
+        await asyncio.wait_for(second, 1)
+        assert controller.snapshot()["tenants"][0]["dbSessions"] == 1
+
+        await slot.__aexit__(None, None, None)
+        assert controller.snapshot()["tenants"][0]["dbSessions"] == 0
+
+    async def test_slot_timeout_rejected_with_503(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from titan.config import settings
+
+        monkeypatch.setattr(settings, "db_pool_timeout", 0.01)
+        controller = AdmissionController(
+            max_in_flight=10, default_quota=TenantQuota(max_concurrency=10, db_sessions=1)
+        )
+
+        async with controller.db_session("acme"):
+            with pytest.raises(AdmissionRejectedError) as exc:
+                async with controller.db_session("acme"):
+                    pass
+
+        assert exc.value.status_code == 503
+        assert exc.value.retry_after == 1
+        assert controller.snapshot()["tenants"][0]["dbSessions"] == 0
+
+    def test_slot_timeout_served_as_503(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from titan.config import settings
+
+        monkeypatch.setattr(settings, "db_pool_timeout", 0.01)
+        controller = AdmissionController(
+            max_in_flight=10, default_quota=TenantQuota(max_concurrency=10, db_sessions=1)
+        )
+        controller._state("acme").db_sessions = 1
+
+        async def session() -> AsyncIterator[None]:
+            async with controller.db_session("acme"):
+                yield
+
+        app = FastAPI()
+        app.add_exception_handler(AdmissionRejectedError, admission_rejected_exception_handler)
+
+        @app.get("/test", dependencies=[Depends(session)])
+        async def endpoint() -> dict[str, str]:
+            return {}
+
+        response = TestClient(app).get("/test")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["messages"][0]["code"] == "ServiceUnavailable"
+
+
+class TestCacheQuota:
+    def test_rejects_writes_over_quota(self) -> None:
+        controller = AdmissionController(
+            max_in_flight=10,
+            default_quota=TenantQuota(max_concurrency=10, cache_bytes=100),
+            cache_window_seconds=60,
+        )
+
+        assert controller.charge_cache("acme", 80, now=0)
+        assert not controller.charge_cache("acme", 30, now=1)
+        assert controller.charge_cache("globex", 30, now=1)
+        # A new window resets the budget
+        assert controller.charge_cache("acme", 30, now=61)
+
+    def test_unlimited_without_quota(self) -> None:
+        controller = AdmissionController(max_in_flight=10)
+
+        assert controller.charge_cache("acme", 10**12)
+
+    def test_charges_explicit_tenant(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        controller = AdmissionController(
+            max_in_flight=10,
+            default_quota=TenantQuota(max_concurrency=10, cache_bytes=100),
+        )
+        monkeypatch.setattr(admission, "_controller", controller)
+
+        with TenantScope("globex"):
+            assert charge_tenant_cache(80, "acme")
+            assert not charge_tenant_cache(30, "acme")
+            # The scope tenant's budget is untouched
+            assert charge_tenant_cache(30)
+
+
+class TestTenantAdmissionMiddleware:
+    def make_app(self, controller: AdmissionController) -> FastAPI:
+        app = FastAPI()
+        app.add_middleware(TenantAdmissionMiddleware, controller=controller)
+
+        @app.get("/test")
+        async def endpoint() -> dict[str, str]:
+            return {"tenant": current_tenant()}
+
+        return app
+
+    def test_admits_request_as_token_tenant(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(oidc, "get_token_validator", lambda: TenantTokenValidator())
+        controller = AdmissionController(max_in_flight=1)
+        client = TestClient(self.make_app(controller))
+
+        response = client.get("/test", headers={"Authorization": "Bearer acme"})
+
+        assert response.json() == {"tenant": "acme"}
+        assert controller.in_flight == 0
+        assert controller.snapshot()["tenants"][0]["admitted"] == 1
+
+    def test_unauthenticated_requests_share_one_bucket(self) -> None:
+        """Made-up tenant headers do not buy extra admission slots."""
+        controller = AdmissionController(max_in_flight=10)
+        client = TestClient(self.make_app(controller))
+
+        for tenant in ("a", "b", "victim"):
+            response = client.get("/test", headers={"X-Tenant-ID": tenant})
+            assert response.json() == {"tenant": "default"}
+
+        [state] = controller.snapshot()["tenants"]
+        assert state["tenant"] == "default"
+        assert state["admitted"] == 3
+
+    def test_rejection_response(self) -> None:
+        controller = AdmissionController(max_in_flight=1, max_queue=0)
+        controller.in_flight = 1
+        client = TestClient(self.make_app(controller))
+
+        response = client.get("/test")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["messages"][0]["code"] == "TooManyRequests"
@@ -1,8 +1,11 @@
 """Tests for tenant isolation utilities."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from titan.tenancy.context import clear_tenant, set_tenant
+from titan.tenancy.admission import admission_tenant_var
+from titan.tenancy.context import TenantScope, clear_tenant, set_tenant
 from titan.tenancy.isolation import (
     RLS_POLICIES,
     RLSPolicy,
@@ -10,6 +13,7 @@ from titan.tenancy.isolation import (
     TenantIsolationError,
     ensure_tenant_field,
     get_rls_migration_sql,
+    set_transaction_tenant,
     validate_tenant_access,
 )
 
@@ -212,6 +216,23 @@ class TestRLSPolicy:
 
         assert "SET app.tenant_id = 'acme'" in sql
 
+    def test_default_tenant_fallback(self) -> None:
+        """Sessions without the variable fall back to the default tenant."""
+        policy = RLSPolicy(table_name="aas", default_tenant="default")
+
+        sql = policy.create_policy_sql()
+
+        assert "current_setting('app.tenant_id', true)" in sql
+        assert "'default')" in sql
+
+    def test_set_local_tenant_sql(self) -> None:
+        """set_local_tenant_sql binds the tenant transaction-locally."""
+        policy = RLSPolicy(table_name="aas")
+
+        sql = policy.set_local_tenant_sql()
+
+        assert sql == "SELECT set_config('app.tenant_id', :tenant_id, true)"
+
     def test_custom_policy_name(self) -> None:
         """Custom policy name is used."""
         policy = RLSPolicy(table_name="shells", policy_name="custom_policy")
@@ -224,10 +245,10 @@ class TestRLSPolicy:
 class TestRLSPolicies:
     """Tests for pre-defined RLS policies."""
 
-    def test_shells_policy_exists(self) -> None:
-        """shells policy is pre-defined."""
-        assert "shells" in RLS_POLICIES
-        assert RLS_POLICIES["shells"].table_name == "shells"
+    def test_aas_policy_exists(self) -> None:
+        """aas policy is pre-defined."""
+        assert "aas" in RLS_POLICIES
+        assert RLS_POLICIES["aas"].table_name == "aas"
 
     def test_submodels_policy_exists(self) -> None:
         """submodels policy is pre-defined."""
@@ -239,6 +260,14 @@ class TestRLSPolicies:
         assert "concept_descriptions" in RLS_POLICIES
         assert RLS_POLICIES["concept_descriptions"].table_name == "concept_descriptions"
 
+    def test_asset_links_policy_scopes_shell_links_only(self) -> None:
+        """Shell links are per tenant; descriptor links stay shared."""
+        sql = RLS_POLICIES["asset_links"].create_policy_sql()
+
+        assert "CREATE POLICY tenant_isolation ON asset_links" in sql
+        assert "USING (source <> 'shell' OR tenant_id = COALESCE(" in sql
+        assert "WITH CHECK (source <> 'shell' OR tenant_id = COALESCE(" in sql
+
 
 class TestGetRLSMigrationSQL:
     """Tests for get_rls_migration_sql function."""
@@ -247,9 +276,10 @@ class TestGetRLSMigrationSQL:
         """Generates SQL for all tables."""
         sql = get_rls_migration_sql()
 
-        assert "ALTER TABLE shells ENABLE ROW LEVEL SECURITY" in sql
+        assert "ALTER TABLE aas ENABLE ROW LEVEL SECURITY" in sql
         assert "ALTER TABLE submodels ENABLE ROW LEVEL SECURITY" in sql
-        assert "CREATE POLICY tenant_isolation ON shells" in sql
+        assert "ALTER TABLE aas FORCE ROW LEVEL SECURITY" in sql
+        assert "CREATE POLICY tenant_isolation ON aas" in sql
         assert "CREATE POLICY tenant_isolation ON submodels" in sql
 
     def test_sql_is_not_empty(self) -> None:
@@ -257,3 +287,55 @@ class TestGetRLSMigrationSQL:
         sql = get_rls_migration_sql()
 
         assert len(sql) > 100
+
+
+class TestSetTransactionTenant:
+    """Tests for the per-transaction tenant hook."""
+
+    def test_binds_current_tenant(self) -> None:
+        """The current tenant is bound as a parameter, not interpolated."""
+        connection = MagicMock()
+
+        with TenantScope("acme"):
+            set_transaction_tenant(MagicMock(), MagicMock(), connection)
+
+        statement, params = connection.execute.call_args.args
+        assert str(statement) == "SELECT set_config('app.tenant_id', :tenant_id, true)"
+        assert params == {"tenant_id": "acme"}
+
+    def test_defaults_to_default_tenant(self) -> None:
+        """Without a tenant the default tenant is bound."""
+        connection = MagicMock()
+
+        set_transaction_tenant(MagicMock(), MagicMock(), connection)
+
+        assert connection.execute.call_args.args[1] == {"tenant_id": "default"}
+
+    def test_ignores_admission_tenant(self) -> None:
+        """The unauthenticated admission header never selects the RLS tenant."""
+        connection = MagicMock()
+        token = admission_tenant_var.set("acme")
+        try:
+            set_transaction_tenant(MagicMock(), MagicMock(), connection)
+        finally:
+            admission_tenant_var.reset(token)
+
+        assert connection.execute.call_args.args[1] == {"tenant_id": "default"}
+
+
+class TestAppWiring:
+    """Tests for installing tenant extraction with isolation."""
+
+    def test_tenant_middleware_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Isolation needs the authenticated tenant as the request context."""
+        from titan.api.app import create_app
+        from titan.config import settings
+        from titan.tenancy.middleware import AuthenticatedTenantMiddleware, TenantMiddleware
+
+        monkeypatch.setattr(settings, "enable_tenant_isolation", True)
+
+        app = create_app()
+
+        classes = [m.cls for m in app.user_middleware]
+        assert AuthenticatedTenantMiddleware in classes
+        assert TenantMiddleware not in classes
@@ -1,10 +1,15 @@
 """Tests for tenant middleware."""
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from titan.config import settings
+from titan.security import oidc
+from titan.security.oidc import InvalidTokenError, User
 from titan.tenancy.context import clear_tenant, get_current_tenant
 from titan.tenancy.middleware import (
+    AuthenticatedTenantMiddleware,
     TenantMiddleware,
     get_tenant_from_request,
 )
@@ -243,3 +248,81 @@ class TestMultipleTenantRequests:
         # Request 3: tenant acme again
         response3 = client.get("/test", headers={"X-Tenant-ID": "acme"})
         assert response3.json()["tenant"] == "acme"
+
+
+class FakeValidator:
+    """Token validator accepting ``<sub>@<tenant>`` tokens."""
+
+    async def validate_token(self, token: str) -> User:
+        if "@" not in token:
+            raise InvalidTokenError("bad token")
+        sub, tenant = token.split("@", 1)
+        return User(sub=sub, tenant_id=tenant)
+
+
+class TestAuthenticatedTenantMiddleware:
+    """Tests for AuthenticatedTenantMiddleware."""
+
+    @pytest.fixture
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+        monkeypatch.setattr(oidc, "get_token_validator", lambda: FakeValidator())
+        app = FastAPI()
+        app.add_middleware(AuthenticatedTenantMiddleware)
+
+        @app.get("/test")
+        async def test_endpoint() -> dict[str, str]:
+            return {"tenant": get_current_tenant()}
+
+        return TestClient(app)
+
+    def test_uses_tenant_of_verified_token(self, client: TestClient) -> None:
+        """The tenant comes from the token's tenant claim."""
+        response = client.get("/test", headers={"Authorization": "Bearer alice@acme"})
+
+        assert response.status_code == 200
+        assert response.json()["tenant"] == "acme"
+
+    def test_rejects_header_naming_another_tenant(self, client: TestClient) -> None:
+        """A client cannot switch tenants by sending X-Tenant-ID."""
+        response = client.get(
+            "/test",
+            headers={"Authorization": "Bearer alice@acme", "X-Tenant-ID": "beta"},
+        )
+
+        assert response.status_code == 403
+        assert response.json()["messages"][0]["code"] == "Forbidden"
+
+    def test_accepts_matching_header(self, client: TestClient) -> None:
+        """A header naming the token's own tenant is allowed."""
+        response = client.get(
+            "/test",
+            headers={"Authorization": "Bearer alice@acme", "X-Tenant-ID": "acme"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["tenant"] == "acme"
+
+    def test_unauthenticated_request_uses_default_tenant(self, client: TestClient) -> None:
+        """Requests without a valid token run as the default tenant."""
+        assert client.get("/test").json()["tenant"] == "default"
+        invalid = client.get("/test", headers={"Authorization": "Bearer garbage"})
+        assert invalid.json()["tenant"] == "default"
+        spoofed = client.get("/test", headers={"X-Tenant-ID": "acme"})
+        assert spoofed.status_code == 403
+
+    def test_header_trusted_without_oidc_in_anonymous_admin_mode(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Local development without OIDC may pick the tenant by header."""
+        monkeypatch.setattr(oidc, "get_token_validator", lambda: None)
+        monkeypatch.setattr(settings, "allow_anonymous_admin", True)
+        app = FastAPI()
+        app.add_middleware(AuthenticatedTenantMiddleware)
+
+        @app.get("/test")
+        async def test_endpoint() -> dict[str, str]:
+            return {"tenant": get_current_tenant()}
+
+        response = TestClient(app).get("/test", headers={"X-Tenant-ID": "acme"})
+
+        assert response.json()["tenant"] == "acme"